@@ -10,4 +10,7 @@ from django.core.asgi import get_asgi_application
 if 'DJANGO_SETTINGS_MODULE' not in os.environ:
     os.environ['DJANGO_SETTINGS_MODULE'] = 'app.settings.production'
 
+# Route the hottest read endpoints to their async views (see settings.SERVER_MODE)
+os.environ['SERVER_MODE'] = 'asgi'
+
 application = get_asgi_application()
\ No newline at end of file
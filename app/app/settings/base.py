@@ -58,6 +58,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework.authtoken',
     'drf_spectacular',
@@ -73,8 +74,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.instrumentation.RequestMetricsMiddleware',  # Query counts and Server-Timing (REQUEST_METRICS)
     'corsheaders.middleware.CorsMiddleware',  # CORS middleware
     'django.middleware.security.SecurityMiddleware',
+    'core.db_router.ReplicaStickinessMiddleware',  # Read-your-writes for replica reads
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -105,6 +108,11 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'app.wsgi.application'
 
+# 'wsgi' or 'asgi' (app.asgi sets it). Under ASGI the hottest read endpoints
+# are routed to async views; under WSGI they stay sync viewset actions, so
+# sync workers don't pay for async_to_sync on every request.
+SERVER_MODE = os.environ.get('SERVER_MODE', 'wsgi')
+
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 DATABASES = {
@@ -117,6 +125,33 @@ DATABASES = {
     }
 }
 
+# Reads inside core.db_router.read_from_replica() go to the replicas in
+# DATABASE_REPLICATION['REPLICAS'] (configured in production)
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+# Cache
+# gunicorn workers and app nodes only see each other's cache entries and
+# invalidations through a shared backend, so production sets REDIS_URL.
+# Without it (development, and always under `manage.py test`) each process
+# gets a local-memory cache.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL and 'test' not in sys.argv:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': os.environ.get('CACHE_KEY_PREFIX', 'kmdiscova'),
+            'TIMEOUT': 300,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'kmdiscova',
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -152,19 +187,29 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'users.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.instrumentation.TimedJSONRenderer',  # JSONRenderer reporting serializer time (REQUEST_METRICS)
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.EstimatedCountPagination',
     'PAGE_SIZE': 20
 }
 
+# Token -> user lookups cached by users.authentication.CachedTokenAuthentication.
+# Use a cache shared by all workers (e.g. Redis) in production.
+TOKEN_AUTH_CACHE = {
+    'CACHE_ALIAS': 'default',
+    'MAX_ENTRIES': int(os.environ.get('TOKEN_AUTH_CACHE_MAX_ENTRIES', 1000)),  # per-process LRU size
+    # Seconds a worker trusts its own copy; other workers see invalidations within this
+    'LOCAL_TTL': int(os.environ.get('TOKEN_AUTH_CACHE_LOCAL_TTL', 5)),
+    'SHARED_TTL': int(os.environ.get('TOKEN_AUTH_CACHE_SHARED_TTL', 300)),
+}
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'K&Mdiscova API',
     'DESCRIPTION': 'Personalized Child Development Platform',
@@ -212,12 +257,108 @@ SUPPORT_EMAIL = os.environ.get('SUPPORT_EMAIL', 'support@kmdiscova.id.vn')
 
 EMAIL_VERIFICATION_TIMEOUT_DAYS = 3
 
+# Email outbox delivery (run by `python manage.py send_queued_emails`)
+EMAIL_OUTBOX = {
+    'BATCH_SIZE': int(os.environ.get('EMAIL_OUTBOX_BATCH_SIZE', 50)),
+    'MAX_ATTEMPTS': int(os.environ.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 5)),
+    # Retry n waits RETRY_BASE_SECONDS * 2**(n-1), capped at RETRY_MAX_SECONDS
+    'RETRY_BASE_SECONDS': int(os.environ.get('EMAIL_OUTBOX_RETRY_BASE_SECONDS', 60)),
+    'RETRY_MAX_SECONDS': int(os.environ.get('EMAIL_OUTBOX_RETRY_MAX_SECONDS', 3600)),
+    'POLL_INTERVAL_SECONDS': int(os.environ.get('EMAIL_OUTBOX_POLL_INTERVAL_SECONDS', 5)),
+    # A claimed batch not finished within this time is picked up by another worker
+    'LEASE_SECONDS': int(os.environ.get('EMAIL_OUTBOX_LEASE_SECONDS', 300)),
+}
+
+# EmailService.send_bulk_email: messages per chunk and template rendering threads
+EMAIL_BULK = {
+    'CHUNK_SIZE': int(os.environ.get('EMAIL_BULK_CHUNK_SIZE', 100)),
+    'RENDER_WORKERS': int(os.environ.get('EMAIL_BULK_RENDER_WORKERS', 4)),
+}
+
+
+# Marketplace name typeahead (PsychologistService.typeahead)
+PSYCHOLOGIST_TYPEAHEAD = {
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': int(os.environ.get('PSYCHOLOGIST_TYPEAHEAD_CACHE_TIMEOUT', 30)),  # seconds per query
+    'DEFAULT_LIMIT': 8,
+    'MAX_LIMIT': 20,
+    'MIN_QUERY_LENGTH': 2,
+}
+
+# Marketplace filter facet counts (PsychologistService.get_marketplace_facets)
+PSYCHOLOGIST_MARKETPLACE_FACETS = {
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': int(os.environ.get('PSYCHOLOGIST_MARKETPLACE_FACETS_CACHE_TIMEOUT', 60)),  # seconds per filter combination
+}
+
+# Planner-estimated counts for big admin changelists and API lists (core.pagination)
+ESTIMATED_COUNT = {
+    'EXACT_COUNT_THRESHOLD': int(os.environ.get('ESTIMATED_COUNT_THRESHOLD', 10000)),  # rows
+}
+
+# Replica routing (core.db_router); production lists the replica aliases
+DATABASE_REPLICATION = {
+    'REPLICAS': [],  # database aliases
+    'STICKY_COOKIE_NAME': 'db_primary_pin',
+    'STICKY_SECONDS': int(os.environ.get('DB_REPLICA_STICKY_SECONDS', 5)),  # primary-only reads after a write
+    'MAX_LAG_SECONDS': float(os.environ.get('DB_REPLICA_MAX_LAG_SECONDS', 5)),  # lagging replicas are skipped
+    'LAG_CHECK_INTERVAL': 5,  # seconds between lag checks per replica and process
+    # A replica whose WAL receiver is down or silent this long is stale (keepalives come every ~30s)
+    'RECEIVER_TIMEOUT_SECONDS': int(os.environ.get('DB_REPLICA_RECEIVER_TIMEOUT_SECONDS', 60)),
+}
+
+# Versioned cache of service-layer reads (core.read_cache.cached_read),
+# invalidated by model signals
+READ_CACHE = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': int(os.environ.get('READ_CACHE_TIMEOUT', 300)),  # seconds; invalidation doesn't wait for it
+}
+
+# Per-request query count and timings (core.instrumentation): Server-Timing
+# headers, warnings for requests over budget, percentiles per view at
+# /api/health/requests/. Off by default; disabled, it adds no overhead.
+REQUEST_METRICS = {
+    'ENABLED': os.environ.get('REQUEST_METRICS_ENABLED', 'False') == 'True',
+    'SERVER_TIMING': os.environ.get('REQUEST_METRICS_SERVER_TIMING', 'True') == 'True',
+    'MAX_QUERIES': int(os.environ.get('REQUEST_METRICS_MAX_QUERIES', 30)),
+    'MAX_DB_MS': int(os.environ.get('REQUEST_METRICS_MAX_DB_MS', 200)),
+    'MAX_TOTAL_MS': int(os.environ.get('REQUEST_METRICS_MAX_TOTAL_MS', 500)),
+    'SAMPLE_SIZE': 500,  # recent requests kept per view and worker
+}
+
+# Response cache of the admin statistics endpoints (core.caching.cached_statistics)
+ADMIN_STATISTICS = {
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': int(os.environ.get('ADMIN_STATISTICS_CACHE_TIMEOUT', 60)),  # seconds a response is fresh
+    'STALE_TIMEOUT': int(os.environ.get('ADMIN_STATISTICS_STALE_TIMEOUT', 300)),  # seconds stale copies are served during a recompute
+    'LOCK_TIMEOUT': 30,  # seconds before a crashed recompute releases its lock
+    'WAIT_TIMEOUT': 5,  # seconds a request waits for another worker's first computation
+    'WAIT_INTERVAL': 0.05,
+}
 
 MVP_PRICING = {
     'ONLINE_SESSION_RATE': 150.00,      # $150 for 1-hour online session
     'INITIAL_CONSULTATION_RATE': 280.00  # $280 for 2-hour initial consultation
 }
 
+# Automatic status transitions for past-due appointments
+# (run by `python manage.py transition_past_appointments` from a scheduler)
+APPOINTMENT_AUTO_TRANSITION = {
+    'GRACE_PERIOD_MINUTES': int(os.environ.get('APPOINTMENT_TRANSITION_GRACE_MINUTES', 30)),
+    'BATCH_SIZE': int(os.environ.get('APPOINTMENT_TRANSITION_BATCH_SIZE', 500)),
+    'LOCK_TIMEOUT_MS': int(os.environ.get('APPOINTMENT_TRANSITION_LOCK_TIMEOUT_MS', 2000)),
+    # Terminal status for online sessions that were never closed by the psychologist
+    'ONLINE_SESSION_STATUS': os.environ.get('APPOINTMENT_TRANSITION_ONLINE_STATUS', 'Completed'),
+    # Terminal status for in-person consultations whose QR code was never scanned
+    'UNVERIFIED_CONSULTATION_STATUS': os.environ.get('APPOINTMENT_TRANSITION_UNVERIFIED_STATUS', 'No_Show'),
+}
+
+# Appointment reminder dispatch (run by `python manage.py send_appointment_reminders`
+# every few minutes; emails are delivered by the outbox worker)
+APPOINTMENT_REMINDERS = {
+    'BATCH_SIZE': int(os.environ.get('APPOINTMENT_REMINDER_BATCH_SIZE', 200)),
+}
+
 
 # CORS settings for React Native
 CORS_ALLOW_ALL_ORIGINS = os.environ.get('CORS_ALLOW_ALL_ORIGINS', 'True') == 'True'
@@ -23,6 +23,12 @@ if 'test' in sys.argv:
         'HOST': 'db',           # This is the service name from docker-compose.test.yml
         'PORT': '5432',
     }
+    # A second local database standing in for a read replica; only the
+    # tests that ask for it create it (see core.tests.test_db_router)
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'TEST': {'NAME': 'test_testdb_replica'},
+    }
 
 
 # Development-specific settings
@@ -15,6 +15,37 @@ DATABASES = {
     }
 }
 
+# Connection pool per gunicorn worker process (psycopg_pool), instead of a
+# new connection and TLS handshake per request. A request holds one
+# connection while it runs: under WSGI a worker runs one request per
+# thread, so the pool is sized to the worker's threads; under ASGI a
+# worker runs many requests at once and gets a larger pool. The server
+# sees up to workers x DB_POOL_MAX_SIZE connections per database.
+# Connections are checked on checkout.
+GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', 1))
+if os.environ.get('DB_POOL', 'True') == 'True':
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 1)),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10 if SERVER_MODE == 'asgi' else GUNICORN_THREADS)),
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),  # seconds to wait for a free connection
+        'max_idle': 300,
+        'max_lifetime': 1800,
+    }
+
+# Read replicas (comma-separated hosts sharing the primary's credentials)
+DB_REPLICA_HOSTS = [host.strip() for host in os.environ.get('DB_REPLICA_HOSTS', '').split(',') if host.strip()]
+for index, host in enumerate(DB_REPLICA_HOSTS, start=1):
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+    }
+DATABASE_REPLICATION = {
+    **DATABASE_REPLICATION,
+    'REPLICAS': [f'replica_{index}' for index in range(1, len(DB_REPLICA_HOSTS) + 1)],
+}
+
 # Security settings - but relaxed for HTTP during development
 SECURE_SSL_REDIRECT = os.environ.get('SECURE_SSL_REDIRECT', 'False') == 'True'
 
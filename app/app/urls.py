@@ -34,6 +34,8 @@ urlpatterns = [
     path('api/psychologists/', include('psychologists.urls')),
     # appointments
     path('api/appointments/', include('appointments.urls')),
+    # health
+    path('api/health/', include('core.urls')),
 ]
 
 
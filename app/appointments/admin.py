@@ -1,3 +1,115 @@
+# appointments/admin.py
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
 
-# Register your models here.
+from core.exports import export_actions
+from core.pagination import EstimatedCountPaginator
+from .exports import AppointmentExport
+from .models import Appointment, AppointmentSlot
+
+
+@admin.register(Appointment)
+class AppointmentAdmin(admin.ModelAdmin):
+    """Admin configuration for Appointment model"""
+
+    list_display = [
+        'appointment_id',
+        'scheduled_start_time',
+        'session_type',
+        'appointment_status',
+        'payment_status',
+        'psychologist_email',
+        'parent_email',
+        'child_name',
+    ]
+
+    list_filter = [
+        'session_type',
+        'appointment_status',
+        'payment_status',
+        'scheduled_start_time',
+    ]
+
+    search_fields = [
+        'psychologist__user__email',
+        'parent__user__email',
+        'child__first_name',
+        'child__last_name',
+    ]
+
+    readonly_fields = [
+        'appointment_id',
+        'qr_verification_code',
+        'session_verified_at',
+        'created_at',
+        'updated_at',
+    ]
+
+    ordering = ['-scheduled_start_time']
+    list_select_related = ['psychologist__user', 'parent__user', 'child']
+    autocomplete_fields = ['child', 'psychologist', 'parent']
+    raw_id_fields = ['appointment_slots']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    actions = [*export_actions(AppointmentExport)]
+
+    def psychologist_email(self, obj):
+        """Display psychologist email"""
+        return obj.psychologist.user.email
+    psychologist_email.short_description = _('Psychologist Email')
+    psychologist_email.admin_order_field = 'psychologist__user__email'
+
+    def parent_email(self, obj):
+        """Display parent email"""
+        return obj.parent.user.email
+    parent_email.short_description = _('Parent Email')
+    parent_email.admin_order_field = 'parent__user__email'
+
+    def child_name(self, obj):
+        """Display child name"""
+        return obj.child.display_name
+    child_name.short_description = _('Child')
+    child_name.admin_order_field = 'child__first_name'
+
+
+@admin.register(AppointmentSlot)
+class AppointmentSlotAdmin(admin.ModelAdmin):
+    """Admin configuration for AppointmentSlot model"""
+
+    list_display = [
+        'slot_id',
+        'psychologist_email',
+        'slot_date',
+        'start_time',
+        'end_time',
+        'is_booked',
+    ]
+
+    list_filter = [
+        'is_booked',
+        'slot_date',
+    ]
+
+    search_fields = [
+        'psychologist__user__email',
+        'psychologist__first_name',
+        'psychologist__last_name',
+    ]
+
+    readonly_fields = [
+        'created_at',
+        'updated_at',
+    ]
+
+    ordering = ['-slot_date', 'start_time']
+    list_select_related = ['psychologist__user']
+    raw_id_fields = ['psychologist', 'availability_block']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def psychologist_email(self, obj):
+        """Display psychologist email"""
+        return obj.psychologist.user.email
+    psychologist_email.short_description = _('Psychologist Email')
+    psychologist_email.admin_order_field = 'psychologist__user__email'
@@ -0,0 +1,33 @@
+# appointments/exports.py
+from core.exports import QuerysetExport
+
+
+class AppointmentExport(QuerysetExport):
+    """Appointments with the psychologist, child and parent they involve"""
+    filename = 'appointments'
+    columns = [
+        ('appointment_id', 'ID'),
+        ('scheduled_start_time', 'Start'),
+        ('scheduled_end_time', 'End'),
+        ('session_type', 'Session Type'),
+        ('appointment_status', 'Status'),
+        ('payment_status', 'Payment Status'),
+        ('psychologist_name', 'Psychologist'),
+        ('psychologist__user__email', 'Psychologist Email'),
+        ('child_name', 'Child'),
+        ('parent__user__email', 'Parent Email'),
+        ('session_verified_at', 'Verified At'),
+        ('created_at', 'Created Date'),
+    ]
+    fields = [
+        'appointment_id', 'scheduled_start_time', 'scheduled_end_time', 'session_type', 'appointment_status',
+        'payment_status', 'psychologist__first_name', 'psychologist__last_name', 'psychologist__user__email',
+        'child__first_name', 'child__last_name', 'parent__user__email', 'session_verified_at', 'created_at',
+    ]
+
+    def get_row(self, values):
+        values['psychologist_name'] = (
+            f"Dr. {values['psychologist__first_name']} {values['psychologist__last_name']}".strip()
+        )
+        values['child_name'] = f"{values['child__first_name']} {values['child__last_name']}".strip()
+        return values
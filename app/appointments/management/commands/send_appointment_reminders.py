@@ -0,0 +1,28 @@
+"""
+Django command to queue 24-hour and 1-hour appointment reminders.
+
+Meant to be run periodically by a scheduler (cron, systemd timer, etc.), e.g.
+every 5 minutes. Overlapping runs are safe: the reminder ledger lets each
+reminder through once. Emails are delivered by `send_queued_emails`.
+"""
+from django.core.management.base import BaseCommand
+
+from appointments.services import AppointmentNotificationService
+
+
+class Command(BaseCommand):
+    """Django command to dispatch appointment reminders."""
+
+    help = 'Queue due appointment reminders, honoring parent communication preferences'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Appointments claimed per transaction')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        results = AppointmentNotificationService.send_appointment_reminders(batch_size=options['batch_size'])
+
+        for reminder_type, counts in results.items():
+            self.stdout.write(self.style.SUCCESS(
+                f"{reminder_type}: {counts['queued']} reminders queued, {counts['skipped']} skipped by preference"
+            ))
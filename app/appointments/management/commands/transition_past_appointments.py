@@ -0,0 +1,50 @@
+"""
+Django command to move past-due Scheduled appointments to a terminal status.
+
+Meant to be run periodically by a scheduler (cron, systemd timer, etc.), e.g.
+every 15 minutes.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from appointments.services import AppointmentStatusTransitionService, AppointmentServiceError
+
+
+class Command(BaseCommand):
+    """Django command to transition past-due appointments."""
+
+    help = 'Move past-due Scheduled appointments to Completed / No_Show in chunked batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-minutes', type=int, help='Minutes after scheduled end before transitioning')
+        parser.add_argument('--batch-size', type=int, help='Appointments updated per transaction')
+        parser.add_argument('--max-batches', type=int, help='Stop after this many batches')
+        parser.add_argument(
+            '--online-status', choices=AppointmentStatusTransitionService.TERMINAL_STATUSES,
+            help='Terminal status for past online sessions'
+        )
+        parser.add_argument(
+            '--unverified-status', choices=AppointmentStatusTransitionService.TERMINAL_STATUSES,
+            help='Terminal status for in-person consultations without QR verification'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be transitioned')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        try:
+            result = AppointmentStatusTransitionService.transition_past_appointments(
+                grace_minutes=options['grace_minutes'],
+                batch_size=options['batch_size'],
+                online_status=options['online_status'],
+                unverified_status=options['unverified_status'],
+                max_batches=options['max_batches'],
+                dry_run=options['dry_run'],
+            )
+        except AppointmentServiceError as e:
+            raise CommandError(str(e))
+
+        prefix = 'Would transition' if result['dry_run'] else 'Transitioned'
+        by_status = ', '.join(f"{status_code}: {count}" for status_code, count in result['by_status'].items())
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix} {result['total_transitioned']} appointments ended before "
+            f"{result['cutoff'].isoformat()} in {result['batches']} batches ({by_status})"
+        ))
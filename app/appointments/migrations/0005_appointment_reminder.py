@@ -0,0 +1,32 @@
+# Generated by Django 5.1.9 on 2026-10-18 22:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0004_alter_appointment_session_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AppointmentReminder',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('reminder_type', models.CharField(choices=[('24_hours', '24 Hours Before'), ('1_hour', '1 Hour Before')], max_length=20, verbose_name='reminder type')),
+                ('status', models.CharField(choices=[('Queued', 'Queued'), ('Skipped', 'Skipped')], help_text='Queued for delivery, or skipped because of parent preferences', max_length=20, verbose_name='status')),
+                ('dispatch_id', models.UUIDField(help_text='Dispatch batch that claimed this reminder', verbose_name='dispatch ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('appointment', models.ForeignKey(help_text='Appointment the reminder is for', on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='appointments.appointment')),
+            ],
+            options={
+                'verbose_name': 'Appointment Reminder',
+                'verbose_name_plural': 'Appointment Reminders',
+                'db_table': 'appointment_reminders',
+                'indexes': [models.Index(fields=['dispatch_id'], name='appointment_dispatc_bca9b0_idx')],
+                'constraints': [models.UniqueConstraint(fields=('appointment', 'reminder_type'), name='unique_appointment_reminder')],
+            },
+        ),
+    ]
@@ -613,4 +613,67 @@ class Appointment(models.Model):
                 appointment_status__in=['Scheduled']
             ).order_by('scheduled_start_time')
 
-        return cls.objects.none()
\ No newline at end of file
+        return cls.objects.none()
+
+
+class AppointmentReminder(models.Model):
+    """
+    Ledger of appointment reminders that have been dispatched
+
+    One row per (appointment, reminder_type); the unique constraint is what
+    guarantees a reminder goes out once even when dispatch runs overlap.
+    """
+
+    REMINDER_TYPE_CHOICES = [
+        ('24_hours', _('24 Hours Before')),
+        ('1_hour', _('1 Hour Before')),
+    ]
+
+    STATUS_CHOICES = [
+        ('Queued', _('Queued')),
+        ('Skipped', _('Skipped')),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    appointment = models.ForeignKey(
+        Appointment,
+        on_delete=models.CASCADE,
+        related_name='reminders',
+        help_text=_("Appointment the reminder is for")
+    )
+    reminder_type = models.CharField(
+        _('reminder type'),
+        max_length=20,
+        choices=REMINDER_TYPE_CHOICES
+    )
+    status = models.CharField(
+        _('status'),
+        max_length=20,
+        choices=STATUS_CHOICES,
+        help_text=_("Queued for delivery, or skipped because of parent preferences")
+    )
+    dispatch_id = models.UUIDField(
+        _('dispatch ID'),
+        help_text=_("Dispatch batch that claimed this reminder")
+    )
+    created_at = models.DateTimeField(
+        _('created at'),
+        auto_now_add=True
+    )
+
+    class Meta:
+        verbose_name = _('Appointment Reminder')
+        verbose_name_plural = _('Appointment Reminders')
+        db_table = 'appointment_reminders'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['appointment', 'reminder_type'],
+                name='unique_appointment_reminder'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['dispatch_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_reminder_type_display()} reminder for {self.appointment_id} ({self.status})"
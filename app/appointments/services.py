@@ -1,19 +1,23 @@
 # appointments/services.py
-from django.db import transaction
+from django.conf import settings
+from django.db import transaction, connection
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.db.models import Q, Count, F, Exists, OuterRef
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from datetime import date, datetime, timedelta, time
 import logging
 from typing import Optional, Dict, Any, List, Tuple
 import uuid
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from .models import Appointment, AppointmentSlot
+from .models import Appointment, AppointmentSlot, AppointmentReminder
 from psychologists.models import Psychologist, PsychologistAvailability
 from parents.models import Parent
 from children.models import Child
 from users.models import User
+from users.services import EmailService
 
 logger = logging.getLogger(__name__)
 
@@ -500,8 +504,39 @@ class AppointmentBookingService:
             date_to = date_from + timedelta(days=30)
 
         # Get available slots
-        available_slots = AppointmentSlot.get_available_slots(psychologist, date_from, date_to)
+        available_slots = list(AppointmentSlot.get_available_slots(psychologist, date_from, date_to))
 
+        return AppointmentBookingService._format_booking_slots(
+            psychologist, session_type, date_from, date_to, available_slots
+        )
+
+    @staticmethod
+    async def aget_available_booking_slots(psychologist: Psychologist, session_type: str,
+                                           date_from: date = None, date_to: date = None) -> Dict[str, Any]:
+        """
+        Async get_available_booking_slots(), reading the slots with the async ORM
+
+        `psychologist` must come with its user loaded (select_related('user')).
+        """
+        if not date_from:
+            date_from = date.today()
+        if not date_to:
+            date_to = date_from + timedelta(days=30)
+
+        available_slots = [
+            slot async for slot in AppointmentSlot.get_available_slots(psychologist, date_from, date_to)
+        ]
+
+        return AppointmentBookingService._format_booking_slots(
+            psychologist, session_type, date_from, date_to, available_slots
+        )
+
+    @staticmethod
+    def _format_booking_slots(psychologist: Psychologist, session_type: str, date_from: date,
+                              date_to: date, available_slots: List[AppointmentSlot]) -> Dict[str, Any]:
+        """
+        Booking options from the available slots, ordered by date and start time
+        """
         if session_type == 'OnlineMeeting':
             # For 1-hour sessions, all available slots can be booked
             booking_options = [
@@ -516,7 +551,9 @@ class AppointmentBookingService:
                 for slot in available_slots
             ]
         else:
-            # For 2-hour sessions, find consecutive slot pairs
+            # For 2-hour sessions, find consecutive slot pairs among the
+            # available slots (as AppointmentSlot.find_consecutive_slots would)
+            slots_by_start = {(slot.slot_date, slot.start_time): slot for slot in available_slots}
             booking_options = []
             processed_slots = set()
 
@@ -524,17 +561,16 @@ class AppointmentBookingService:
                 if slot.slot_id in processed_slots:
                     continue
 
-                # Try to find consecutive slot
-                consecutive_slots = AppointmentSlot.find_consecutive_slots(
-                    psychologist, slot.slot_date, slot.start_time, 2
-                )
+                next_start = (datetime.combine(date.today(), slot.start_time) + timedelta(hours=1)).time()
+                next_slot = slots_by_start.get((slot.slot_date, next_start))
 
-                if len(consecutive_slots) == 2:
+                if next_slot is not None:
+                    consecutive_slots = [slot, next_slot]
                     booking_options.append({
                         'slot_id': slot.slot_id,  # Start slot ID for booking
                         'date': slot.slot_date,
                         'start_time': slot.start_time,
-                        'end_time': consecutive_slots[1].end_time,
+                        'end_time': next_slot.end_time,
                         'session_types': ['InitialConsultation'],
                         'is_consecutive_block': True,
                         'consecutive_slot_ids': [s.slot_id for s in consecutive_slots]
@@ -729,7 +765,44 @@ class AppointmentManagementService:
         else:
             return []
 
-        # Apply filters
+        queryset = AppointmentManagementService._filter_user_appointments(
+            queryset, status_filter, date_from, date_to, is_upcoming
+        )
+        return list(queryset)
+
+    @staticmethod
+    async def aget_user_appointments(user: User, status_filter: str = None, date_from: date = None,
+                                     date_to: date = None, is_upcoming: bool = None) -> List[Appointment]:
+        """
+        Async get_user_appointments(), reading with the async ORM
+        """
+        queryset = Appointment.objects.select_related(
+            'child', 'psychologist__user', 'parent__user'
+        ).prefetch_related('appointment_slots')
+
+        # Filter by user type (profiles checked with queries: the reverse
+        # one-to-one accessors can't be used from async code)
+        if user.is_parent and await Parent.objects.filter(user=user).aexists():
+            queryset = queryset.filter(parent__user=user)
+        elif user.is_psychologist and await Psychologist.objects.filter(user=user).aexists():
+            queryset = queryset.filter(psychologist__user=user)
+        elif user.is_admin or user.is_staff:
+            # Admins can see all appointments
+            pass
+        else:
+            return []
+
+        queryset = AppointmentManagementService._filter_user_appointments(
+            queryset, status_filter, date_from, date_to, is_upcoming
+        )
+        return [appointment async for appointment in queryset]
+
+    @staticmethod
+    def _filter_user_appointments(queryset, status_filter: str = None, date_from: date = None,
+                                  date_to: date = None, is_upcoming: bool = None):
+        """
+        Apply the get_user_appointments() filters, ordered by start time
+        """
         if status_filter:
             queryset = queryset.filter(appointment_status=status_filter)
 
@@ -746,7 +819,202 @@ class AppointmentManagementService:
             else:
                 queryset = queryset.filter(scheduled_end_time__lt=now)
 
-        return list(queryset.order_by('scheduled_start_time'))
+        return queryset.order_by('scheduled_start_time')
+
+
+# ============================================================================
+# APPOINTMENT STATUS TRANSITION SERVICE
+# ============================================================================
+
+class AppointmentStatusTransitionService:
+    """
+    Service for moving past-due scheduled appointments to a terminal status
+    (to be called by a scheduled task)
+    """
+
+    DEFAULT_CONFIG = {
+        'GRACE_PERIOD_MINUTES': 30,
+        'BATCH_SIZE': 500,
+        'LOCK_TIMEOUT_MS': 2000,
+        'ONLINE_SESSION_STATUS': 'Completed',
+        'UNVERIFIED_CONSULTATION_STATUS': 'No_Show',
+    }
+
+    TERMINAL_STATUSES = ['Completed', 'No_Show']
+
+    @staticmethod
+    def get_transition_config(**overrides) -> Dict[str, Any]:
+        """
+        Merge APPOINTMENT_AUTO_TRANSITION settings with defaults and explicit overrides
+        """
+        config = {
+            **AppointmentStatusTransitionService.DEFAULT_CONFIG,
+            **getattr(settings, 'APPOINTMENT_AUTO_TRANSITION', {}),
+        }
+        config.update({key: value for key, value in overrides.items() if value is not None})
+
+        for key in ['ONLINE_SESSION_STATUS', 'UNVERIFIED_CONSULTATION_STATUS']:
+            if config[key] not in AppointmentStatusTransitionService.TERMINAL_STATUSES:
+                raise AppointmentServiceError(
+                    f"{key} must be one of {AppointmentStatusTransitionService.TERMINAL_STATUSES}"
+                )
+
+        if config['BATCH_SIZE'] < 1:
+            raise AppointmentServiceError("BATCH_SIZE must be at least 1")
+
+        return config
+
+    @staticmethod
+    def get_past_due_queryset(cutoff: datetime):
+        """
+        Scheduled appointments that ended before the cutoff
+        """
+        # scheduled_start_time < scheduled_end_time always holds, so the redundant
+        # start-time bound lets Postgres range-scan the (status, start_time) index
+        return Appointment.objects.filter(
+            appointment_status='Scheduled',
+            scheduled_start_time__lt=cutoff,
+            scheduled_end_time__lt=cutoff
+        )
+
+    @staticmethod
+    def _get_transition_rules(config: Dict[str, Any]) -> List[Tuple[Q, str]]:
+        """
+        (row filter, target status) pairs; together they cover every session type
+        """
+        return [
+            (
+                Q(session_type='InitialConsultation', session_verified_at__isnull=False),
+                'Completed'
+            ),
+            (
+                Q(session_type='InitialConsultation', session_verified_at__isnull=True),
+                config['UNVERIFIED_CONSULTATION_STATUS']
+            ),
+            (
+                ~Q(session_type='InitialConsultation'),
+                config['ONLINE_SESSION_STATUS']
+            ),
+        ]
+
+    @staticmethod
+    def transition_past_appointments(grace_minutes: int = None, batch_size: int = None,
+                                     online_status: str = None, unverified_status: str = None,
+                                     max_batches: int = None, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Move past-due Scheduled appointments to Completed / No_Show in chunks
+
+        Each chunk runs in its own short transaction: candidate rows are claimed with
+        FOR UPDATE SKIP LOCKED (rows held by a concurrent request are left for the next
+        run) and updated with guarded UPDATEs that re-check the Scheduled status, so a
+        psychologist completing or cancelling at the same time always wins.
+
+        Args:
+            grace_minutes: Minutes after scheduled_end_time before an appointment is transitioned
+            batch_size: Rows claimed and updated per transaction
+            online_status: Terminal status for past online sessions
+            unverified_status: Terminal status for in-person sessions without QR verification
+            max_batches: Stop after this many batches (default: until no rows are left)
+            dry_run: Only count what would be transitioned
+
+        Returns:
+            Dict with cutoff, batch count and per-status totals
+        """
+        config = AppointmentStatusTransitionService.get_transition_config(
+            GRACE_PERIOD_MINUTES=grace_minutes,
+            BATCH_SIZE=batch_size,
+            ONLINE_SESSION_STATUS=online_status,
+            UNVERIFIED_CONSULTATION_STATUS=unverified_status,
+        )
+        cutoff = timezone.now() - timedelta(minutes=config['GRACE_PERIOD_MINUTES'])
+        rules = AppointmentStatusTransitionService._get_transition_rules(config)
+        past_due = AppointmentStatusTransitionService.get_past_due_queryset(cutoff)
+
+        by_status = {status_code: 0 for status_code in AppointmentStatusTransitionService.TERMINAL_STATUSES}
+
+        if dry_run:
+            counts = past_due.aggregate(**{
+                f'rule_{index}': Count('appointment_id', filter=rule_filter)
+                for index, (rule_filter, _target) in enumerate(rules)
+            })
+            for index, (_rule_filter, target_status) in enumerate(rules):
+                by_status[target_status] += counts[f'rule_{index}']
+
+            return {
+                'cutoff': cutoff,
+                'dry_run': True,
+                'batches': 0,
+                'total_transitioned': sum(by_status.values()),
+                'by_status': by_status,
+            }
+
+        batches = 0
+        while True:
+            claimed = AppointmentStatusTransitionService._transition_batch(
+                past_due, rules, config, by_status
+            )
+            if claimed:
+                batches += 1
+
+            if claimed < config['BATCH_SIZE']:
+                break
+            if max_batches and batches >= max_batches:
+                break
+
+        total = sum(by_status.values())
+        logger.info(
+            f"Transitioned {total} past-due appointments in {batches} batches "
+            f"(cutoff {cutoff.isoformat()}): {by_status}"
+        )
+
+        return {
+            'cutoff': cutoff,
+            'dry_run': False,
+            'batches': batches,
+            'total_transitioned': total,
+            'by_status': by_status,
+        }
+
+    @staticmethod
+    def _transition_batch(past_due, rules: List[Tuple[Q, str]], config: Dict[str, Any],
+                          by_status: Dict[str, int]) -> int:
+        """
+        Claim and transition one chunk; returns the number of rows claimed
+        """
+        now = timezone.now()
+
+        with transaction.atomic():
+            # Bound how long this transaction may wait on any lock
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('lock_timeout', %s, true)",
+                    [f"{int(config['LOCK_TIMEOUT_MS'])}ms"]
+                )
+
+            claimed_ids = list(
+                past_due.order_by('scheduled_start_time')
+                .select_for_update(skip_locked=True)
+                .values_list('appointment_id', flat=True)[:config['BATCH_SIZE']]
+            )
+            if not claimed_ids:
+                return 0
+
+            for rule_filter, target_status in rules:
+                update_fields = {
+                    'appointment_status': target_status,
+                    'updated_at': now,
+                }
+                if target_status == 'Completed':
+                    update_fields['actual_end_time'] = Coalesce(F('actual_end_time'), F('scheduled_end_time'))
+
+                updated = Appointment.objects.filter(
+                    rule_filter,
+                    appointment_id__in=claimed_ids,
+                    appointment_status='Scheduled'
+                ).update(**update_fields)
+                by_status[target_status] += updated
+
+        return len(claimed_ids)
 
 
 # ============================================================================
@@ -782,17 +1050,176 @@ class AppointmentNotificationService:
         """
         pass
 
+    # Reminder types with the longest and shortest time before the session
+    # they go out. The day-before reminder is only sent while the session is
+    # still about a day away, so a same-day booking doesn't get it.
+    REMINDER_LEAD_TIMES = [
+        ('24_hours', timedelta(hours=24), timedelta(hours=23)),
+        ('1_hour', timedelta(hours=1), timedelta(0)),
+    ]
+
+    REMINDER_SUBJECTS = {
+        '24_hours': _('Reminder: your K&Mdiscova appointment is tomorrow'),
+        '1_hour': _('Reminder: your K&Mdiscova appointment starts in 1 hour'),
+    }
+
     @staticmethod
-    def send_appointment_reminders():
+    def get_reminder_windows(now: datetime) -> List[Tuple[str, datetime, datetime]]:
         """
-        Send appointment reminders (to be called by scheduled task)
+        Get (reminder_type, window_start, window_end) for every reminder type
 
-        TODO: Implement reminder system
-        - 24 hours before appointment
-        - 2 hours before appointment
-        - Different content for online vs in-person
+        A scheduled appointment is due for a reminder when
+        window_start < scheduled_start_time <= window_end.
         """
-        pass
+        return [
+            (reminder_type, now + min_lead_time, now + max_lead_time)
+            for reminder_type, max_lead_time, min_lead_time in AppointmentNotificationService.REMINDER_LEAD_TIMES
+        ]
+
+    @staticmethod
+    def get_due_reminders_queryset(reminder_type: str, window_start: datetime, window_end: datetime):
+        """
+        Scheduled appointments in the window without a ledger entry for this reminder
+
+        Filters on (appointment_status, scheduled_start_time) so the scan uses
+        that composite index.
+        """
+        already_dispatched = AppointmentReminder.objects.filter(
+            appointment=OuterRef('pk'),
+            reminder_type=reminder_type
+        )
+        return Appointment.objects.filter(
+            appointment_status='Scheduled',
+            scheduled_start_time__gt=window_start,
+            scheduled_start_time__lte=window_end,
+        ).filter(
+            ~Exists(already_dispatched)
+        ).select_related(
+            'parent__user', 'child', 'psychologist__user'
+        ).order_by('scheduled_start_time')
+
+    @staticmethod
+    def parent_wants_reminder(parent: Parent, reminder_type: str) -> bool:
+        """
+        Check the parent's communication preferences for a reminder type
+
+        Parents who disabled email notifications or appointment reminders get
+        none. The day-before reminder only goes to parents whose
+        reminder_timing is '24_hours'; shorter timings get the 1-hour one.
+        """
+        preferences = {
+            **Parent.get_default_communication_preferences(),
+            **(parent.communication_preferences or {})
+        }
+        if not preferences.get('email_notifications') or not preferences.get('appointment_reminders'):
+            return False
+        if reminder_type == '24_hours':
+            return preferences.get('reminder_timing') == '24_hours'
+        return True
+
+    @staticmethod
+    def send_appointment_reminders(now: datetime = None, batch_size: int = None) -> Dict[str, Dict[str, int]]:
+        """
+        Queue due 24-hour and 1-hour reminders (to be called by scheduled task)
+
+        Appointments are streamed with .iterator() and handled in batches, so
+        memory stays flat however many appointments are due. Each batch claims
+        its reminders in the AppointmentReminder ledger and queues the emails
+        in the same transaction; a reminder already claimed by an overlapping
+        run is skipped.
+
+        Returns:
+            Dict with queued/skipped counts per reminder type
+        """
+        now = now or timezone.now()
+        config = {'BATCH_SIZE': 200, **getattr(settings, 'APPOINTMENT_REMINDERS', {})}
+        batch_size = batch_size or config['BATCH_SIZE']
+
+        results = {}
+        for reminder_type, window_start, window_end in AppointmentNotificationService.get_reminder_windows(now):
+            counts = {'queued': 0, 'skipped': 0}
+            queryset = AppointmentNotificationService.get_due_reminders_queryset(
+                reminder_type, window_start, window_end
+            )
+
+            batch = []
+            for appointment in queryset.iterator(chunk_size=batch_size):
+                batch.append(appointment)
+                if len(batch) >= batch_size:
+                    AppointmentNotificationService._dispatch_reminder_batch(batch, reminder_type, counts)
+                    batch = []
+            if batch:
+                AppointmentNotificationService._dispatch_reminder_batch(batch, reminder_type, counts)
+
+            results[reminder_type] = counts
+            logger.info(
+                f"{reminder_type} reminders: {counts['queued']} queued, {counts['skipped']} skipped by preference"
+            )
+
+        return results
+
+    @staticmethod
+    def _dispatch_reminder_batch(appointments: List[Appointment], reminder_type: str, counts: Dict[str, int]):
+        """Claim reminders for a batch in the ledger and queue the emails atomically"""
+        dispatch_id = uuid.uuid4()
+        wanted = {
+            appointment.pk: AppointmentNotificationService.parent_wants_reminder(appointment.parent, reminder_type)
+            for appointment in appointments
+        }
+
+        with transaction.atomic():
+            AppointmentReminder.objects.bulk_create(
+                [
+                    AppointmentReminder(
+                        appointment_id=appointment.pk,
+                        reminder_type=reminder_type,
+                        status='Queued' if wanted[appointment.pk] else 'Skipped',
+                        dispatch_id=dispatch_id,
+                    )
+                    for appointment in appointments
+                ],
+                ignore_conflicts=True
+            )
+
+            # Rows inserted by a concurrent run were ignored; only ours carry this dispatch id
+            claimed = set(
+                AppointmentReminder.objects.filter(dispatch_id=dispatch_id).values_list('appointment_id', flat=True)
+            )
+            to_send = [a for a in appointments if a.pk in claimed and wanted[a.pk]]
+
+            if to_send:
+                EmailService.queue_bulk_email(
+                    subject=AppointmentNotificationService.REMINDER_SUBJECTS[reminder_type],
+                    template_name='appointment_reminder',
+                    recipients_contexts=[
+                        (a.parent.user.email, AppointmentNotificationService._get_reminder_context(a, reminder_type))
+                        for a in to_send
+                    ]
+                )
+
+        counts['queued'] += len(to_send)
+        counts['skipped'] += len(claimed) - len(to_send)
+
+    @staticmethod
+    def _get_reminder_context(appointment: Appointment, reminder_type: str) -> Dict[str, Any]:
+        """Build the email context for a reminder, with times in the parent's timezone"""
+        try:
+            parent_timezone = ZoneInfo(appointment.parent.user.user_timezone or 'UTC')
+        except (ZoneInfoNotFoundError, ValueError):
+            parent_timezone = ZoneInfo('UTC')
+
+        return {
+            'reminder_type': reminder_type,
+            'parent_name': appointment.parent.display_name,
+            'child_name': appointment.child.display_name,
+            'psychologist_name': appointment.psychologist.display_name,
+            'session_type': appointment.get_session_type_display(),
+            'is_online': appointment.session_type == 'OnlineMeeting',
+            'scheduled_start_time': timezone.localtime(appointment.scheduled_start_time, parent_timezone),
+            'timezone_name': str(parent_timezone),
+            'meeting_link': appointment.meeting_link,
+            'meeting_address': appointment.meeting_address,
+        }
 
     @staticmethod
     def send_qr_verification_confirmation(appointment: Appointment):
@@ -0,0 +1,16 @@
+# appointments/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from psychologists.services import AvailabilityVersionService
+from .models import AppointmentSlot
+
+
+@receiver(post_save, sender=AppointmentSlot)
+@receiver(post_delete, sender=AppointmentSlot)
+def bump_availability_version(sender, instance, raw=False, **kwargs):
+    """
+    Invalidate availability ETags when a slot is generated, booked, released or deleted
+    """
+    if not raw:
+        AvailabilityVersionService.bump(instance.psychologist_id)
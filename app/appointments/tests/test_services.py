@@ -1,8 +1,11 @@
 # appointments/tests/test_services.py
+from asgiref.sync import async_to_sync
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db import transaction
+from django.core.management import call_command
+from io import StringIO
 from datetime import date, datetime, timedelta, time
 from decimal import Decimal
 import uuid
@@ -11,13 +14,16 @@ from users.models import User
 from parents.models import Parent
 from children.models import Child
 from psychologists.models import Psychologist, PsychologistAvailability
-from appointments.models import Appointment, AppointmentSlot
+from appointments.models import Appointment, AppointmentSlot, AppointmentReminder
+from users.models import OutboundEmail
 from appointments.services import (
     AppointmentSlotService,
     AppointmentBookingService,
     AppointmentManagementService,
     AppointmentAnalyticsService,
     AppointmentUtilityService,
+    AppointmentStatusTransitionService,
+    AppointmentNotificationService,
     # Exceptions
     AppointmentServiceError,
     AppointmentBookingError,
@@ -599,6 +605,52 @@ class AppointmentBookingServiceTest(TestCase):
             self.assertTrue(slot['is_consecutive_block'])
             self.assertIn('consecutive_slot_ids', slot)
 
+    def test_get_available_booking_slots_consultation_pairs(self):
+        """Test consultations pair a slot with the available slot in the next hour"""
+        result = AppointmentBookingService.get_available_booking_slots(
+            self.psychologist, 'InitialConsultation', date.today(), date.today() + timedelta(days=7)
+        )
+
+        self.assertEqual(result['total_slots'], 1)
+        option = result['available_slots'][0]
+        self.assertEqual(option['slot_id'], self.slot1.slot_id)
+        self.assertEqual(option['end_time'], self.slot2.end_time)
+        self.assertEqual(option['consecutive_slot_ids'], [self.slot1.slot_id, self.slot2.slot_id])
+
+        # A booked second hour leaves no consecutive pair
+        AppointmentSlot.objects.filter(pk=self.slot2.pk).update(is_booked=True)
+        result = AppointmentBookingService.get_available_booking_slots(
+            self.psychologist, 'InitialConsultation', date.today(), date.today() + timedelta(days=7)
+        )
+        self.assertEqual(result['available_slots'], [])
+
+    def test_aget_available_booking_slots_matches_sync(self):
+        """Test the async variant returns the same booking options"""
+        psychologist = Psychologist.objects.select_related('user').get(pk=self.psychologist.pk)
+        for session_type in ['OnlineMeeting', 'InitialConsultation']:
+            expected = AppointmentBookingService.get_available_booking_slots(psychologist, session_type)
+            result = async_to_sync(AppointmentBookingService.aget_available_booking_slots)(
+                psychologist, session_type
+            )
+            self.assertEqual(result, expected)
+
+    def test_aget_user_appointments_matches_sync(self):
+        """Test the async variant returns the same appointments for both participants"""
+        appointment = AppointmentBookingService.book_appointment(
+            parent=self.parent,
+            child=self.child,
+            psychologist=self.psychologist,
+            session_type='OnlineMeeting',
+            start_slot_id=self.slot1.slot_id
+        )
+
+        for user in [self.parent_user, self.psychologist_user]:
+            user = User.objects.get(pk=user.pk)
+            expected = list(AppointmentManagementService.get_user_appointments(user, is_upcoming=True))
+            result = async_to_sync(AppointmentManagementService.aget_user_appointments)(user, is_upcoming=True)
+            self.assertEqual(result, expected)
+            self.assertEqual(result, [appointment])
+
 
 class AppointmentManagementServiceTest(TestCase):
     """Test AppointmentManagementService functionality"""
@@ -1006,3 +1058,299 @@ class AppointmentUtilityServiceTest(TestCase):
         self.assertEqual(time_display['day_name'], self.appointment.scheduled_start_time.strftime('%A'))
         self.assertEqual(time_display['start_time'], self.appointment.scheduled_start_time.strftime('%H:%M'))
         self.assertEqual(time_display['end_time'], self.appointment.scheduled_end_time.strftime('%H:%M'))
+
+
+class AppointmentStatusTransitionServiceTest(TestCase):
+    """Test AppointmentStatusTransitionService functionality"""
+
+    def setUp(self):
+        self.psychologist_user = User.objects.create_user(
+            email='psychologist@test.com',
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=self.psychologist_user,
+            first_name='Dr. Jane',
+            last_name='Smith',
+            license_number='PSY123456',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=10,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=True,
+            office_address='123 Main St, City, State'
+        )
+        self.parent_user = User.objects.create_user(
+            email='parent@test.com',
+            password='testpass123',
+            user_type='Parent',
+            is_verified=True
+        )
+        self.parent = Parent.objects.get(user=self.parent_user)
+        self.child = Child.objects.create(
+            parent=self.parent,
+            first_name='Alice',
+            date_of_birth=date.today() - timedelta(days=2555)
+        )
+
+        past = timezone.now() - timedelta(days=1)
+        self.past_online = self._create_appointment('OnlineMeeting', past)
+        self.past_verified = self._create_appointment(
+            'InitialConsultation', past + timedelta(hours=2), session_verified_at=past + timedelta(hours=2)
+        )
+        self.past_unverified = self._create_appointment('InitialConsultation', past + timedelta(hours=5))
+        self.past_cancelled = self._create_appointment('OnlineMeeting', past, appointment_status='Cancelled')
+        # Ended 10 minutes ago - still inside the default 30 minute grace period
+        self.just_ended = self._create_appointment('OnlineMeeting', timezone.now() - timedelta(minutes=70))
+        self.future = self._create_appointment('OnlineMeeting', timezone.now() + timedelta(days=2))
+
+    def _create_appointment(self, session_type, start_time, appointment_status='Scheduled', **extra):
+        duration = timedelta(hours=1 if session_type == 'OnlineMeeting' else 2)
+        return Appointment.objects.create(
+            child=self.child,
+            psychologist=self.psychologist,
+            parent=self.parent,
+            session_type=session_type,
+            appointment_status=appointment_status,
+            scheduled_start_time=start_time,
+            scheduled_end_time=start_time + duration,
+            **extra
+        )
+
+    def _status(self, appointment):
+        appointment.refresh_from_db()
+        return appointment.appointment_status
+
+    def test_transition_past_appointments(self):
+        """Test past-due appointments move to the configured terminal statuses"""
+        result = AppointmentStatusTransitionService.transition_past_appointments()
+
+        self.assertEqual(result['total_transitioned'], 3)
+        self.assertEqual(result['by_status'], {'Completed': 2, 'No_Show': 1})
+
+        self.assertEqual(self._status(self.past_online), 'Completed')
+        self.assertEqual(self._status(self.past_verified), 'Completed')
+        self.assertEqual(self._status(self.past_unverified), 'No_Show')
+        self.assertEqual(self._status(self.past_cancelled), 'Cancelled')
+        self.assertEqual(self._status(self.just_ended), 'Scheduled')
+        self.assertEqual(self._status(self.future), 'Scheduled')
+
+        # Completed sessions get the scheduled end as their actual end, no-shows do not
+        self.assertEqual(self.past_online.actual_end_time, self.past_online.scheduled_end_time)
+        self.assertIsNone(self.past_unverified.actual_end_time)
+
+    def test_transition_in_small_batches(self):
+        """Test chunked processing covers every past-due appointment"""
+        result = AppointmentStatusTransitionService.transition_past_appointments(batch_size=1)
+
+        self.assertEqual(result['batches'], 3)
+        self.assertEqual(result['total_transitioned'], 3)
+        self.assertFalse(
+            AppointmentStatusTransitionService.get_past_due_queryset(result['cutoff']).exists()
+        )
+
+    def test_transition_respects_max_batches(self):
+        """Test max_batches bounds a single run"""
+        result = AppointmentStatusTransitionService.transition_past_appointments(batch_size=1, max_batches=2)
+
+        self.assertEqual(result['batches'], 2)
+        self.assertEqual(result['total_transitioned'], 2)
+
+    def test_transition_configurable_statuses(self):
+        """Test terminal statuses can be overridden"""
+        result = AppointmentStatusTransitionService.transition_past_appointments(
+            online_status='No_Show', unverified_status='Completed'
+        )
+
+        self.assertEqual(result['by_status'], {'Completed': 2, 'No_Show': 1})
+        self.assertEqual(self._status(self.past_online), 'No_Show')
+        self.assertEqual(self._status(self.past_unverified), 'Completed')
+
+    def test_transition_invalid_status(self):
+        """Test non-terminal statuses are rejected"""
+        with self.assertRaises(AppointmentServiceError):
+            AppointmentStatusTransitionService.transition_past_appointments(online_status='Cancelled')
+
+    def test_transition_dry_run(self):
+        """Test dry run reports counts without updating"""
+        result = AppointmentStatusTransitionService.transition_past_appointments(dry_run=True)
+
+        self.assertTrue(result['dry_run'])
+        self.assertEqual(result['by_status'], {'Completed': 2, 'No_Show': 1})
+        self.assertEqual(self._status(self.past_online), 'Scheduled')
+
+    def test_transition_command(self):
+        """Test management command runs the transition"""
+        from io import StringIO
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command('transition_past_appointments', '--batch-size', '2', stdout=out)
+
+        self.assertIn('Transitioned 3 appointments', out.getvalue())
+        self.assertEqual(self._status(self.past_unverified), 'No_Show')
+
+
+class AppointmentNotificationServiceTest(TestCase):
+    """Test appointment reminder dispatch"""
+
+    def setUp(self):
+        self.psychologist_user = User.objects.create_user(
+            email='psychologist@test.com',
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=self.psychologist_user,
+            first_name='Jane',
+            last_name='Smith',
+            license_number='PSY123456',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=10,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=True,
+            office_address='123 Main St, City, State'
+        )
+        self.parent, self.child = self._create_family('parent@test.com', 'Alice')
+
+        self.now = timezone.now()
+        self.tomorrow = self._create_appointment(
+            self.parent, self.child, self.now + timedelta(hours=23, minutes=30)
+        )
+        self.soon = self._create_appointment(
+            self.parent, self.child, self.now + timedelta(minutes=45), session_type='InitialConsultation'
+        )
+        self.next_week = self._create_appointment(self.parent, self.child, self.now + timedelta(days=7))
+        self.cancelled = self._create_appointment(
+            self.parent, self.child, self.now + timedelta(hours=23, minutes=30), appointment_status='Cancelled'
+        )
+
+    def _create_family(self, email, child_name):
+        user = User.objects.create_user(email=email, password='testpass123', user_type='Parent', is_verified=True)
+        parent = Parent.objects.get(user=user)
+        child = Child.objects.create(
+            parent=parent,
+            first_name=child_name,
+            date_of_birth=date.today() - timedelta(days=2555)
+        )
+        return parent, child
+
+    def _create_appointment(self, parent, child, start_time, session_type='OnlineMeeting',
+                            appointment_status='Scheduled', **extra):
+        duration = timedelta(hours=1 if session_type == 'OnlineMeeting' else 2)
+        return Appointment.objects.create(
+            child=child,
+            psychologist=self.psychologist,
+            parent=parent,
+            session_type=session_type,
+            appointment_status=appointment_status,
+            scheduled_start_time=start_time,
+            scheduled_end_time=start_time + duration,
+            meeting_link='https://meet.example.com/abc' if session_type == 'OnlineMeeting' else None,
+            **extra
+        )
+
+    def test_reminder_windows(self):
+        """Test each reminder type goes out just inside its lead time"""
+        windows = AppointmentNotificationService.get_reminder_windows(self.now)
+
+        self.assertEqual(windows, [
+            ('24_hours', self.now + timedelta(hours=23), self.now + timedelta(hours=24)),
+            ('1_hour', self.now, self.now + timedelta(hours=1)),
+        ])
+
+    def test_same_day_booking_skips_day_before_reminder(self):
+        """Test a session booked a few hours ahead gets only the 1-hour reminder"""
+        parent, child = self._create_family('sameday@test.com', 'Dana')
+        same_day = self._create_appointment(parent, child, self.now + timedelta(hours=3))
+
+        AppointmentNotificationService.send_appointment_reminders(now=self.now)
+        self.assertFalse(AppointmentReminder.objects.filter(appointment=same_day).exists())
+
+        AppointmentNotificationService.send_appointment_reminders(now=self.now + timedelta(hours=2, minutes=30))
+        self.assertEqual(
+            list(AppointmentReminder.objects.filter(appointment=same_day).values_list('reminder_type', flat=True)),
+            ['1_hour']
+        )
+        self.assertFalse(
+            OutboundEmail.objects.filter(recipient_email='sameday@test.com', subject__contains='tomorrow').exists()
+        )
+
+    def test_send_appointment_reminders(self):
+        """Test due reminders are queued once per appointment and type"""
+        results = AppointmentNotificationService.send_appointment_reminders(now=self.now)
+
+        self.assertEqual(results['24_hours'], {'queued': 1, 'skipped': 0})
+        self.assertEqual(results['1_hour'], {'queued': 1, 'skipped': 0})
+        self.assertEqual(
+            set(AppointmentReminder.objects.values_list('appointment_id', 'reminder_type')),
+            {(self.tomorrow.pk, '24_hours'), (self.soon.pk, '1_hour')}
+        )
+
+        emails = OutboundEmail.objects.filter(template_name='appointment_reminder')
+        self.assertEqual(emails.count(), 2)
+        self.assertTrue(all(e.recipient_email == 'parent@test.com' for e in emails))
+        online_email = emails.get(subject__contains='tomorrow')
+        self.assertIn('https://meet.example.com/abc', online_email.text_body)
+        self.assertIn('Alice', online_email.text_body)
+        self.assertIn('QR code', emails.get(subject__contains='1 hour').text_body)
+
+        # A second run finds nothing left to send
+        results = AppointmentNotificationService.send_appointment_reminders(now=self.now)
+        self.assertEqual(results['24_hours'], {'queued': 0, 'skipped': 0})
+        self.assertEqual(emails.count(), 2)
+
+    def test_send_appointment_reminders_in_batches(self):
+        """Test small batches produce the same result"""
+        parent, child = self._create_family('other@test.com', 'Bob')
+        for minutes in (10, 20, 40):
+            self._create_appointment(parent, child, self.now + timedelta(hours=23, minutes=minutes))
+
+        results = AppointmentNotificationService.send_appointment_reminders(now=self.now, batch_size=2)
+
+        self.assertEqual(results['24_hours'], {'queued': 4, 'skipped': 0})
+        self.assertEqual(AppointmentReminder.objects.values('dispatch_id').distinct().count(), 3)
+
+    def test_reminders_honor_parent_preferences(self):
+        """Test opted-out parents are skipped and short timings get only the 1-hour reminder"""
+        opted_out_parent, opted_out_child = self._create_family('optout@test.com', 'Carl')
+        opted_out_parent.set_communication_preference('appointment_reminders', False)
+        opted_out = self._create_appointment(
+            opted_out_parent, opted_out_child, self.now + timedelta(hours=23, minutes=30)
+        )
+        self.parent.set_communication_preference('reminder_timing', '2_hours')
+
+        results = AppointmentNotificationService.send_appointment_reminders(now=self.now)
+
+        self.assertEqual(results['24_hours'], {'queued': 0, 'skipped': 2})
+        self.assertEqual(results['1_hour'], {'queued': 1, 'skipped': 0})
+        self.assertEqual(AppointmentReminder.objects.get(appointment=opted_out).status, 'Skipped')
+        self.assertFalse(OutboundEmail.objects.filter(recipient_email='optout@test.com').exists())
+
+    def test_overlapping_dispatch_sends_once(self):
+        """Test a batch already claimed by another run queues nothing"""
+        appointments = list(AppointmentNotificationService.get_due_reminders_queryset(
+            '24_hours', self.now + timedelta(hours=23), self.now + timedelta(hours=24)
+        ))
+        first, second = {'queued': 0, 'skipped': 0}, {'queued': 0, 'skipped': 0}
+
+        AppointmentNotificationService._dispatch_reminder_batch(appointments, '24_hours', first)
+        AppointmentNotificationService._dispatch_reminder_batch(appointments, '24_hours', second)
+
+        self.assertEqual(first['queued'], 1)
+        self.assertEqual(second, {'queued': 0, 'skipped': 0})
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+
+    def test_send_appointment_reminders_command(self):
+        """Test the management command reports queued reminders"""
+        out = StringIO()
+        call_command('send_appointment_reminders', stdout=out)
+
+        self.assertIn('24_hours: 1 reminders queued', out.getvalue())
+        self.assertEqual(OutboundEmail.objects.count(), 2)
@@ -1,5 +1,8 @@
 # appointments/tests/test_views_AppointmentSlotViewSet.py
 from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -27,6 +30,7 @@ class AppointmentSlotViewSetTestCase(TestCase):
 
     def setUp(self):
         """Set up test data"""
+        cache.clear()
         self.client = APIClient()
 
         # Create parent user and profile
@@ -506,6 +510,51 @@ class AppointmentSlotViewSetTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('not available for booking', response.data['error'])
 
+    def test_available_for_booking_conditional_get(self):
+        """
+        Test polling with If-None-Match gets a 304 until the slots change
+        """
+        self.authenticate_user('parent')
+        url = reverse('appointment-slots-available-for-booking')
+        params = {'psychologist_id': self.psychologist.user.id, 'session_type': 'OnlineMeeting'}
+
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse([q for q in queries.captured_queries if 'appointment_slots' in q['sql']])
+
+        # Other parameters are a different representation
+        response = self.client.get(url, {**params, 'date_to': date.today().isoformat()}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Booking, releasing and deleting slots each change the ETag
+        etags = {etag}
+        for change in (self.slot1.mark_as_booked, self.slot1.mark_as_available, self.slot2.delete):
+            change()
+            response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            etag = response['ETag']
+            etags.add(etag)
+        self.assertEqual(len(etags), 4)
+
+    def test_available_for_booking_errors_have_no_etag(self):
+        """
+        Test only successful responses carry an ETag
+        """
+        self.authenticate_user('parent')
+        url = reverse('appointment-slots-available-for-booking')
+        response = self.client.get(url, {
+            'psychologist_id': self.psychologist.user.id,
+            'session_type': 'InvalidType'
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.has_header('ETag'))
+
     def test_delete_slot_success(self):
         """
         Test successful slot deletion
@@ -608,6 +657,10 @@ class AppointmentSlotViewSetTestCase(TestCase):
         self.assertIn('utilization_rate', response.data)
         self.assertIn('by_psychologist', response.data)
 
+        # Repeat requests are served from the statistics cache
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
     def test_statistics_with_date_filter(self):
         """
         Test statistics with date filtering
@@ -618,6 +618,25 @@ class AppointmentViewSetTestCase(APITestCase):
         self.assertEqual(response.data['psychologist_name'], 'Dr. Jane Smith')
         self.assertEqual(response.data['total_slots'], 10)
 
+    def test_available_slots_conditional_get(self):
+        """Test available slots answers If-None-Match with a 304"""
+        self.authenticate_parent()
+        url = reverse('appointment-available-slots')
+        params = {'psychologist_id': str(self.psychologist.user.id), 'session_type': 'OnlineMeeting'}
+
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        self.appointment_slot1.mark_as_booked()
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
     def test_available_slots_missing_parameters(self):
         """Test getting available slots with missing required parameters"""
         self.authenticate_parent()
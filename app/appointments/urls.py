@@ -1,11 +1,15 @@
 # appointments/urls.py
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
 from .views import (
     AppointmentViewSet,
     AppointmentSlotViewSet,
-    AppointmentAnalyticsViewSet
+    AppointmentAnalyticsViewSet,
+    MyAppointmentsView,
+    UpcomingAppointmentsView,
+    AvailableSlotsView
 )
 
 # Create router for ViewSets
@@ -21,6 +25,14 @@ urlpatterns = [
 
 ]
 
+if settings.SERVER_MODE == 'asgi':
+    # Async views for the hottest reads; ahead of the router's actions, which serve them under WSGI
+    urlpatterns = [
+        path('my_appointments/', MyAppointmentsView.as_view(), name='appointment-my-appointments'),
+        path('upcoming/', UpcomingAppointmentsView.as_view(), name='appointment-upcoming'),
+        path('available_slots/', AvailableSlotsView.as_view(), name='appointment-available-slots'),
+    ] + urlpatterns
+
 # The resulting URL patterns will be:
 #
 # Main Appointment Management:
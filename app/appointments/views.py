@@ -1,4 +1,5 @@
 # appointments/views.py
+from asgiref.sync import sync_to_async
 from rest_framework import status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -59,12 +60,101 @@ from .permissions import (
     CanManageSlots
 )
 from psychologists.models import Psychologist
+from psychologists.services import AvailabilityVersionService
 from parents.services import ParentService, ParentNotFoundError
 from children.models import Child
+from core.async_views import AsyncGenericAPIView
+from core.caching import FRESH_PARAMETER, cached_statistics, conditional_get
+from core.db_router import read_from_replica
 
 logger = logging.getLogger(__name__)
 
 
+def availability_etag(request, *args, **kwargs):
+    """ETag of the requested psychologist's bookable slots"""
+    return AvailabilityVersionService.get_etag(
+        request.query_params.get('psychologist_id'),
+        request.path,
+        sorted(request.query_params.items())
+    )
+
+
+def user_appointment_filters(request):
+    """Service filters of the my_appointments and upcoming endpoints"""
+    upcoming = request.query_params.get('upcoming')
+    return {
+        'status_filter': request.query_params.get('status'),
+        'is_upcoming': upcoming == 'true' if upcoming is not None else None,
+    }
+
+
+def appointments_payload(appointments, serializer):
+    """Response body of an appointment listing"""
+    return {
+        'count': len(appointments),
+        'appointments': serializer.data
+    }
+
+
+def upcoming_payload(appointments):
+    """Upcoming appointments response body, with the next one highlighted"""
+    # Appointments are already ordered by scheduled_start_time
+    next_appointment = appointments[0] if appointments else None
+    return {
+        'count': len(appointments),
+        'next_appointment': AppointmentSummarySerializer(next_appointment).data if next_appointment else None,
+        'appointments': AppointmentSummarySerializer(appointments, many=True).data
+    }
+
+
+def parse_available_slots_params(request):
+    """
+    Validate the available_slots query parameters.
+    Returns (psychologist_id, session_type, date_from, date_to) and None,
+    or None and the error Response to send.
+    """
+    psychologist_id = request.query_params.get('psychologist_id')
+    session_type = request.query_params.get('session_type')
+    date_from_str = request.query_params.get('date_from')
+    date_to_str = request.query_params.get('date_to')
+
+    if not psychologist_id:
+        return None, Response({
+            'error': _('psychologist_id parameter is required')
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    if not session_type:
+        return None, Response({
+            'error': _('session_type parameter is required')
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    if session_type not in ['OnlineMeeting', 'InitialConsultation']:
+        return None, Response({
+            'error': _('Invalid session_type. Must be OnlineMeeting or InitialConsultation')
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    date_from = date.today()
+    date_to = date_from + timedelta(days=30)
+
+    if date_from_str:
+        try:
+            date_from = date.fromisoformat(date_from_str)
+        except ValueError:
+            return None, Response({
+                'error': _('Invalid date_from format. Use YYYY-MM-DD')
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    if date_to_str:
+        try:
+            date_to = date.fromisoformat(date_to_str)
+        except ValueError:
+            return None, Response({
+                'error': _('Invalid date_to format. Use YYYY-MM-DD')
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    return (psychologist_id, session_type, date_from, date_to), None
+
+
 class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
     """
     ViewSet for appointment management
@@ -74,6 +164,7 @@ class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
         'child', 'psychologist__user', 'parent__user'
     ).prefetch_related('appointment_slots').all()
     permission_classes = [permissions.IsAuthenticated]
+    cursor_ordering = '-created_at'
     def get_object(self):
         """
         Override to use service layer for access control
@@ -288,18 +379,13 @@ class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
         try:
             # Get appointments using service with proper filtering
             appointments = AppointmentManagementService.get_user_appointments(
-                user=request.user,
-                status_filter=request.query_params.get('status'),
-                is_upcoming=request.query_params.get('upcoming') == 'true' if 'upcoming' in request.query_params else None
+                user=request.user, **user_appointment_filters(request)
             )
 
-            serializer = self.get_serializer(appointments, many=True)
+            data = appointments_payload(appointments, self.get_serializer(appointments, many=True))
 
             logger.info(f"Retrieved {len(appointments)} appointments for user: {request.user.email}")
-            return Response({
-                'count': len(appointments),
-                'appointments': serializer.data
-            }, status=status.HTTP_200_OK)
+            return Response(data, status=status.HTTP_200_OK)
 
         except Exception as e:
             logger.error(f"Error retrieving appointments for {request.user.email}: {str(e)}")
@@ -623,6 +709,7 @@ class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
                     ]
                 }
             },
+            304: {'description': 'Slots unchanged since the If-None-Match ETag'},
             400: {'description': 'Invalid parameters'},
             404: {'description': 'Psychologist not found'}
         },
@@ -630,6 +717,7 @@ class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
         tags=['Appointments']
     )
     @action(detail=False, methods=['get'])
+    @conditional_get(availability_etag)
     def available_slots(self, request):
         """
         Get available appointment slots for booking
@@ -637,54 +725,19 @@ class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
         """
         try:
             # Parse and validate query parameters
-            psychologist_id = request.query_params.get('psychologist_id')
-            session_type = request.query_params.get('session_type')
-            date_from_str = request.query_params.get('date_from')
-            date_to_str = request.query_params.get('date_to')
-
-            if not psychologist_id:
-                return Response({
-                    'error': _('psychologist_id parameter is required')
-                }, status=status.HTTP_400_BAD_REQUEST)
-
-            if not session_type:
-                return Response({
-                    'error': _('session_type parameter is required')
-                }, status=status.HTTP_400_BAD_REQUEST)
-
-            if session_type not in ['OnlineMeeting', 'InitialConsultation']:
-                return Response({
-                    'error': _('Invalid session_type. Must be OnlineMeeting or InitialConsultation')
-                }, status=status.HTTP_400_BAD_REQUEST)
+            params, error = parse_available_slots_params(request)
+            if error:
+                return error
+            psychologist_id, session_type, date_from, date_to = params
 
             # Get psychologist
             try:
-                psychologist = Psychologist.objects.get(user__id=psychologist_id)
+                psychologist = Psychologist.objects.select_related('user').get(user__id=psychologist_id)
             except Psychologist.DoesNotExist:
                 return Response({
                     'error': _('Psychologist not found')
                 }, status=status.HTTP_404_NOT_FOUND)
 
-            # Parse dates
-            date_from = date.today()
-            date_to = date_from + timedelta(days=30)
-
-            if date_from_str:
-                try:
-                    date_from = date.fromisoformat(date_from_str)
-                except ValueError:
-                    return Response({
-                        'error': _('Invalid date_from format. Use YYYY-MM-DD')
-                    }, status=status.HTTP_400_BAD_REQUEST)
-
-            if date_to_str:
-                try:
-                    date_to = date.fromisoformat(date_to_str)
-                except ValueError:
-                    return Response({
-                        'error': _('Invalid date_to format. Use YYYY-MM-DD')
-                    }, status=status.HTTP_400_BAD_REQUEST)
-
             # Get available slots using service
             availability_data = AppointmentBookingService.get_available_booking_slots(
                 psychologist, session_type, date_from, date_to
@@ -809,20 +862,7 @@ class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
                 is_upcoming=True
             )
 
-            # Find next appointment
-            next_appointment = None
-            if appointments:
-                # Appointments are already ordered by scheduled_start_time
-                next_appointment = appointments[0]
-
-            serializer = AppointmentSummarySerializer(appointments, many=True)
-            next_appointment_serializer = AppointmentSummarySerializer(next_appointment) if next_appointment else None
-
-            return Response({
-                'count': len(appointments),
-                'next_appointment': next_appointment_serializer.data if next_appointment_serializer else None,
-                'appointments': serializer.data
-            }, status=status.HTTP_200_OK)
+            return Response(upcoming_payload(appointments), status=status.HTTP_200_OK)
 
         except Exception as e:
             logger.error(f"Error getting upcoming appointments for {request.user.email}: {str(e)}")
@@ -870,6 +910,201 @@ class AppointmentViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class MyAppointmentsView(AsyncGenericAPIView):
+    """
+    Current user's appointments (async, routed under ASGI)
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAppointmentParticipant]
+    serializer_class = AppointmentSummarySerializer
+
+    @extend_schema(
+        responses={
+            200: AppointmentSummarySerializer(many=True),
+            404: {'description': 'User profile not found'}
+        },
+        description="Get current user's appointments",
+        tags=['Appointments']
+    )
+    async def get(self, request):
+        """
+        Get current user's appointments
+        GET /api/appointments/my-appointments/
+        """
+        try:
+            # Get appointments using service with proper filtering
+            appointments = await AppointmentManagementService.aget_user_appointments(
+                user=request.user, **user_appointment_filters(request)
+            )
+
+            data = await sync_to_async(
+                lambda: appointments_payload(appointments, self.get_serializer(appointments, many=True))
+            )()
+
+            logger.info(f"Retrieved {len(appointments)} appointments for user: {request.user.email}")
+            return Response(data, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Error retrieving appointments for {request.user.email}: {str(e)}")
+            return Response({
+                'error': _('Failed to retrieve appointments')
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class UpcomingAppointmentsView(AsyncGenericAPIView):
+    """
+    Current user's upcoming appointments (async, routed under ASGI)
+    """
+    permission_classes = [permissions.IsAuthenticated, AppointmentViewPermissions]
+    serializer_class = AppointmentSummarySerializer
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='status',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Filter by appointment status'
+            ),
+            OpenApiParameter(
+                name='upcoming',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description='Filter for upcoming appointments only'
+            )
+        ],
+        responses={
+            200: {
+                'description': 'Upcoming appointments',
+                'example': {
+                    'count': 3,
+                    'next_appointment': {
+                        'appointment_id': 'uuid',
+                        'scheduled_start_time': '2024-01-15T10:00:00Z',
+                        'child_name': 'John Doe'
+                    },
+                    'appointments': []
+                }
+            }
+        },
+        description="Get upcoming appointments with next appointment highlighted",
+        tags=['Appointments']
+    )
+    async def get(self, request):
+        """
+        Get upcoming appointments
+        GET /api/appointments/upcoming/
+        """
+        try:
+            # Get upcoming appointments using service
+            appointments = await AppointmentManagementService.aget_user_appointments(
+                user=request.user,
+                status_filter=request.query_params.get('status'),
+                is_upcoming=True
+            )
+
+            data = await sync_to_async(upcoming_payload)(appointments)
+
+            return Response(data, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Error getting upcoming appointments for {request.user.email}: {str(e)}")
+            return Response({
+                'error': _('Failed to get upcoming appointments')
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AvailableSlotsView(AsyncGenericAPIView):
+    """
+    Bookable slots of a psychologist (async, routed under ASGI)
+    """
+    permission_classes = [permissions.IsAuthenticated, IsMarketplaceUser]
+    serializer_class = BookingAvailabilitySerializer
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='psychologist_id',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Psychologist ID to get availability for'
+            ),
+            OpenApiParameter(
+                name='session_type',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Session type: OnlineMeeting or InitialConsultation'
+            ),
+            OpenApiParameter(
+                name='date_from',
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description='Start date for availability search (default: today)'
+            ),
+            OpenApiParameter(
+                name='date_to',
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description='End date for availability search (default: +30 days)'
+            )
+        ],
+        responses={
+            200: {
+                'description': 'Available booking slots',
+                'example': {
+                    'psychologist_name': 'Dr. Jane Smith',
+                    'session_type': 'OnlineMeeting',
+                    'total_slots': 25,
+                    'available_slots': [
+                        {
+                            'slot_id': 123,
+                            'date': '2024-01-15',
+                            'start_time': '10:00',
+                            'end_time': '11:00',
+                            'session_types': ['OnlineMeeting']
+                        }
+                    ]
+                }
+            },
+            304: {'description': 'Slots unchanged since the If-None-Match ETag'},
+            400: {'description': 'Invalid parameters'},
+            404: {'description': 'Psychologist not found'}
+        },
+        description="Get available appointment slots for booking",
+        tags=['Appointments']
+    )
+    @conditional_get(availability_etag)
+    async def get(self, request):
+        """
+        Get available appointment slots for booking
+        GET /api/appointments/available-slots/?psychologist_id=uuid&session_type=OnlineMeeting
+        """
+        try:
+            # Parse and validate query parameters
+            params, error = parse_available_slots_params(request)
+            if error:
+                return error
+            psychologist_id, session_type, date_from, date_to = params
+
+            # Get psychologist
+            try:
+                psychologist = await Psychologist.objects.select_related('user').aget(user__id=psychologist_id)
+            except Psychologist.DoesNotExist:
+                return Response({
+                    'error': _('Psychologist not found')
+                }, status=status.HTTP_404_NOT_FOUND)
+
+            # Get available slots using service
+            availability_data = await AppointmentBookingService.aget_available_booking_slots(
+                psychologist, session_type, date_from, date_to
+            )
+
+            return Response(availability_data, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Error getting available slots for {request.user.email}: {str(e)}")
+            return Response({
+                'error': _('Failed to get available slots')
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
@@ -881,6 +1116,7 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
     """
     queryset = AppointmentSlot.objects.select_related('psychologist__user', 'availability_block').all()
     permission_classes = [permissions.IsAuthenticated]
+    cursor_ordering = '-created_at'
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -913,33 +1149,25 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
         """Filter queryset based on user permissions and action"""
         queryset = super().get_queryset()
 
-
         # For list actions, apply filtering to show appropriate slots
         if self.action == 'list':
-            print("Branch: list action")
             # Admins can see all slots
             if self.request.user.is_admin or self.request.user.is_staff:
-                print("Returning admin view")
                 return queryset
 
             # Psychologists can see their own slots
             elif self.request.user.user_type == 'Psychologist':
-                print("Branch: list - psychologist filtering")
                 try:
                     psychologist = PsychologistService.get_psychologist_by_user(self.request.user)
                     if psychologist:
                         filtered = queryset.filter(psychologist=psychologist)
-                        print(f"Filtered queryset count: {filtered.count()}")
                         return filtered
-                except Exception as e:
-                    print(f"Exception getting psychologist: {e}")
+                except Exception:
                     pass
-                print("Returning empty queryset for psychologist")
                 return queryset.none()
 
             # Parents can see available slots from marketplace-visible psychologists
             elif self.request.user.user_type == 'Parent':
-                print("Branch: list - parent filtering")
                 filtered = queryset.filter(
                     is_booked=False,
                     slot_date__gte=date.today(),
@@ -950,16 +1178,13 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
                     models.Q(psychologist__offers_initial_consultation=True) |
                     models.Q(psychologist__offers_online_sessions=True)
                 )
-                print(f"Parent filtered queryset count: {filtered.count()}")
                 return filtered
 
             # Default for list: no access
-            print("Branch: list - default no access")
             return queryset.none()
 
         # For marketplace/booking actions, apply parent filtering
         elif self.action in ['available_for_booking', 'booking_availability']:
-            print("Branch: marketplace/booking actions")
             filtered = queryset.filter(
                 is_booked=False,
                 slot_date__gte=date.today(),
@@ -970,29 +1195,22 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
                 models.Q(psychologist__offers_initial_consultation=True) |
                 models.Q(psychologist__offers_online_sessions=True)
             )
-            print(f"Marketplace filtered queryset count: {filtered.count()}")
             return filtered
 
         # For psychologist-specific actions
         elif self.action == 'my_slots':
-            print("Branch: my_slots action")
             if self.request.user.user_type == 'Psychologist':
                 try:
                     psychologist = PsychologistService.get_psychologist_by_user(self.request.user)
                     if psychologist:
                         filtered = queryset.filter(psychologist=psychologist)
-                        print(f"My slots filtered queryset count: {filtered.count()}")
                         return filtered
-                except Exception as e:
-                    print(f"Exception in my_slots: {e}")
+                except Exception:
                     pass
-            print("Returning empty queryset for my_slots")
             return queryset.none()
 
         # For detail actions (retrieve, update, destroy), return ALL slots
         else:
-            print(f"Branch: detail action ({self.action}) - returning full queryset")
-            print(f"Full queryset count: {queryset.count()}")
             return queryset
 
     def get_current_psychologist(self):
@@ -1023,7 +1241,10 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
             date_from = request.query_params.get('date_from')
             date_to = request.query_params.get('date_to')
 
-            queryset = AppointmentSlot.objects.filter(psychologist=psychologist)
+            # is_available_for_booking reads slot.psychologist and its user
+            queryset = AppointmentSlot.objects.filter(
+                psychologist=psychologist
+            ).select_related('psychologist__user')
 
             if date_from:
                 try:
@@ -1282,12 +1503,14 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
                     ]
                 }
             },
+            304: {'description': 'Slots unchanged since the If-None-Match ETag'},
             400: {'description': 'Invalid parameters'}
         },
         description="Get available appointment slots for booking",
         tags=['Appointment Slots']
     )
     @action(detail=False, methods=['get'])
+    @conditional_get(availability_etag)
     def available_for_booking(self, request):
         """
         Get available appointment slots for booking
@@ -1488,6 +1711,7 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @extend_schema(
+        parameters=[FRESH_PARAMETER],
         responses={
             200: {
                 'description': 'Slot statistics',
@@ -1506,6 +1730,8 @@ class AppointmentSlotViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
         tags=['Appointment Slots']
     )
     @action(detail=False, methods=['get'])
+    @cached_statistics()
+    @read_from_replica()
     def statistics(self, request):
         """
         Get appointment slot statistics
@@ -1660,6 +1886,7 @@ class AppointmentAnalyticsViewSet(GenericViewSet):
 
     @extend_schema(
         parameters=[
+            FRESH_PARAMETER,
             OpenApiParameter(
                 name='psychologist_id',
                 type=OpenApiTypes.UUID,
@@ -1708,6 +1935,8 @@ class AppointmentAnalyticsViewSet(GenericViewSet):
         tags=['Appointment Analytics']
     )
     @action(detail=False, methods=['get'])
+    @cached_statistics(vary_on_user=True)
+    @read_from_replica()
     def psychologist_stats(self, request):
         """
         Get appointment statistics for a psychologist
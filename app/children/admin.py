@@ -4,10 +4,16 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from django.urls import reverse
 from django.db.models import Count, Q
+from django.core.cache import caches
 from django.utils import timezone
 from datetime import date
 import json
 
+from core import caching
+from core.admin import ProfileCompletenessFilter
+from core.exports import export_actions
+from core.pagination import EstimatedCountPaginator
+from .exports import ChildExport
 from .models import Child
 
 
@@ -49,6 +55,10 @@ class ChildAdmin(admin.ModelAdmin):
         'primary_language',
     ]
 
+    list_select_related = ['parent__user']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     readonly_fields = [
         'id',
         'parent_link',
@@ -212,7 +222,7 @@ class ChildAdmin(admin.ModelAdmin):
                     Q(consent_forms_signed__isnull=True) | Q(consent_forms_signed__exact={})
                 )
 
-    list_filter = list_filter + [AgeRangeFilter, ConsentStatusFilter]
+    list_filter = list_filter + [AgeRangeFilter, ConsentStatusFilter, ProfileCompletenessFilter]
 
     # Display methods
     def parent_email(self, obj):
@@ -246,7 +256,7 @@ class ChildAdmin(admin.ModelAdmin):
 
     def profile_completeness_display(self, obj):
         """Display profile completeness with color coding"""
-        completeness = obj.get_profile_completeness()
+        completeness = obj.profile_completeness
 
         if completeness >= 80:
             color = 'green'
@@ -265,6 +275,7 @@ class ChildAdmin(admin.ModelAdmin):
             completeness
         )
     profile_completeness_display.short_description = _('Profile Completeness')
+    profile_completeness_display.admin_order_field = 'profile_completeness'
 
     def consent_status_display(self, obj):
         """Display consent status summary"""
@@ -386,43 +397,7 @@ class ChildAdmin(admin.ModelAdmin):
             _(f'Successfully reset consent forms for {updated_count} children.')
         )
 
-    @admin.action(description=_('Export children data to CSV'))
-    def export_children_csv(self, request, queryset):
-        """Export selected children data to CSV"""
-        import csv
-        from django.http import HttpResponse
-
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="children_export.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow([
-            'ID', 'Full Name', 'Age', 'Gender', 'Parent Email',
-            'School Grade', 'Has Psychology History', 'Profile Completeness',
-            'Consent Status', 'Created Date'
-        ])
-
-        for child in queryset:
-            consent_types = Child.get_default_consent_types()
-            granted_count = sum(1 for ct in consent_types.keys() if child.get_consent_status(ct))
-            consent_status = f"{granted_count}/{len(consent_types)}"
-
-            writer.writerow([
-                str(child.id),
-                child.full_name,
-                child.age or 'Unknown',
-                child.gender or 'Not specified',
-                child.parent.user.email,
-                child.school_grade_level or 'Not specified',
-                'Yes' if child.has_psychology_history else 'No',
-                f"{child.get_profile_completeness()}%",
-                consent_status,
-                child.created_at.strftime('%Y-%m-%d')
-            ])
-
-        return response
-
-    actions = ['reset_consent_forms', 'export_children_csv']
+    actions = ['reset_consent_forms', *export_actions(ChildExport)]
 
     # Permissions
     def has_add_permission(self, request):
@@ -482,19 +457,22 @@ class ChildAdmin(admin.ModelAdmin):
         """Add extra context to changelist"""
         extra_context = extra_context or {}
 
-        # Add summary statistics
-        queryset = self.get_queryset(request)
-        extra_context.update({
-            'total_children': queryset.count(),
-            'children_with_psychology_history': queryset.filter(
-                Q(has_seen_psychologist=True) | Q(has_received_therapy=True)
-            ).count(),
-            'fully_consented_children': queryset.exclude(
-                Q(consent_forms_signed__isnull=True) | Q(consent_forms_signed__exact={})
-            ).count(),
-            'verified_parents_children': queryset.filter(
-                parent__user__is_verified=True
-            ).count(),
-        })
+        # Add summary statistics: one aggregate query, cached like the
+        # statistics endpoints
+        config = caching.get_config()
+        extra_context.update(caches[config['CACHE_ALIAS']].get_or_set(
+            f'{caching.CACHE_PREFIX}admin:children-summary',
+            lambda: Child.objects.aggregate(
+                total_children=Count('pk'),
+                children_with_psychology_history=Count(
+                    'pk', filter=Q(has_seen_psychologist=True) | Q(has_received_therapy=True)
+                ),
+                fully_consented_children=Count(
+                    'pk', filter=~Q(consent_forms_signed__isnull=True) & ~Q(consent_forms_signed__exact={})
+                ),
+                verified_parents_children=Count('pk', filter=Q(parent__user__is_verified=True)),
+            ),
+            config['CACHE_TIMEOUT']
+        ))
 
         return super().changelist_view(request, extra_context=extra_context)
\ No newline at end of file
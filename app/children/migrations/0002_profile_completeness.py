@@ -0,0 +1,18 @@
+# Generated by Django 5.1.9 on 2026-10-18 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('children', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='child',
+            name='profile_completeness',
+            field=models.FloatField(db_index=True, default=0, editable=False, help_text='Profile completeness percentage, maintained on save', verbose_name='profile completeness'),
+        ),
+    ]
@@ -8,6 +8,12 @@ from datetime import date, timedelta
 from parents.models import Parent
 
 
+class CurrentAge(models.Func):
+    """Whole years since a date, as of the database's current date"""
+    template = 'CAST(EXTRACT(YEAR FROM AGE(CURRENT_DATE, %(expressions)s)) AS integer)'
+    output_field = models.IntegerField()
+
+
 class Child(models.Model):
     """
     Child profile model - stores information about children linked to parents
@@ -181,6 +187,15 @@ class Child(models.Model):
         help_text=_("Record of signed consent forms")
     )
 
+    # Stored so profiles can be filtered and sorted by it; set in save()
+    profile_completeness = models.FloatField(
+        _('profile completeness'),
+        default=0,
+        editable=False,
+        db_index=True,
+        help_text=_("Profile completeness percentage, maintained on save")
+    )
+
     # Timestamps
     created_at = models.DateTimeField(
         _('created at'),
@@ -233,8 +248,11 @@ class Child(models.Model):
             raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
-        """Override save to run validation"""
+        """Override save to run validation and refresh the stored completeness"""
         self.full_clean()
+        self.profile_completeness = self.get_profile_completeness()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'profile_completeness'}
         super().save(*args, **kwargs)
 
     @property
@@ -1,7 +1,7 @@
 # children/permissions.py
 from rest_framework import permissions
 from django.utils.translation import gettext_lazy as _
-from parents.models import Parent
+from users.actor import get_actor
 
 
 class IsChildOwner(permissions.BasePermission):
@@ -124,11 +124,7 @@ class CanCreateChildForParent(permissions.BasePermission):
             return False
 
         # Check if parent profile exists
-        try:
-            Parent.objects.get(user=request.user)
-            return True
-        except Parent.DoesNotExist:
-            return False
+        return get_actor(request).parent is not None
 
 
 class CanManageChildConsent(permissions.BasePermission):
@@ -402,7 +402,7 @@ class ChildDetailSerializer(ChildSerializer):
     parent = ParentSummarySerializer(read_only=True)
 
     # Additional computed fields
-    profile_completeness = serializers.SerializerMethodField()
+    profile_completeness = serializers.FloatField(read_only=True)
     age_appropriate_grades = serializers.SerializerMethodField()
     consent_summary = serializers.SerializerMethodField()
 
@@ -413,10 +413,6 @@ class ChildDetailSerializer(ChildSerializer):
             'consent_summary',
         ]
 
-    def get_profile_completeness(self, obj):
-        """Get profile completeness percentage"""
-        return obj.get_profile_completeness()
-
     def get_age_appropriate_grades(self, obj):
         """Get age-appropriate grade suggestions"""
         return obj.get_age_appropriate_grade_suggestions()
@@ -462,6 +458,7 @@ class ChildSummarySerializer(serializers.ModelSerializer):
             'gender',
             'profile_picture_url',
             'school_grade_level',
+            'profile_completeness',
         ]
         read_only_fields = [
             'id',
@@ -551,6 +548,13 @@ class ChildSearchSerializer(serializers.Serializer):
     has_psychology_history = serializers.BooleanField(required=False)
     created_after = serializers.DateTimeField(required=False)
     created_before = serializers.DateTimeField(required=False)
+    min_profile_completeness = serializers.FloatField(min_value=0, max_value=100, required=False)
+    max_profile_completeness = serializers.FloatField(min_value=0, max_value=100, required=False)
+    ordering = serializers.ChoiceField(
+        choices=['profile_completeness', '-profile_completeness', 'created_at', '-created_at'],
+        required=False,
+        help_text=_("Sort order; defaults to name")
+    )
 
     def validate(self, attrs):
         """Validate search parameters"""
@@ -571,6 +575,14 @@ class ChildSearchSerializer(serializers.Serializer):
                 'created_after': _("Start date must be before end date")
             })
 
+        # Validate profile completeness range
+        min_completeness = attrs.get('min_profile_completeness')
+        max_completeness = attrs.get('max_profile_completeness')
+        if min_completeness is not None and max_completeness is not None and min_completeness > max_completeness:
+            raise serializers.ValidationError({
+                'min_profile_completeness': _("Minimum profile completeness must be less than maximum profile completeness")
+            })
+
         return attrs
 
 
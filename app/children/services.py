@@ -2,15 +2,17 @@
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils import timezone
 from datetime import date, timedelta
 import logging
 from typing import Optional, Dict, Any, List, Tuple
 
-from .models import Child
+from core.read_cache import cached_read
+from .models import Child, CurrentAge
 from parents.models import Parent
 from users.models import User
+from users.actor import get_user_profile
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,13 @@ class ChildService:
     Service class for child profile management and business logic
     """
 
+    # (label, min age, max age) buckets of the age distribution
+    AGE_BUCKETS = [
+        ('5-8', 5, 8),
+        ('9-12', 9, 12),
+        ('13-17', 13, 17),
+    ]
+
     @staticmethod
     def get_child_by_id(child_id: str) -> Optional[Child]:
         """
@@ -67,11 +76,14 @@ class ChildService:
         return child
 
     @staticmethod
+    @cached_read('parent', arg='parent')
     def get_children_for_parent(parent: Parent) -> List[Child]:
         """
         Get all children for a specific parent
         """
-        return Child.objects.filter(parent=parent).order_by('first_name', 'last_name')
+        return Child.objects.filter(parent=parent).select_related('parent__user').order_by(
+            'first_name', 'last_name'
+        )
 
     @staticmethod
     def create_child_profile(parent: Parent, child_data: Dict[str, Any]) -> Child:
@@ -238,7 +250,7 @@ class ChildService:
             'consent_summary': ChildService.get_consent_summary(child),
 
             # Profile metrics
-            'profile_completeness': child.get_profile_completeness(),
+            'profile_completeness': child.profile_completeness,
 
             # Timestamps
             'created_at': child.created_at,
@@ -345,6 +357,50 @@ class ChildService:
 
         return summary
 
+    @staticmethod
+    def get_platform_statistics() -> Dict[str, Any]:
+        """
+        Platform-wide child statistics for the admin dashboard
+
+        Computed with one conditional aggregate query grouped by gender.
+        Ages are worked out by the database relative to the current date.
+        """
+        counts = {
+            'total': Count('pk'),
+            'with_history': Count('pk', filter=Q(has_seen_psychologist=True) | Q(has_received_therapy=True)),
+            'verified_parents': Count('pk', filter=Q(parent__user__is_verified=True)),
+            'active_profiles': Count('pk', filter=Q(parent__user__is_active=True)),
+        }
+        for index, (_label, low, high) in enumerate(ChildService.AGE_BUCKETS):
+            counts[f'age_{index}'] = Count('pk', filter=Q(current_age__gte=low, current_age__lte=high))
+
+        rows = (
+            Child.objects.annotate(current_age=CurrentAge('date_of_birth'))
+            .values('gender').annotate(**counts).order_by()
+        )
+
+        totals = dict.fromkeys(counts, 0)
+        gender_distribution = {}
+        for row in rows:
+            for key in counts:
+                totals[key] += row[key]
+            if row['gender']:
+                gender_distribution[row['gender']] = row['total']
+
+        return {
+            'total_children': totals['total'],
+            'age_distribution': {
+                label: totals[f'age_{index}']
+                for index, (label, _low, _high) in enumerate(ChildService.AGE_BUCKETS)
+            },
+            'psychology_history': {
+                'with_history': totals['with_history'],
+                'without_history': totals['total'] - totals['with_history'],
+            },
+            'gender_distribution': gender_distribution,
+            'verified_parents': totals['verified_parents'],
+            'active_profiles': totals['active_profiles'],
+        }
 
     @staticmethod
     def search_children(search_params: Dict[str, Any], user: User) -> List[Child]:
@@ -356,13 +412,12 @@ class ChildService:
         # Apply access control filtering based on user type
         if user.user_type == 'Parent':
             # Parents can only see their own children
-            try:
-                parent = Parent.objects.get(user=user)
-                queryset = queryset.filter(parent=parent)
-            except Parent.DoesNotExist:
+            parent = get_user_profile(user, 'parent_profile')
+            if parent is None:
                 # If parent profile doesn't exist, return empty queryset
                 logger.warning(f"Parent profile not found for user {user.email}")
                 return []
+            queryset = queryset.filter(parent=parent)
         elif user.user_type == 'Psychologist':
             # Psychologists can see all children (or implement specific logic)
             # TODO: Implement logic to filter children psychologist has worked with
@@ -421,11 +476,22 @@ class ChildService:
         if search_params.get('created_before'):
             queryset = queryset.filter(created_at__lte=search_params['created_before'])
 
+        # Profile completeness filtering
+        if search_params.get('min_profile_completeness') is not None:
+            queryset = queryset.filter(profile_completeness__gte=search_params['min_profile_completeness'])
+
+        if search_params.get('max_profile_completeness') is not None:
+            queryset = queryset.filter(profile_completeness__lte=search_params['max_profile_completeness'])
+
         # Debug logging to help identify the issue
         logger.debug(f"User {user.email} search query: {queryset.query}")
         logger.debug(f"Search params: {search_params}")
 
-        result = list(queryset.order_by('first_name', 'last_name'))
+        ordering = ['first_name', 'last_name']
+        if search_params.get('ordering'):
+            ordering.insert(0, search_params['ordering'])
+
+        result = list(queryset.order_by(*ordering))
         logger.debug(f"Search results count: {len(result)} for user {user.email}")
 
         return result
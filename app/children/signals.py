@@ -0,0 +1,16 @@
+# children/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core import read_cache
+from .models import Child
+
+
+@receiver(post_save, sender=Child)
+@receiver(post_delete, sender=Child)
+def invalidate_parent_reads(sender, instance, raw=False, **kwargs):
+    """
+    Drop the parent's cached children list when one of their children changes
+    """
+    if not raw:
+        read_cache.invalidate('parent', instance.parent_id)
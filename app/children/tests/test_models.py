@@ -344,6 +344,22 @@ class ChildModelTest(TestCase):
         completeness = complete_child.get_profile_completeness()
         self.assertGreater(completeness, 90.0)  # Should be nearly complete
 
+    def test_profile_completeness_is_stored(self):
+        """Test the stored completeness follows profile changes"""
+        child = Child.objects.create(
+            parent=self.parent_profile,
+            first_name='Minimal',
+            date_of_birth=date.today() - timedelta(days=365 * 8)
+        )
+        self.assertEqual(child.profile_completeness, 60.0)
+
+        child.gender = 'Female'
+        child.save(update_fields=['gender'])
+        child.refresh_from_db()
+
+        self.assertEqual(child.profile_completeness, child.get_profile_completeness())
+        self.assertGreater(child.profile_completeness, 60.0)
+
     def test_age_appropriate_grade_suggestions(self):
         """Test grade suggestions based on age"""
         # Create a 10-year-old child (age 10 should suggest grades for 10-year-olds)
@@ -618,6 +618,43 @@ class ChildServiceTestCase(TestCase):
 
         mock_logger.error.assert_called()
 
+    def test_get_platform_statistics(self):
+        """Test statistics come from one query, with ages relative to today"""
+        today = date.today()
+
+        def born(years_ago, days_later=0):
+            try:
+                birthday = today.replace(year=today.year - years_ago)
+            except ValueError:  # 29 February
+                birthday = today.replace(year=today.year - years_ago, day=28)
+            return birthday + timedelta(days=days_later)
+
+        children = [
+            # (first name, date of birth, gender, has seen a psychologist)
+            ('Eight', born(8), 'Female', True),
+            ('AlmostNine', born(9, days_later=1), 'Male', False),
+            ('Nine', born(9), 'Male', False),
+            ('Thirteen', born(13), '', False),
+        ]
+        for first_name, date_of_birth, gender, has_seen in children:
+            Child.objects.create(
+                parent=self.parent,
+                first_name=first_name,
+                date_of_birth=date_of_birth,
+                gender=gender,
+                has_seen_psychologist=has_seen,
+            )
+
+        with self.assertNumQueries(1):
+            statistics = ChildService.get_platform_statistics()
+
+        self.assertEqual(statistics['total_children'], 4)
+        self.assertEqual(statistics['age_distribution'], {'5-8': 2, '9-12': 1, '13-17': 1})
+        self.assertEqual(statistics['gender_distribution'], {'Female': 1, 'Male': 2})
+        self.assertEqual(statistics['psychology_history'], {'with_history': 1, 'without_history': 3})
+        self.assertEqual(statistics['verified_parents'], 4)
+        self.assertEqual(statistics['active_profiles'], 4)
+
     def tearDown(self):
         """Clean up after tests"""
         # Clean up is automatic with Django TestCase
@@ -6,6 +6,7 @@ from decimal import Decimal
 from unittest.mock import patch, Mock
 
 from django.test import TestCase
+from django.core.cache import cache
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -26,6 +27,7 @@ class BaseChildTestCase(TestCase):
 
     def setUp(self):
         """Set up test data"""
+        cache.clear()
         self.client = APIClient()
 
         # Create test users
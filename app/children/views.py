@@ -38,6 +38,8 @@ from .permissions import (
     ChildProfilePermissions
 )
 from parents.services import ParentService, ParentNotFoundError
+from core.caching import FRESH_PARAMETER, cached_statistics
+from core.db_router import read_from_replica
 
 logger = logging.getLogger(__name__)
 
@@ -408,7 +410,7 @@ class ChildProfileViewSet(GenericViewSet):
                 'display_name': child.display_name,
                 'age': child.age,
                 'age_in_months': child.age_in_months,
-                'profile_completeness': child.get_profile_completeness(),
+                'profile_completeness': child.profile_completeness,
                 'consent_summary': ChildService.get_consent_summary(child),
                 'has_psychology_history': child.has_psychology_history,
                 'age_appropriate_grades': child.get_age_appropriate_grade_suggestions(),
@@ -577,6 +579,7 @@ class ChildManagementViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
     """
     queryset = Child.objects.select_related('parent__user').all()
     permission_classes = [permissions.IsAuthenticated, IsChildOwnerOrReadOnly]
+    cursor_ordering = '-created_at'
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -682,6 +685,7 @@ class ChildManagementViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @extend_schema(
+        parameters=[FRESH_PARAMETER],
         responses={
             200: {
                 'description': 'Platform-wide child statistics',
@@ -693,10 +697,12 @@ class ChildManagementViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
             },
             403: {'description': 'Permission denied'}
         },
-        description="Get platform-wide child statistics (Admin only)",
+        description="Get platform-wide child statistics, cached briefly (Admin only)",
         tags=['Child Management']
     )
     @action(detail=False, methods=['get'])
+    @cached_statistics()
+    @read_from_replica()
     def statistics(self, request):
         """
         Get platform-wide child statistics
@@ -709,40 +715,7 @@ class ChildManagementViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin)
             }, status=status.HTTP_403_FORBIDDEN)
 
         try:
-            queryset = Child.objects.all()
-
-            # Basic counts
-            total_children = queryset.count()
-
-            # Age distribution
-            from django.db import models
-            age_distribution = {
-                '5-8': queryset.filter(date_of_birth__gte='2016-01-01', date_of_birth__lte='2019-12-31').count(),
-                '9-12': queryset.filter(date_of_birth__gte='2012-01-01', date_of_birth__lte='2015-12-31').count(),
-                '13-17': queryset.filter(date_of_birth__gte='2007-01-01', date_of_birth__lte='2011-12-31').count()
-            }
-
-            # Psychology history
-            has_psychology_history = queryset.filter(
-                models.Q(has_seen_psychologist=True) | models.Q(has_received_therapy=True)
-            ).count()
-
-            # Gender distribution (excluding null/empty)
-            gender_stats = {}
-            for gender in queryset.exclude(gender__isnull=True).exclude(gender='').values_list('gender', flat=True).distinct():
-                gender_stats[gender] = queryset.filter(gender=gender).count()
-
-            statistics = {
-                'total_children': total_children,
-                'age_distribution': age_distribution,
-                'psychology_history': {
-                    'with_history': has_psychology_history,
-                    'without_history': total_children - has_psychology_history
-                },
-                'gender_distribution': gender_stats,
-                'verified_parents': queryset.filter(parent__user__is_verified=True).count(),
-                'active_profiles': queryset.filter(parent__user__is_active=True).count()
-            }
+            statistics = ChildService.get_platform_statistics()
 
             logger.info(f"Child statistics accessed by admin {request.user.email}")
             return Response(statistics, status=status.HTTP_200_OK)
@@ -1,3 +1,32 @@
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
 
-# Register your models here.
+
+class ProfileCompletenessFilter(admin.SimpleListFilter):
+    """Filter profiles by their stored profile_completeness score"""
+    title = _('Profile Completeness')
+    parameter_name = 'completeness'
+
+    RANGES = {
+        'low': (None, 50),
+        'medium': (50, 80),
+        'high': (80, None),
+    }
+
+    def lookups(self, request, model_admin):
+        return (
+            ('low', _('Under 50%')),
+            ('medium', _('50-79%')),
+            ('high', _('80% and above')),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() not in self.RANGES:
+            return queryset
+
+        low, high = self.RANGES[self.value()]
+        if low is not None:
+            queryset = queryset.filter(profile_completeness__gte=low)
+        if high is not None:
+            queryset = queryset.filter(profile_completeness__lt=high)
+        return queryset
@@ -0,0 +1,58 @@
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework.generics import GenericAPIView
+
+
+class AsyncGenericAPIView(GenericAPIView):
+    """
+    GenericAPIView with `async def` handlers
+
+    Django serves it natively under ASGI (and through async_to_sync under
+    WSGI), so a request waiting on the database or a slow client no longer
+    holds a worker. DRF's own authentication, permission and throttle checks
+    are sync code and run with sync_to_async; handlers do their queries with
+    the async ORM and isolate any other sync-only work (serializers,
+    pagination) with sync_to_async too.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def apaginate_queryset(self, queryset):
+        """paginate_queryset() off the event loop: paginators count and slice synchronously"""
+        return await sync_to_async(self.paginate_queryset)(queryset)
+
+    async def aget_object(self):
+        """get_object() with the async ORM: same lookup, 404 and object permission check"""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError):
+            raise Http404
+        await sync_to_async(self.check_object_permissions)(self.request, obj)
+        return obj
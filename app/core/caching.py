@@ -0,0 +1,223 @@
+import hashlib
+import json
+import logging
+import time
+import uuid
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': 60,
+    'STALE_TIMEOUT': 300,
+    'LOCK_TIMEOUT': 30,
+    'WAIT_TIMEOUT': 5,
+    'WAIT_INTERVAL': 0.05,
+}
+CACHE_PREFIX = 'statistics-cache:'
+EVENTS = ('hit', 'miss', 'stale', 'wait', 'fresh')
+FRESH_VALUES = ('1', 'true', 'yes')
+
+# Endpoint names of every decorated view, for reporting
+CACHED_ENDPOINTS = set()
+
+FRESH_PARAMETER = OpenApiParameter(
+    name='fresh',
+    type=OpenApiTypes.BOOL,
+    location=OpenApiParameter.QUERY,
+    description='Recompute instead of serving the cached response (admins only)',
+    required=False
+)
+
+
+def get_config():
+    """ADMIN_STATISTICS settings merged over the defaults"""
+    return {**DEFAULT_CONFIG, **getattr(settings, 'ADMIN_STATISTICS', {})}
+
+
+def cached_statistics(vary_on_user=False):
+    """
+    Cache the 200 responses of an expensive statistics action
+
+    Responses are keyed by endpoint and normalized query parameters and are
+    fresh for CACHE_TIMEOUT seconds. After that, only one worker recomputes
+    (single-flight, via a cache.add lock); the others serve the stale copy
+    for up to STALE_TIMEOUT more seconds, or wait for the new one when
+    there is none. Admins can pass ?fresh=1 to bypass the cache.
+
+    Shared entries are only used for admin/staff requests, so views keep
+    enforcing their own permission checks for everyone else. With
+    `vary_on_user` every user gets their own entry instead.
+    """
+    def decorator(func):
+        endpoint = func.__qualname__
+        CACHED_ENDPOINTS.add(endpoint)
+
+        @wraps(func)
+        def wrapper(view, request, *args, **kwargs):
+            user = request.user
+            is_admin = bool(getattr(user, 'is_admin', False) or user.is_staff)
+            if not (vary_on_user or is_admin):
+                return func(view, request, *args, **kwargs)
+
+            config = get_config()
+            cache = caches[config['CACHE_ALIAS']]
+            key = _cache_key(endpoint, request, user.pk if vary_on_user else None)
+
+            def compute():
+                response = func(view, request, *args, **kwargs)
+                if response.status_code == status.HTTP_200_OK:
+                    cache.set(key, {
+                        'data': response.data,
+                        'expires_at': time.time() + config['CACHE_TIMEOUT'],
+                    }, config['CACHE_TIMEOUT'] + config['STALE_TIMEOUT'])
+                return response
+
+            if is_admin and request.query_params.get('fresh', '').lower() in FRESH_VALUES:
+                _count(cache, endpoint, 'fresh')
+                return _tagged(compute(), 'FRESH')
+
+            entry = cache.get(key)
+            if entry is not None and entry['expires_at'] > time.time():
+                _count(cache, endpoint, 'hit')
+                return _tagged(Response(entry['data']), 'HIT')
+
+            lock_key = f'{key}:lock'
+            token = uuid.uuid4().hex
+            if cache.add(lock_key, token, config['LOCK_TIMEOUT']):
+                _count(cache, endpoint, 'miss')
+                try:
+                    return _tagged(compute(), 'MISS')
+                finally:
+                    if cache.get(lock_key) == token:
+                        cache.delete(lock_key)
+
+            # Another worker is recomputing
+            if entry is not None:
+                _count(cache, endpoint, 'stale')
+                return _tagged(Response(entry['data']), 'STALE')
+
+            _count(cache, endpoint, 'wait')
+            deadline = time.monotonic() + config['WAIT_TIMEOUT']
+            while time.monotonic() < deadline:
+                time.sleep(config['WAIT_INTERVAL'])
+                entry = cache.get(key)
+                if entry is not None:
+                    return _tagged(Response(entry['data']), 'HIT')
+
+            logger.warning(f"Timed out waiting for cached {endpoint}; computing it directly")
+            return _tagged(compute(), 'MISS')
+
+        return wrapper
+    return decorator
+
+
+def get_counters(endpoints=None):
+    """Cache event counts per endpoint, e.g. {'X.statistics': {'hit': 3, ...}}"""
+    cache = caches[get_config()['CACHE_ALIAS']]
+    counters = {}
+    for endpoint in sorted(endpoints or CACHED_ENDPOINTS):
+        keys = {event: _counter_key(endpoint, event) for event in EVENTS}
+        values = cache.get_many(list(keys.values()))
+        counters[endpoint] = {event: values.get(key, 0) for event, key in keys.items()}
+    return counters
+
+
+def reset_counters(endpoints=None):
+    """Zero the cache event counts"""
+    cache = caches[get_config()['CACHE_ALIAS']]
+    cache.delete_many([
+        _counter_key(endpoint, event)
+        for endpoint in endpoints or CACHED_ENDPOINTS
+        for event in EVENTS
+    ])
+
+
+def conditional_get(etag_func):
+    """
+    Answer conditional GETs of an action from a cheap ETag
+
+    `etag_func(request, *args, **kwargs)` returns the current ETag, or None
+    to serve the request normally. A matching If-None-Match gets a 304
+    before the action runs; 304 and 200 responses carry the ETag. Permission
+    checks still run first, as for any action. Works on async handlers
+    too, calling `etag_func` with sync_to_async.
+    """
+    def decorator(func):
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(view, request, *args, **kwargs):
+                etag = await sync_to_async(etag_func)(request, *args, **kwargs)
+                if etag is None:
+                    return await func(view, request, *args, **kwargs)
+
+                etag = quote_etag(etag)
+                not_modified = get_conditional_response(request, etag=etag)
+                if not_modified is not None:
+                    return _with_etag(not_modified, etag)
+
+                return _with_etag(await func(view, request, *args, **kwargs), etag)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(view, request, *args, **kwargs):
+            etag = etag_func(request, *args, **kwargs)
+            if etag is None:
+                return func(view, request, *args, **kwargs)
+
+            etag = quote_etag(etag)
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return _with_etag(not_modified, etag)
+
+            return _with_etag(func(view, request, *args, **kwargs), etag)
+
+        return wrapper
+    return decorator
+
+
+def _with_etag(response, etag):
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        response['ETag'] = etag
+    return response
+
+
+def _cache_key(endpoint, request, user_id):
+    params = {
+        name: sorted(values)
+        for name, values in request.query_params.lists()
+        if name != 'fresh'
+    }
+    digest = hashlib.md5(json.dumps([user_id, params], sort_keys=True, default=str).encode()).hexdigest()
+    return f'{CACHE_PREFIX}{endpoint}:{digest}'
+
+
+def _counter_key(endpoint, event):
+    return f'{CACHE_PREFIX}counter:{endpoint}:{event}'
+
+
+def _count(cache, endpoint, event):
+    key = _counter_key(endpoint, event)
+    if not cache.add(key, 1, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr()
+            cache.add(key, 1, None)
+
+
+def _tagged(response, outcome):
+    response['X-Cache'] = outcome
+    return response
@@ -0,0 +1,43 @@
+import logging
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+def summarize_pool(pool):
+    """Connection use, queueing and wait time of a psycopg_pool.ConnectionPool"""
+    stats = pool.get_stats()
+    queued = stats.get('requests_queued', 0)
+    wait_ms = stats.get('requests_wait_ms', 0)
+    return {
+        'pooled': True,
+        'min_size': stats['pool_min'],
+        'max_size': stats['pool_max'],
+        'size': stats['pool_size'],
+        'idle': stats['pool_available'],
+        'in_use': stats['pool_size'] - stats['pool_available'],
+        'waiting': stats.get('requests_waiting', 0),
+        'requests': stats.get('requests_num', 0),
+        'requests_queued': queued,
+        'wait_ms_total': wait_ms,
+        'wait_ms_avg': round(wait_ms / queued, 1) if queued else 0,
+        'request_errors': stats.get('requests_errors', 0),
+        'connections_opened': stats.get('connections_num', 0),
+        'connections_lost': stats.get('connections_lost', 0),
+    }
+
+
+def get_pool_stats():
+    """
+    Connection pool statistics of this process, per database alias
+
+    Pools are per process (one per gunicorn worker), so these numbers cover
+    the worker that answers; request counters are cumulative since it
+    started. Databases without a pool report {'pooled': False}.
+    """
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], 'pool', None)
+        stats[alias] = summarize_pool(pool) if pool is not None else {'pooled': False}
+    return stats
@@ -0,0 +1,211 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'REPLICAS': [],
+    'STICKY_COOKIE_NAME': 'db_primary_pin',
+    'STICKY_SECONDS': 5,
+    'MAX_LAG_SECONDS': 5,
+    'LAG_CHECK_INTERVAL': 5,
+    'RECEIVER_TIMEOUT_SECONDS': 60,
+}
+
+# Seconds a replica is behind its primary. NULL when its WAL receiver isn't
+# streaming or hasn't heard from the primary within RECEIVER_TIMEOUT_SECONDS
+# (%s): a disconnected replica has replayed all it received but receives
+# nothing new. A connected replica that replayed everything it received is
+# 0 behind (an idle primary makes the replay timestamp look old). Reading
+# pg_stat_wal_receiver needs the pg_read_all_stats role; without it every
+# replica reads as stale.
+LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver
+            WHERE status = 'streaming' AND last_msg_receipt_time > now() - make_interval(secs => %s)
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+@dataclass
+class RoutingState:
+    """Replica routing state of the current request"""
+    pinned: bool = False
+    wrote: bool = False
+
+
+_use_replica = ContextVar('use_replica', default=False)
+_request_state = ContextVar('replica_routing_state', default=None)
+
+# alias -> (monotonic time of the check, whether the replica was fresh)
+_lag_checks = {}
+
+
+def get_config():
+    """DATABASE_REPLICATION settings merged over the defaults"""
+    return {**DEFAULT_CONFIG, **getattr(settings, 'DATABASE_REPLICATION', {})}
+
+
+@contextmanager
+def read_from_replica():
+    """
+    Send the reads inside the block (or decorated function) to a replica
+
+    Only for read-only work that tolerates data a few seconds old:
+    marketplace browsing, analytics, statistics and exports. Writes still
+    go to the primary, and reads fall back to it when no replica is fresh,
+    inside transactions, and for clients that wrote recently. Async views
+    use the `with` form: decorating a coroutine function would leave the
+    block before the coroutine runs.
+    """
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def replica_lag(alias):
+    """
+    Replication lag of a database in seconds
+
+    Infinite when the replica isn't receiving WAL from its primary, None if
+    the lag can't be read.
+    """
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_SQL, [get_config()['RECEIVER_TIMEOUT_SECONDS']])
+            lag = cursor.fetchone()[0]
+    except DatabaseError as e:
+        logger.warning(f"Replication lag check failed for {alias}: {str(e)}")
+        return None
+
+    if lag is None:
+        logger.warning(f"Replica {alias} is not streaming WAL from its primary")
+        return float('inf')
+    return float(lag)
+
+
+def replica_is_fresh(alias):
+    """Whether a replica is reachable and within MAX_LAG_SECONDS, checked at most every LAG_CHECK_INTERVAL"""
+    config = get_config()
+    now = time.monotonic()
+    checked = _lag_checks.get(alias)
+    if checked is not None and now - checked[0] < config['LAG_CHECK_INTERVAL']:
+        return checked[1]
+
+    lag = replica_lag(alias)
+    fresh = lag is not None and lag <= config['MAX_LAG_SECONDS']
+    if lag is not None and not fresh and lag != float('inf'):
+        logger.warning(f"Replica {alias} is {lag:.1f}s behind; reading from the primary")
+    _lag_checks[alias] = (now, fresh)
+    return fresh
+
+
+def get_read_alias():
+    """Database for replica reads right now: a fresh replica, or the primary"""
+    state = _request_state.get()
+    if state is not None and (state.pinned or state.wrote):
+        return DEFAULT_DB_ALIAS
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        # Reads inside a transaction must see its writes
+        return DEFAULT_DB_ALIAS
+
+    replicas = [alias for alias in get_config()['REPLICAS'] if replica_is_fresh(alias)]
+    return random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+
+
+class ReplicaRouter:
+    """
+    Route reads inside read_from_replica() to replicas, everything else to the primary
+
+    Replicas are listed in DATABASE_REPLICATION['REPLICAS']; with none, all
+    traffic stays on the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get():
+            return None
+        return get_read_alias()
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = True
+        # Also for instances that were read from a replica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_config()['REPLICAS']}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Keep clients that just wrote on the primary (read-your-writes)
+
+    A response to a request that wrote sets a short-lived cookie; while it
+    is present, replica reads are served by the primary instead, so the
+    client never reads data older than its own writes. Later reads in the
+    writing request itself stay on the primary too.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        state = self.start(request)
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        return self.finish(request, response, state)
+
+    async def __acall__(self, request):
+        state = self.start(request)
+        token = _request_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        return self.finish(request, response, state)
+
+    def start(self, request):
+        return RoutingState(pinned=get_config()['STICKY_COOKIE_NAME'] in request.COOKIES)
+
+    def finish(self, request, response, state):
+        if state.wrote:
+            config = get_config()
+            response.set_cookie(
+                config['STICKY_COOKIE_NAME'],
+                '1',
+                max_age=config['STICKY_SECONDS'],
+                secure=request.is_secure(),
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
@@ -0,0 +1,236 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.renderers import JSONRenderer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'ENABLED': False,
+    'SERVER_TIMING': True,
+    # Budgets: requests over any of them are logged as warnings
+    'MAX_QUERIES': 30,
+    'MAX_DB_MS': 200,
+    'MAX_TOTAL_MS': 500,
+    # Recent requests kept per view for the percentiles
+    'SAMPLE_SIZE': 500,
+}
+
+
+@dataclass
+class RequestMetrics:
+    """SQL and serializer time of the current request"""
+    started: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    db_ms: float = 0
+    serializer_ms: float = 0
+
+
+_current = ContextVar('request_metrics', default=None)
+
+
+def get_config():
+    """REQUEST_METRICS settings merged over the defaults"""
+    return {**DEFAULT_CONFIG, **getattr(settings, 'REQUEST_METRICS', {})}
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class RequestMetricsStore:
+    """
+    Recent request timings per view, kept in memory
+
+    Each worker process keeps its own SAMPLE_SIZE most recent requests per
+    view, so the percentiles cover the worker that answers.
+    """
+
+    def __init__(self):
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, view, total_ms, metrics):
+        sample = (total_ms, metrics.db_ms, metrics.queries, metrics.serializer_ms)
+        with self._lock:
+            samples = self._samples.get(view)
+            if samples is None:
+                samples = self._samples[view] = deque(maxlen=get_config()['SAMPLE_SIZE'])
+            samples.append(sample)
+
+    def summary(self):
+        """Percentiles per view, e.g. {'GET appointment-list': {'count': 20, 'total_ms': {...}, ...}}"""
+        with self._lock:
+            samples = {view: list(values) for view, values in self._samples.items()}
+
+        summary = {}
+        for view, values in sorted(samples.items()):
+            total_ms, db_ms, queries, serializer_ms = zip(*values)
+            summary[view] = {
+                'count': len(values),
+                'total_ms': self._percentiles(total_ms),
+                'db_ms': self._percentiles(db_ms),
+                'serializer_ms': self._percentiles(serializer_ms),
+                'queries': {**self._percentiles(queries), 'max': max(queries)},
+            }
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    @staticmethod
+    def _percentiles(values):
+        return {
+            'p50': round(percentile(values, 50), 1),
+            'p95': round(percentile(values, 95), 1),
+            'p99': round(percentile(values, 99), 1),
+        }
+
+
+request_metrics = RequestMetricsStore()
+
+
+def _time_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_ms += (time.perf_counter() - start) * 1000
+
+
+def _add_query_timer(sender, connection, **kwargs):
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that reports its time as the request's serializer time
+
+    Set in REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']; views with their own
+    renderer_classes are not timed. Only measures while a request is being
+    recorded.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        start = time.perf_counter()
+        try:
+            return super().render(data, accepted_media_type, renderer_context)
+        finally:
+            metrics.serializer_ms += (time.perf_counter() - start) * 1000
+
+
+_installed = False
+
+
+def install():
+    """
+    Hook query timing in, once per process
+
+    Queries are timed by an execute wrapper on every database connection
+    (including ones opened in sync_to_async threads for async views), and
+    only while a request is being recorded. Serializer time comes from
+    TimedJSONRenderer.
+    """
+    global _installed
+    if _installed:
+        return
+    connection_created.connect(_add_query_timer, dispatch_uid='core.instrumentation')
+    for alias in connections:
+        _add_query_timer(None, connections[alias])
+    _installed = True
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure SQL queries, DB time and serializer time of each request
+
+    Adds a Server-Timing header (db, serializer, view = the rest of the
+    app's own time, total), logs requests over the REQUEST_METRICS budgets,
+    and records per-view percentiles in request_metrics. When disabled the
+    middleware removes itself from the stack and installs no hooks.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not get_config()['ENABLED']:
+            raise MiddlewareNotUsed
+        install()
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        config = get_config()
+        total_ms = (time.perf_counter() - metrics.started) * 1000
+        view_ms = max(total_ms - metrics.db_ms - metrics.serializer_ms, 0)
+        view = self.view_name(request)
+
+        if config['SERVER_TIMING']:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={metrics.db_ms:.1f};desc="{metrics.queries} queries"',
+                f'serializer;dur={metrics.serializer_ms:.1f}',
+                f'view;dur={view_ms:.1f}',
+                f'total;dur={total_ms:.1f}',
+            ])
+
+        if (metrics.queries > config['MAX_QUERIES'] or metrics.db_ms > config['MAX_DB_MS']
+                or total_ms > config['MAX_TOTAL_MS']):
+            logger.warning(
+                f"Request over budget: {view} took {total_ms:.0f}ms with {metrics.queries} queries "
+                f"(db {metrics.db_ms:.0f}ms, serializer {metrics.serializer_ms:.0f}ms)"
+            )
+
+        request_metrics.record(view, total_ms, metrics)
+        return response
+
+    @staticmethod
+    def view_name(request):
+        """'GET appointment-list' style label of the view that served the request"""
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return f"{request.method} <unresolved>"
+        return f"{request.method} {match.view_name or match.route}"
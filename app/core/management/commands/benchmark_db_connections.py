@@ -0,0 +1,76 @@
+"""
+Django command comparing per-request connections with a connection pool.
+
+Each iteration stands for one request: it gets a connection, runs a small
+query and gives the connection back. Without a pool that means a new
+connection (and TLS handshake, against Aiven) every time; with one, the
+connection is reused.
+"""
+import statistics
+import time
+
+import psycopg
+from psycopg_pool import ConnectionPool
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+class Command(BaseCommand):
+    """Django command to benchmark connection setup with and without a pool."""
+
+    help = 'Measure per-request database latency with new connections and with a connection pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias to connect to')
+        parser.add_argument('--iterations', type=int, default=200, help='Requests to simulate per mode')
+        parser.add_argument('--query', default='SELECT 1', help='Query each simulated request runs')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        connect_kwargs = connections[options['database']].get_connection_params()
+        connect_kwargs['autocommit'] = True
+        iterations = options['iterations']
+        query = options['query']
+
+        def unpooled():
+            with psycopg.connect(**connect_kwargs) as conn:
+                conn.execute(query).fetchall()
+
+        with ConnectionPool(
+            kwargs=connect_kwargs, min_size=1, max_size=1, check=ConnectionPool.check_connection
+        ) as pool:
+            pool.wait()
+
+            def pooled():
+                with pool.connection() as conn:
+                    conn.execute(query).fetchall()
+
+            results = {
+                'new connection': self.measure(unpooled, iterations),
+                'pooled': self.measure(pooled, iterations),
+            }
+
+        for mode, timings in results.items():
+            self.stdout.write(
+                f"{mode:<16} mean {statistics.mean(timings):7.2f} ms  "
+                f"p50 {statistics.median(timings):7.2f} ms  "
+                f"p95 {self.percentile(timings, 95):7.2f} ms"
+            )
+
+        speedup = statistics.mean(results['new connection']) / statistics.mean(results['pooled'])
+        self.stdout.write(self.style.SUCCESS(f"Pooled requests are {speedup:.1f}x faster on average"))
+
+    @staticmethod
+    def measure(request, iterations):
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            request()
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    @staticmethod
+    def percentile(timings, percent):
+        ordered = sorted(timings)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
@@ -0,0 +1,161 @@
+"""
+Django command putting concurrent load on running API endpoints.
+
+Sends GET requests from a pool of client threads and reports throughput,
+latency percentiles and errors, so the WSGI and ASGI server modes can be
+compared on the same endpoints with the same worker count. With
+--server-pid it also reports the resident memory of that process and its
+children (the gunicorn master and workers).
+
+--slow-clients adds clients on slow links: each sends its requests one
+header line at a time, spread over --slow-client-seconds, for as long as
+the load runs. A sync worker is held by such a client until its request
+has fully arrived; an ASGI worker reads it in the event loop and keeps
+serving the others.
+"""
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """Django command to load test API endpoints."""
+
+    help = 'Send concurrent GET requests to API endpoints and report throughput and latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='Endpoint paths, e.g. /api/psychologists/marketplace/')
+        parser.add_argument('--base-url', default='http://localhost:8000', help='Server to load')
+        parser.add_argument('--token', help='API token sent in the Authorization header')
+        parser.add_argument('--requests', type=int, default=500, help='Total requests to send')
+        parser.add_argument('--concurrency', type=int, default=20, help='Requests in flight at once')
+        parser.add_argument('--timeout', type=float, default=30, help='Seconds before a request fails')
+        parser.add_argument('--server-pid', type=int, help='Server process to report memory for')
+        parser.add_argument('--slow-clients', type=int, default=0,
+                            help='Extra clients that send their requests slowly while the load runs')
+        parser.add_argument('--slow-client-seconds', type=float, default=5,
+                            help='Seconds a slow client takes to send one request')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        headers = {'Accept': 'application/json'}
+        if options['token']:
+            headers['Authorization'] = f"Token {options['token']}"
+        base_url = options['base_url'].rstrip('/')
+        urls = [base_url + path for path in options['paths']]
+        timeout = options['timeout']
+
+        def send(index):
+            request = Request(urls[index % len(urls)], headers=headers)
+            start = time.perf_counter()
+            try:
+                with urlopen(request, timeout=timeout) as response:
+                    response.read()
+                    ok = response.status < 400
+            except (HTTPError, URLError, OSError):
+                ok = False
+            return (time.perf_counter() - start) * 1000, ok
+
+        done = threading.Event()
+        slow_requests = []
+        slow_threads = [
+            threading.Thread(
+                target=self.slow_client,
+                args=(urls[index % len(urls)], headers, options['slow_client_seconds'], timeout, done, slow_requests),
+                daemon=True,
+            )
+            for index in range(options['slow_clients'])
+        ]
+        for thread in slow_threads:
+            thread.start()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            results = list(executor.map(send, range(options['requests'])))
+        elapsed = time.perf_counter() - start
+
+        done.set()
+        for thread in slow_threads:
+            thread.join(timeout)
+
+        timings = [timing for timing, _ in results]
+        errors = sum(1 for _, ok in results if not ok)
+        self.stdout.write(
+            f"{len(results)} requests, concurrency {options['concurrency']}: "
+            f"{len(results) / elapsed:.1f} req/s, {errors} errors"
+        )
+        self.stdout.write(
+            f"latency mean {statistics.mean(timings):.1f} ms  "
+            f"p50 {statistics.median(timings):.1f} ms  "
+            f"p95 {self.percentile(timings, 95):.1f} ms  "
+            f"p99 {self.percentile(timings, 99):.1f} ms"
+        )
+
+        if slow_threads:
+            self.stdout.write(
+                f"{len(slow_threads)} slow clients ({options['slow_client_seconds']:g} s per request) "
+                f"completed {len(slow_requests)} requests alongside"
+            )
+
+        if options['server_pid']:
+            rss = self.process_tree_rss(options['server_pid'])
+            self.stdout.write(f"server memory (RSS, master and workers) {rss / 1024:.1f} MiB")
+
+        if errors:
+            self.stdout.write(self.style.WARNING(f"{errors} of {len(results)} requests failed"))
+
+    @staticmethod
+    def slow_client(url, headers, seconds, timeout, done, completed):
+        """Send GETs to url a header line at a time until done is set; append each finished one to completed"""
+        parts = urlsplit(url)
+        path = parts.path + (f'?{parts.query}' if parts.query else '')
+        lines = [f'GET {path} HTTP/1.1', f'Host: {parts.netloc}', 'User-Agent: load_test slow client']
+        lines += [f'{name}: {value}' for name, value in headers.items()]
+        lines += ['Connection: close', '']
+        pause = seconds / len(lines)
+
+        while not done.is_set():
+            try:
+                with socket.create_connection((parts.hostname, parts.port or 80), timeout=timeout) as sock:
+                    for line in lines:
+                        if done.wait(pause):
+                            return
+                        sock.sendall(f'{line}\r\n'.encode())
+                    while sock.recv(65536):
+                        pass
+                completed.append(url)
+            except OSError:
+                done.wait(1)
+
+    @staticmethod
+    def percentile(timings, percent):
+        ordered = sorted(timings)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    @staticmethod
+    def process_tree_rss(pid):
+        """Resident memory in KiB of a process and its direct children, from /proc"""
+        pids = [pid]
+        try:
+            with open(f'/proc/{pid}/task/{pid}/children') as f:
+                pids += [int(child) for child in f.read().split()]
+        except OSError as e:
+            raise CommandError(f"Can't read process {pid}: {str(e)}")
+
+        total = 0
+        for process in pids:
+            try:
+                with open(f'/proc/{process}/status') as f:
+                    for line in f:
+                        if line.startswith('VmRSS:'):
+                            total += int(line.split()[1])
+            except OSError:
+                continue
+        return total
@@ -0,0 +1,74 @@
+"""
+Django command to recompute the stored profile completeness scores.
+
+Scores are refreshed whenever a profile is saved. Run this after migrating,
+and after deploys that change how completeness is scored, or after bulk
+updates that bypass save(). Only rows whose score changed are written.
+"""
+from django.core.management.base import BaseCommand
+
+from children.models import Child
+from parents.models import Parent
+from psychologists.models import Psychologist
+from psychologists.services import MarketplaceSnapshotService
+
+MODELS = {
+    'psychologist': Psychologist,
+    'child': Child,
+    'parent': Parent,
+}
+
+
+class Command(BaseCommand):
+    """Django command to recompute profile completeness scores."""
+
+    help = 'Recompute the stored profile completeness of psychologists, children and parents'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=sorted(MODELS),
+            action='append',
+            help='Only recompute this profile type (repeatable; default: all)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows written per batch')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        for name in options['model'] or MODELS:
+            model = MODELS[name]
+            checked, changed = self._recompute(model, options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f'{model._meta.verbose_name_plural}: {changed} of {checked} scores updated'
+            ))
+
+    @staticmethod
+    def _recompute(model, batch_size):
+        checked = changed = 0
+        batch = []
+
+        for profile in model.objects.order_by('pk').iterator(chunk_size=batch_size):
+            checked += 1
+            score = profile.get_profile_completeness()
+            if score == profile.profile_completeness:
+                continue
+
+            profile.profile_completeness = score
+            batch.append(profile)
+            if len(batch) >= batch_size:
+                changed += Command._save(model, batch)
+                batch = []
+
+        if batch:
+            changed += Command._save(model, batch)
+
+        return checked, changed
+
+    @staticmethod
+    def _save(model, profiles):
+        # bulk_update skips save(), so marketplace snapshots, which include
+        # the score, are refreshed explicitly
+        model.objects.bulk_update(profiles, ['profile_completeness'])
+        if model is Psychologist:
+            MarketplaceSnapshotService.refresh_for_users(*(p.user_id for p in profiles))
+        return len(profiles)
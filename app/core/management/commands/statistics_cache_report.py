@@ -0,0 +1,43 @@
+"""
+Django command to report how the admin statistics response cache performs.
+
+Counters live in the ADMIN_STATISTICS cache, so they are only shared
+between processes when that cache is (Redis, Memcached, database); with
+the per-process local-memory cache this command only sees its own process.
+"""
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+
+from core import caching
+
+
+class Command(BaseCommand):
+    """Django command to print statistics cache hit/miss counters."""
+
+    help = 'Show hit, miss and stale counts of the cached admin statistics endpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Zero the counters after reporting')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        # Loading the URLconf imports every view, registering its endpoints
+        get_resolver().url_patterns
+
+        config = caching.get_config()
+        self.stdout.write(
+            f"Fresh for {config['CACHE_TIMEOUT']}s, served stale for up to {config['STALE_TIMEOUT']}s more"
+        )
+
+        for endpoint, counts in caching.get_counters().items():
+            served = counts['hit'] + counts['stale']
+            requests = served + counts['miss'] + counts['wait'] + counts['fresh']
+            hit_rate = f'{served / requests:.0%}' if requests else '-'
+            self.stdout.write(
+                f"{endpoint:<48} hit {counts['hit']:>6}  stale {counts['stale']:>6}  miss {counts['miss']:>6}"
+                f"  wait {counts['wait']:>6}  fresh {counts['fresh']:>6}  hit rate {hit_rate:>4}"
+            )
+
+        if options['reset']:
+            caching.reset_counters()
+            self.stdout.write(self.style.SUCCESS('Counters reset'))
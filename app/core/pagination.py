@@ -0,0 +1,220 @@
+import json
+import logging
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import DatabaseError, connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'EXACT_COUNT_THRESHOLD': 10000,
+}
+
+
+def get_config():
+    """ESTIMATED_COUNT settings merged over the defaults"""
+    return {**DEFAULT_CONFIG, **getattr(settings, 'ESTIMATED_COUNT', {})}
+
+
+def estimate_count(queryset):
+    """
+    PostgreSQL's estimate of how many rows `queryset` returns, or None
+
+    Unfiltered querysets read the table statistics (pg_class.reltuples);
+    anything else asks the planner (EXPLAIN) for its row estimate. Either
+    way it is one cheap query that doesn't scan the table.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            if not queryset.query.where and not queryset.query.distinct:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                # -1 until the table is first vacuumed or analyzed
+                return int(row[0]) if row and row[0] >= 0 else None
+
+            sql, params = queryset.order_by().query.sql_with_params()
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
+    except EmptyResultSet:
+        # e.g. .none() or an empty __in lookup
+        return 0
+    except DatabaseError as e:
+        logger.warning(f"Row estimate failed for {queryset.model.__name__}: {str(e)}")
+        return None
+
+
+def count_with_estimate(queryset, threshold=None):
+    """
+    (count, is_estimate) for `queryset`
+
+    Results the planner expects to be smaller than the threshold are
+    counted exactly; larger ones use the estimate.
+    """
+    if threshold is None:
+        threshold = get_config()['EXACT_COUNT_THRESHOLD']
+
+    estimate = estimate_count(queryset)
+    if estimate is None or estimate < threshold:
+        return queryset.count(), False
+    return estimate, True
+
+
+class EstimatedPage(Page):
+    """
+    Page of an estimated count, which knows from its own rows whether
+    another page follows
+    """
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1 if self.object_list else 0
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator counting large querysets from planner estimates
+
+    For admin changelists of big tables (together with
+    `show_full_result_count = False`) and API list endpoints, where an
+    exact COUNT(*) costs more than rendering the page. An estimate can be
+    too low as well as too high, so estimated pages are not checked
+    against the count: each page fetches one extra row to tell whether
+    another page follows, and a page past the last row is empty.
+    """
+    is_estimate = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return super().count
+        count, self.is_estimate = count_with_estimate(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        self.count
+        if not self.is_estimate:
+            return super().validate_number(number)
+
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_estimate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        return EstimatedPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page-number pagination that skips COUNT(*) on large results
+
+    `count` comes from EstimatedCountPaginator, and `count_is_estimate` in
+    the response says whether it is exact. Views that declare a
+    `cursor_ordering` also page by cursor when the client asks with
+    `?pagination=cursor`: every page then costs the same and nothing is
+    counted. The `next`/`previous` links carry the cursor along.
+    """
+    django_paginator_class = EstimatedCountPaginator
+    pagination_mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+
+    cursor = None
+
+    def use_cursor(self, request, view):
+        if getattr(view, 'cursor_ordering', None) is None:
+            return False
+        return (
+            request.query_params.get(self.pagination_mode_query_param) == 'cursor'
+            or self.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request, view):
+            self.cursor = CursorPagination()
+            self.cursor.cursor_query_param = self.cursor_query_param
+            self.cursor.ordering = view.cursor_ordering
+            self.cursor.page_size = self.get_page_size(request)
+            return self.cursor.paginate_queryset(queryset, request, view)
+
+        self.cursor = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor is not None:
+            return self.cursor.get_paginated_response(data)
+
+        return Response({
+            'count': self.page.paginator.count,
+            'count_is_estimate': self.page.paginator.is_estimate,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_is_estimate'] = {
+            'type': 'boolean',
+            'example': False,
+        }
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if getattr(view, 'cursor_ordering', None) is not None:
+            parameters += [
+                {
+                    'name': self.pagination_mode_query_param,
+                    'required': False,
+                    'in': 'query',
+                    'description': 'Set to "cursor" for cursor pagination without a result count.',
+                    'schema': {'type': 'string', 'enum': ['cursor']},
+                },
+                {
+                    'name': self.cursor_query_param,
+                    'required': False,
+                    'in': 'query',
+                    'description': 'The pagination cursor value.',
+                    'schema': {'type': 'string'},
+                },
+            ]
+        return parameters
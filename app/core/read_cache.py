@@ -0,0 +1,113 @@
+import hashlib
+import inspect
+import json
+import logging
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+CACHE_PREFIX = 'read-cache:'
+
+_MISSING = object()
+
+
+def get_config():
+    """READ_CACHE settings merged over the defaults"""
+    return {**DEFAULT_CONFIG, **getattr(settings, 'READ_CACHE', {})}
+
+
+def _cache():
+    return caches[get_config()['CACHE_ALIAS']]
+
+
+def _version_key(entity, pk):
+    return f'{CACHE_PREFIX}version:{entity}:{pk}'
+
+
+def _new_version():
+    # Random rather than counting from 1: if a version key is evicted, the
+    # next one must not match entries cached under the old one
+    return uuid.uuid4().int >> 80
+
+
+def get_version(entity, pk):
+    """Current version of the cached reads derived from an entity"""
+    cache = _cache()
+    key = _version_key(entity, pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def _bump(entity, pk):
+    cache = _cache()
+    key = _version_key(entity, pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Never read (or evicted): any new version will do
+        cache.set(key, _new_version(), None)
+
+
+def invalidate(entity, pk):
+    """
+    Move an entity to a new version, orphaning every read cached for it
+
+    The bump happens right away, so this process never reads its own stale
+    entries, and again after the transaction commits, so an entry another
+    worker cached from pre-commit data is not served either. Orphaned
+    entries simply expire.
+    """
+    _bump(entity, pk)
+    transaction.on_commit(lambda: _bump(entity, pk))
+
+
+def cached_read(entity, arg):
+    """
+    Cache a read-only lookup per entity version
+
+    `arg` names the parameter holding the entity (an instance or a primary
+    key); its version is part of the key, so invalidate(entity, pk) drops
+    every cached result for it at once, in every process sharing the
+    cache. Other arguments are part of the key too. QuerySets are stored
+    evaluated (pickling a QuerySet stores its results). The undecorated
+    function stays available as `.uncached`.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        endpoint = f'{func.__module__}.{func.__qualname__}'
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            target = bound.arguments[arg]
+            pk = getattr(target, 'pk', target)
+            extra = {
+                name: value for name, value in bound.arguments.items()
+                if name not in (arg, 'self', 'cls')
+            }
+            digest = hashlib.md5(json.dumps(extra, sort_keys=True, default=str).encode()).hexdigest()
+
+            cache = _cache()
+            key = f'{CACHE_PREFIX}{endpoint}:{entity}:{pk}:{get_version(entity, pk)}:{digest}'
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.set(key, result, get_config()['TIMEOUT'])
+            return result
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
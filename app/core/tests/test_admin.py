@@ -0,0 +1,177 @@
+"""
+Test admin changelist query counts and the estimated-count paginator.
+"""
+from datetime import date, time, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from appointments.models import Appointment, AppointmentSlot
+from children.models import Child
+from core.pagination import EstimatedCountPaginator, count_with_estimate, estimate_count
+from parents.models import Parent
+from psychologists.models import Psychologist, PsychologistAvailability
+from users.models import User
+
+
+class AdminQueryCountTests(TestCase):
+    """Changelists run the same number of queries however many rows they show"""
+
+    def setUp(self):
+        cache.clear()
+        self.admin_user = User.objects.create_superuser(email='admin@test.com', password='testpass123')
+        self.client.force_login(self.admin_user)
+        self.created = 0
+
+    def _create_rows(self, count):
+        """A psychologist with availability, slots and an appointment, plus a child, per row"""
+        for _ in range(count):
+            index = self.created = self.created + 1
+            psychologist = Psychologist.objects.create(
+                user=User.objects.create_user(
+                    email=f'psychologist{index}@test.com',
+                    password='testpass123',
+                    user_type='Psychologist',
+                    is_verified=True,
+                ),
+                first_name='Admin',
+                last_name=f'Psychologist{index}',
+                license_number=f'PSY-ADMIN-{index}',
+                license_issuing_authority='State Board',
+                license_expiry_date=date.today() + timedelta(days=365),
+                years_of_experience=5,
+                verification_status='Approved',
+                offers_online_sessions=True,
+                offers_initial_consultation=False,
+            )
+            block = PsychologistAvailability.objects.create(
+                psychologist=psychologist,
+                day_of_week=1,
+                start_time=time(9, 0),
+                end_time=time(11, 0),
+                is_recurring=True,
+            )
+            slot = AppointmentSlot.objects.create(
+                psychologist=psychologist,
+                availability_block=block,
+                slot_date=date.today() + timedelta(days=7),
+                start_time=time(9, 0),
+            )
+
+            parent = Parent.objects.get(
+                user=User.objects.create_parent(email=f'parent{index}@test.com', password='testpass123')
+            )
+            child = Child.objects.create(
+                parent=parent,
+                first_name=f'Child{index}',
+                date_of_birth=date(date.today().year - 8, 1, 1),
+            )
+            start = timezone.now() + timedelta(days=7)
+            appointment = Appointment.objects.create(
+                child=child,
+                psychologist=psychologist,
+                parent=parent,
+                session_type='OnlineMeeting',
+                scheduled_start_time=start,
+                scheduled_end_time=start + timedelta(hours=1),
+            )
+            appointment.appointment_slots.add(slot)
+
+    def _changelist_queries(self, url_name):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelists_constant_query_count(self):
+        """Test adding rows adds no queries to any changelist"""
+        changelists = [
+            'admin:psychologists_psychologist_changelist',
+            'admin:psychologists_psychologistavailability_changelist',
+            'admin:children_child_changelist',
+            'admin:parents_parent_changelist',
+            'admin:appointments_appointment_changelist',
+            'admin:appointments_appointmentslot_changelist',
+        ]
+        self._create_rows(1)
+        baseline = {name: self._changelist_queries(name) for name in changelists}
+
+        self._create_rows(4)
+        for name in changelists:
+            with self.subTest(changelist=name):
+                self.assertEqual(self._changelist_queries(name), baseline[name])
+
+    def test_psychologist_change_page_availability_summary(self):
+        """Test the availability summary reads the blocks in one query"""
+        self._create_rows(1)
+        psychologist = Psychologist.objects.get()
+        for day in range(2, 5):
+            PsychologistAvailability.objects.create(
+                psychologist=psychologist,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(12, 0),
+                is_recurring=True,
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('admin:psychologists_psychologist_change', args=[psychologist.pk])
+            )
+
+        self.assertContains(response, 'Recurring Availability')
+        availability_queries = [
+            query for query in queries.captured_queries
+            if 'FROM "psychologist_availability"' in query['sql'] and 'COUNT' not in query['sql']
+        ]
+        # The inline formset and the summary
+        self.assertLessEqual(len(availability_queries), 2)
+
+
+class EstimatedCountTests(TestCase):
+    """Tests for planner-estimated counts"""
+
+    def setUp(self):
+        parent = Parent.objects.get(
+            user=User.objects.create_parent(email='parent@test.com', password='testpass123')
+        )
+        for index in range(3):
+            Child.objects.create(
+                parent=parent,
+                first_name=f'Child{index}',
+                date_of_birth=date(date.today().year - 8, 1, 1),
+                gender='Female' if index else 'Male',
+            )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE children')
+
+    def test_estimate_count(self):
+        """Test unfiltered querysets use table statistics and filtered ones the planner"""
+        with self.assertNumQueries(1):
+            self.assertEqual(estimate_count(Child.objects.all()), 3)
+
+        with self.assertNumQueries(1):
+            estimate = estimate_count(Child.objects.filter(gender='Female'))
+        self.assertGreaterEqual(estimate, 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(estimate_count(Child.objects.none()), 0)
+
+    def test_small_results_counted_exactly(self):
+        """Test results under the threshold get an exact count"""
+        self.assertEqual(count_with_estimate(Child.objects.filter(gender='Female')), (2, False))
+
+    @override_settings(ESTIMATED_COUNT={'EXACT_COUNT_THRESHOLD': 1})
+    def test_large_results_estimated(self):
+        """Test results over the threshold skip COUNT(*)"""
+        paginator = EstimatedCountPaginator(Child.objects.order_by('pk'), 2)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, 3)
+        self.assertTrue(paginator.is_estimate)
+        self.assertEqual(paginator.num_pages, 2)
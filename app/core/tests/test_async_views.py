@@ -0,0 +1,286 @@
+"""
+Test the async API view base class, the async middleware path and the
+async endpoints routed under ASGI.
+"""
+import importlib
+import uuid
+from datetime import date, timedelta
+
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import SimpleTestCase, override_settings
+from django.urls import clear_url_caches, resolve, reverse
+from django.utils import timezone
+from rest_framework import permissions, status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from appointments.models import Appointment, AppointmentSlot
+from appointments.views import AppointmentViewSet, AvailableSlotsView, MyAppointmentsView, UpcomingAppointmentsView
+from children.models import Child
+from core.async_views import AsyncGenericAPIView
+from core.db_router import ReplicaRouter, ReplicaStickinessMiddleware, _request_state
+from parents.models import Parent
+from psychologists.models import Psychologist, PsychologistAvailability
+from psychologists.views import (
+    PsychologistMarketplaceDetailView,
+    PsychologistMarketplaceListView,
+    PsychologistMarketplaceViewSet,
+)
+from users.models import User
+
+
+def reload_urlconf():
+    """Rebuild the URL patterns for the current SERVER_MODE"""
+    for module in ('appointments.urls', 'psychologists.urls', 'app.urls'):
+        importlib.reload(importlib.import_module(module))
+    clear_url_caches()
+
+
+class EchoView(AsyncGenericAPIView):
+    """Stand-in view with an async GET"""
+    permission_classes = [permissions.AllowAny]
+
+    async def get(self, request):
+        if request.query_params.get('missing'):
+            raise NotFound('No such thing')
+        return Response({'echo': request.query_params.get('q')})
+
+
+class ClosedView(EchoView):
+    permission_classes = [permissions.IsAuthenticated]
+
+
+class AsyncGenericAPIViewTests(SimpleTestCase):
+    """Tests for AsyncGenericAPIView"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def _call(self, view_class, request):
+        response = async_to_sync(view_class.as_view())(request)
+        return response.render()
+
+    def test_view_is_async(self):
+        """Test Django dispatches the view as a coroutine"""
+        self.assertTrue(EchoView.view_is_async)
+
+    def test_async_handler(self):
+        """Test async handlers are awaited and rendered"""
+        response = self._call(EchoView, self.factory.get('/echo/', {'q': 'hello'}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'echo': 'hello'})
+
+    def test_sync_options_handler(self):
+        """Test the inherited sync OPTIONS handler still works"""
+        response = self._call(EchoView, self.factory.options('/echo/'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], 'Echo')
+
+    def test_handler_exception(self):
+        """Test exceptions raised in async handlers become error responses"""
+        response = self._call(EchoView, self.factory.get('/echo/', {'missing': '1'}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_permission_denied(self):
+        """Test authentication and permission checks run before the handler"""
+        response = self._call(ClosedView, self.factory.get('/echo/'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_method_not_allowed(self):
+        """Test methods without a handler are rejected"""
+        response = self._call(EchoView, self.factory.delete('/echo/'))
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+
+class AsyncStickinessMiddlewareTests(SimpleTestCase):
+    """Tests for ReplicaStickinessMiddleware under ASGI"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def test_async_write_sets_pin_cookie(self):
+        """Test a write in an async request pins the client to the primary"""
+        async def get_response(request):
+            ReplicaRouter().db_for_write(None)
+            return HttpResponse()
+
+        middleware = ReplicaStickinessMiddleware(get_response)
+        response = async_to_sync(middleware)(self.factory.get('/'))
+
+        self.assertIn('db_primary_pin', response.cookies)
+        self.assertIsNone(_request_state.get())
+
+    def test_async_read_sets_no_cookie(self):
+        """Test a read-only async request leaves the client unpinned"""
+        async def get_response(request):
+            return HttpResponse()
+
+        middleware = ReplicaStickinessMiddleware(get_response)
+        response = async_to_sync(middleware)(self.factory.get('/'))
+
+        self.assertNotIn('db_primary_pin', response.cookies)
+
+
+class ServerModeRoutingTests(SimpleTestCase):
+    """Tests for routing the hottest reads by SERVER_MODE"""
+
+    def test_wsgi_routes_to_viewsets(self):
+        """Test sync workers serve the endpoints with the viewset actions"""
+        self.assertIs(resolve(reverse('appointment-upcoming')).func.cls, AppointmentViewSet)
+        self.assertIs(resolve('/api/psychologists/marketplace/').func.cls, PsychologistMarketplaceViewSet)
+
+    def test_asgi_routes_to_async_views(self):
+        """Test ASGI serves the endpoints with the async views, on the same URLs"""
+        self.addCleanup(reload_urlconf)
+        with override_settings(SERVER_MODE='asgi'):
+            reload_urlconf()
+            pk = uuid.uuid4()
+            routes = {
+                reverse('appointment-my-appointments'): MyAppointmentsView,
+                reverse('appointment-upcoming'): UpcomingAppointmentsView,
+                reverse('appointment-available-slots'): AvailableSlotsView,
+                reverse('psychologist-marketplace-list'): PsychologistMarketplaceListView,
+                reverse('psychologist-marketplace-detail', args=[pk]): PsychologistMarketplaceDetailView,
+            }
+            for url, view_class in routes.items():
+                self.assertIs(resolve(url).func.cls, view_class, url)
+            # Marketplace actions still reach the viewset
+            self.assertIs(resolve('/api/psychologists/marketplace/search/').func.cls, PsychologistMarketplaceViewSet)
+
+
+class AsyncEndpointTests(APITestCase):
+    """Tests for the async endpoints, requested as under ASGI"""
+
+    def setUp(self):
+        self.addCleanup(reload_urlconf)
+        self.enterContext(override_settings(SERVER_MODE='asgi'))
+        reload_urlconf()
+
+        self.parent_user = User.objects.create_parent(email='parent@test.com', password='testpass123')
+        self.parent_user.is_verified = True
+        self.parent_user.save()
+        self.parent = Parent.objects.get(user=self.parent_user)
+        self.child = Child.objects.create(
+            parent=self.parent,
+            first_name='Alice',
+            last_name='Doe',
+            date_of_birth=date.today() - timedelta(days=2555),
+        )
+
+        psychologist_user = User.objects.create_user(
+            email='psychologist@test.com',
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=psychologist_user,
+            first_name='Jane',
+            last_name='Smith',
+            license_number='PSY-ASYNC',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=8,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=False,
+        )
+        slot_date = date.today() + timedelta(days=3)
+        block = PsychologistAvailability.objects.create(
+            psychologist=self.psychologist,
+            day_of_week=(slot_date.weekday() + 1) % 7,
+            start_time='09:00',
+            end_time='12:00',
+            is_recurring=True,
+        )
+        AppointmentSlot.objects.create(
+            psychologist=self.psychologist,
+            availability_block=block,
+            slot_date=slot_date,
+            start_time='09:00',
+            end_time='10:00',
+        )
+        start = timezone.now() + timedelta(days=2)
+        self.appointment = Appointment.objects.create(
+            child=self.child,
+            psychologist=self.psychologist,
+            parent=self.parent,
+            session_type='OnlineMeeting',
+            scheduled_start_time=start,
+            scheduled_end_time=start + timedelta(hours=1),
+        )
+        self.client.force_authenticate(user=self.parent_user)
+
+    def test_my_appointments_and_upcoming(self):
+        """Test the parent's appointments are listed"""
+        response = self.client.get(reverse('appointment-my-appointments'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+
+        response = self.client.get(reverse('appointment-upcoming'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['next_appointment']['appointment_id'], str(self.appointment.appointment_id))
+
+    def test_available_slots(self):
+        """Test bookable slots are returned, revalidated with their ETag, and bad parameters rejected"""
+        url = reverse('appointment-available-slots')
+        response = self.client.get(url, {
+            'psychologist_id': str(self.psychologist.user_id),
+            'session_type': 'OnlineMeeting',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_slots'], 1)
+
+        etag = response['ETag']
+        response = self.client.get(url, {
+            'psychologist_id': str(self.psychologist.user_id),
+            'session_type': 'OnlineMeeting',
+        }, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        response = self.client.get(url, {'psychologist_id': str(self.psychologist.user_id)})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_marketplace_profile(self):
+        """Test a listed profile is returned and an unknown one is a 404"""
+        url = reverse('psychologist-marketplace-detail', args=[self.psychologist.user_id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['full_name'], 'Dr. Jane Smith')
+
+        response = self.client.get(reverse('psychologist-marketplace-detail', args=[uuid.uuid4()]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_responses_match_viewset(self):
+        """Test the async views answer like the viewset actions they replace"""
+        requests = [
+            (reverse('appointment-my-appointments'), {'upcoming': 'true'}),
+            (reverse('appointment-upcoming'), {}),
+            (reverse('appointment-available-slots'), {
+                'psychologist_id': str(self.psychologist.user_id),
+                'session_type': 'OnlineMeeting',
+            }),
+            (reverse('appointment-available-slots'), {
+                'psychologist_id': str(self.psychologist.user_id),
+                'session_type': 'OnlineMeeting',
+                'date_to': 'soon',
+            }),
+            (reverse('psychologist-marketplace-detail', args=[self.psychologist.user_id]), {}),
+        ]
+        async_responses = [self.client.get(url, params) for url, params in requests]
+
+        with override_settings(SERVER_MODE='wsgi'):
+            reload_urlconf()
+            sync_responses = [self.client.get(url, params) for url, params in requests]
+
+        for (url, params), async_response, sync_response in zip(requests, async_responses, sync_responses):
+            self.assertEqual(async_response.status_code, sync_response.status_code, url)
+            self.assertEqual(async_response.data, sync_response.data, url)
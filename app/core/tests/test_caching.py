@@ -0,0 +1,185 @@
+"""
+Test the statistics response cache.
+"""
+import time
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from core import caching
+from core.caching import cached_statistics
+
+ADMIN = SimpleNamespace(pk=1, is_admin=True, is_staff=False)
+OTHER_ADMIN = SimpleNamespace(pk=2, is_admin=False, is_staff=True)
+PSYCHOLOGIST = SimpleNamespace(pk=3, is_admin=False, is_staff=False)
+
+
+class StatisticsView:
+    """Stand-in viewset counting how often each action really runs"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached_statistics()
+    def statistics(self, request):
+        self.calls += 1
+        if request.query_params.get('broken'):
+            return Response({'error': 'failed'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response({'calls': self.calls})
+
+    @cached_statistics(vary_on_user=True)
+    def own_statistics(self, request):
+        self.calls += 1
+        return Response({'user': request.user.pk})
+
+
+class CachedStatisticsTests(SimpleTestCase):
+    """Tests for the cached_statistics decorator"""
+
+    ENDPOINT = 'StatisticsView.statistics'
+
+    def setUp(self):
+        cache.clear()
+        self.view = StatisticsView()
+        self.factory = APIRequestFactory()
+
+    def _request(self, user=ADMIN, **params):
+        request = Request(self.factory.get('/statistics/', params))
+        request.user = user
+        return request
+
+    def _expire(self, **params):
+        """Age the cached entry past its TTL, leaving it to be served stale"""
+        key = caching._cache_key(self.ENDPOINT, self._request(**params), None)
+        entry = cache.get(key)
+        entry['expires_at'] = time.time() - 1
+        cache.set(key, entry)
+        return key
+
+    def test_miss_then_hit(self):
+        """Test the second request is served from the cache"""
+        first = self.view.statistics(self._request(date_from='2024-01-01'))
+        second = self.view.statistics(self._request(OTHER_ADMIN, date_from='2024-01-01'))
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, {'calls': 1})
+        self.assertEqual(self.view.calls, 1)
+
+    def test_key_normalizes_query_parameters(self):
+        """Test parameter order doesn't matter but parameter values do"""
+        self.view.statistics(self._request(date_from='2024-01-01', date_to='2024-01-31'))
+
+        same = self.view.statistics(self._request(date_to='2024-01-31', date_from='2024-01-01'))
+        other = self.view.statistics(self._request(date_from='2024-02-01'))
+
+        self.assertEqual(same['X-Cache'], 'HIT')
+        self.assertEqual(other['X-Cache'], 'MISS')
+
+    def test_fresh_recomputes_for_admins_only(self):
+        """Test ?fresh=1 bypasses the cache for admins and refreshes it"""
+        self.view.statistics(self._request())
+
+        fresh = self.view.statistics(self._request(fresh='1'))
+        after = self.view.statistics(self._request())
+
+        self.assertEqual(fresh['X-Cache'], 'FRESH')
+        self.assertEqual(after.data, {'calls': 2})
+
+    def test_non_admins_bypass_shared_cache(self):
+        """Test shared entries are never served to non-admins"""
+        self.view.statistics(self._request())
+
+        response = self.view.statistics(self._request(PSYCHOLOGIST))
+
+        self.assertNotIn('X-Cache', response)
+        self.assertEqual(self.view.calls, 2)
+
+    def test_vary_on_user(self):
+        """Test per-user entries aren't shared"""
+        self.view.own_statistics(self._request(PSYCHOLOGIST))
+        other = self.view.own_statistics(self._request(ADMIN))
+        again = self.view.own_statistics(self._request(PSYCHOLOGIST))
+
+        self.assertEqual(other.data, {'user': ADMIN.pk})
+        self.assertEqual(again['X-Cache'], 'HIT')
+        self.assertEqual(again.data, {'user': PSYCHOLOGIST.pk})
+
+    def test_errors_not_cached(self):
+        """Test failed responses are recomputed"""
+        self.view.statistics(self._request(broken='1'))
+        response = self.view.statistics(self._request(broken='1'))
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(self.view.calls, 2)
+
+    def test_expired_entry_recomputed_by_one_worker(self):
+        """Test an expired entry is recomputed by the worker taking the lock"""
+        self.view.statistics(self._request())
+        self._expire()
+
+        response = self.view.statistics(self._request())
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data, {'calls': 2})
+
+    def test_stale_served_while_another_worker_recomputes(self):
+        """Test a request arriving mid-recompute gets the stale copy"""
+        self.view.statistics(self._request())
+        key = self._expire()
+        cache.add(f'{key}:lock', 'other-worker')
+
+        response = self.view.statistics(self._request())
+
+        self.assertEqual(response['X-Cache'], 'STALE')
+        self.assertEqual(response.data, {'calls': 1})
+        self.assertEqual(self.view.calls, 1)
+
+    def test_waits_for_first_computation(self):
+        """Test a request with nothing cached waits for the worker holding the lock"""
+        key = caching._cache_key(self.ENDPOINT, self._request(), None)
+        cache.add(f'{key}:lock', 'other-worker')
+
+        def other_worker_finishes(_seconds):
+            cache.set(key, {'data': {'calls': 'other'}, 'expires_at': time.time() + 60})
+
+        with patch('core.caching.time.sleep', side_effect=other_worker_finishes):
+            response = self.view.statistics(self._request())
+
+        self.assertEqual(response.data, {'calls': 'other'})
+        self.assertEqual(self.view.calls, 0)
+
+    @override_settings(ADMIN_STATISTICS={'WAIT_TIMEOUT': 0})
+    def test_wait_timeout_computes_directly(self):
+        """Test requests stop waiting on a stuck recompute"""
+        key = caching._cache_key(self.ENDPOINT, self._request(), None)
+        cache.add(f'{key}:lock', 'stuck-worker')
+
+        response = self.view.statistics(self._request())
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(self.view.calls, 1)
+
+    def test_counters_and_report(self):
+        """Test hit/miss counters are recorded and reported"""
+        self.view.statistics(self._request())
+        self.view.statistics(self._request())
+        self.view.statistics(self._request())
+        self.view.statistics(self._request(fresh='true'))
+
+        counts = caching.get_counters([self.ENDPOINT])[self.ENDPOINT]
+        self.assertEqual(counts, {'hit': 2, 'miss': 1, 'stale': 0, 'wait': 0, 'fresh': 1})
+
+        out = StringIO()
+        call_command('statistics_cache_report', '--reset', stdout=out)
+        self.assertIn(self.ENDPOINT, out.getvalue())
+        self.assertIn('hit rate  50%', out.getvalue())
+        self.assertEqual(caching.get_counters([self.ENDPOINT])[self.ENDPOINT]['hit'], 0)
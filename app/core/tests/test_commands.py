@@ -6,9 +6,16 @@ from unittest.mock import patch
 
 from psycopg import OperationalError as Psycopg2Error
 
+from datetime import date, timedelta
+from io import StringIO
+
 from django.core.management import call_command
 from django.db.utils import OperationalError
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
+
+from parents.models import Parent
+from psychologists.models import Psychologist, PsychologistMarketplaceSnapshot
+from users.models import User
 
 
 @patch('core.management.commands.wait_for_db.Command.check')
@@ -28,4 +35,76 @@ class CommandTests(SimpleTestCase):
             Psycopg2Error] * 2 + [OperationalError] * 5 + [True]
         call_command("wait_for_db")
         self.assertEqual(patched_check.call_count, 8)
-        patched_check.assert_called_with(databases=['default'])
\ No newline at end of file
+        patched_check.assert_called_with(databases=['default'])
+
+
+class RecomputeProfileCompletenessTests(TestCase):
+    """Test the recompute_profile_completeness command."""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            email='psychologist@test.com',
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=user,
+            first_name='Jane',
+            last_name='Smith',
+            license_number='PSY-001',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=8,
+            verification_status='Approved',
+            offers_initial_consultation=False,
+        )
+        self.parent = User.objects.create_parent(
+            email='parent@test.com', password='testpass123'
+        ).parent_profile
+
+    def test_recompute_updates_stale_scores(self):
+        """Test scores changed outside save() are recomputed."""
+        Psychologist.objects.filter(pk=self.psychologist.pk).update(
+            biography='Child psychologist', profile_completeness=0
+        )
+        Parent.objects.filter(pk=self.parent.pk).update(profile_completeness=0)
+        out = StringIO()
+
+        call_command('recompute_profile_completeness', stdout=out)
+
+        self.psychologist.refresh_from_db()
+        self.parent.refresh_from_db()
+        self.assertEqual(self.psychologist.profile_completeness, 80.0)
+        self.assertEqual(self.parent.profile_completeness, 6.0)
+        self.assertIn('1 of 1 scores updated', out.getvalue())
+
+        snapshot = PsychologistMarketplaceSnapshot.objects.get(psychologist=self.psychologist)
+        self.assertEqual(snapshot.payload['profile_completeness'], 80.0)
+
+    def test_recompute_single_model(self):
+        """Test --model limits the recompute to one profile type."""
+        Parent.objects.filter(pk=self.parent.pk).update(profile_completeness=0)
+        out = StringIO()
+
+        call_command('recompute_profile_completeness', model=['psychologist'], stdout=out)
+
+        self.parent.refresh_from_db()
+        self.assertEqual(self.parent.profile_completeness, 0)
+        self.assertIn('0 of 1 scores updated', out.getvalue())
+
+
+class BenchmarkDbConnectionsTests(TestCase):
+    """Test the benchmark_db_connections command."""
+
+    def test_benchmark_reports_both_modes(self):
+        """Test new-connection and pooled latencies are reported."""
+        out = StringIO()
+
+        call_command('benchmark_db_connections', iterations=3, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('new connection', output)
+        self.assertIn('pooled', output)
+        self.assertIn('faster on average', output)
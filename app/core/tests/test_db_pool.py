@@ -0,0 +1,67 @@
+"""
+Test connection pool statistics and the database health endpoint.
+"""
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from psycopg_pool import ConnectionPool
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.db_pool import get_pool_stats, summarize_pool
+from users.models import User
+
+
+class PoolStatsTests(TestCase):
+    """Tests for pool statistics"""
+
+    def test_summarize_pool(self):
+        """Test in-use, waiting and wait time figures of a real pool"""
+        connect_kwargs = {**connection.get_connection_params(), 'autocommit': True}
+        with ConnectionPool(kwargs=connect_kwargs, min_size=1, max_size=2) as pool:
+            pool.wait()
+            with pool.connection(), pool.connection():
+                stats = summarize_pool(pool)
+
+        self.assertTrue(stats['pooled'])
+        self.assertEqual(stats['max_size'], 2)
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['in_use'], 2)
+        self.assertEqual(stats['idle'], 0)
+        self.assertEqual(stats['waiting'], 0)
+        self.assertEqual(stats['requests'], 2)
+        self.assertGreaterEqual(stats['wait_ms_total'], 0)
+
+    def test_unpooled_databases(self):
+        """Test databases without a pool are reported as such"""
+        self.assertEqual(get_pool_stats()['default'], {'pooled': False})
+
+
+class DatabaseHealthViewTests(APITestCase):
+    """Tests for the database health endpoint"""
+
+    def setUp(self):
+        self.url = reverse('health-database')
+
+    def test_admin_gets_pool_stats(self):
+        """Test admins see the database status and pool statistics"""
+        self.client.force_authenticate(
+            user=User.objects.create_superuser(email='admin@test.com', password='testpass123')
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'ok')
+        self.assertIn('pid', response.data)
+        self.assertEqual(response.data['databases']['default'], {'pooled': False})
+
+    def test_non_admin_forbidden(self):
+        """Test other users can't read the statistics"""
+        self.client.force_authenticate(
+            user=User.objects.create_parent(email='parent@test.com', password='testpass123')
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
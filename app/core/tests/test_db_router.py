@@ -0,0 +1,142 @@
+"""
+Test replica routing against two local databases.
+
+The 'replica' database is a separate, empty copy of the schema, so a read
+served by it can't see rows written to the primary.
+"""
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core import db_router
+from core.db_router import ReplicaStickinessMiddleware, read_from_replica, replica_lag
+from psychologists.models import Psychologist
+from users.models import User
+
+REPLICATION = {
+    'REPLICAS': ['replica'],
+    'STICKY_COOKIE_NAME': 'db_primary_pin',
+    'STICKY_SECONDS': 5,
+    'MAX_LAG_SECONDS': 5,
+    'LAG_CHECK_INTERVAL': 0,
+}
+
+
+@override_settings(DATABASE_REPLICATION=REPLICATION)
+class ReplicaRouterTests(TransactionTestCase):
+    """Tests for ReplicaRouter and the stickiness middleware"""
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        db_router._lag_checks.clear()
+        self.user = User.objects.create_parent(email='parent@test.com', password='testpass123')
+
+    def test_reads_outside_replica_blocks_use_primary(self):
+        """Test undesignated reads are untouched"""
+        self.assertTrue(User.objects.filter(pk=self.user.pk).exists())
+
+    def test_replica_reads(self):
+        """Test reads inside read_from_replica() go to the replica and writes to the primary"""
+        with read_from_replica():
+            self.assertEqual(User.objects.all().db, 'replica')
+            self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+            User.objects.create_parent(email='other@test.com', password='testpass123')
+
+        self.assertEqual(User.objects.count(), 2)
+        self.assertEqual(User.objects.using('replica').count(), 0)
+
+    def test_transactions_read_from_primary(self):
+        """Test reads inside a transaction see its writes"""
+        with read_from_replica(), transaction.atomic():
+            self.assertTrue(User.objects.filter(pk=self.user.pk).exists())
+
+    def test_lagging_or_unreachable_replica_skipped(self):
+        """Test the lag guard falls back to the primary"""
+        self.assertEqual(replica_lag('replica'), 0)
+
+        for lag in (30.0, None):
+            with self.subTest(lag=lag), patch('core.db_router.replica_lag', return_value=lag):
+                with read_from_replica():
+                    self.assertEqual(User.objects.all().db, 'default')
+
+    def test_replica_without_wal_receiver_is_stale(self):
+        """Test a replica that stopped receiving WAL is skipped, however caught up it looks"""
+        # What LAG_SQL returns when pg_stat_wal_receiver has no streaming, recent receiver
+        with patch('core.db_router.LAG_SQL', 'SELECT NULL WHERE %s IS NOT NULL'):
+            self.assertEqual(replica_lag('replica'), float('inf'))
+            with read_from_replica():
+                self.assertEqual(User.objects.all().db, 'default')
+
+    @override_settings(DATABASE_REPLICATION={**REPLICATION, 'LAG_CHECK_INTERVAL': 60})
+    def test_lag_checked_once_per_interval(self):
+        """Test the lag check result is reused between checks"""
+        with patch('core.db_router.replica_lag', return_value=0.0) as lag:
+            with read_from_replica():
+                User.objects.exists()
+                User.objects.exists()
+
+        self.assertEqual(lag.call_count, 1)
+
+    def test_writes_pin_the_client_to_primary(self):
+        """Test a request that writes reads from the primary, and so does the client's next request"""
+        reads = []
+
+        def view(request):
+            with read_from_replica():
+                reads.append(User.objects.filter(pk=self.user.pk).exists())
+                if request.method == 'POST':
+                    User.objects.filter(pk=self.user.pk).update(is_active=True)
+                    reads.append(User.objects.filter(pk=self.user.pk).exists())
+            return HttpResponse()
+
+        middleware = ReplicaStickinessMiddleware(view)
+        factory = RequestFactory()
+
+        response = middleware(factory.get('/'))
+        self.assertNotIn('db_primary_pin', response.cookies)
+
+        response = middleware(factory.post('/'))
+        self.assertEqual(response.cookies['db_primary_pin']['max-age'], 5)
+
+        request = factory.get('/')
+        request.COOKIES['db_primary_pin'] = '1'
+        middleware(request)
+
+        self.assertEqual(reads, [False, False, True, True])
+
+    def test_marketplace_filter_reads_from_replica(self):
+        """Test a designated endpoint is served by the replica unless the client is pinned"""
+        Psychologist.objects.create(
+            user=User.objects.create_user(
+                email='psychologist@test.com',
+                password='testpass123',
+                user_type='Psychologist',
+                is_verified=True,
+            ),
+            first_name='Jane',
+            last_name='Smith',
+            license_number='PSY-REPLICA',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=8,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=False,
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse('psychologist-marketplace-filter')
+
+        response = client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+        client.cookies['db_primary_pin'] = '1'
+        response = client.get(url)
+        self.assertEqual(response.data['count'], 1)
@@ -0,0 +1,178 @@
+"""
+Test the streaming queryset exports.
+"""
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from appointments.exports import AppointmentExport
+from appointments.models import Appointment
+from children.exports import ChildExport
+from children.models import Child
+from core.exports import csv_lines, ndjson_lines
+from parents.models import Parent
+from psychologists.models import Psychologist
+from users.models import User
+
+
+class ExportWriterTests(TestCase):
+    """Tests for the CSV and NDJSON writers"""
+
+    COLUMNS = [('name', 'Name'), ('active', 'Active'), ('joined', 'Joined')]
+    ROWS = [
+        {'name': 'Anna, "Annie"', 'active': True, 'joined': date(2024, 1, 2)},
+        {'name': 'Ben', 'active': False, 'joined': None},
+    ]
+
+    def test_csv_lines(self):
+        """Test CSV cells are quoted and formatted for spreadsheets"""
+        rows = list(csv.reader(io.StringIO(''.join(csv_lines(self.COLUMNS, self.ROWS)))))
+
+        self.assertEqual(rows, [
+            ['Name', 'Active', 'Joined'],
+            ['Anna, "Annie"', 'Yes', '2024-01-02'],
+            ['Ben', 'No', ''],
+        ])
+
+    def test_ndjson_lines(self):
+        """Test NDJSON keeps value types, one object per line"""
+        lines = list(ndjson_lines(self.COLUMNS, self.ROWS))
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0]), {'name': 'Anna, "Annie"', 'active': True, 'joined': '2024-01-02'})
+        self.assertIsNone(json.loads(lines[1])['joined'])
+
+
+class QuerysetExportTests(TestCase):
+    """Tests for the children, psychologist and appointment exports"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(email='admin@test.com', password='testpass123')
+        self.client.force_login(self.admin_user)
+
+        self.parent_user = User.objects.create_parent(email='parent@test.com', password='testpass123')
+        self.parent = Parent.objects.get(user=self.parent_user)
+
+        today = date.today()
+        self.children = []
+        for index, years in enumerate([6, 10, 14]):
+            child = Child.objects.create(
+                parent=self.parent,
+                first_name=f'Child{index}',
+                last_name='Export',
+                date_of_birth=date(today.year - years, 1, 1),
+                has_received_therapy=index == 0,
+            )
+            self.children.append(child)
+        self.children[0].set_consent('service_consent', True)
+        self.children[0].save()
+
+        psychologist_user = User.objects.create_user(
+            email='psychologist@test.com',
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=psychologist_user,
+            first_name='Jane',
+            last_name='Smith',
+            license_number='PSY-EXPORT',
+            license_issuing_authority='State Board',
+            license_expiry_date=today + timedelta(days=365),
+            years_of_experience=8,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=False,
+        )
+
+    def _download(self, changelist, action, ids):
+        response = self.client.post(reverse(changelist), {
+            'action': action,
+            '_selected_action': [str(pk) for pk in ids],
+        })
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_child_export_streams_in_one_query(self):
+        """Test rows are read in chunks through one server-side cursor query"""
+        export = ChildExport()
+        export.chunk_size = 2
+
+        with self.assertNumQueries(1):
+            chunks = list(export.stream(Child.objects.all()))
+
+        self.assertEqual(len(chunks), 2)
+        rows = list(csv.DictReader(io.StringIO(''.join(chunks))))
+        by_name = {row['Full Name']: row for row in rows}
+        self.assertEqual(by_name['Child0 Export']['Consent Status'], '1/4')
+        self.assertEqual(by_name['Child0 Export']['Has Psychology History'], 'Yes')
+        self.assertEqual(by_name['Child1 Export']['Age'], str(self.children[1].age))
+        self.assertEqual(by_name['Child2 Export']['Parent Email'], 'parent@test.com')
+
+    def test_child_csv_keeps_cell_formats(self):
+        """Test the children CSV formats cells as before, while NDJSON keeps raw values"""
+        child = self.children[1]
+        queryset = Child.objects.filter(pk=child.pk)
+
+        row = next(csv.DictReader(io.StringIO(''.join(ChildExport().stream(queryset)))))
+        self.assertEqual(row['Gender'], 'Not specified')
+        self.assertEqual(row['School Grade'], 'Not specified')
+        self.assertEqual(row['Profile Completeness'], f'{child.profile_completeness}%')
+        self.assertEqual(row['Created Date'], child.created_at.strftime('%Y-%m-%d'))
+
+        row = json.loads(''.join(ChildExport().stream(queryset, 'ndjson')))
+        self.assertFalse(row['gender'])
+        self.assertEqual(row['profile_completeness'], child.profile_completeness)
+
+    def test_children_admin_csv_action(self):
+        """Test the admin action downloads only the selected children"""
+        response, content = self._download(
+            'admin:children_child_changelist', 'export_children_csv', [self.children[1].pk]
+        )
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('attachment; filename="children_', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual([row['ID'] for row in rows], [str(self.children[1].pk)])
+
+    def test_psychologists_admin_ndjson_action(self):
+        """Test the psychologist admin streams NDJSON"""
+        response, content = self._download(
+            'admin:psychologists_psychologist_changelist', 'export_psychologists_ndjson', [self.psychologist.pk]
+        )
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        row = json.loads(content)
+        self.assertEqual(row['full_name'], 'Dr. Jane Smith')
+        self.assertEqual(row['user__email'], 'psychologist@test.com')
+        self.assertIs(row['offers_online_sessions'], True)
+
+    def test_appointments_admin_csv_action(self):
+        """Test appointments export with their participants"""
+        start = timezone.now() + timedelta(days=3)
+        appointment = Appointment.objects.create(
+            child=self.children[0],
+            psychologist=self.psychologist,
+            parent=self.parent,
+            session_type='OnlineMeeting',
+            scheduled_start_time=start,
+            scheduled_end_time=start + timedelta(hours=1),
+        )
+
+        with self.assertNumQueries(1):
+            rows = list(AppointmentExport().rows(Appointment.objects.all()))
+        self.assertEqual(rows[0]['child_name'], 'Child0 Export')
+
+        _response, content = self._download(
+            'admin:appointments_appointment_changelist', 'export_appointments_csv', [appointment.pk]
+        )
+        row = next(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(row['ID'], str(appointment.pk))
+        self.assertEqual(row['Psychologist'], 'Dr. Jane Smith')
+        self.assertEqual(row['Parent Email'], 'parent@test.com')
@@ -0,0 +1,189 @@
+"""
+Test per-request SQL instrumentation and the request metrics endpoint.
+"""
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import serializers, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+from rest_framework.test import APITestCase
+
+from core.instrumentation import (
+    RequestMetrics,
+    RequestMetricsMiddleware,
+    RequestMetricsStore,
+    request_metrics,
+)
+from users.models import User
+
+ENABLED = {'ENABLED': True}
+
+
+class UserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ['email']
+
+
+def three_queries(request):
+    for _ in range(3):
+        User.objects.count()
+    return HttpResponse()
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    """Tests for RequestMetricsMiddleware"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        request_metrics.reset()
+
+    def _timings(self, response):
+        """Server-Timing header as {'db': (duration, description), ...}"""
+        timings = {}
+        for metric in response['Server-Timing'].split(', '):
+            name, *params = metric.split(';')
+            params = dict(param.split('=', 1) for param in params)
+            timings[name] = (float(params['dur']), params.get('desc', '').strip('"'))
+        return timings
+
+    def test_disabled_by_default(self):
+        """Test the middleware removes itself from the stack unless enabled"""
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestMetricsMiddleware(three_queries)
+
+    @override_settings(REQUEST_METRICS=ENABLED)
+    def test_server_timing_counts_queries(self):
+        """Test the Server-Timing header reports the request's queries and times"""
+        response = RequestMetricsMiddleware(three_queries)(self.factory.get('/'))
+
+        timings = self._timings(response)
+        self.assertEqual(set(timings), {'db', 'serializer', 'view', 'total'})
+        self.assertEqual(timings['db'][1], '3 queries')
+        self.assertGreater(timings['db'][0], 0)
+        # Each duration is rounded to 0.1ms in the header
+        self.assertGreaterEqual(timings['total'][0] + 0.2, timings['db'][0] + timings['view'][0])
+
+    @override_settings(REQUEST_METRICS=ENABLED)
+    def test_queries_outside_requests_not_counted(self):
+        """Test only queries made while serving the request are counted"""
+        middleware = RequestMetricsMiddleware(three_queries)
+        User.objects.count()
+
+        response = middleware(self.factory.get('/'))
+
+        self.assertEqual(self._timings(response)['db'][1], '3 queries')
+
+    @override_settings(REQUEST_METRICS=ENABLED)
+    def test_serializer_time(self):
+        """Test time spent rendering the response data is reported"""
+        user = User.objects.create_parent(email='parent@test.com', password='testpass123')
+
+        @api_view(['GET'])
+        @permission_classes([AllowAny])
+        def serialize(request):
+            # Large enough to take well over the header's 0.1ms resolution
+            return Response(UserSerializer([user] * 1000, many=True).data)
+
+        def get_response(request):
+            return serialize(request).render()
+
+        response = RequestMetricsMiddleware(get_response)(self.factory.get('/'))
+
+        self.assertGreater(self._timings(response)['serializer'][0], 0)
+
+    @override_settings(REQUEST_METRICS=ENABLED)
+    def test_serializers_not_patched(self):
+        """Test enabling the metrics leaves DRF's serializers alone"""
+        RequestMetricsMiddleware(three_queries)
+
+        self.assertEqual(BaseSerializer.data.fget.__module__, 'rest_framework.serializers')
+
+    @override_settings(REQUEST_METRICS=ENABLED)
+    def test_async_request(self):
+        """Test queries run through sync_to_async in async views are counted"""
+        async def get_response(request):
+            await sync_to_async(three_queries)(request)
+            await User.objects.acount()
+            return HttpResponse()
+
+        response = async_to_sync(RequestMetricsMiddleware(get_response))(self.factory.get('/'))
+
+        self.assertEqual(self._timings(response)['db'][1], '4 queries')
+
+    @override_settings(REQUEST_METRICS={**ENABLED, 'MAX_QUERIES': 2})
+    def test_over_budget_logged(self):
+        """Test requests over the query budget are logged"""
+        with self.assertLogs('core.instrumentation', level='WARNING') as logs:
+            RequestMetricsMiddleware(three_queries)(self.factory.get('/'))
+
+        self.assertIn('3 queries', logs.output[0])
+
+    @override_settings(REQUEST_METRICS={**ENABLED, 'SERVER_TIMING': False})
+    def test_server_timing_optional(self):
+        """Test the header can be turned off while metrics are still recorded"""
+        response = RequestMetricsMiddleware(three_queries)(self.factory.get('/'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(request_metrics.summary()['GET <unresolved>']['queries']['max'], 3)
+
+
+class RequestMetricsStoreTests(SimpleTestCase):
+    """Tests for the per-view percentiles"""
+
+    def test_percentiles(self):
+        """Test percentiles and sample limits per view"""
+        store = RequestMetricsStore()
+        with override_settings(REQUEST_METRICS={'SAMPLE_SIZE': 100}):
+            for i in range(1, 201):
+                store.record('GET appointment-list', i, RequestMetrics(queries=i % 10, db_ms=i / 2))
+            store.record('GET appointment-detail', 5, RequestMetrics(queries=2))
+
+        summary = store.summary()
+        self.assertEqual(summary['GET appointment-list']['count'], 100)
+        self.assertEqual(summary['GET appointment-list']['total_ms'], {'p50': 151, 'p95': 196, 'p99': 200})
+        self.assertEqual(summary['GET appointment-list']['queries']['max'], 9)
+        self.assertEqual(summary['GET appointment-detail']['queries'], {'p50': 2, 'p95': 2, 'p99': 2, 'max': 2})
+
+        store.reset()
+        self.assertEqual(store.summary(), {})
+
+
+@override_settings(REQUEST_METRICS=ENABLED)
+class RequestMetricsViewTests(APITestCase):
+    """Tests for the request metrics endpoint"""
+
+    def setUp(self):
+        self.url = reverse('health-requests')
+        request_metrics.reset()
+
+    def test_admin_gets_view_percentiles(self):
+        """Test admins see the recorded requests per view"""
+        self.client.force_authenticate(
+            user=User.objects.create_superuser(email='admin@test.com', password='testpass123')
+        )
+        self.client.get(reverse('health-database'))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['enabled'])
+        self.assertIn('Server-Timing', response)
+        stats = response.data['views']['GET health-database']
+        self.assertEqual(stats['count'], 1)
+        self.assertGreaterEqual(stats['queries']['max'], 1)
+
+    def test_non_admin_forbidden(self):
+        """Test other users can't read the metrics"""
+        self.client.force_authenticate(
+            user=User.objects.create_parent(email='parent@test.com', password='testpass123')
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
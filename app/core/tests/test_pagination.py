@@ -0,0 +1,96 @@
+"""
+Test the estimated-count API pagination.
+"""
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.pagination import EstimatedCountPagination
+from users.models import User
+
+
+@patch.object(EstimatedCountPagination, 'page_size', 2)
+class EstimatedCountPaginationTests(APITestCase):
+    """Tests for page-number and cursor paging of list endpoints"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(email='admin@test.com', password='testpass123')
+        for index in range(4):
+            User.objects.create_parent(email=f'parent{index}@test.com', password='testpass123')
+        self.client.force_authenticate(user=self.admin_user)
+        self.url = reverse('users-list')
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE users')
+
+    def test_small_results_counted_exactly(self):
+        """Test results under the threshold report an exact count"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+        self.assertFalse(response.data['count_is_estimate'])
+        self.assertEqual(len(response.data['results']), 2)
+
+    @override_settings(ESTIMATED_COUNT={'EXACT_COUNT_THRESHOLD': 1})
+    def test_large_results_estimated(self):
+        """Test results over the threshold are labelled as estimated"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+        self.assertTrue(response.data['count_is_estimate'])
+
+    @override_settings(ESTIMATED_COUNT={'EXACT_COUNT_THRESHOLD': 1})
+    def test_overestimate_has_no_next_link(self):
+        """Test a short page ends the listing even if the estimate promised more"""
+        # Table statistics still say five users
+        User.objects.filter(user_type='Parent').delete()
+
+        response = self.client.get(self.url)
+
+        self.assertTrue(response.data['count_is_estimate'])
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNone(response.data['next'])
+
+    @override_settings(ESTIMATED_COUNT={'EXACT_COUNT_THRESHOLD': 1})
+    def test_underestimate_reaches_every_row(self):
+        """Test pages past a low estimate are served and linked"""
+        # Table statistics still say five users
+        for index in range(4, 8):
+            User.objects.create_parent(email=f'parent{index}@test.com', password='testpass123')
+
+        seen = []
+        url = self.url
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.data['count_is_estimate'])
+            seen += [user['email'] for user in response.data['results']]
+            url = response.data['next']
+
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(len(seen), 9)
+        self.assertEqual(len(set(seen)), 9)
+
+        response = self.client.get(self.url, {'page': 6})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_pagination(self):
+        """Test cursor paging walks every row once without counting"""
+        seen = []
+        url = f'{self.url}?pagination=cursor'
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            seen += [user['email'] for user in response.data['results']]
+            url = response.data['next']
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
@@ -0,0 +1,451 @@
+"""
+Test API endpoint query budgets.
+
+Every list, detail and action endpoint gets a fixed query budget, checked
+against a small fixture, and must issue the same number of queries once
+the fixture holds fifty times as many rows. An N+1 regression fails here
+instead of shipping.
+"""
+from datetime import date, datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from appointments.models import Appointment, AppointmentSlot
+from children.models import Child
+from parents.models import Parent
+from psychologists import search
+from psychologists.models import Psychologist, PsychologistAvailability
+from users.models import User
+
+# Rows of every kind in the small and the large fixture
+SMALL = 1
+LARGE = 50
+
+
+class QueryBudgetTestCase(APITestCase):
+    """
+    Fixture of realistic volume plus budget assertions
+
+    Each row adds, for the main parent and psychologist: a child, a
+    specific-date availability block, three slots (two free consecutive
+    hours and one booked) and an appointment; and elsewhere: another
+    approved psychologist with availability and another parent with a child.
+    """
+
+    def setUp(self):
+        cache.clear()
+        # Checked once per process; not part of any request's budget
+        search.trigram_available()
+        self.created = 0
+        self.admin_user = User.objects.create_superuser(email='admin@test.com', password='testpass123')
+        self.parent_user = User.objects.create_parent(email='parent@test.com', password='testpass123')
+        self.parent_user.is_verified = True
+        self.parent_user.save()
+        self.parent = Parent.objects.get(user=self.parent_user)
+        self.psychologist = self._create_psychologist('main')
+        self.psychologist_user = self.psychologist.user
+        self.blocks = self._create_weekly_availability(self.psychologist)
+
+    def _create_psychologist(self, key):
+        return Psychologist.objects.create(
+            user=User.objects.create_user(
+                email=f'psychologist-{key}@test.com',
+                password='testpass123',
+                user_type='Psychologist',
+                is_verified=True,
+            ),
+            first_name='Budget',
+            last_name=f'Psychologist {key}',
+            license_number=f'PSY-BUDGET-{key}',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=5,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=True,
+            office_address='1 Main St',
+            biography='Child psychologist',
+        )
+
+    def _create_weekly_availability(self, psychologist):
+        """Recurring 08:00-18:00 availability, by day_of_week (0=Sunday)"""
+        return {
+            day: PsychologistAvailability.objects.create(
+                psychologist=psychologist,
+                day_of_week=day,
+                start_time=time(8, 0),
+                end_time=time(18, 0),
+                is_recurring=True,
+            )
+            for day in range(7)
+        }
+
+    def _create_slot(self, slot_date, hour):
+        return AppointmentSlot.objects.create(
+            psychologist=self.psychologist,
+            availability_block=self.blocks[(slot_date.weekday() + 1) % 7],
+            slot_date=slot_date,
+            start_time=time(hour, 0),
+        )
+
+    def _create_rows(self, count):
+        for _ in range(count):
+            index = self.created = self.created + 1
+            child = Child.objects.create(
+                parent=self.parent,
+                first_name=f'Child{index}',
+                date_of_birth=date(date.today().year - 8, 1, 1),
+            )
+
+            # From the day after tomorrow, so appointments can still be cancelled
+            slot_date = date.today() + timedelta(days=index + 1)
+            PsychologistAvailability.objects.create(
+                psychologist=self.psychologist,
+                day_of_week=(slot_date.weekday() + 1) % 7,
+                specific_date=slot_date,
+                start_time=time(19, 0),
+                end_time=time(20, 0),
+                is_recurring=False,
+            )
+            self._create_slot(slot_date, 9)
+            self._create_slot(slot_date, 10)
+            booked = self._create_slot(slot_date, 11)
+            start = timezone.make_aware(datetime.combine(slot_date, booked.start_time))
+            appointment = Appointment.objects.create(
+                child=child,
+                psychologist=self.psychologist,
+                parent=self.parent,
+                session_type='OnlineMeeting',
+                scheduled_start_time=start,
+                scheduled_end_time=start + timedelta(hours=1),
+                parent_notes='Budget appointment',
+            )
+            appointment.appointment_slots.add(booked)
+            booked.mark_as_booked()
+
+            other = self._create_psychologist(index)
+            PsychologistAvailability.objects.create(
+                psychologist=other,
+                day_of_week=index % 7,
+                start_time=time(9, 0),
+                end_time=time(12, 0),
+                is_recurring=True,
+            )
+            other_parent = Parent.objects.get(
+                user=User.objects.create_parent(email=f'parent{index}@test.com', password='testpass123')
+            )
+            Child.objects.create(
+                parent=other_parent,
+                first_name=f'Other{index}',
+                date_of_birth=date(date.today().year - 10, 1, 1),
+            )
+
+    def _queries(self, user, method, url, data=None):
+        """Queries issued by one request, with every cache empty"""
+        cache.clear()
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data, format='json' if method != 'get' else None)
+        self.assertLess(response.status_code, 300, f"{method.upper()} {url}: {response.status_code} {response.data}")
+        return len(queries)
+
+    def assertQueryBudgets(self, user, endpoints):
+        """
+        Check `endpoints` ({label: (budget, method, url, data)}) stay within
+        budget and don't grow with the fixture
+
+        `url` and `data` may be callables, called before each measurement;
+        write endpoints use them to prepare the row the request acts on.
+        """
+        def measure():
+            counts = {}
+            for label, (budget, method, url, data) in endpoints.items():
+                url = url() if callable(url) else url
+                data = data() if callable(data) else data
+                counts[label] = self._queries(user, method, url, data)
+            return counts
+
+        self._create_rows(SMALL)
+        small = measure()
+        self._create_rows(LARGE - SMALL)
+        large = measure()
+
+        for label, (budget, *_) in endpoints.items():
+            with self.subTest(endpoint=label):
+                self.assertLessEqual(small[label], budget, f"{label} is over its query budget")
+                self.assertEqual(
+                    large[label], small[label],
+                    f"{label}: {small[label]} queries with {SMALL} rows, {large[label]} with {LARGE}"
+                )
+
+
+class ParentQueryBudgetTests(QueryBudgetTestCase):
+    """Endpoints used by parents"""
+
+    def test_parent_endpoints(self):
+        """Test parent endpoints stay within budget at any volume"""
+        psychologist_id = str(self.psychologist.user_id)
+        # appointment-cancel below cancels the latest open appointment
+        open_appointments = Appointment.objects.exclude(appointment_status='Cancelled')
+        slots = {'psychologist_id': psychologist_id, 'session_type': 'OnlineMeeting'}
+        consultation_slots = {'psychologist_id': psychologist_id, 'session_type': 'InitialConsultation'}
+
+        def first_child():
+            return Child.objects.filter(parent=self.parent).order_by('created_at').first().pk
+
+        def first_appointment():
+            return open_appointments.order_by('scheduled_start_time').first().pk
+
+        def last_open():
+            return open_appointments.order_by('-scheduled_start_time').first().pk
+
+        def booking():
+            slot = AppointmentSlot.objects.filter(
+                psychologist=self.psychologist, is_booked=False, start_time=time(9, 0)
+            ).order_by('-slot_date').first()
+            return {
+                'child': str(first_child()),
+                'psychologist': psychologist_id,
+                'session_type': 'OnlineMeeting',
+                'start_slot_id': slot.pk,
+            }
+
+        def new_child():
+            # The one created by child-profile-list
+            return reverse('child-profile-detail', args=[Child.objects.get(first_name='New').pk])
+
+        self.assertQueryBudgets(self.parent_user, {
+            'auth-me': (0, 'get', reverse('auth-me'), None),
+            'auth-update-profile': (
+                2, 'patch', reverse('auth-update-profile'), {'user_timezone': 'Europe/Berlin'}),
+            'parent-profile-profile': (0, 'get', reverse('parent-profile-profile'), None),
+            'parent-profile-update-profile': (
+                4, 'patch', reverse('parent-profile-update-profile'), {'city': 'Springfield'}),
+            'parent-profile-completeness': (0, 'get', reverse('parent-profile-completeness'), None),
+            'parent-profile-communication-preferences': (
+                0, 'get', reverse('parent-profile-communication-preferences'), None),
+            'parent-profile-communication-preferences (update)': (
+                2, 'patch', reverse('parent-profile-communication-preferences'), {'sms_notifications': True}),
+            'parent-profile-reset-communication-preferences': (
+                2, 'post', reverse('parent-profile-reset-communication-preferences'), {}),
+            'child-profile-my-children': (1, 'get', reverse('child-profile-my-children'), None),
+            'child-profile-list': (
+                8, 'post', reverse('child-profile-list'),
+                {'first_name': 'New', 'date_of_birth': date(date.today().year - 7, 1, 1).isoformat()}),
+            'child-profile-detail': (
+                1, 'get', lambda: reverse('child-profile-detail', args=[first_child()]), None),
+            'child-profile-detail (update)': (5, 'patch', new_child, {'nickname': 'Newbie'}),
+            'child-profile-detail (delete)': (5, 'delete', new_child, None),
+            'child-profile-profile-summary': (
+                1, 'get', lambda: reverse('child-profile-profile-summary', args=[first_child()]), None),
+            'psychologist-marketplace-list': (3, 'get', reverse('psychologist-marketplace-list'), None),
+            'psychologist-marketplace-detail': (
+                1, 'get', reverse('psychologist-marketplace-detail', args=[psychologist_id]), None),
+            'psychologist-marketplace-search': (
+                3, 'post', reverse('psychologist-marketplace-search'), {'name': 'Budget'}),
+            'psychologist-marketplace-filter': (
+                2, 'get', reverse('psychologist-marketplace-filter') + '?offers_online_sessions=true', None),
+            'psychologist-marketplace-typeahead': (
+                1, 'get', reverse('psychologist-marketplace-typeahead') + '?q=Budget&limit=1', None),
+            'psychologist-marketplace-availability': (
+                4, 'get', reverse('psychologist-marketplace-availability', args=[psychologist_id]), None),
+            'appointment-list': (4, 'get', reverse('appointment-list'), None),
+            'appointment-detail': (
+                5, 'get', lambda: reverse('appointment-detail', args=[first_appointment()]), None),
+            'appointment-history': (1, 'get', reverse('appointment-history'), None),
+            'appointment-search': (2, 'post', reverse('appointment-search'), {'is_upcoming': True}),
+            'appointment-search (filtered)': (
+                2, 'post', reverse('appointment-search'),
+                {'is_upcoming': True, 'session_type': 'OnlineMeeting', 'psychologist_id': psychologist_id}),
+            'appointment-my-appointments': (3, 'get', reverse('appointment-my-appointments'), None),
+            'appointment-upcoming': (3, 'get', reverse('appointment-upcoming'), None),
+            'appointment-available-slots': (3, 'get', reverse('appointment-available-slots'), slots),
+            'appointment-available-slots (consultation)': (
+                3, 'get', reverse('appointment-available-slots'), consultation_slots),
+            'appointment-slots-available-for-booking': (
+                4, 'get', reverse('appointment-slots-available-for-booking'), slots),
+            'appointment-list (book)': (37, 'post', reverse('appointment-list'), booking),
+            'child-profile-manage-consent': (
+                3, 'post', lambda: reverse('child-profile-manage-consent', args=[first_child()]),
+                {'consent_type': 'service_consent', 'granted': True, 'parent_signature': 'Parent'}),
+            'child-profile-bulk-consent': (
+                5, 'post', lambda: reverse('child-profile-bulk-consent', args=[first_child()]),
+                {'consent_types': ['assessment_consent', 'communication_consent'], 'granted': True,
+                 'parent_signature': 'Parent'}),
+            'appointment-cancel': (
+                15, 'post', lambda: reverse('appointment-cancel', args=[last_open()]),
+                {'cancellation_reason': 'Schedule conflict'}),
+        })
+
+
+class PsychologistQueryBudgetTests(QueryBudgetTestCase):
+    """Endpoints used by psychologists"""
+
+    def test_psychologist_endpoints(self):
+        """Test psychologist endpoints stay within budget at any volume"""
+        psychologist_id = str(self.psychologist.user_id)
+        far_date = date.today() + timedelta(days=LARGE + 30)
+        # Booked appointments only: verify-qr adds a consultation starting now
+        pending_appointments = Appointment.objects.filter(appointment_status='Payment_Pending')
+
+        def first_slot():
+            return AppointmentSlot.objects.order_by('slot_date', 'start_time').first().pk
+
+        def first_appointment():
+            return pending_appointments.order_by('scheduled_start_time').first().pk
+
+        def new_block():
+            # Drop the block left by the previous measurement first
+            PsychologistAvailability.objects.filter(psychologist=self.psychologist, start_time=time(20, 0)).delete()
+            return {
+                'psychologist': psychologist_id,
+                'day_of_week': 3,
+                'start_time': '20:00',
+                'end_time': '21:00',
+                'is_recurring': True,
+                'specific_date': None,
+            }
+
+        def created_block():
+            block = PsychologistAvailability.objects.get(psychologist=self.psychologist, start_time=time(20, 0))
+            return reverse('psychologist-availability-detail', args=[block.pk])
+
+        def weekly_schedule():
+            PsychologistAvailability.objects.filter(psychologist=self.psychologist, start_time=time(22, 0)).delete()
+            return {'weekly_schedule': {'friday': [{'start_time': '22:00', 'end_time': '23:00'}]}}
+
+        def new_slot():
+            AppointmentSlot.objects.filter(slot_date=far_date).delete()
+            return {
+                'psychologist': psychologist_id,
+                'availability_block': self.blocks[(far_date.weekday() + 1) % 7].pk,
+                'slot_date': far_date.isoformat(),
+                'start_time': '09:00',
+                'end_time': '10:00',
+            }
+
+        def created_slot():
+            return reverse('appointment-slots-detail', args=[AppointmentSlot.objects.get(slot_date=far_date).pk])
+
+        def generate_slots():
+            # The latest specific-date block, without the slot generated from it before
+            block = PsychologistAvailability.objects.filter(
+                psychologist=self.psychologist, is_recurring=False
+            ).order_by('-specific_date').first()
+            AppointmentSlot.objects.filter(availability_block=block).delete()
+            return reverse('appointment-slots-generate-slots') + f'?availability_block_id={block.pk}'
+
+        def scheduled_appointment():
+            appointment = pending_appointments.order_by('scheduled_start_time').first()
+            appointment.appointment_status = 'Scheduled'
+            appointment.save(update_fields=['appointment_status'])
+            return reverse('appointment-complete', args=[appointment.pk])
+
+        def consultation_qr():
+            start = timezone.now()
+            appointment = Appointment.objects.create(
+                child=Child.objects.filter(parent=self.parent).first(),
+                psychologist=self.psychologist,
+                parent=self.parent,
+                session_type='InitialConsultation',
+                appointment_status='Scheduled',
+                scheduled_start_time=start,
+                scheduled_end_time=start + timedelta(hours=2),
+            )
+            return {'qr_code': appointment.qr_verification_code}
+
+        self.assertQueryBudgets(self.psychologist_user, {
+            'psychologist-profile-profile': (0, 'get', reverse('psychologist-profile-profile'), None),
+            'psychologist-profile-update-profile': (
+                8, 'patch', reverse('psychologist-profile-update-profile'), {'biography': 'Play therapy'}),
+            'psychologist-profile-completeness': (0, 'get', reverse('psychologist-profile-completeness'), None),
+            'psychologist-profile-education': (0, 'get', reverse('psychologist-profile-education'), None),
+            'psychologist-profile-education (update)': (
+                6, 'patch', reverse('psychologist-profile-education'),
+                {'education': [{'degree': 'PhD Psychology', 'institution': 'State University', 'year': 2010}]}),
+            'psychologist-profile-certifications': (
+                0, 'get', reverse('psychologist-profile-certifications'), None),
+            'psychologist-profile-certifications (update)': (
+                6, 'patch', reverse('psychologist-profile-certifications'),
+                {'certifications': [{'name': 'Play Therapy', 'institution': 'APT', 'year': 2015}]}),
+            'psychologist-availability-list': (10, 'post', reverse('psychologist-availability-list'), new_block),
+            'psychologist-availability-detail': (
+                1, 'get', reverse('psychologist-availability-detail', args=[self.blocks[1].pk]), None),
+            'psychologist-availability-detail (update)': (11, 'patch', created_block, {'end_time': '21:30'}),
+            'psychologist-availability-detail (delete)': (4, 'delete', created_block, None),
+            'psychologist-availability-bulk-create': (
+                10, 'post', reverse('psychologist-availability-bulk-create'), weekly_schedule),
+            'psychologist-availability-my-availability': (
+                2, 'get', reverse('psychologist-availability-my-availability'), None),
+            'psychologist-availability-weekly-summary': (
+                1, 'get', reverse('psychologist-availability-weekly-summary'), None),
+            'psychologist-availability-appointment-slots': (
+                2, 'get', reverse('psychologist-availability-appointment-slots'), None),
+            'appointment-slots-list': (3, 'get', reverse('appointment-slots-list'), None),
+            'appointment-slots-list (create)': (10, 'post', reverse('appointment-slots-list'), new_slot),
+            'appointment-slots-detail': (
+                1, 'get', lambda: reverse('appointment-slots-detail', args=[first_slot()]), None),
+            'appointment-slots-detail (delete)': (4, 'delete', created_slot, None),
+            'appointment-slots-my-slots': (1, 'get', reverse('appointment-slots-my-slots'), None),
+            'appointment-slots-generate-slots': (9, 'post', generate_slots, {}),
+            'appointment-analytics-psychologist-stats': (
+                7, 'get', reverse('appointment-analytics-psychologist-stats'), None),
+            'appointment-list': (4, 'get', reverse('appointment-list'), None),
+            'appointment-detail': (
+                5, 'get', lambda: reverse('appointment-detail', args=[first_appointment()]), None),
+            'appointment-detail (update)': (
+                9, 'patch', lambda: reverse('appointment-detail', args=[first_appointment()]),
+                {'psychologist_notes': 'Bring drawings'}),
+            'appointment-history': (1, 'get', reverse('appointment-history'), None),
+            'appointment-my-appointments': (3, 'get', reverse('appointment-my-appointments'), None),
+            'appointment-upcoming': (3, 'get', reverse('appointment-upcoming'), None),
+            'appointment-complete': (9, 'post', scheduled_appointment, {'psychologist_notes': 'Went well'}),
+            'appointment-verify-qr': (14, 'post', reverse('appointment-verify-qr'), consultation_qr),
+        })
+
+
+class AdminQueryBudgetTests(QueryBudgetTestCase):
+    """Endpoints used by admins"""
+
+    def test_admin_endpoints(self):
+        """Test admin endpoints stay within budget at any volume"""
+        def first_parent():
+            return Parent.objects.order_by('created_at').first().pk
+
+        def first_child():
+            return Child.objects.order_by('created_at').first().pk
+
+        def first_appointment():
+            return Appointment.objects.order_by('scheduled_start_time').first().pk
+
+        self.assertQueryBudgets(self.admin_user, {
+            'users-list': (3, 'get', reverse('users-list'), None),
+            'users-detail': (1, 'get', reverse('users-detail', args=[self.parent_user.pk]), None),
+            'parent-management-list': (3, 'get', reverse('parent-management-list'), None),
+            'parent-management-detail': (
+                1, 'get', lambda: reverse('parent-management-detail', args=[first_parent()]), None),
+            'parent-management-search': (2, 'post', reverse('parent-management-search'), {}),
+            'child-management-list': (3, 'get', reverse('child-management-list'), None),
+            'child-management-detail': (
+                1, 'get', lambda: reverse('child-management-detail', args=[first_child()]), None),
+            'child-management-search': (1, 'post', reverse('child-management-search'), {}),
+            'child-management-statistics': (1, 'get', reverse('child-management-statistics'), None),
+            'psychologist-management-list': (3, 'get', reverse('psychologist-management-list'), None),
+            'psychologist-management-detail': (
+                1, 'get', reverse('psychologist-management-detail', args=[self.psychologist.pk]), None),
+            'psychologist-management-search': (1, 'post', reverse('psychologist-management-search'), {}),
+            'psychologist-management-statistics': (
+                1, 'get', reverse('psychologist-management-statistics'), None),
+            'appointment-list': (4, 'get', reverse('appointment-list'), None),
+            'appointment-detail': (
+                5, 'get', lambda: reverse('appointment-detail', args=[first_appointment()]), None),
+            'appointment-slots-list': (3, 'get', reverse('appointment-slots-list'), None),
+            'appointment-slots-statistics': (4, 'get', reverse('appointment-slots-statistics'), None),
+            'appointment-slots-cleanup-past-slots': (
+                1, 'post', reverse('appointment-slots-cleanup-past-slots'), {}),
+        })
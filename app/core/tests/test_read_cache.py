@@ -0,0 +1,168 @@
+"""
+Test the versioned service-layer read cache.
+"""
+from datetime import date, time, timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from children.models import Child
+from children.services import ChildService
+from core import read_cache
+from parents.models import Parent
+from psychologists.models import Psychologist, PsychologistAvailability
+from psychologists.services import PsychologistAvailabilityService
+from users.models import User
+
+
+class ReadCacheTests(TestCase):
+    """Tests for cached_read and invalidate"""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = []
+
+        @read_cache.cached_read('widget', arg='widget_id')
+        def lookup(widget_id, scale=1):
+            self.calls.append((widget_id, scale))
+            return widget_id * scale
+
+        self.lookup = lookup
+
+    def test_results_cached_per_entity_and_arguments(self):
+        """Test repeated calls are served from the cache"""
+        self.assertEqual(self.lookup(2), 2)
+        self.assertEqual(self.lookup(2), 2)
+        self.assertEqual(self.lookup(2, scale=3), 6)
+        self.assertEqual(self.lookup(3), 3)
+
+        self.assertEqual(self.calls, [(2, 1), (2, 3), (3, 1)])
+        self.assertEqual(self.lookup.uncached(2), 2)
+
+    def test_invalidate_drops_every_read_of_the_entity(self):
+        """Test invalidating an entity recomputes all its reads, and only its reads"""
+        self.lookup(2)
+        self.lookup(2, scale=3)
+        self.lookup(3)
+
+        read_cache.invalidate('widget', 2)
+        self.lookup(2)
+        self.lookup(2, scale=3)
+        self.lookup(3)
+
+        self.assertEqual(self.calls, [(2, 1), (2, 3), (3, 1), (2, 1), (2, 3)])
+
+    def test_invalidated_again_on_commit(self):
+        """Test the version moves again when the transaction commits"""
+        self.lookup(2)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            read_cache.invalidate('widget', 2)
+            # Cached by "another worker" from data read before the commit
+            self.lookup(2)
+
+        self.assertEqual(len(callbacks), 1)
+        self.lookup(2)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_evicted_version_does_not_revive_old_entries(self):
+        """Test losing the version key never serves entries cached under an old version"""
+        self.lookup(2)
+        cache.delete(read_cache._version_key('widget', 2))
+
+        self.lookup(2)
+
+        self.assertEqual(len(self.calls), 2)
+
+
+class ServiceReadCacheTests(TestCase):
+    """Tests for the cached service reads and their signal invalidation"""
+
+    def setUp(self):
+        cache.clear()
+        self.parent = Parent.objects.get(
+            user=User.objects.create_parent(email='parent@test.com', password='testpass123')
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=User.objects.create_user(
+                email='psychologist@test.com',
+                password='testpass123',
+                user_type='Psychologist',
+                is_verified=True,
+            ),
+            first_name='Jane',
+            last_name='Smith',
+            license_number='PSY-CACHE',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=8,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=False,
+        )
+
+    def _add_child(self, first_name):
+        return Child.objects.create(
+            parent=self.parent,
+            first_name=first_name,
+            date_of_birth=date(date.today().year - 8, 1, 1),
+        )
+
+    def test_children_for_parent(self):
+        """Test the children list is cached until a child changes"""
+        self._add_child('Anna')
+        self.assertEqual([c.first_name for c in ChildService.get_children_for_parent(self.parent)], ['Anna'])
+
+        with self.assertNumQueries(0):
+            children = ChildService.get_children_for_parent(self.parent)
+        self.assertEqual(len(children), 1)
+
+        ben = self._add_child('Ben')
+        self.assertEqual(
+            [c.first_name for c in ChildService.get_children_for_parent(self.parent)], ['Anna', 'Ben']
+        )
+
+        ben.delete()
+        self.assertEqual(len(ChildService.get_children_for_parent(self.parent)), 1)
+
+    def test_weekly_availability_summary(self):
+        """Test the weekly summary is cached until an availability block or the profile changes"""
+        summary = PsychologistAvailabilityService.get_weekly_availability_summary(self.psychologist)
+        self.assertEqual(summary['total_weekly_hours'], 0)
+
+        with self.assertNumQueries(0):
+            PsychologistAvailabilityService.get_weekly_availability_summary(self.psychologist)
+
+        block = PsychologistAvailability.objects.create(
+            psychologist=self.psychologist,
+            day_of_week=1,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+            is_recurring=True,
+        )
+        summary = PsychologistAvailabilityService.get_weekly_availability_summary(self.psychologist)
+        self.assertEqual(summary['weekly_availability']['monday']['blocks_count'], 1)
+        self.assertEqual(len(PsychologistAvailability.get_psychologist_recurring_availability(self.psychologist)), 1)
+
+        block.delete()
+        self.assertEqual(len(PsychologistAvailability.get_psychologist_recurring_availability(self.psychologist)), 0)
+
+        self.psychologist.first_name = 'Janet'
+        self.psychologist.save()
+        summary = PsychologistAvailabilityService.get_weekly_availability_summary(self.psychologist)
+        self.assertEqual(summary['psychologist_name'], 'Dr. Janet Smith')
+
+    def test_recurring_availability_cached_with_psychologist(self):
+        """Test cached recurring blocks carry their psychologist, so serializing them needs no queries"""
+        PsychologistAvailability.objects.create(
+            psychologist=self.psychologist,
+            day_of_week=1,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+            is_recurring=True,
+        )
+        PsychologistAvailability.get_psychologist_recurring_availability(self.psychologist)
+
+        with self.assertNumQueries(0):
+            blocks = PsychologistAvailability.get_psychologist_recurring_availability(self.psychologist)
+            self.assertEqual([block.psychologist.user.email for block in blocks], ['psychologist@test.com'])
@@ -0,0 +1,9 @@
+# core/urls.py
+from django.urls import path
+
+from .views import DatabaseHealthView, RequestMetricsView
+
+urlpatterns = [
+    path('database/', DatabaseHealthView.as_view(), name='health-database'),
+    path('requests/', RequestMetricsView.as_view(), name='health-requests'),
+]
@@ -0,0 +1,118 @@
+import logging
+import os
+
+from django.db import DatabaseError, connection
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.db_pool import get_pool_stats
+from core.instrumentation import get_config as get_metrics_config, request_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseHealthView(APIView):
+    """
+    Database health and connection pool statistics (Admin only)
+    """
+    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+
+    @extend_schema(
+        responses={
+            200: {
+                'description': 'Database reachable; pool statistics of the worker that answered',
+                'example': {
+                    'status': 'ok',
+                    'pid': 12,
+                    'databases': {
+                        'default': {
+                            'pooled': True,
+                            'min_size': 1,
+                            'max_size': 2,
+                            'size': 1,
+                            'idle': 0,
+                            'in_use': 1,
+                            'waiting': 0,
+                            'requests': 1520,
+                            'requests_queued': 3,
+                            'wait_ms_total': 41,
+                            'wait_ms_avg': 13.7,
+                            'request_errors': 0,
+                            'connections_opened': 2,
+                            'connections_lost': 0
+                        }
+                    }
+                }
+            },
+            503: {'description': 'Database unreachable'}
+        },
+        description=(
+            "Check the primary database and report connection pool use per database. "
+            "Pools are per gunicorn worker, so each response covers one worker (`pid`)."
+        ),
+        tags=['Health']
+    )
+    def get(self, request):
+        """
+        Database health and pool statistics
+        GET /api/health/database/
+        """
+        healthy = True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+        except DatabaseError as e:
+            logger.error(f"Database health check failed: {str(e)}")
+            healthy = False
+
+        return Response({
+            'status': 'ok' if healthy else 'unavailable',
+            'pid': os.getpid(),
+            'databases': get_pool_stats(),
+        }, status=status.HTTP_200_OK if healthy else status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+class RequestMetricsView(APIView):
+    """
+    Per-view query counts and timings of recent requests (Admin only)
+    """
+    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+
+    @extend_schema(
+        responses={
+            200: {
+                'description': 'Percentiles of the recent requests served by the worker that answered',
+                'example': {
+                    'enabled': True,
+                    'pid': 12,
+                    'views': {
+                        'GET appointment-list': {
+                            'count': 500,
+                            'total_ms': {'p50': 38.2, 'p95': 91.0, 'p99': 140.7},
+                            'db_ms': {'p50': 9.1, 'p95': 24.3, 'p99': 40.2},
+                            'serializer_ms': {'p50': 6.0, 'p95': 12.8, 'p99': 20.1},
+                            'queries': {'p50': 6, 'p95': 8, 'p99': 8, 'max': 9}
+                        }
+                    }
+                }
+            }
+        },
+        description=(
+            "Query count, database, serializer and total time percentiles per view, over the "
+            "most recent requests. Recorded per gunicorn worker (`pid`) while REQUEST_METRICS "
+            "is enabled."
+        ),
+        tags=['Health']
+    )
+    def get(self, request):
+        """
+        Request metrics per view
+        GET /api/health/requests/
+        """
+        return Response({
+            'enabled': get_metrics_config()['ENABLED'],
+            'pid': os.getpid(),
+            'views': request_metrics.summary(),
+        })
@@ -0,0 +1,21 @@
+"""
+gunicorn settings, read from the environment.
+
+SERVER_MODE=wsgi (default) runs sync workers on app.wsgi; SERVER_MODE=asgi
+runs uvicorn workers on app.asgi, where the async views serve many
+requests per worker at once.
+"""
+import os
+
+SERVER_MODE = os.environ.get('SERVER_MODE', 'wsgi')
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', 3))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+
+if SERVER_MODE == 'asgi':
+    wsgi_app = 'app.asgi:application'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    wsgi_app = 'app.wsgi:application'
+    threads = int(os.environ.get('GUNICORN_THREADS', 1))
@@ -6,6 +6,8 @@ from django.urls import reverse
 from django.db.models import Count
 import json
 
+from core.admin import ProfileCompletenessFilter
+from core.pagination import EstimatedCountPaginator
 from .models import Parent
 
 
@@ -19,11 +21,13 @@ class ParentAdmin(admin.ModelAdmin):
         'phone_number',
         'city',
         'country',
+        'profile_completeness_display',
         'created_at',
         'is_active'
     ]
 
     list_filter = [
+        ProfileCompletenessFilter,
         'country',
         'state_province',
         'created_at',
@@ -39,17 +43,22 @@ class ParentAdmin(admin.ModelAdmin):
         'postal_code'
     ]
 
+    list_select_related = ['user']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     readonly_fields = [
         'user_link',
         'created_at',
         'updated_at',
         'full_address',
+        'profile_completeness_display',
         'communication_preferences_display'
     ]
 
     fieldsets = (
         (_('User Information'), {
-            'fields': ('user_link',)
+            'fields': ('user_link', 'profile_completeness_display')
         }),
         (_('Personal Information'), {
             'fields': (
@@ -97,6 +106,25 @@ class ParentAdmin(admin.ModelAdmin):
     is_active.boolean = True
     is_active.admin_order_field = 'user__is_active'
 
+    def profile_completeness_display(self, obj):
+        """Display profile completeness percentage"""
+        completeness = obj.profile_completeness
+
+        if completeness >= 80:
+            color = 'green'
+        elif completeness >= 60:
+            color = 'orange'
+        else:
+            color = 'red'
+
+        return format_html(
+            '<span style="color: {};">{}%</span>',
+            color,
+            f'{completeness:.1f}'
+        )
+    profile_completeness_display.short_description = _('Profile Completeness')
+    profile_completeness_display.admin_order_field = 'profile_completeness'
+
     def user_link(self, obj):
         """Display link to user admin"""
         url = reverse('admin:users_user_change', args=[obj.user.id])
@@ -93,6 +93,15 @@ class Parent(models.Model):
         help_text=_("Notification and communication preferences")
     )
 
+    # Stored so profiles can be filtered and sorted by it; set in save()
+    profile_completeness = models.FloatField(
+        _('profile completeness'),
+        default=0,
+        editable=False,
+        db_index=True,
+        help_text=_("Profile completeness percentage, maintained on save")
+    )
+
     # Timestamps
     created_at = models.DateTimeField(
         _('created at'),
@@ -113,12 +122,33 @@ class Parent(models.Model):
             models.Index(fields=['created_at']),
         ]
 
+    # Fields scored by get_profile_completeness
+    COMPLETENESS_REQUIRED_FIELDS = ['first_name', 'last_name', 'phone_number']
+    COMPLETENESS_OPTIONAL_FIELDS = ['address_line1', 'city', 'state_province', 'postal_code', 'country']
+
     def __str__(self):
         name = self.full_name.strip()
         if name:
             return f"{name} ({self.user.email})"
         return f"({self.user.email})"
 
+    def save(self, *args, **kwargs):
+        """Override save to refresh the stored completeness"""
+        self.profile_completeness = self.get_profile_completeness()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'profile_completeness'}
+        super().save(*args, **kwargs)
+
+    def get_profile_completeness(self):
+        """Calculate profile completeness percentage"""
+        def completed(fields):
+            return sum(1 for field in fields if (getattr(self, field) or '').strip())
+
+        required_score = completed(self.COMPLETENESS_REQUIRED_FIELDS) / len(self.COMPLETENESS_REQUIRED_FIELDS) * 100
+        optional_score = completed(self.COMPLETENESS_OPTIONAL_FIELDS) / len(self.COMPLETENESS_OPTIONAL_FIELDS) * 100
+
+        # Required fields weighted more heavily
+        return round((required_score * 0.7) + (optional_score * 0.3), 1)
 
     @property
     def full_name(self):
@@ -185,8 +185,9 @@ class ParentSummarySerializer(serializers.ModelSerializer):
             'city',
             'state_province',
             'country',
+            'profile_completeness',
         ]
-        read_only_fields = ['user', 'email', 'full_name', 'display_name']
+        read_only_fields = ['user', 'email', 'full_name', 'display_name', 'profile_completeness']
 
 
 class CommunicationPreferencesSerializer(serializers.Serializer):
@@ -239,9 +240,16 @@ class ParentSearchSerializer(serializers.Serializer):
     is_verified = serializers.BooleanField(required=False)
     created_after = serializers.DateTimeField(required=False)
     created_before = serializers.DateTimeField(required=False)
+    min_profile_completeness = serializers.FloatField(min_value=0, max_value=100, required=False)
+    max_profile_completeness = serializers.FloatField(min_value=0, max_value=100, required=False)
+    ordering = serializers.ChoiceField(
+        choices=['profile_completeness', '-profile_completeness', 'created_at', '-created_at'],
+        required=False,
+        help_text=_("Sort order for the results")
+    )
 
     def validate(self, attrs):
-        """Validate date ranges"""
+        """Validate date and profile completeness ranges"""
         created_after = attrs.get('created_after')
         created_before = attrs.get('created_before')
 
@@ -250,4 +258,11 @@ class ParentSearchSerializer(serializers.Serializer):
                 'created_after': _("Start date must be before end date")
             })
 
+        min_completeness = attrs.get('min_profile_completeness')
+        max_completeness = attrs.get('max_profile_completeness')
+        if min_completeness is not None and max_completeness is not None and min_completeness > max_completeness:
+            raise serializers.ValidationError({
+                'min_profile_completeness': _("Minimum profile completeness must be less than maximum profile completeness")
+            })
+
         return attrs
\ No newline at end of file
@@ -7,6 +7,7 @@ from typing import Optional, Dict, Any
 
 from .models import Parent
 from users.models import User
+from users.actor import get_user_profile
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +31,14 @@ class ParentService:
     def get_parent_by_user(user: User) -> Optional[Parent]:
         """
         Get parent profile by user, return None if not found
+
+        The profile is memoized on the user instance (and preloaded by
+        CachedTokenAuthentication), so repeated calls in a request are free.
         """
-        try:
-            return Parent.objects.select_related('user').get(user=user)
-        except Parent.DoesNotExist:
+        profile = get_user_profile(user, 'parent_profile')
+        if profile is None:
             logger.warning(f"Parent profile not found for user {user.email}")
-            return None
+        return profile
 
     @staticmethod
     def get_parent_by_user_or_raise(user: User) -> Parent:
@@ -176,19 +179,8 @@ class ParentService:
         """
         Calculate profile completeness score and missing fields
         """
-        required_fields = {
-            'first_name': parent.first_name,
-            'last_name': parent.last_name,
-            'phone_number': parent.phone_number,
-        }
-
-        optional_fields = {
-            'address_line1': parent.address_line1,
-            'city': parent.city,
-            'state_province': parent.state_province,
-            'postal_code': parent.postal_code,
-            'country': parent.country,
-        }
+        required_fields = {field: getattr(parent, field) for field in Parent.COMPLETENESS_REQUIRED_FIELDS}
+        optional_fields = {field: getattr(parent, field) for field in Parent.COMPLETENESS_OPTIONAL_FIELDS}
 
         # Check required fields
         completed_required = sum(1 for value in required_fields.values() if value and value.strip())
@@ -202,8 +194,8 @@ class ParentService:
         required_score = (completed_required / total_required) * 100 if total_required > 0 else 100
         optional_score = (completed_optional / total_optional) * 100 if total_optional > 0 else 100
 
-        # Overall score (required fields weighted more heavily)
-        overall_score = (required_score * 0.7) + (optional_score * 0.3)
+        # Overall score (required fields weighted more heavily), as stored on the parent
+        overall_score = parent.get_profile_completeness()
 
         # Missing fields
         missing_required = [field for field, value in required_fields.items()
@@ -212,7 +204,7 @@ class ParentService:
                           if not value or not value.strip()]
 
         return {
-            'overall_score': round(overall_score, 1),
+            'overall_score': overall_score,
             'required_score': round(required_score, 1),
             'optional_score': round(optional_score, 1),
             'is_complete': len(missing_required) == 0,
@@ -1,9 +1,10 @@
 # parents/signals.py
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.db import transaction
 import logging
 
+from core import read_cache
 from users.models import User
 from .models import Parent
 
@@ -28,3 +29,13 @@ def create_parent_profile(sender, instance, created, **kwargs):
         except Exception as e:
             logger.error(f"Failed to create parent profile for user {instance.email}: {str(e)}")
             # Don't raise the exception to avoid breaking user creation
+
+
+@receiver(post_save, sender=Parent)
+@receiver(post_delete, sender=Parent)
+def invalidate_parent_reads(sender, instance, raw=False, **kwargs):
+    """
+    Drop the parent's cached reads when the profile changes
+    """
+    if not raw:
+        read_cache.invalidate('parent', instance.pk)
@@ -66,6 +66,20 @@ class ParentModelTest(TestCase):
         self.assertEqual(parent.city, 'New York')
         self.assertEqual(parent.country, 'US')
 
+    def test_profile_completeness_is_stored(self):
+        """Test the stored completeness follows profile changes"""
+        user = User.objects.create_parent(**self.user_data)
+        parent = user.parent_profile
+        self.assertEqual(parent.profile_completeness, 6.0)  # Only the default country
+
+        parent.first_name = 'John'
+        parent.last_name = 'Doe'
+        parent.phone_number = '+1-555-123-4567'
+        parent.save(update_fields=['first_name', 'last_name', 'phone_number'])
+        parent.refresh_from_db()
+
+        self.assertEqual(parent.profile_completeness, 76.0)
+
     def test_parent_str_representation(self):
         """Test string representation of parent"""
         user = User.objects.create_parent(**self.user_data)
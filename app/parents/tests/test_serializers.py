@@ -233,7 +233,7 @@ class ParentSummarySerializerTest(TestCase):
 
         expected_fields = [
             'user', 'email', 'full_name', 'display_name',
-            'city', 'state_province', 'country'
+            'city', 'state_province', 'country', 'profile_completeness'
         ]
         self.assertEqual(set(data.keys()), set(expected_fields))
 
@@ -242,7 +242,7 @@ class ParentSummarySerializerTest(TestCase):
         serializer = ParentSummarySerializer()
         read_only_fields = serializer.Meta.read_only_fields
 
-        expected_read_only = ['user', 'email', 'full_name', 'display_name']
+        expected_read_only = ['user', 'email', 'full_name', 'display_name', 'profile_completeness']
         self.assertEqual(set(read_only_fields), set(expected_read_only))
 
 
@@ -69,12 +69,16 @@ class TestGetParentByUser(ParentServiceTestCase):
         )
 
     def test_get_parent_with_select_related(self):
-        """Test that the method uses select_related optimization"""
+        """Test that the method loads the profile in one query and memoizes it"""
+        user = User.objects.get(pk=self.parent_user.pk)
         with self.assertNumQueries(1):
-            parent = ParentService.get_parent_by_user(self.parent_user)
+            parent = ParentService.get_parent_by_user(user)
             # Accessing user should not trigger additional query
             _ = parent.user.email
 
+        with self.assertNumQueries(0):
+            self.assertIs(ParentService.get_parent_by_user(user), parent)
+
 
 class TestGetParentByUserOrRaise(ParentServiceTestCase):
     """Test get_parent_by_user_or_raise method"""
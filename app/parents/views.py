@@ -309,6 +309,7 @@ class ParentManagementViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin
     """
     queryset = Parent.objects.select_related('user').all()
     permission_classes = [permissions.IsAuthenticated, IsParentOwnerOrReadOnly]
+    cursor_ordering = '-created_at'
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -409,8 +410,16 @@ class ParentManagementViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin
                 if search_data.get('created_before'):
                     filters['created_at__lte'] = search_data['created_before']
 
+                # Profile completeness filters
+                if search_data.get('min_profile_completeness') is not None:
+                    filters['profile_completeness__gte'] = search_data['min_profile_completeness']
+                if search_data.get('max_profile_completeness') is not None:
+                    filters['profile_completeness__lte'] = search_data['max_profile_completeness']
+
                 # Apply filters
                 queryset = self.get_queryset().filter(**filters)
+                if search_data.get('ordering'):
+                    queryset = queryset.order_by(search_data['ordering'], 'last_name', 'first_name')
 
                 # Serialize results
                 serializer = ParentSummarySerializer(queryset, many=True)
@@ -4,9 +4,16 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
+from django.db.models import Count
 import json
 
 from .models import Psychologist, PsychologistAvailability
+from core.admin import ProfileCompletenessFilter
+from core.exports import export_actions
+from core.pagination import EstimatedCountPaginator
+from users.authentication import invalidate_user_tokens
+from .services import MarketplaceSnapshotService
+from .exports import PsychologistExport
 
 
 class PsychologistAvailabilityInline(admin.TabularInline):
@@ -47,11 +54,13 @@ class PsychologistAdmin(admin.ModelAdmin):
         'services_offered_display',
         'availability_blocks_count',
         'is_marketplace_visible',
+        'profile_completeness_display',
         'created_at'
     ]
 
     list_filter = [
         'verification_status',
+        ProfileCompletenessFilter,
         'offers_initial_consultation',
         'offers_online_sessions',
         'license_expiry_date',
@@ -115,7 +124,8 @@ class PsychologistAdmin(admin.ModelAdmin):
             'fields': (
                 'offers_online_sessions',
                 'offers_initial_consultation',
-                'office_address'
+                'office_address',
+                ('office_latitude', 'office_longitude')
             )
         }),
         (_('Pricing (Optional - MVP)'), {
@@ -151,7 +161,11 @@ class PsychologistAdmin(admin.ModelAdmin):
 
     inlines = [PsychologistAvailabilityInline]
 
-    actions = ['approve_verification', 'reject_verification', 'reset_to_pending']
+    actions = ['approve_verification', 'reject_verification', 'reset_to_pending', *export_actions(PsychologistExport)]
+
+    list_select_related = ['user']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     def user_email(self, obj):
         """Display user email"""
@@ -197,23 +211,31 @@ class PsychologistAdmin(admin.ModelAdmin):
         return format_html(' '.join(service_badges))
     def availability_blocks_count(self, obj):
         """Display count of availability blocks"""
-        count = obj.availability_blocks.count()
+        count = obj.availability_blocks_total
         if count == 0:
             return format_html('<span style="color: red;">No availability set</span>')
         return f"{count} blocks"
     availability_blocks_count.short_description = _('Availability Blocks')
+    availability_blocks_count.admin_order_field = 'availability_blocks_total'
 
     def availability_summary(self, obj):
         """Display availability summary"""
-        recurring = obj.availability_blocks.filter(is_recurring=True).order_by('day_of_week', 'start_time')
-        specific = obj.availability_blocks.filter(is_recurring=False).order_by('specific_date', 'start_time')
+        blocks = list(obj.availability_blocks.all())
+        recurring = sorted(
+            (block for block in blocks if block.is_recurring),
+            key=lambda block: (block.day_of_week, block.start_time)
+        )
+        specific = sorted(
+            (block for block in blocks if not block.is_recurring),
+            key=lambda block: (block.specific_date, block.start_time)
+        )
 
-        if not recurring.exists() and not specific.exists():
+        if not blocks:
             return format_html('<span style="color: red;">No availability set</span>')
 
         html_parts = []
 
-        if recurring.exists():
+        if recurring:
             html_parts.append('<h4>Recurring Availability:</h4>')
             html_parts.append('<ul style="margin: 5px 0; padding-left: 20px;">')
             for avail in recurring:
@@ -223,7 +245,7 @@ class PsychologistAdmin(admin.ModelAdmin):
                 )
             html_parts.append('</ul>')
 
-        if specific.exists():
+        if specific:
             html_parts.append('<h4>Specific Date Availability:</h4>')
             html_parts.append('<ul style="margin: 5px 0; padding-left: 20px;">')
             for avail in specific[:5]:  # Show only first 5
@@ -231,8 +253,8 @@ class PsychologistAdmin(admin.ModelAdmin):
                     f'<li>{avail.specific_date}: {avail.get_time_range_display()} '
                     f'({avail.max_appointable_slots} slots)</li>'
                 )
-            if specific.count() > 5:
-                html_parts.append(f'<li><em>... and {specific.count() - 5} more</em></li>')
+            if len(specific) > 5:
+                html_parts.append(f'<li><em>... and {len(specific) - 5} more</em></li>')
             html_parts.append('</ul>')
 
         return format_html(''.join(html_parts))
@@ -250,7 +272,7 @@ class PsychologistAdmin(admin.ModelAdmin):
 
     def profile_completeness_display(self, obj):
         """Display profile completeness percentage"""
-        completeness = obj.get_profile_completeness()
+        completeness = obj.profile_completeness
 
         if completeness >= 80:
             color = 'green'
@@ -260,11 +282,12 @@ class PsychologistAdmin(admin.ModelAdmin):
             color = 'red'
 
         return format_html(
-            '<span style="color: {}; font-weight: bold;">{:.1f}%</span>',
+            '<span style="color: {}; font-weight: bold;">{}%</span>',
             color,
-            completeness
+            f'{completeness:.1f}'
         )
     profile_completeness_display.short_description = _('Profile Completeness')
+    profile_completeness_display.admin_order_field = 'profile_completeness'
 
     def verification_requirements_display(self, obj):
         """Display verification requirements"""
@@ -314,8 +337,10 @@ class PsychologistAdmin(admin.ModelAdmin):
     certifications_display.short_description = _('Certifications')
 
     def get_queryset(self, request):
-        """Optimize queryset with select_related"""
-        return super().get_queryset(request).select_related('user')
+        """Optimize queryset with select_related and the availability block count"""
+        return super().get_queryset(request).select_related('user').annotate(
+            availability_blocks_total=Count('availability_blocks')
+        )
 
     def has_add_permission(self, request):
         """Prevent manual creation of psychologist profiles"""
@@ -328,10 +353,13 @@ class PsychologistAdmin(admin.ModelAdmin):
     # Admin Actions
     def approve_verification(self, request, queryset):
         """Approve selected psychologists"""
+        user_ids = list(queryset.values_list('user_id', flat=True))
         updated = queryset.update(
             verification_status='Approved',
             updated_at=timezone.now()
         )
+        invalidate_user_tokens(*user_ids)
+        MarketplaceSnapshotService.refresh_for_users(*user_ids)
         self.message_user(
             request,
             f'{updated} psychologist(s) approved successfully.'
@@ -340,10 +368,13 @@ class PsychologistAdmin(admin.ModelAdmin):
 
     def reject_verification(self, request, queryset):
         """Reject selected psychologists"""
+        user_ids = list(queryset.values_list('user_id', flat=True))
         updated = queryset.update(
             verification_status='Rejected',
             updated_at=timezone.now()
         )
+        invalidate_user_tokens(*user_ids)
+        MarketplaceSnapshotService.refresh_for_users(*user_ids)
         self.message_user(
             request,
             f'{updated} psychologist(s) rejected.'
@@ -352,10 +383,13 @@ class PsychologistAdmin(admin.ModelAdmin):
 
     def reset_to_pending(self, request, queryset):
         """Reset verification status to pending"""
+        user_ids = list(queryset.values_list('user_id', flat=True))
         updated = queryset.update(
             verification_status='Pending',
             updated_at=timezone.now()
         )
+        invalidate_user_tokens(*user_ids)
+        MarketplaceSnapshotService.refresh_for_users(*user_ids)
         self.message_user(
             request,
             f'{updated} psychologist(s) reset to pending verification.'
@@ -390,6 +424,10 @@ class PsychologistAvailabilityAdmin(admin.ModelAdmin):
         'psychologist__last_name'
     ]
 
+    list_select_related = ['psychologist__user']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     readonly_fields = [
         'psychologist_link',
         'duration_hours_display',
@@ -6,3 +6,5 @@ class PsychologistsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'psychologists'
 
+    def ready(self):
+        import psychologists.signals  # noqa
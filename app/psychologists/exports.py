@@ -0,0 +1,27 @@
+# psychologists/exports.py
+from core.exports import QuerysetExport
+
+
+class PsychologistExport(QuerysetExport):
+    """Psychologist profiles with license, services and verification details"""
+    filename = 'psychologists'
+    columns = [
+        ('user_id', 'ID'),
+        ('full_name', 'Full Name'),
+        ('user__email', 'Email'),
+        ('license_number', 'License Number'),
+        ('license_issuing_authority', 'License Authority'),
+        ('license_expiry_date', 'License Expiry'),
+        ('years_of_experience', 'Years of Experience'),
+        ('verification_status', 'Verification Status'),
+        ('offers_online_sessions', 'Online Sessions'),
+        ('offers_initial_consultation', 'Initial Consultations'),
+        ('office_address', 'Office Address'),
+        ('profile_completeness', 'Profile Completeness'),
+        ('created_at', 'Created Date'),
+    ]
+    fields = [key for key, _header in columns if key != 'full_name'] + ['first_name', 'last_name']
+
+    def get_row(self, values):
+        values['full_name'] = f"Dr. {values['first_name']} {values['last_name']}".strip()
+        return values
@@ -0,0 +1,76 @@
+# psychologists/geo.py
+import math
+from typing import Tuple
+
+from django.db.models import FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LATITUDE = math.pi * EARTH_RADIUS_KM / 180
+
+DEFAULT_RADIUS_KM = 25
+MAX_RADIUS_KM = 500
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    (min_lat, max_lat, min_lng, max_lng) enclosing the circle of `radius_km`
+
+    Longitudes are normalized to [-180, 180], so min_lng > max_lng means
+    the box crosses the antimeridian. Near the poles the box spans every
+    longitude.
+    """
+    lat_delta = radius_km / KM_PER_DEGREE_LATITUDE
+    min_lat, max_lat = latitude - lat_delta, latitude + lat_delta
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90), min(max_lat, 90), -180.0, 180.0
+
+    # Widest longitude offset reached by the circle
+    ratio = math.sin(math.radians(lat_delta)) / math.cos(math.radians(latitude))
+    lng_delta = math.degrees(math.asin(min(1.0, ratio)))
+
+    def wrap(lng):
+        return (lng + 180) % 360 - 180
+
+    return min_lat, max_lat, wrap(longitude - lng_delta), wrap(longitude + lng_delta)
+
+
+def bounding_box_q(box) -> Q:
+    """Index-friendly filter for offices inside `box`"""
+    min_lat, max_lat, min_lng, max_lng = box
+    q = Q(office_latitude__gte=min_lat, office_latitude__lte=max_lat)
+    if min_lng <= max_lng:
+        return q & Q(office_longitude__gte=min_lng, office_longitude__lte=max_lng)
+    return q & (Q(office_longitude__gte=min_lng) | Q(office_longitude__lte=max_lng))
+
+
+def near_q(latitude: float, longitude: float, radius_km: float) -> Q:
+    """
+    Candidate filter for offices within `radius_km`
+
+    Matches the bounding box of the circle, which the (latitude, longitude)
+    index answers without touching other rows; the distance itself is then
+    checked with haversine_distance().
+    """
+    return bounding_box_q(bounding_box(latitude, longitude, radius_km))
+
+
+def haversine_distance(latitude: float, longitude: float):
+    """Great-circle distance in km from (latitude, longitude) to the office"""
+    lat = Radians('office_latitude')
+    lat0 = math.radians(latitude)
+    half_dlat = (lat - Value(lat0)) / 2
+    half_dlng = (Radians('office_longitude') - Value(math.radians(longitude))) / 2
+    a = Power(Sin(half_dlat), 2) + Value(math.cos(lat0)) * Cos(lat) * Power(Sin(half_dlng), 2)
+    # LEAST guards asin() against rounding slightly above 1
+    return Value(2 * EARTH_RADIUS_KM) * ASin(Sqrt(Least(a, Value(1.0))), output_field=FloatField())
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Python counterpart of haversine_distance(), e.g. for tests"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
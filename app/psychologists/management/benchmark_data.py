@@ -0,0 +1,112 @@
+"""
+Synthetic psychologist data for the psychologists benchmark commands
+"""
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+
+from psychologists.models import Psychologist, infer_degree_level
+from users.models import User
+
+FIRST_NAMES = [
+    'Anna', 'Ben', 'Clara', 'David', 'Elena', 'Felix', 'Grace', 'Hugo', 'Iris', 'James',
+    'Kate', 'Liam', 'Maya', 'Noah', 'Olivia', 'Peter', 'Quinn', 'Rosa', 'Sam', 'Tara',
+]
+LAST_NAMES = [
+    'Anderson', 'Baker', 'Carter', 'Davies', 'Evans', 'Fischer', 'Garcia', 'Hughes', 'Ito', 'Jensen',
+    'Keller', 'Lopez', 'Moreau', 'Nguyen', 'Okafor', 'Patel', 'Rossi', 'Smith', 'Tanaka', 'Weber',
+]
+BIO_WORDS = [
+    'anxiety', 'depression', 'adhd', 'autism', 'trauma', 'grief', 'bullying', 'sleep', 'eating',
+    'behaviour', 'attention', 'learning', 'dyslexia', 'family', 'parenting', 'teenagers', 'children',
+    'toddlers', 'play', 'therapy', 'cognitive', 'behavioural', 'mindfulness', 'assessment', 'support',
+    'school', 'social', 'skills', 'emotional', 'regulation', 'self', 'esteem', 'confidence', 'anger',
+    'separation', 'divorce', 'adoption', 'phobia', 'panic', 'obsessive', 'compulsive', 'tics', 'speech',
+]
+# Topic frequency falls off with rank, as in real biographies
+BIO_WEIGHTS = [1 / rank for rank in range(1, len(BIO_WORDS) + 1)]
+SURNAME_SUFFIXES = ['', 'son', 'man', 'ford', 'ley', 'ton', 'berg', 'ini', 'ova', 'wood', 'field', 'stein']
+FILLER_WORDS = ['with', 'and', 'for', 'the', 'of', 'in', 'a', 'helping', 'families', 'experience', 'years']
+DEGREES = ['PhD Clinical Psychology', 'PsyD', 'MSc Child Psychology', 'MA Counselling', 'MSc Neuropsychology']
+INSTITUTIONS = ['Oxford University', 'Leeds University', 'Sorbonne', 'University of Toronto', 'Monash University']
+CERTIFYING_BODIES = ['British Psychological Society', 'EMDR Europe', 'Play Therapy UK', 'CBT Institute', 'Autism Education Trust']
+CITIES = ['London', 'Leeds', 'Paris', 'Toronto', 'Melbourne', 'Berlin', 'Madrid', 'Dublin']
+CITY_COORDINATES = {
+    'London': (51.507, -0.128),
+    'Leeds': (53.801, -1.549),
+    'Paris': (48.857, 2.352),
+    'Toronto': (43.653, -79.383),
+    'Melbourne': (-37.814, 144.963),
+    'Berlin': (52.520, 13.405),
+    'Madrid': (40.417, -3.704),
+    'Dublin': (53.350, -6.260),
+}
+# Spread of offices around their city centre, in degrees (about 20 km)
+OFFICE_SPREAD = 0.2
+STREETS = ['Main Street', 'Harbour Road', 'Station Road', 'Park Avenue', 'Church Lane', 'Mill Road']
+
+
+def seed_psychologists(count, rng, email_prefix='benchmark'):
+    """
+    Bulk-create `count` approved, marketplace-visible psychologists
+
+    Bypasses model signals, so callers build anything derived (e.g.
+    marketplace snapshots) themselves. Run inside a transaction that is
+    rolled back.
+    """
+    password = make_password(None)
+    expiry = date.today() + timedelta(days=365)
+
+    for offset in range(0, count, 5000):
+        batch = range(offset, min(offset + 5000, count))
+        users = User.objects.bulk_create([
+            User(
+                email=f'{email_prefix}-{i}@example.com',
+                password=password,
+                user_type='Psychologist',
+                is_verified=True,
+            )
+            for i in batch
+        ])
+        Psychologist.objects.bulk_create([
+            Psychologist(
+                user=user,
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES) + rng.choice(SURNAME_SUFFIXES),
+                license_number=f'BENCH-{i}',
+                license_issuing_authority='State Board',
+                license_expiry_date=expiry,
+                years_of_experience=rng.randint(1, 30),
+                biography=_biography(rng),
+                education=[
+                    {
+                        'degree': degree,
+                        'institution': rng.choice(INSTITUTIONS),
+                        'year': rng.randint(1990, 2020),
+                        'level': infer_degree_level(degree),
+                    }
+                    for degree in rng.sample(DEGREES, rng.randint(1, 2))
+                ],
+                certifications=[
+                    {'name': 'Certification', 'institution': body, 'year': rng.randint(2000, 2023)}
+                    for body in rng.sample(CERTIFYING_BODIES, rng.randint(0, 2))
+                ],
+                verification_status='Approved',
+                offers_online_sessions=True,
+                offers_initial_consultation=True,
+                office_address=f'{rng.randint(1, 200)} {rng.choice(STREETS)}, {city}',
+                office_latitude=CITY_COORDINATES[city][0] + rng.gauss(0, OFFICE_SPREAD),
+                office_longitude=CITY_COORDINATES[city][1] + rng.gauss(0, OFFICE_SPREAD),
+            )
+            for i, user, city in zip(batch, users, rng.choices(CITIES, k=len(batch)))
+        ])
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE users, psychologists')
+
+
+def _biography(rng):
+    words = rng.choices(BIO_WORDS, weights=BIO_WEIGHTS, k=6) + rng.choices(FILLER_WORDS, k=30)
+    rng.shuffle(words)
+    return ' '.join(words).capitalize() + '.'
@@ -0,0 +1,87 @@
+"""
+Django command to compare the snapshot-backed marketplace list with
+serializing psychologists on every request.
+
+Seeds synthetic psychologists inside a transaction that is rolled back at
+the end. Each run times a full request through the viewset, including
+pagination and JSON rendering.
+"""
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.mixins import ListModelMixin
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from psychologists.management.benchmark_data import seed_psychologists
+from psychologists.services import MarketplaceSnapshotService
+from psychologists.views import PsychologistMarketplaceViewSet
+from users.models import User
+
+
+class SerializingMarketplaceViewSet(PsychologistMarketplaceViewSet):
+    """The marketplace list as it was before snapshots"""
+
+    def list(self, request, *args, **kwargs):
+        return ListModelMixin.list(self, request, *args, **kwargs)
+
+
+class Command(BaseCommand):
+    """Django command to benchmark the marketplace list endpoint."""
+
+    help = 'Benchmark snapshot-backed marketplace listing against per-request serialization'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--psychologists', type=int, default=10000, help='Number of psychologists to seed')
+        parser.add_argument('--page-sizes', type=int, nargs='+', default=[20, 100], help='Page sizes to time')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed requests per page size')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for generated profiles')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['psychologists']} psychologists...")
+            seed_psychologists(options['psychologists'], random.Random(options['seed']))
+
+            started = time.perf_counter()
+            MarketplaceSnapshotService.rebuild_all()
+            self.stdout.write(f'Snapshots built in {time.perf_counter() - started:.1f}s')
+
+            user = User(email='benchmark-parent@example.com', user_type='Parent', is_verified=True)
+            for page_size in options['page_sizes']:
+                snapshot = self._time(PsychologistMarketplaceViewSet, user, page_size, options['repeat'])
+                serializing = self._time(SerializingMarketplaceViewSet, user, page_size, options['repeat'])
+                speedup = statistics.median(serializing) / statistics.median(snapshot)
+                self.stdout.write(
+                    f'page size {page_size:>4}  snapshots {self._summary(snapshot)}  |  '
+                    f'serializer {self._summary(serializing)}  ({speedup:.1f}x)'
+                )
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _time(viewset_class, user, page_size, repeat):
+        pagination_class = type('BenchmarkPagination', (PageNumberPagination,), {'page_size': page_size})
+        view = type('BenchmarkViewSet', (viewset_class,), {'pagination_class': pagination_class}).as_view(
+            {'get': 'list'}
+        )
+        factory = APIRequestFactory()
+
+        timings = []
+        for i in range(repeat):
+            # Walk a few pages so later pages (larger offsets) are included
+            request = factory.get('/api/psychologists/marketplace/', {'page': i % 5 + 1})
+            force_authenticate(request, user=user)
+            started = time.perf_counter()
+            response = view(request)
+            response.render()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    @staticmethod
+    def _summary(timings):
+        p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+        return f'median {statistics.median(timings):7.2f} ms p95 {p95:7.2f} ms'
@@ -0,0 +1,105 @@
+"""
+Django command to time marketplace distance ("near") searches.
+
+Seeds synthetic approved psychologists with offices scattered around a few
+cities, inside a transaction that is rolled back at the end. Each scenario
+times the bounding-box pruned search the endpoints run against computing
+the distance for every office.
+"""
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from psychologists import geo
+from psychologists.management.benchmark_data import seed_psychologists
+from psychologists.models import Psychologist
+from psychologists.services import PsychologistService
+
+SCENARIOS = [
+    ('Leeds centre, 2 km', 53.801, -1.549, 2),
+    ('Leeds centre, 10 km', 53.801, -1.549, 10),
+    ('Paris outskirts, 25 km', 48.95, 2.55, 25),
+    ('Berlin region, 100 km', 52.520, 13.405, 100),
+    ('Open sea, 25 km', 45.0, -30.0, 25),
+]
+
+
+class Command(BaseCommand):
+    """Django command to benchmark distance search."""
+
+    help = 'Benchmark bounding-box indexed distance search for marketplace psychologists'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--psychologists', type=int, default=100000, help='Number of psychologists to seed')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs per scenario')
+        parser.add_argument('--page-size', type=int, default=20, help='Results fetched per search')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for generated profiles')
+        parser.add_argument('--explain', action='store_true', help='Print query plans for each strategy')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['psychologists']} psychologists...")
+            started = time.perf_counter()
+            seed_psychologists(options['psychologists'], random.Random(options['seed']))
+            self.stdout.write(f'Seeded in {time.perf_counter() - started:.1f}s')
+
+            for label, latitude, longitude, radius_km in SCENARIOS:
+                strategies = {
+                    'indexed': self._indexed_queryset(latitude, longitude, radius_km),
+                    'scan': self._scan_queryset(latitude, longitude, radius_km),
+                }
+                results = {name: self._time(qs, options) for name, qs in strategies.items()}
+                self._report(label, results)
+
+                if options['explain']:
+                    for queryset in strategies.values():
+                        self.stdout.write(queryset.all()[:options['page_size']].explain(analyze=True))
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _indexed_queryset(latitude, longitude, radius_km):
+        """What the marketplace filter endpoint runs"""
+        queryset = PsychologistService._apply_marketplace_filters(
+            Psychologist.get_marketplace_psychologists(),
+            {'latitude': latitude, 'longitude': longitude, 'radius_km': radius_km}
+        )
+        return queryset.order_by('distance_km', 'first_name', 'last_name')
+
+    @staticmethod
+    def _scan_queryset(latitude, longitude, radius_km):
+        """Distance computed for every office"""
+        return Psychologist.get_marketplace_psychologists().annotate(
+            distance_km=geo.haversine_distance(latitude, longitude)
+        ).filter(distance_km__lte=radius_km).order_by('distance_km', 'first_name', 'last_name')
+
+    @staticmethod
+    def _time(queryset, options):
+        timings = []
+        for _ in range(options['repeat']):
+            started = time.perf_counter()
+            total = queryset.count()
+            list(queryset.all()[:options['page_size']])
+            timings.append((time.perf_counter() - started) * 1000)
+        return total, timings
+
+    def _report(self, label, results):
+        total, timings = results['indexed']
+        scan_total, scan_timings = results['scan']
+        speedup = statistics.median(scan_timings) / statistics.median(timings)
+        line = (
+            f'{label:<24} {total:>6} matches  indexed {self._summary(timings)}'
+            f'  |  scan {self._summary(scan_timings)} ({speedup:.1f}x)'
+        )
+        if scan_total != total:
+            line += f'  [scan found {scan_total}]'
+        self.stdout.write(line)
+
+    @staticmethod
+    def _summary(timings):
+        p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+        return f'median {statistics.median(timings):7.2f} ms p95 {p95:7.2f} ms'
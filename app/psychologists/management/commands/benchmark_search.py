@@ -0,0 +1,146 @@
+"""
+Django command to compare full-text marketplace search with the previous
+ILIKE-based search, and to time name typeahead lookups.
+
+Seeds synthetic approved psychologists inside a transaction that is rolled
+back at the end, so it leaves no data behind. Each scenario times what the
+paginated search endpoint runs: the total count plus the first page.
+"""
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from psychologists import search
+from psychologists.management.benchmark_data import seed_psychologists
+from psychologists.models import Psychologist
+from psychologists.services import PsychologistService
+
+SCENARIOS = [
+    ('name', {'name': 'Kellerman'}),
+    ('name prefix', {'name': 'Kel'}),
+    ('common bio keyword', {'bio_keywords': 'anxiety'}),
+    ('bio keyword', {'bio_keywords': 'dyslexia'}),
+    ('bio keyword + location', {'bio_keywords': 'trauma', 'location_keywords': 'Leeds'}),
+    ('rare bio keyword', {'bio_keywords': 'speech'}),
+]
+FULL_TEXT_ONLY_SCENARIOS = [
+    ('multi-word query', {'query': 'anxiety teenagers Leeds'}),
+    ('phrase query', {'query': '"play therapy" -toddlers'}),
+]
+TYPEAHEAD_QUERIES = ['ke', 'kel', 'kellerm', 'anna kel', 'smiht']
+
+
+class SearchUser:
+    """Stand-in for a parent browsing the marketplace"""
+    is_admin = False
+    is_staff = False
+    is_parent = True
+    is_psychologist = False
+    user_type = 'Parent'
+
+
+class Command(BaseCommand):
+    """Django command to benchmark psychologist search."""
+
+    help = 'Benchmark full-text psychologist search against the previous ILIKE search'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--psychologists', type=int, default=50000, help='Number of psychologists to seed')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs per scenario')
+        parser.add_argument('--page-size', type=int, default=20, help='Results fetched per search')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for generated profiles')
+        parser.add_argument('--explain', action='store_true', help='Print query plans for both paths')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['psychologists']} psychologists...")
+            started = time.perf_counter()
+            seed_psychologists(options['psychologists'], random.Random(options['seed']))
+            self.stdout.write(f'Seeded in {time.perf_counter() - started:.1f}s')
+
+            for label, params in SCENARIOS:
+                legacy = self._time(self._legacy_queryset(params), options)
+                full_text = self._time(self._full_text_queryset(params), options)
+                self._report(label, full_text, legacy)
+
+                if options['explain']:
+                    self._explain(self._legacy_queryset(params))
+                    self._explain(self._full_text_queryset(params))
+
+            for label, params in FULL_TEXT_ONLY_SCENARIOS:
+                self._report(label, self._time(self._full_text_queryset(params), options))
+
+            self._benchmark_typeahead(options)
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _full_text_queryset(params):
+        return PsychologistService.get_search_queryset(params, SearchUser())
+
+    @staticmethod
+    def _legacy_queryset(params):
+        """The ILIKE filters search used before the search vector existed"""
+        queryset = Psychologist.get_marketplace_psychologists()
+        if params.get('name'):
+            queryset = queryset.filter(
+                Q(first_name__icontains=params['name']) | Q(last_name__icontains=params['name'])
+            )
+        if params.get('bio_keywords'):
+            queryset = queryset.filter(biography__icontains=params['bio_keywords'])
+        if params.get('location_keywords'):
+            queryset = queryset.filter(office_address__icontains=params['location_keywords'])
+        return queryset.order_by('first_name', 'last_name')
+
+    @staticmethod
+    def _time(queryset, options):
+        timings = []
+        for _ in range(options['repeat']):
+            started = time.perf_counter()
+            total = queryset.count()
+            list(queryset.all()[:options['page_size']])
+            timings.append((time.perf_counter() - started) * 1000)
+        return total, timings
+
+    def _report(self, label, full_text, legacy=None):
+        total, timings = full_text
+        line = f'{label:<24} {total:>6} matches  full-text {self._summary(timings)}'
+        if legacy is not None:
+            legacy_total, legacy_timings = legacy
+            speedup = statistics.median(legacy_timings) / statistics.median(timings)
+            line += f'  |  ILIKE {legacy_total:>6} matches {self._summary(legacy_timings)}  ({speedup:.1f}x)'
+        self.stdout.write(line)
+
+    @staticmethod
+    def _summary(timings):
+        p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+        return f'median {statistics.median(timings):7.2f} ms p95 {p95:7.2f} ms'
+
+    def _benchmark_typeahead(self, options):
+        """Time typeahead lookups on a cache miss and on a cache hit"""
+        backend = 'trigram' if search.trigram_available() else 'full-text prefix (pg_trgm not installed)'
+        self.stdout.write(f'Typeahead via {backend}:')
+
+        for query in TYPEAHEAD_QUERIES:
+            misses, hits = [], []
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                results = PsychologistService._get_typeahead_results(query, 8)
+                misses.append((time.perf_counter() - started) * 1000)
+
+                PsychologistService.typeahead(query)
+                started = time.perf_counter()
+                PsychologistService.typeahead(query)
+                hits.append((time.perf_counter() - started) * 1000)
+
+            self.stdout.write(
+                f'  {query!r:<24} {len(results):>6} shown    miss {self._summary(misses)}  |  hit {self._summary(hits)}'
+            )
+
+    def _explain(self, queryset):
+        self.stdout.write(queryset.all()[:20].explain(analyze=True))
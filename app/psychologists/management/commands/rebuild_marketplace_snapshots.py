@@ -0,0 +1,24 @@
+"""
+Django command to rebuild every precomputed marketplace listing entry.
+
+Snapshots are refreshed automatically when psychologists or their users
+are saved. Run this after migrating, and after deploys that change the
+marketplace payload or MVP_PRICING.
+"""
+from django.core.management.base import BaseCommand
+
+from psychologists.services import MarketplaceSnapshotService
+
+
+class Command(BaseCommand):
+    """Django command to rebuild marketplace snapshots."""
+
+    help = 'Rebuild the precomputed marketplace listing for all psychologists'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Psychologists rendered per batch')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        rebuilt = MarketplaceSnapshotService.rebuild_all(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{rebuilt} marketplace snapshots rebuilt'))
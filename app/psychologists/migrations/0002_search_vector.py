@@ -0,0 +1,27 @@
+# Generated by Django 5.1.9 on 2026-10-18 22:49
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import psychologists.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='psychologist',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('first_name', 'last_name', config='english', weight='A'), '||', psychologists.search.JSONBSearchVector('education', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', psychologists.search.JSONBSearchVector('certifications', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('biography', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('office_address', config='english', weight='D'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='psychologist',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='psychologists_search_gin'),
+        ),
+    ]
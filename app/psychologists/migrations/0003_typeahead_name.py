@@ -0,0 +1,43 @@
+# Generated by Django 5.1.9 on 2026-10-18 23:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    Enable pg_trgm and index search_name for typeahead
+
+    Skipped on servers without the extension (it ships with PostgreSQL's
+    contrib package); typeahead then falls back to the full-text index.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS psychologists_name_trgm '
+        'ON psychologists USING gin (search_name gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX IF EXISTS psychologists_name_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0002_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='psychologist',
+            name='search_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=201)),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.9 on 2026-10-18 23:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0003_typeahead_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PsychologistMarketplaceSnapshot',
+            fields=[
+                ('psychologist', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='marketplace_snapshot', serialize=False, to='psychologists.psychologist')),
+                ('payload', models.JSONField(help_text='Rendered marketplace listing data', verbose_name='payload')),
+                ('is_listed', models.BooleanField(default=False, verbose_name='is listed')),
+                ('license_expiry_date', models.DateField(verbose_name='license expiry date')),
+                ('first_name', models.CharField(max_length=100, verbose_name='first name')),
+                ('last_name', models.CharField(max_length=100, verbose_name='last name')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+            ],
+            options={
+                'verbose_name': 'Psychologist Marketplace Snapshot',
+                'verbose_name_plural': 'Psychologist Marketplace Snapshots',
+                'db_table': 'psychologist_marketplace_snapshots',
+                'indexes': [models.Index(condition=models.Q(('is_listed', True)), fields=['first_name', 'last_name', 'psychologist'], name='marketplace_snapshot_listed')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.9 on 2026-10-18 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0004_marketplace_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='psychologist',
+            name='profile_completeness',
+            field=models.FloatField(db_index=True, default=0, editable=False, help_text='Profile completeness percentage, maintained on save', verbose_name='profile completeness'),
+        ),
+    ]
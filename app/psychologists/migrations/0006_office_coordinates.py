@@ -0,0 +1,30 @@
+# Generated by Django 5.1.9 on 2026-10-19 00:06
+
+import django.core.validators
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0005_profile_completeness'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='psychologist',
+            name='office_latitude',
+            field=models.FloatField(blank=True, help_text='Office latitude in decimal degrees, used for distance search', null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)], verbose_name='office latitude'),
+        ),
+        migrations.AddField(
+            model_name='psychologist',
+            name='office_longitude',
+            field=models.FloatField(blank=True, help_text='Office longitude in decimal degrees, used for distance search', null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)], verbose_name='office longitude'),
+        ),
+        migrations.AddIndex(
+            model_name='psychologist',
+            index=models.Index(fields=['office_latitude', 'office_longitude'], name='psychologists_office_coords'),
+        ),
+    ]
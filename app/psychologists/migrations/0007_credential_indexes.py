@@ -0,0 +1,58 @@
+# Generated by Django 5.1.9 on 2026-10-19 00:12
+
+import re
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+# Copied from psychologists.models as of this migration, so later changes
+# to the live patterns don't change what the backfill did
+DEGREE_LEVEL_PATTERNS = [
+    ('doctorate', re.compile(r'\b(phd|psyd|dphil|edd|dclinpsy|doctor|doctorate|doctoral)\b')),
+    ('master', re.compile(r'\b(ms|msc|ma|med|mphil|mres|msw|master|masters)\b')),
+    ('bachelor', re.compile(r'\b(bs|bsc|ba|bed|bachelor|bachelors)\b')),
+]
+
+
+def infer_degree_level(degree):
+    text = re.sub(r"[.']", '', str(degree or '')).lower()
+    for level, pattern in DEGREE_LEVEL_PATTERNS:
+        if pattern.search(text):
+            return level
+    return None
+
+
+def backfill_degree_levels(apps, schema_editor):
+    """Set the level of existing education entries so degree filters match them"""
+    Psychologist = apps.get_model('psychologists', 'Psychologist')
+    for psychologist in Psychologist.objects.exclude(education=[]).only('pk', 'education').iterator():
+        changed = False
+        for edu in psychologist.education or []:
+            if isinstance(edu, dict) and not edu.get('level'):
+                level = infer_degree_level(edu.get('degree'))
+                if level:
+                    edu['level'] = level
+                    changed = True
+        if changed:
+            Psychologist.objects.filter(pk=psychologist.pk).update(education=psychologist.education)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0006_office_coordinates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='psychologist',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['education'], name='psychologists_education_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='psychologist',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['certifications'], name='psychologists_certs_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.RunPython(backfill_degree_levels, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.9 on 2026-10-19 01:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_versions(apps, schema_editor):
+    """Start a version for existing psychologists so their availability gets ETags"""
+    Psychologist = apps.get_model('psychologists', 'Psychologist')
+    PsychologistAvailabilityVersion = apps.get_model('psychologists', 'PsychologistAvailabilityVersion')
+    PsychologistAvailabilityVersion.objects.bulk_create(
+        [
+            PsychologistAvailabilityVersion(psychologist_id=pk)
+            for pk in Psychologist.objects.values_list('pk', flat=True).iterator()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0007_credential_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PsychologistAvailabilityVersion',
+            fields=[
+                ('psychologist', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='availability_version', serialize=False, to='psychologists.psychologist')),
+                ('version', models.PositiveBigIntegerField(default=1, verbose_name='version')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+            ],
+            options={
+                'verbose_name': 'Psychologist Availability Version',
+                'verbose_name_plural': 'Psychologist Availability Versions',
+                'db_table': 'psychologist_availability_versions',
+            },
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
@@ -5,7 +5,31 @@ from django.core.validators import RegexValidator, MinValueValidator, MaxValueVa
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import date
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Concat
+import re
+from core.read_cache import cached_read
 from users.models import User
+from .search import psychologist_search_vector
+
+# Degree levels in ascending order, stored as the `level` of education entries
+DEGREE_LEVELS = ['bachelor', 'master', 'doctorate']
+
+_DEGREE_LEVEL_PATTERNS = [
+    ('doctorate', re.compile(r'\b(phd|psyd|dphil|edd|dclinpsy|doctor|doctorate|doctoral)\b')),
+    ('master', re.compile(r'\b(ms|msc|ma|med|mphil|mres|msw|master|masters)\b')),
+    ('bachelor', re.compile(r'\b(bs|bsc|ba|bed|bachelor|bachelors)\b')),
+]
+
+
+def infer_degree_level(degree):
+    """Degree level named by a free-text degree (e.g. "M.Sc. Psychology" -> master), or None"""
+    text = re.sub(r"[.']", '', str(degree or '')).lower()
+    for level, pattern in _DEGREE_LEVEL_PATTERNS:
+        if pattern.search(text):
+            return level
+    return None
 
 
 class Psychologist(models.Model):
@@ -117,6 +141,20 @@ class Psychologist(models.Model):
         blank=True,
         help_text=_("Complete office address for in-person consultations")
     )
+    office_latitude = models.FloatField(
+        _('office latitude'),
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+        help_text=_("Office latitude in decimal degrees, used for distance search")
+    )
+    office_longitude = models.FloatField(
+        _('office longitude'),
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+        help_text=_("Office longitude in decimal degrees, used for distance search")
+    )
 
     # Professional URLs
     website_url = models.URLField(
@@ -156,6 +194,15 @@ class Psychologist(models.Model):
         help_text=_("Rate for 2-hour initial consultation")
     )
 
+    # Stored so profiles can be filtered and sorted by it; set in save()
+    profile_completeness = models.FloatField(
+        _('profile completeness'),
+        default=0,
+        editable=False,
+        db_index=True,
+        help_text=_("Profile completeness percentage, maintained on save")
+    )
+
     # Timestamps
     created_at = models.DateTimeField(
         _('created at'),
@@ -166,6 +213,22 @@ class Psychologist(models.Model):
         auto_now=True
     )
 
+    # Weighted full-text document (name > education/certifications >
+    # biography > address), kept up to date by the database
+    search_vector = models.GeneratedField(
+        expression=psychologist_search_vector(),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    # "first last" for typeahead; trigram-indexed where pg_trgm is available
+    # (see migration 0003)
+    search_name = models.GeneratedField(
+        expression=Concat('first_name', models.Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+    )
+
     class Meta:
         verbose_name = _('Psychologist')
         verbose_name_plural = _('Psychologists')
@@ -176,6 +239,13 @@ class Psychologist(models.Model):
             models.Index(fields=['license_number']),
             models.Index(fields=['offers_initial_consultation', 'offers_online_sessions']),
             models.Index(fields=['created_at']),
+            GinIndex(fields=['search_vector'], name='psychologists_search_gin'),
+            # Containment (@>) filters on credentials, e.g. degree level or
+            # certifying institution
+            GinIndex(fields=['education'], opclasses=['jsonb_path_ops'], name='psychologists_education_gin'),
+            GinIndex(fields=['certifications'], opclasses=['jsonb_path_ops'], name='psychologists_certs_gin'),
+            # Bounding-box pruning for distance search (see geo.near_q)
+            models.Index(fields=['office_latitude', 'office_longitude'], name='psychologists_office_coords'),
         ]
 
     def __str__(self):
@@ -191,6 +261,12 @@ class Psychologist(models.Model):
                 "Office address is required when offering initial consultations"
             )
 
+        # Office coordinates are only meaningful as a pair
+        if (self.office_latitude is None) != (self.office_longitude is None):
+            errors['office_latitude'] = _(
+                "Office latitude and longitude must be provided together"
+            )
+
         # Business Rule: Must offer at least one service type
         if not self.offers_initial_consultation and not self.offers_online_sessions:
             errors['offers_online_sessions'] = _(
@@ -223,8 +299,12 @@ class Psychologist(models.Model):
             raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
-        """Override save to run validation"""
+        """Override save to run validation and refresh the stored completeness"""
         self.full_clean()
+        self.set_degree_levels()
+        self.profile_completeness = self.get_profile_completeness()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'profile_completeness'}
         super().save(*args, **kwargs)
 
     @property
@@ -364,6 +444,14 @@ class Psychologist(models.Model):
             license_expiry_date__gte=date.today()
         ).select_related('user').order_by('first_name', 'last_name')
 
+    def set_degree_levels(self):
+        """Fill in the `level` of education entries that don't have one, from the degree name"""
+        for edu in self.education or []:
+            if isinstance(edu, dict) and not edu.get('level'):
+                level = infer_degree_level(edu.get('degree'))
+                if level:
+                    edu['level'] = level
+
     def _validate_education_structure(self):
         """Validate education JSON structure"""
         if not isinstance(self.education, list):
@@ -380,6 +468,9 @@ class Psychologist(models.Model):
                 if key not in edu:
                     errors.append(f"Education entry {i+1} missing required field: {key}")
 
+            if edu.get('level') and edu['level'] not in DEGREE_LEVELS:
+                errors.append(f"Education entry {i+1} has invalid level: {edu['level']}")
+
             # Validate year if present
             if 'year' in edu:
                 try:
@@ -425,6 +516,7 @@ class Psychologist(models.Model):
         """Return template for education entry"""
         return {
             'degree': '',
+            'level': '',
             'institution': '',
             'year': '',
             'field_of_study': '',
@@ -658,12 +750,13 @@ class PsychologistAvailability(models.Model):
         )
 
     @classmethod
+    @cached_read('psychologist', arg='psychologist')
     def get_psychologist_recurring_availability(cls, psychologist):
         """Get all recurring availability for a psychologist, ordered by day and time"""
         return cls.objects.filter(
             psychologist=psychologist,
             is_recurring=True
-        ).order_by('day_of_week', 'start_time')
+        ).select_related('psychologist__user').order_by('day_of_week', 'start_time')
 
     @classmethod
     def get_psychologist_specific_availability(cls, psychologist, date_from=None, date_to=None):
@@ -724,4 +817,94 @@ class PsychologistAvailability(models.Model):
             day_of_week = (day_of_week + 1) % 7
             return self.day_of_week == day_of_week
         else:
-            return self.specific_date == target_date
\ No newline at end of file
+            return self.specific_date == target_date
+
+
+class PsychologistMarketplaceSnapshot(models.Model):
+    """
+    Precomputed marketplace listing entry for a psychologist
+
+    Holds the rendered PsychologistMarketplaceSerializer output so the
+    marketplace list can page over listed psychologists and return stored
+    payloads without serializing. Maintained by
+    MarketplaceSnapshotService (psychologists.signals keeps it current).
+    """
+
+    psychologist = models.OneToOneField(
+        Psychologist,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='marketplace_snapshot'
+    )
+    payload = models.JSONField(
+        _('payload'),
+        help_text=_("Rendered marketplace listing data")
+    )
+
+    # Everything that decides visibility except the license expiry, which
+    # changes with the date rather than with the profile
+    is_listed = models.BooleanField(
+        _('is listed'),
+        default=False
+    )
+    license_expiry_date = models.DateField(_('license expiry date'))
+
+    # Listing order, same as Psychologist.get_marketplace_psychologists
+    first_name = models.CharField(_('first name'), max_length=100)
+    last_name = models.CharField(_('last name'), max_length=100)
+
+    updated_at = models.DateTimeField(
+        _('updated at'),
+        auto_now=True
+    )
+
+    class Meta:
+        verbose_name = _('Psychologist Marketplace Snapshot')
+        verbose_name_plural = _('Psychologist Marketplace Snapshots')
+        db_table = 'psychologist_marketplace_snapshots'
+        indexes = [
+            models.Index(
+                fields=['first_name', 'last_name', 'psychologist'],
+                condition=models.Q(is_listed=True),
+                name='marketplace_snapshot_listed'
+            ),
+        ]
+
+    def __str__(self):
+        return f"Marketplace snapshot for {self.psychologist_id}"
+
+
+class PsychologistAvailabilityVersion(models.Model):
+    """
+    Counter of changes to a psychologist's bookable availability
+
+    Bumped whenever the psychologist's profile, availability blocks or
+    appointment slots change (generated, booked, released or deleted), so
+    the availability endpoints can derive ETags from it and answer
+    conditional requests without querying slots. Maintained by
+    AvailabilityVersionService (psychologists.signals and
+    appointments.signals keep it current).
+    """
+
+    psychologist = models.OneToOneField(
+        Psychologist,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='availability_version'
+    )
+    version = models.PositiveBigIntegerField(
+        _('version'),
+        default=1
+    )
+    updated_at = models.DateTimeField(
+        _('updated at'),
+        auto_now=True
+    )
+
+    class Meta:
+        verbose_name = _('Psychologist Availability Version')
+        verbose_name_plural = _('Psychologist Availability Versions')
+        db_table = 'psychologist_availability_versions'
+
+    def __str__(self):
+        return f"Availability version {self.version} for {self.psychologist_id}"
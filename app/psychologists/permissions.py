@@ -2,6 +2,8 @@
 from rest_framework import permissions
 from django.utils.translation import gettext_lazy as _
 
+from users.actor import get_actor
+
 
 class IsPsychologistOwner(permissions.BasePermission):
     """
@@ -98,13 +100,7 @@ class CanCreatePsychologistProfile(permissions.BasePermission):
             return False
 
         # Check if psychologist profile doesn't already exist
-        from .models import Psychologist
-        try:
-            Psychologist.objects.get(user=request.user)
-            # Profile already exists, can't create another
-            return False
-        except Psychologist.DoesNotExist:
-            return True
+        return get_actor(request).psychologist is None
 
 
 class CanUpdatePsychologistVerification(permissions.BasePermission):
@@ -289,12 +285,8 @@ class IsApprovedPsychologist(permissions.BasePermission):
             return False
 
         # Check if psychologist profile exists and is approved
-        from .models import Psychologist
-        try:
-            psychologist = Psychologist.objects.get(user=request.user)
-            return psychologist.verification_status == 'Approved'
-        except Psychologist.DoesNotExist:
-            return False
+        psychologist = get_actor(request).psychologist
+        return psychologist is not None and psychologist.verification_status == 'Approved'
 
     def has_object_permission(self, request, view, obj):
         """
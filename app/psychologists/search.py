@@ -0,0 +1,115 @@
+# psychologists/search.py
+import re
+from typing import Optional
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchVector,
+    SearchVectorCombinable,
+    SearchVectorField,
+)
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Func
+
+# Text search configuration used for both the stored vector and queries;
+# they must match or stemmed lexemes won't line up
+SEARCH_CONFIG = 'english'
+# Configuration for prefix terms: lowercases without stemming or stop words
+PREFIX_CONFIG = 'simple'
+
+# Weight of each part of the profile in the search vector (A ranks highest)
+NAME_WEIGHT = 'A'
+CREDENTIALS_WEIGHT = 'B'
+BIOGRAPHY_WEIGHT = 'C'
+ADDRESS_WEIGHT = 'D'
+
+_TERM_RE = re.compile(r'[^\W_]+')
+
+_trigram_support = {}
+
+
+class JSONBSearchVector(SearchVectorCombinable, Func):
+    """
+    Weighted tsvector over the string values of a JSON field
+
+    Only strings are indexed, so numbers such as graduation years in the
+    education/certifications entries stay out of the vector. Config and
+    weight are inlined so the expression can be used in a GeneratedField.
+    """
+    function = 'jsonb_to_tsvector'
+    template = (
+        "setweight(%(function)s('%(config)s'::regconfig, "
+        "COALESCE(%(expressions)s, '[]'::jsonb), '[\"string\"]'::jsonb), '%(weight)s')"
+    )
+    output_field = SearchVectorField()
+
+    def __init__(self, expression, config=SEARCH_CONFIG, weight='D'):
+        if weight not in 'ABCD' or not re.fullmatch(r'\w+', config):
+            raise ValueError('Invalid search vector config or weight')
+        super().__init__(expression, config=config, weight=weight)
+
+
+def psychologist_search_vector():
+    """Expression for Psychologist.search_vector"""
+    return (
+        SearchVector('first_name', 'last_name', config=SEARCH_CONFIG, weight=NAME_WEIGHT)
+        + JSONBSearchVector('education', weight=CREDENTIALS_WEIGHT)
+        + JSONBSearchVector('certifications', weight=CREDENTIALS_WEIGHT)
+        + SearchVector('biography', config=SEARCH_CONFIG, weight=BIOGRAPHY_WEIGHT)
+        + SearchVector('office_address', config=SEARCH_CONFIG, weight=ADDRESS_WEIGHT)
+    )
+
+
+def keyword_query(text: str, weights: str = '', prefix: bool = False) -> Optional[SearchQuery]:
+    """
+    Build a query matching every word of `text`, optionally only in the
+    given weight classes and as prefixes (e.g. "Jo Sm" finds "John Smith")
+
+    User input is reduced to plain words, so it can't inject tsquery
+    operators. Returns None if `text` contains no words.
+    """
+    terms = _TERM_RE.findall(text or '')
+    if not terms:
+        return None
+
+    label = ('*' if prefix else '') + weights
+    if label:
+        terms = [f'{term}:{label}' for term in terms]
+
+    if not prefix:
+        return SearchQuery(' & '.join(terms), search_type='raw', config=SEARCH_CONFIG)
+
+    # Partial words can't be stemmed reliably and may be stop words ("an"
+    # while typing "Anna"), so match each one both as typed and stemmed
+    query = None
+    for term in terms:
+        term_query = (
+            SearchQuery(term, search_type='raw', config=PREFIX_CONFIG)
+            | SearchQuery(term, search_type='raw', config=SEARCH_CONFIG)
+        )
+        query = term_query if query is None else query & term_query
+    return query
+
+
+def websearch_query(text: str) -> Optional[SearchQuery]:
+    """
+    Free-text query in web search syntax: words are ANDed, "quoted phrases",
+    `or` and -exclusions are supported
+    """
+    if not text or not _TERM_RE.search(text):
+        return None
+    return SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+
+
+def trigram_available(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """
+    Whether the pg_trgm extension is installed, checked once per process
+
+    Migration 0003 only creates the extension and the name trigram index
+    where the server provides pg_trgm.
+    """
+    if using not in _trigram_support:
+        with connections[using].cursor() as cursor:
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            _trigram_support[using] = cursor.fetchone()[0]
+    return _trigram_support[using]
@@ -6,7 +6,8 @@ from django.utils import timezone
 from datetime import date, time, datetime
 from django.core.exceptions import ValidationError
 
-from .models import Psychologist, PsychologistAvailability
+from .models import DEGREE_LEVELS, Psychologist, PsychologistAvailability
+from . import geo
 from users.models import User
 from users.serializers import UserSerializer
 
@@ -59,6 +60,8 @@ class PsychologistSerializer(serializers.ModelSerializer):
             'offers_initial_consultation',
             'offers_online_sessions',
             'office_address',
+            'office_latitude',
+            'office_longitude',
 
             # Professional URLs
             'website_url',
@@ -127,6 +130,9 @@ class PsychologistSerializer(serializers.ModelSerializer):
                 if key not in edu or not edu[key]:
                     raise serializers.ValidationError(_(f"Education entry {i+1} missing required field: {key}"))
 
+            if edu.get('level') and edu['level'] not in DEGREE_LEVELS:
+                raise serializers.ValidationError(_(f"Education entry {i+1} has invalid level: {edu['level']}"))
+
             # Validate year
             try:
                 year = int(edu['year'])
@@ -192,6 +198,14 @@ class PsychologistSerializer(serializers.ModelSerializer):
                 'offers_online_sessions': _("Must offer at least one service type (online sessions or initial consultations)")
             })
 
+        # Office coordinates are only meaningful as a pair
+        office_latitude = attrs.get('office_latitude', self.instance.office_latitude if self.instance else None)
+        office_longitude = attrs.get('office_longitude', self.instance.office_longitude if self.instance else None)
+        if (office_latitude is None) != (office_longitude is None):
+            raise serializers.ValidationError({
+                'office_latitude': _("Office latitude and longitude must be provided together")
+            })
+
         return attrs
 
 
@@ -221,6 +235,8 @@ class PsychologistProfileUpdateSerializer(serializers.ModelSerializer):
             'offers_initial_consultation',
             'offers_online_sessions',
             'office_address',
+            'office_latitude',
+            'office_longitude',
 
             # Professional URLs
             'website_url',
@@ -298,6 +314,9 @@ class PsychologistProfileUpdateSerializer(serializers.ModelSerializer):
                 if key not in edu or not str(edu[key]).strip():
                     raise serializers.ValidationError(_(f"Education entry {i+1} missing required field: {key}"))
 
+            if edu.get('level') and edu['level'] not in DEGREE_LEVELS:
+                raise serializers.ValidationError(_(f"Education entry {i+1} has invalid level: {edu['level']}"))
+
         return value
 
     def validate_certifications(self, value):
@@ -345,6 +364,14 @@ class PsychologistProfileUpdateSerializer(serializers.ModelSerializer):
                 'offers_online_sessions': _("Must offer at least one service type")
             })
 
+        # Office coordinates are only meaningful as a pair
+        office_latitude = attrs.get('office_latitude', self.instance.office_latitude if self.instance else None)
+        office_longitude = attrs.get('office_longitude', self.instance.office_longitude if self.instance else None)
+        if (office_latitude is None) != (office_longitude is None):
+            raise serializers.ValidationError({
+                'office_latitude': _("Office latitude and longitude must be provided together")
+            })
+
         return attrs
 
 
@@ -355,7 +382,9 @@ class PsychologistMarketplaceSerializer(serializers.ModelSerializer):
     """
     full_name = serializers.CharField(read_only=True)
     services_offered = serializers.ListField(read_only=True)
-    profile_completeness = serializers.SerializerMethodField()
+    profile_completeness = serializers.FloatField(read_only=True)
+    # Only present in distance ("near") searches
+    distance_km = serializers.FloatField(read_only=True)
     pricing = serializers.SerializerMethodField() # Optional pricing details
     class Meta:
         model = Psychologist
@@ -373,6 +402,9 @@ class PsychologistMarketplaceSerializer(serializers.ModelSerializer):
 
             # Location (for initial consultations)
             'office_address',
+            'office_latitude',
+            'office_longitude',
+            'distance_km',
 
             # Professional URLs (public)
             'website_url',
@@ -402,10 +434,6 @@ class PsychologistMarketplaceSerializer(serializers.ModelSerializer):
             'created_at',
         ]
 
-    def get_profile_completeness(self, obj):
-        """Get profile completeness percentage"""
-        return obj.get_profile_completeness()
-
     def to_representation(self, instance):
         """Filter to only show approved, marketplace-visible psychologists"""
         if not instance.is_marketplace_visible:
@@ -425,7 +453,7 @@ class PsychologistDetailSerializer(PsychologistSerializer):
     user = UserSerializer(read_only=True)
 
     # Additional computed fields
-    profile_completeness = serializers.SerializerMethodField()
+    profile_completeness = serializers.FloatField(read_only=True)
     verification_requirements = serializers.SerializerMethodField()
     can_book_appointments = serializers.SerializerMethodField()
 
@@ -437,10 +465,6 @@ class PsychologistDetailSerializer(PsychologistSerializer):
             'can_book_appointments',
         ]
 
-    def get_profile_completeness(self, obj):
-        """Get profile completeness percentage"""
-        return obj.get_profile_completeness()
-
     def get_verification_requirements(self, obj):
         """Get list of verification requirements"""
         return obj.get_verification_requirements()
@@ -518,15 +542,12 @@ class PsychologistVerificationSerializer(serializers.ModelSerializer):
 
         return attrs
 
-    profile_completeness = serializers.SerializerMethodField()
+    profile_completeness = serializers.FloatField(read_only=True)
     verification_requirements = serializers.SerializerMethodField()
     full_name = serializers.CharField(read_only=True)
     email = serializers.EmailField(source='user.email', read_only=True)
     license_is_valid = serializers.BooleanField(read_only=True)
 
-    def get_profile_completeness(self, obj):
-        return obj.get_profile_completeness()
-
     def get_verification_requirements(self, obj):
         return obj.get_verification_requirements()
 
@@ -536,6 +557,11 @@ class PsychologistSearchSerializer(serializers.Serializer):
     Serializer for search and filtering parameters
     """
     # Text search
+    query = serializers.CharField(
+        max_length=200,
+        required=False,
+        help_text=_("Free-text search across name, education, certifications, biography and address")
+    )
     name = serializers.CharField(max_length=200, required=False)
     bio_keywords = serializers.CharField(max_length=500, required=False)
 
@@ -550,9 +576,31 @@ class PsychologistSearchSerializer(serializers.Serializer):
     # License filters
     license_authority = serializers.CharField(max_length=255, required=False)
 
+    # Credential filters (exact JSON containment on education/certifications)
+    certification_institution = serializers.CharField(
+        max_length=255,
+        required=False,
+        help_text=_("Only psychologists holding a certification from this institution (exact name)")
+    )
+    min_degree_level = serializers.ChoiceField(
+        choices=DEGREE_LEVELS,
+        required=False,
+        help_text=_("Only psychologists holding a degree at or above this level")
+    )
+
     # Location filters (for initial consultations)
     location_keywords = serializers.CharField(max_length=500, required=False)
 
+    # Distance filter: offices within radius_km of (latitude, longitude)
+    latitude = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    longitude = serializers.FloatField(min_value=-180, max_value=180, required=False)
+    radius_km = serializers.FloatField(
+        min_value=0.1,
+        max_value=geo.MAX_RADIUS_KM,
+        required=False,
+        help_text=_("Search radius in km; defaults to 25 km")
+    )
+
     # Verification filters
     verification_status = serializers.ChoiceField(
         choices=Psychologist.VERIFICATION_STATUS_CHOICES,
@@ -569,6 +617,16 @@ class PsychologistSearchSerializer(serializers.Serializer):
     created_after = serializers.DateTimeField(required=False)
     created_before = serializers.DateTimeField(required=False)
 
+    # Profile completeness filters
+    min_profile_completeness = serializers.FloatField(min_value=0, max_value=100, required=False)
+    max_profile_completeness = serializers.FloatField(min_value=0, max_value=100, required=False)
+
+    ordering = serializers.ChoiceField(
+        choices=['profile_completeness', '-profile_completeness', 'created_at', '-created_at'],
+        required=False,
+        help_text=_("Sort order; defaults to relevance for text searches, otherwise name")
+    )
+
     def validate(self, attrs):
         """Validate search parameters"""
         # Validate experience range
@@ -603,6 +661,24 @@ class PsychologistSearchSerializer(serializers.Serializer):
                 'created_after': _("Start date must be before end date")
             })
 
+        # Validate distance filter
+        if (attrs.get('latitude') is None) != (attrs.get('longitude') is None):
+            raise serializers.ValidationError({
+                'latitude': _("Latitude and longitude must be provided together")
+            })
+        if attrs.get('radius_km') is not None and attrs.get('latitude') is None:
+            raise serializers.ValidationError({
+                'radius_km': _("A radius requires latitude and longitude")
+            })
+
+        # Validate profile completeness range
+        min_completeness = attrs.get('min_profile_completeness')
+        max_completeness = attrs.get('max_profile_completeness')
+        if min_completeness is not None and max_completeness is not None and min_completeness > max_completeness:
+            raise serializers.ValidationError({
+                'min_profile_completeness': _("Minimum profile completeness must be less than maximum profile completeness")
+            })
+
         return attrs
 
 
@@ -748,6 +824,7 @@ class PsychologistSummarySerializer(serializers.ModelSerializer):
             'offers_online_sessions',
             'services_offered',
             'office_address',
+            'profile_completeness',
             'created_at',
         ]
         read_only_fields = [
@@ -755,10 +832,20 @@ class PsychologistSummarySerializer(serializers.ModelSerializer):
             'email',
             'full_name',
             'services_offered',
+            'profile_completeness',
             'created_at',
         ]
 
 
+class PsychologistTypeaheadSerializer(serializers.Serializer):
+    """
+    Typeahead suggestion; documents the payload of PsychologistService.typeahead
+    """
+    id = serializers.UUIDField(read_only=True, help_text=_("Psychologist user ID"))
+    full_name = serializers.CharField(read_only=True)
+    years_of_experience = serializers.IntegerField(read_only=True)
+
+
 class EducationEntrySerializer(serializers.Serializer):
     """
     Helper serializer for individual education entries
@@ -2,14 +2,29 @@
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.conf import settings
+from django.contrib.postgres.search import SearchRank, TrigramWordSimilarity
+from django.core.cache import caches
+from django.db.models import Count, F, Q
 from django.utils import timezone
 from datetime import date, datetime, timedelta, time
+from collections import defaultdict
+import hashlib
+import json
 import logging
+import uuid
 from typing import Optional, Dict, Any, List, Tuple
 
-from .models import Psychologist, PsychologistAvailability
+from rest_framework.renderers import JSONRenderer
+
+from .models import (
+    DEGREE_LEVELS, Psychologist, PsychologistAvailability, PsychologistAvailabilityVersion,
+    PsychologistMarketplaceSnapshot
+)
+from . import geo, search
+from core.read_cache import cached_read
 from users.models import User
+from users.actor import get_user_profile
 from users.services import EmailService
 
 logger = logging.getLogger(__name__)
@@ -45,16 +60,40 @@ class PsychologistService:
     Service class for psychologist profile management and business logic
     """
 
+    TYPEAHEAD_DEFAULT_CONFIG = {
+        'CACHE_ALIAS': 'default',
+        'CACHE_TIMEOUT': 30,
+        'DEFAULT_LIMIT': 8,
+        'MAX_LIMIT': 20,
+        'MIN_QUERY_LENGTH': 2,
+    }
+    TYPEAHEAD_CACHE_PREFIX = 'psychologists:typeahead:'
+
+    MARKETPLACE_FACETS_DEFAULT_CONFIG = {
+        'CACHE_ALIAS': 'default',
+        'CACHE_TIMEOUT': 60,
+    }
+    MARKETPLACE_FACETS_CACHE_PREFIX = 'psychologists:facets:'
+    # (label, min years, max years) options of the experience facet
+    EXPERIENCE_BUCKETS = [
+        ('0-2', 0, 2),
+        ('3-5', 3, 5),
+        ('6-10', 6, 10),
+        ('11+', 11, None),
+    ]
+
     @staticmethod
     def get_psychologist_by_user(user: User) -> Optional[Psychologist]:
         """
         Get psychologist profile by user, return None if not found
+
+        The profile is memoized on the user instance (and preloaded by
+        CachedTokenAuthentication), so repeated calls in a request are free.
         """
-        try:
-            return Psychologist.objects.select_related('user').get(user=user)
-        except Psychologist.DoesNotExist:
+        profile = get_user_profile(user, 'psychologist_profile')
+        if profile is None:
             logger.warning(f"Psychologist profile not found for user {user.email}")
-            return None
+        return profile
 
     @staticmethod
     def get_psychologist_by_user_or_raise(user: User) -> Psychologist:
@@ -203,7 +242,7 @@ class PsychologistService:
             'initial_consultation_rate': psychologist.initial_consultation_rate,
 
             # Profile metrics
-            'profile_completeness': psychologist.get_profile_completeness(),
+            'profile_completeness': psychologist.profile_completeness,
             'verification_requirements': psychologist.get_verification_requirements(),
             'can_book_appointments': psychologist.can_book_appointments(),
 
@@ -229,17 +268,15 @@ class PsychologistService:
                 ]
             }
 
-            success = EmailService.send_email(
+            EmailService.queue_email(
                 subject=_('Welcome to K&Mdiscova - Profile Created Successfully'),
                 template_name='psychologist_welcome',
                 context=context,
                 recipient_email=psychologist.user.email
             )
 
-            if success:
-                logger.info(f"Welcome email sent to psychologist {psychologist.user.email}")
-
-            return success
+            logger.info(f"Welcome email queued for psychologist {psychologist.user.email}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to send welcome email to psychologist {psychologist.user.email}: {str(e)}")
@@ -255,13 +292,216 @@ class PsychologistService:
         if filters:
             queryset = PsychologistService._apply_marketplace_filters(queryset, filters)
 
+            # Distance searches list the nearest offices first
+            if filters.get('latitude') is not None:
+                queryset = queryset.order_by('distance_km', 'first_name', 'last_name')
+
         return list(queryset)
 
+    @staticmethod
+    def get_marketplace_facets_config() -> Dict[str, Any]:
+        """Marketplace facet settings merged over the defaults"""
+        return {
+            **PsychologistService.MARKETPLACE_FACETS_DEFAULT_CONFIG,
+            **getattr(settings, 'PSYCHOLOGIST_MARKETPLACE_FACETS', {}),
+        }
+
+    @staticmethod
+    def get_marketplace_facets(filters: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Result counts for every option of each marketplace filter dimension
+
+        Each dimension is counted with the other dimensions' filters applied
+        but not its own, so the counts show what selecting an option would
+        return. Counts come from a single aggregate query and are cached
+        briefly per normalized filter combination.
+        """
+        filters = PsychologistService._normalize_marketplace_filters(filters or {})
+        config = PsychologistService.get_marketplace_facets_config()
+        digest = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+        cache_key = f"{PsychologistService.MARKETPLACE_FACETS_CACHE_PREFIX}{digest}"
+
+        cache = caches[config['CACHE_ALIAS']]
+        facets = cache.get(cache_key)
+        if facets is None:
+            facets = PsychologistService._count_marketplace_facets(filters)
+            cache.set(cache_key, facets, config['CACHE_TIMEOUT'])
+
+        return facets
+
+    @staticmethod
+    def get_platform_statistics() -> Dict[str, Any]:
+        """
+        Platform-wide psychologist statistics for the admin dashboard
+
+        Every figure comes from one conditional aggregate query.
+        """
+        today = date.today()
+        valid_license = Q(license_expiry_date__gte=today)
+        online = Q(offers_online_sessions=True)
+        consultation = Q(offers_initial_consultation=True)
+
+        counts = {
+            'total': Count('pk'),
+            'online_only': Count('pk', filter=online & ~consultation),
+            'consultation_only': Count('pk', filter=~online & consultation),
+            'both_services': Count('pk', filter=online & consultation),
+            'valid_licenses': Count('pk', filter=valid_license),
+            'expired_licenses': Count('pk', filter=Q(license_expiry_date__lt=today)),
+            'marketplace_visible': Count('pk', filter=valid_license & Q(
+                verification_status='Approved',
+                user__is_active=True,
+                user__is_verified=True,
+            )),
+            'active_users': Count('pk', filter=Q(user__is_active=True)),
+            'verified_emails': Count('pk', filter=Q(user__is_verified=True)),
+        }
+        for status_code, _label in Psychologist.VERIFICATION_STATUS_CHOICES:
+            counts[f'status_{status_code}'] = Count('pk', filter=Q(verification_status=status_code))
+
+        totals = Psychologist.objects.aggregate(**counts)
+
+        return {
+            'total_psychologists': totals['total'],
+            'verification_status': {
+                status_code: totals[f'status_{status_code}']
+                for status_code, _label in Psychologist.VERIFICATION_STATUS_CHOICES
+            },
+            'service_offerings': {
+                'online_only': totals['online_only'],
+                'consultation_only': totals['consultation_only'],
+                'both_services': totals['both_services'],
+            },
+            'license_status': {
+                'valid_licenses': totals['valid_licenses'],
+                'expired_licenses': totals['expired_licenses'],
+            },
+            'marketplace_visible': totals['marketplace_visible'],
+            'user_status': {
+                'active_users': totals['active_users'],
+                'verified_emails': totals['verified_emails'],
+            },
+        }
+
+    @staticmethod
+    def _normalize_marketplace_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop unset filters and canonicalize text so equal filters share a cache entry"""
+        normalized = {}
+        for key in ('offers_online_sessions', 'offers_initial_consultation'):
+            if filters.get(key) is not None:
+                normalized[key] = bool(filters[key])
+        for key in ('min_years_experience', 'max_years_experience'):
+            if filters.get(key):
+                normalized[key] = int(filters[key])
+        if filters.get('license_authority'):
+            normalized['license_authority'] = filters['license_authority'].strip()
+        if filters.get('location_keywords'):
+            normalized['location_keywords'] = ' '.join(filters['location_keywords'].split()).lower()
+        for key in ('certification_institution', 'min_degree_level'):
+            if filters.get(key):
+                normalized[key] = filters[key].strip()
+        if filters.get('latitude') is not None:
+            normalized['latitude'] = float(filters['latitude'])
+            normalized['longitude'] = float(filters['longitude'])
+            normalized['radius_km'] = float(filters.get('radius_km') or geo.DEFAULT_RADIUS_KM)
+        return normalized
+
+    @staticmethod
+    def _count_marketplace_facets(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Count facets with one query grouped by license authority
+
+        Per-option counts are conditional aggregates (COUNT ... FILTER), and
+        grouping by authority yields the authority facet directly; the other
+        facets are summed over the groups matching the authority filter.
+        """
+        # Location, distance and credential filters aren't facets, so they
+        # narrow every count
+        narrowing_keys = (
+            'location_keywords', 'latitude', 'longitude', 'radius_km',
+            'certification_institution', 'min_degree_level',
+        )
+        queryset = PsychologistService._apply_marketplace_filters(
+            Psychologist.get_marketplace_psychologists().order_by(),
+            {key: filters[key] for key in narrowing_keys if key in filters}
+        )
+
+        services_q = Q()
+        if filters.get('offers_online_sessions') is not None:
+            services_q &= Q(offers_online_sessions=filters['offers_online_sessions'])
+        if filters.get('offers_initial_consultation') is not None:
+            services_q &= Q(offers_initial_consultation=filters['offers_initial_consultation'])
+
+        experience_q = Q()
+        if filters.get('min_years_experience'):
+            experience_q &= Q(years_of_experience__gte=filters['min_years_experience'])
+        if filters.get('max_years_experience'):
+            experience_q &= Q(years_of_experience__lte=filters['max_years_experience'])
+
+        service_options = {
+            'online': Q(offers_online_sessions=True),
+            'consultation': Q(offers_initial_consultation=True),
+            'both': Q(offers_online_sessions=True, offers_initial_consultation=True),
+        }
+
+        counts = {'matches': Count('pk', filter=services_q & experience_q)}
+        for value, option_q in service_options.items():
+            counts[f'services_{value}'] = Count('pk', filter=option_q & experience_q)
+        for index, (_label, low, high) in enumerate(PsychologistService.EXPERIENCE_BUCKETS):
+            bucket_q = Q(years_of_experience__gte=low)
+            if high is not None:
+                bucket_q &= Q(years_of_experience__lte=high)
+            counts[f'experience_{index}'] = Count('pk', filter=bucket_q & services_q)
+
+        rows = list(queryset.values('license_issuing_authority').annotate(**counts))
+
+        authority = filters.get('license_authority')
+        selected = [
+            row for row in rows
+            if authority is None or row['license_issuing_authority'] == authority
+        ]
+
+        return {
+            'count': sum(row['matches'] for row in selected),
+            'services': [
+                {'value': value, 'count': sum(row[f'services_{value}'] for row in selected)}
+                for value in service_options
+            ],
+            'experience': [
+                {
+                    'value': label,
+                    'min_experience': low,
+                    'max_experience': high,
+                    'count': sum(row[f'experience_{index}'] for row in selected),
+                }
+                for index, (label, low, high) in enumerate(PsychologistService.EXPERIENCE_BUCKETS)
+            ],
+            'license_authority': sorted(
+                (
+                    {'value': row['license_issuing_authority'], 'count': row['matches']}
+                    for row in rows if row['matches']
+                ),
+                key=lambda option: (-option['count'], option['value'])
+            ),
+        }
+
     @staticmethod
     def search_psychologists(search_params: Dict[str, Any], user: User) -> List[Psychologist]:
         """
         Search psychologists with filters and proper access control
         """
+        return list(PsychologistService.get_search_queryset(search_params, user))
+
+    @staticmethod
+    def get_search_queryset(search_params: Dict[str, Any], user: User):
+        """
+        Build the search queryset with filters and proper access control
+
+        Text criteria are matched against the full-text search vector and
+        results are ordered by relevance (ts_rank), then by name. Distance
+        searches order by distance first, and an explicit `ordering` takes
+        precedence over both.
+        """
         # Base queryset depends on user type
         if user.is_admin or user.is_staff:
             # Admins can see all psychologists
@@ -275,12 +515,90 @@ class PsychologistService:
         else:
             # Unknown user type, return empty for security
             logger.warning(f"Unknown user type {user.user_type} attempting psychologist search")
-            return []
+            return Psychologist.objects.none()
 
         # Apply search filters
         queryset = PsychologistService._apply_search_filters(queryset, search_params)
 
-        return list(queryset.order_by('first_name', 'last_name'))
+        ordering = ['first_name', 'last_name']
+
+        text_query = PsychologistService._get_text_search_query(search_params)
+        if text_query is not None:
+            queryset = queryset.annotate(search_rank=SearchRank(F('search_vector'), text_query))
+            ordering.insert(0, '-search_rank')
+
+        # Distance searches rank by distance, relevance breaking ties
+        if search_params.get('latitude') is not None:
+            ordering.insert(0, 'distance_km')
+
+        if search_params.get('ordering'):
+            ordering.insert(0, search_params['ordering'])
+
+        return queryset.order_by(*ordering)
+
+    @staticmethod
+    def get_typeahead_config() -> Dict[str, Any]:
+        """Typeahead settings merged over the defaults"""
+        return {
+            **PsychologistService.TYPEAHEAD_DEFAULT_CONFIG,
+            **getattr(settings, 'PSYCHOLOGIST_TYPEAHEAD', {}),
+        }
+
+    @staticmethod
+    def typeahead(query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Top marketplace psychologists whose name matches a prefix or fuzzy query
+
+        Returns minimal {id, full_name, years_of_experience} entries. Results
+        are cached briefly per normalized query, so hot prefixes are served
+        without touching the database.
+        """
+        config = PsychologistService.get_typeahead_config()
+        query = ' '.join((query or '').split()).lower()
+        if len(query) < config['MIN_QUERY_LENGTH']:
+            return []
+
+        limit = min(limit or config['DEFAULT_LIMIT'], config['MAX_LIMIT'])
+        digest = hashlib.md5(query.encode()).hexdigest()
+        cache_key = f"{PsychologistService.TYPEAHEAD_CACHE_PREFIX}{limit}:{digest}"
+
+        cache = caches[config['CACHE_ALIAS']]
+        results = cache.get(cache_key)
+        if results is None:
+            results = PsychologistService._get_typeahead_results(query, limit)
+            cache.set(cache_key, results, config['CACHE_TIMEOUT'])
+
+        return results
+
+    @staticmethod
+    def _get_typeahead_results(query: str, limit: int) -> List[Dict[str, Any]]:
+        """Run a typeahead lookup against the database"""
+        queryset = Psychologist.get_marketplace_psychologists()
+
+        if search.trigram_available():
+            # Served by the search_name trigram index; tolerates typos and
+            # matches partial words anywhere in the name
+            queryset = queryset.filter(
+                search_name__trigram_word_similar=query
+            ).annotate(
+                similarity=TrigramWordSimilarity(query, 'search_name')
+            ).order_by('-similarity', 'last_name', 'first_name')
+        else:
+            # Without pg_trgm, match name word prefixes via the search vector
+            name_query = search.keyword_query(query, weights=search.NAME_WEIGHT, prefix=True)
+            if name_query is None:
+                return []
+            queryset = queryset.filter(search_vector=name_query).order_by('last_name', 'first_name')
+
+        rows = queryset.values_list('user_id', 'first_name', 'last_name', 'years_of_experience')[:limit]
+        return [
+            {
+                'id': str(user_id),
+                'full_name': f"Dr. {first_name} {last_name}",
+                'years_of_experience': years_of_experience,
+            }
+            for user_id, first_name, last_name, years_of_experience in rows
+        ]
 
     @staticmethod
     def validate_psychologist_data(profile_data: Dict[str, Any], is_update: bool = False) -> Dict[str, Any]:
@@ -514,23 +832,118 @@ class PsychologistService:
         if filters.get('max_years_experience'):
             queryset = queryset.filter(years_of_experience__lte=filters['max_years_experience'])
 
+        if filters.get('license_authority'):
+            queryset = queryset.filter(license_issuing_authority=filters['license_authority'])
+
+        # Credential filters
+        queryset = PsychologistService._apply_credential_filters(queryset, filters)
+
         # Location filter for office address
         if filters.get('location_keywords'):
-            queryset = queryset.filter(office_address__icontains=filters['location_keywords'])
+            location_query = search.keyword_query(
+                filters['location_keywords'], weights=search.ADDRESS_WEIGHT, prefix=True
+            )
+            if location_query is None:
+                return queryset.none()
+            queryset = queryset.filter(search_vector=location_query)
+
+        # Distance filter
+        if filters.get('latitude') is not None:
+            queryset = PsychologistService._apply_near_filter(queryset, filters)
 
         return queryset
 
     @staticmethod
-    def _apply_search_filters(queryset, search_params: Dict[str, Any]):
-        """Apply search filters to psychologist queryset"""
-        # Name search
+    def _apply_credential_filters(queryset, params: Dict[str, Any]):
+        """
+        Filter on education/certification entries with JSON containment
+
+        `@>` lookups are answered by the jsonb_path_ops GIN indexes on both
+        columns; a minimum degree level matches any of the levels at or
+        above it.
+        """
+        if params.get('certification_institution'):
+            queryset = queryset.filter(
+                certifications__contains=[{'institution': params['certification_institution']}]
+            )
+
+        if params.get('min_degree_level'):
+            levels = DEGREE_LEVELS[DEGREE_LEVELS.index(params['min_degree_level']):]
+            level_q = Q()
+            for level in levels:
+                level_q |= Q(education__contains=[{'level': level}])
+            queryset = queryset.filter(level_q)
+
+        return queryset
+
+    @staticmethod
+    def _apply_near_filter(queryset, params: Dict[str, Any]):
+        """
+        Keep psychologists whose office is within `radius_km` of
+        (`latitude`, `longitude`), annotated with `distance_km`
+
+        Candidates are pruned with the indexed bounding box before the
+        haversine distance is computed for the survivors.
+        """
+        latitude, longitude = params['latitude'], params['longitude']
+        radius_km = params.get('radius_km') or geo.DEFAULT_RADIUS_KM
+
+        return queryset.filter(geo.near_q(latitude, longitude, radius_km)).annotate(
+            distance_km=geo.haversine_distance(latitude, longitude)
+        ).filter(distance_km__lte=radius_km)
+
+    @staticmethod
+    def _get_text_search_queries(search_params: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """
+        Full-text queries for the text search parameters that were given
+
+        Returns (parameter, query) pairs; the query is None when the
+        parameter contains no searchable words.
+        """
+        queries = []
+
+        # Free-text query over the whole profile
+        if search_params.get('query'):
+            queries.append(('query', search.websearch_query(search_params['query'])))
+
+        # Name search matches word prefixes, so partial names still work
         if search_params.get('name'):
-            name_query = Q(first_name__icontains=search_params['name']) | Q(last_name__icontains=search_params['name'])
-            queryset = queryset.filter(name_query)
+            queries.append(('name', search.keyword_query(
+                search_params['name'], weights=search.NAME_WEIGHT, prefix=True
+            )))
 
         # Biography keywords
         if search_params.get('bio_keywords'):
-            queryset = queryset.filter(biography__icontains=search_params['bio_keywords'])
+            queries.append(('bio_keywords', search.keyword_query(
+                search_params['bio_keywords'], weights=search.BIOGRAPHY_WEIGHT
+            )))
+
+        # Location search
+        if search_params.get('location_keywords'):
+            queries.append(('location_keywords', search.keyword_query(
+                search_params['location_keywords'], weights=search.ADDRESS_WEIGHT, prefix=True
+            )))
+
+        return queries
+
+    @staticmethod
+    def _get_text_search_query(search_params: Dict[str, Any]):
+        """Combined full-text query used to rank search results, if any"""
+        combined = None
+        for _param, query in PsychologistService._get_text_search_queries(search_params):
+            if query is not None:
+                combined = query if combined is None else combined & query
+        return combined
+
+    @staticmethod
+    def _apply_search_filters(queryset, search_params: Dict[str, Any]):
+        """Apply search filters to psychologist queryset"""
+        # Text search (query, name, biography and location keywords) uses
+        # the GIN-indexed search vector instead of ILIKE scans
+        for _param, query in PsychologistService._get_text_search_queries(search_params):
+            if query is None:
+                return queryset.none()
+            queryset = queryset.filter(search_vector=query)
 
         # Service filters
         if search_params.get('offers_online_sessions') is not None:
@@ -550,10 +963,6 @@ class PsychologistService:
         if search_params.get('license_authority'):
             queryset = queryset.filter(license_issuing_authority__icontains=search_params['license_authority'])
 
-        # Location search
-        if search_params.get('location_keywords'):
-            queryset = queryset.filter(office_address__icontains=search_params['location_keywords'])
-
         # Verification status (admin only typically)
         if search_params.get('verification_status'):
             queryset = queryset.filter(verification_status=search_params['verification_status'])
@@ -565,6 +974,20 @@ class PsychologistService:
         if search_params.get('created_before'):
             queryset = queryset.filter(created_at__lte=search_params['created_before'])
 
+        # Credential filters
+        queryset = PsychologistService._apply_credential_filters(queryset, search_params)
+
+        # Distance filter
+        if search_params.get('latitude') is not None:
+            queryset = PsychologistService._apply_near_filter(queryset, search_params)
+
+        # Profile completeness filters
+        if search_params.get('min_profile_completeness') is not None:
+            queryset = queryset.filter(profile_completeness__gte=search_params['min_profile_completeness'])
+
+        if search_params.get('max_profile_completeness') is not None:
+            queryset = queryset.filter(profile_completeness__lte=search_params['max_profile_completeness'])
+
         return queryset
 
     @staticmethod
@@ -742,13 +1165,28 @@ class PsychologistService:
                                   recurring_availability, specific_availability) -> List[Dict[str, Any]]:
         """
         Generate 1-hour appointment slots from availability blocks
+
+        Blocks for each date are picked from the given recurring and specific
+        availability (as PsychologistAvailability.get_availability_for_date
+        would) instead of a query per date.
         """
+        recurring_by_day = defaultdict(list)
+        for block in recurring_availability:
+            recurring_by_day[block.day_of_week].append(block)
+        specific_by_date = defaultdict(list)
+        for block in specific_availability:
+            specific_by_date[block.specific_date].append(block)
+
         slots = []
         current_date = date_from
 
         while current_date <= date_to:
-            # Get availability for this specific date
-            date_availability = PsychologistAvailability.get_availability_for_date(psychologist, current_date)
+            # Python weekday (0=Monday) in our format (0=Sunday)
+            day_of_week = (current_date.weekday() + 1) % 7
+            date_availability = sorted(
+                recurring_by_day[day_of_week] + specific_by_date[current_date],
+                key=lambda block: block.start_time
+            )
 
             for availability_block in date_availability:
                 # Generate 1-hour slots for this block
@@ -832,7 +1270,7 @@ class PsychologistVerificationService:
         verification_check = {
             'is_eligible_for_approval': len(requirements) == 0,
             'missing_requirements': requirements,
-            'profile_completeness': psychologist.get_profile_completeness(),
+            'profile_completeness': psychologist.profile_completeness,
             'license_status': {
                 'is_valid': psychologist.license_is_valid,
                 'expiry_date': psychologist.license_expiry_date,
@@ -870,7 +1308,7 @@ class PsychologistVerificationService:
 
     @staticmethod
     def _send_approval_email(psychologist: Psychologist):
-        """Send approval email to psychologist"""
+        """Queue approval email to psychologist"""
         context = {
             'psychologist': psychologist,
             'psychologist_name': psychologist.full_name,
@@ -883,7 +1321,7 @@ class PsychologistVerificationService:
             ]
         }
 
-        EmailService.send_email(
+        EmailService.queue_email(
             subject=_('Congratulations! Your K&Mdiscova Profile Has Been Approved'),
             template_name='psychologist_approved',
             context=context,
@@ -892,7 +1330,7 @@ class PsychologistVerificationService:
 
     @staticmethod
     def _send_rejection_email(psychologist: Psychologist):
-        """Send rejection email to psychologist"""
+        """Queue rejection email to psychologist"""
         context = {
             'psychologist': psychologist,
             'psychologist_name': psychologist.full_name,
@@ -906,7 +1344,7 @@ class PsychologistVerificationService:
             ]
         }
 
-        EmailService.send_email(
+        EmailService.queue_email(
             subject=_('K&Mdiscova Profile Verification Update Required'),
             template_name='psychologist_rejected',
             context=context,
@@ -920,6 +1358,7 @@ class PsychologistAvailabilityService:
     """
 
     @staticmethod
+    @cached_read('psychologist', arg='psychologist')
     def get_weekly_availability_summary(psychologist: Psychologist) -> Dict[str, Any]:
         """
         Get a weekly summary of psychologist's recurring availability
@@ -1040,10 +1479,17 @@ class PsychologistAvailabilityService:
 
             for time_block in time_blocks:
                 try:
+                    # The API sends "HH:MM" strings; the overlap checks compare times
+                    start_time, end_time = time_block['start_time'], time_block['end_time']
+                    if isinstance(start_time, str):
+                        start_time = datetime.strptime(start_time, '%H:%M').time()
+                    if isinstance(end_time, str):
+                        end_time = datetime.strptime(end_time, '%H:%M').time()
+
                     availability_data = {
                         'day_of_week': day_of_week,
-                        'start_time': time_block['start_time'],
-                        'end_time': time_block['end_time'],
+                        'start_time': start_time,
+                        'end_time': end_time,
                         'is_recurring': True
                     }
 
@@ -1077,4 +1523,158 @@ class PsychologistAvailabilityService:
                 for block in created_blocks
             ],
             'error_details': errors
-        }
\ No newline at end of file
+        }
+
+
+class MarketplaceSnapshotService:
+    """
+    Service class maintaining the precomputed marketplace listing
+
+    Snapshots hold the PsychologistMarketplaceSerializer output as it would
+    be rendered, so listing the marketplace needs no per-row serialization,
+    completeness or pricing computation. They are refreshed by the signals
+    in psychologists.signals; code that bulk-updates psychologists or their
+    users with QuerySet.update() must call refresh_for_users() itself.
+    """
+
+    SNAPSHOT_UPDATE_FIELDS = ['payload', 'is_listed', 'license_expiry_date', 'first_name', 'last_name', 'updated_at']
+
+    @staticmethod
+    def is_listed(psychologist: Psychologist) -> bool:
+        """Whether a psychologist belongs in the marketplace, apart from license expiry"""
+        return (
+            psychologist.verification_status == 'Approved' and
+            psychologist.is_marketplace_visible
+        )
+
+    @staticmethod
+    def build_snapshot(psychologist: Psychologist) -> PsychologistMarketplaceSnapshot:
+        """Render an (unsaved) snapshot for a psychologist"""
+        from .serializers import PsychologistMarketplaceSerializer
+
+        is_listed = MarketplaceSnapshotService.is_listed(psychologist)
+        payload = {}
+        if is_listed:
+            # Round-trip through the API renderer so the stored payload is
+            # exactly what the endpoint would have returned
+            data = PsychologistMarketplaceSerializer(psychologist).data
+            payload = json.loads(JSONRenderer().render(data))
+
+        return PsychologistMarketplaceSnapshot(
+            psychologist=psychologist,
+            payload=payload,
+            is_listed=is_listed,
+            license_expiry_date=psychologist.license_expiry_date,
+            first_name=psychologist.first_name,
+            last_name=psychologist.last_name,
+        )
+
+    @staticmethod
+    def refresh(psychologist: Psychologist) -> PsychologistMarketplaceSnapshot:
+        """Rebuild one psychologist's snapshot"""
+        snapshot = MarketplaceSnapshotService.build_snapshot(psychologist)
+        MarketplaceSnapshotService._save_snapshots([snapshot])
+        return snapshot
+
+    @staticmethod
+    def refresh_for_users(*user_ids) -> int:
+        """Rebuild the snapshots of the given psychologist users"""
+        psychologists = Psychologist.objects.filter(user_id__in=user_ids).select_related('user')
+        snapshots = [MarketplaceSnapshotService.build_snapshot(p) for p in psychologists]
+        MarketplaceSnapshotService._save_snapshots(snapshots)
+        return len(snapshots)
+
+    @staticmethod
+    def rebuild_all(batch_size: int = 500) -> int:
+        """Rebuild every snapshot, e.g. after deploys that change the payload or pricing"""
+        rebuilt = 0
+        batch = []
+        queryset = Psychologist.objects.select_related('user').order_by('pk')
+
+        for psychologist in queryset.iterator(chunk_size=batch_size):
+            batch.append(MarketplaceSnapshotService.build_snapshot(psychologist))
+            if len(batch) >= batch_size:
+                MarketplaceSnapshotService._save_snapshots(batch)
+                rebuilt += len(batch)
+                batch = []
+
+        if batch:
+            MarketplaceSnapshotService._save_snapshots(batch)
+            rebuilt += len(batch)
+
+        logger.info(f"Rebuilt {rebuilt} marketplace snapshots")
+        return rebuilt
+
+    @staticmethod
+    def get_listed_payloads():
+        """Payloads of marketplace-visible psychologists in listing order"""
+        return PsychologistMarketplaceSnapshot.objects.filter(
+            is_listed=True,
+            license_expiry_date__gte=date.today()
+        ).order_by('first_name', 'last_name', 'psychologist_id').values_list('payload', flat=True)
+
+    @staticmethod
+    def _save_snapshots(snapshots: List[PsychologistMarketplaceSnapshot]):
+        if snapshots:
+            PsychologistMarketplaceSnapshot.objects.bulk_create(
+                snapshots,
+                update_conflicts=True,
+                unique_fields=['psychologist'],
+                update_fields=MarketplaceSnapshotService.SNAPSHOT_UPDATE_FIELDS,
+            )
+
+
+class AvailabilityVersionService:
+    """
+    Service class maintaining per-psychologist availability versions
+
+    The version is bumped by the signals in psychologists.signals and
+    appointments.signals whenever the psychologist's profile, availability
+    blocks or appointment slots change. Code that changes slots with
+    QuerySet.update() must call bump() itself.
+    """
+
+    @staticmethod
+    def bump(psychologist_id, create: bool = False) -> None:
+        """
+        Increment a psychologist's availability version
+
+        Slot and availability block changes only increment an existing
+        counter (their signals also fire while a psychologist is being
+        deleted); profile saves pass create=True to start one.
+        """
+        updated = PsychologistAvailabilityVersion.objects.filter(psychologist_id=psychologist_id).update(
+            version=F('version') + 1,
+            updated_at=timezone.now()
+        )
+        if not updated and create:
+            PsychologistAvailabilityVersion.objects.get_or_create(psychologist_id=psychologist_id)
+
+    @staticmethod
+    def get_version(psychologist_id) -> Optional[int]:
+        """Current availability version, or None for unknown psychologists"""
+        try:
+            psychologist_id = uuid.UUID(str(psychologist_id))
+        except ValueError:
+            return None
+
+        return PsychologistAvailabilityVersion.objects.filter(
+            psychologist_id=psychologist_id
+        ).values_list('version', flat=True).first()
+
+    @staticmethod
+    def get_etag(psychologist_id, *parts) -> Optional[str]:
+        """
+        Strong ETag for a psychologist's availability data
+
+        `parts` are whatever else the response depends on (endpoint, query
+        parameters). The current date is always included because default
+        date ranges start today. Returns None when there is no version to
+        derive it from, so the response is simply not conditional.
+        """
+        version = AvailabilityVersionService.get_version(psychologist_id)
+        if version is None:
+            return None
+
+        key = ':'.join(str(part) for part in (psychologist_id, version, date.today(), *parts))
+        return f"{version}-{hashlib.md5(key.encode()).hexdigest()}"
@@ -0,0 +1,73 @@
+# psychologists/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core import read_cache
+from users.models import User
+from .models import Psychologist, PsychologistAvailability
+from .services import AvailabilityVersionService, MarketplaceSnapshotService
+
+# User fields that appear in or decide a marketplace listing
+LISTING_USER_FIELDS = {'is_active', 'is_verified'}
+
+
+@receiver(post_save, sender=Psychologist)
+def refresh_marketplace_snapshot(sender, instance, raw=False, **kwargs):
+    """
+    Rebuild the marketplace listing entry when a profile is saved
+    """
+    if not raw:
+        MarketplaceSnapshotService.refresh(instance)
+
+
+@receiver(post_save, sender=User)
+def refresh_marketplace_snapshot_for_user(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Rebuild the listing entry when a psychologist's account changes (e.g. deactivation)
+    """
+    if created or raw or instance.user_type != 'Psychologist':
+        return
+    if update_fields is not None and not LISTING_USER_FIELDS.intersection(update_fields):
+        return
+    MarketplaceSnapshotService.refresh_for_users(instance.pk)
+    # Deciding whether the psychologist can be booked at all
+    AvailabilityVersionService.bump(instance.pk)
+
+
+@receiver(post_save, sender=Psychologist)
+def bump_availability_version(sender, instance, raw=False, **kwargs):
+    """
+    Invalidate availability ETags when a profile is saved (booking settings, visibility)
+    """
+    if not raw:
+        AvailabilityVersionService.bump(instance.pk, create=True)
+
+
+@receiver(post_save, sender=PsychologistAvailability)
+@receiver(post_delete, sender=PsychologistAvailability)
+def bump_availability_version_for_block(sender, instance, raw=False, **kwargs):
+    """
+    Invalidate availability ETags when an availability block changes
+    """
+    if not raw:
+        AvailabilityVersionService.bump(instance.psychologist_id)
+
+
+@receiver(post_save, sender=Psychologist)
+@receiver(post_delete, sender=Psychologist)
+def invalidate_psychologist_reads(sender, instance, raw=False, **kwargs):
+    """
+    Drop the psychologist's cached reads when the profile changes
+    """
+    if not raw:
+        read_cache.invalidate('psychologist', instance.pk)
+
+
+@receiver(post_save, sender=PsychologistAvailability)
+@receiver(post_delete, sender=PsychologistAvailability)
+def invalidate_psychologist_reads_for_block(sender, instance, raw=False, **kwargs):
+    """
+    Drop the psychologist's cached availability reads when a block changes
+    """
+    if not raw:
+        read_cache.invalidate('psychologist', instance.psychologist_id)
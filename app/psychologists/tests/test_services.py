@@ -5,9 +5,19 @@ from django.utils import timezone
 from datetime import date, time, timedelta
 from unittest.mock import patch, MagicMock
 
+from django.core.cache import cache
+from django.db import connection, transaction
+
 from users.models import User
-from psychologists.models import Psychologist, PsychologistAvailability
+from psychologists import geo, search
+from psychologists.models import (
+    Psychologist, PsychologistAvailability, PsychologistAvailabilityVersion, PsychologistMarketplaceSnapshot,
+    infer_degree_level
+)
+from psychologists.serializers import PsychologistMarketplaceSerializer
 from psychologists.services import (
+    AvailabilityVersionService,
+    MarketplaceSnapshotService,
     PsychologistService,
     PsychologistVerificationService,
     PsychologistAvailabilityService,
@@ -297,17 +307,16 @@ class PsychologistServiceTests(TestCase):
 
         self.assertIn("Office address is required", str(context.exception))
 
-    @patch('psychologists.services.EmailService.send_email')
+    @patch('psychologists.services.EmailService.queue_email')
     def test_send_profile_creation_welcome_email_success(self, mock_send_email):
-        """Test sending welcome email successfully"""
-        mock_send_email.return_value = True
+        """Test queueing welcome email successfully"""
 
         result = PsychologistService.send_profile_creation_welcome_email(self.psychologist)
 
         self.assertTrue(result)
         mock_send_email.assert_called_once()
 
-    @patch('psychologists.services.EmailService.send_email')
+    @patch('psychologists.services.EmailService.queue_email')
     def test_send_profile_creation_welcome_email_failure(self, mock_send_email):
         """Test handling welcome email failure"""
         mock_send_email.side_effect = Exception("Email failed")
@@ -317,6 +326,745 @@ class PsychologistServiceTests(TestCase):
         self.assertFalse(result)
 
 
+class PsychologistSearchServiceTests(TestCase):
+    """Tests for full-text psychologist search"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email='parent@test.com',
+            password='testpass123',
+            user_type='Parent',
+            is_verified=True,
+            is_active=True
+        )
+
+        self.anxiety_specialist = self._create_psychologist(
+            'anxiety@test.com', 'Anna', 'Keller',
+            biography='I help children and teenagers manage anxiety and panic attacks.',
+            education=[{'degree': 'PhD Clinical Psychology', 'institution': 'Oxford University', 'year': 2010}],
+            office_address='12 Harbour Road, Portsmouth'
+        )
+        self.family_therapist = self._create_psychologist(
+            'family@test.com', 'Johnathan', 'Smith',
+            biography='Family therapy with a focus on communication.',
+            education=[{'degree': 'MSc Family Therapy', 'institution': 'Leeds University', 'year': 2015}],
+            office_address='4 Anxiety Lane, Leeds'
+        )
+        self.pending = self._create_psychologist(
+            'pending@test.com', 'Anxious', 'Pending',
+            biography='Anxiety specialist awaiting approval.',
+            office_address='1 Anxiety Street, Leeds',
+            verification_status='Pending'
+        )
+
+    def _create_psychologist(self, email, first_name, last_name, verification_status='Approved', **fields):
+        user = User.objects.create_user(
+            email=email,
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        return Psychologist.objects.create(
+            user=user,
+            first_name=first_name,
+            last_name=last_name,
+            license_number=f'PSY-{email}',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=8,
+            verification_status=verification_status,
+            offers_online_sessions=True,
+            offers_initial_consultation=True,
+            **fields
+        )
+
+    def _search(self, **params):
+        return PsychologistService.search_psychologists(params, self.parent_user)
+
+    def test_search_vector_is_maintained_on_save(self):
+        """Test the search vector follows profile changes"""
+        self.assertEqual(self._search(query='dyslexia'), [])
+
+        self.family_therapist.biography = 'Assessments for dyslexia'
+        self.family_therapist.save()
+
+        self.assertEqual(self._search(query='dyslexia'), [self.family_therapist])
+
+    def test_filter_by_profile_completeness(self):
+        """Test completeness bounds filter on the stored score"""
+        self.anxiety_specialist.certifications = [{'name': 'CBT Practitioner', 'institution': 'BABCP', 'year': 2018}]
+        self.anxiety_specialist.save()
+
+        self.assertEqual(self.anxiety_specialist.profile_completeness, 100.0)
+        self.assertEqual(self.family_therapist.profile_completeness, 92.5)
+        self.assertEqual(self._search(min_profile_completeness=95), [self.anxiety_specialist])
+        self.assertEqual(self._search(max_profile_completeness=95), [self.family_therapist])
+
+    def test_ordering_overrides_relevance(self):
+        """Test an explicit ordering takes precedence over the search rank"""
+        self.anxiety_specialist.certifications = [{'name': 'CBT Practitioner', 'institution': 'BABCP', 'year': 2018}]
+        self.anxiety_specialist.save()
+
+        results = self._search(query='anxiety', ordering='profile_completeness')
+
+        self.assertEqual(results, [self.family_therapist, self.anxiety_specialist])
+
+    def test_query_ranks_by_field_weight(self):
+        """Test matches in higher-weighted fields rank first"""
+        # Biography (C) matches rank above address (D) matches
+        results = self._search(query='anxiety')
+
+        self.assertEqual(results, [self.anxiety_specialist, self.family_therapist])
+        self.assertNotIn(self.pending, results)
+
+        # Education (B) matches rank above address (D) matches
+        self.anxiety_specialist.education = [{'degree': 'PhD', 'institution': 'Leeds University', 'year': 2010}]
+        self.anxiety_specialist.save()
+        self.family_therapist.education = []
+        self.family_therapist.save()
+
+        results = self._search(query='leeds')
+        self.assertEqual(results, [self.anxiety_specialist, self.family_therapist])
+
+    def test_query_multi_word_and_stemming(self):
+        """Test multi-word queries require every word and match word forms"""
+        self.assertEqual(self._search(query='teenager panic'), [self.anxiety_specialist])
+        self.assertEqual(self._search(query='teenager communication'), [])
+        self.assertEqual(
+            self._search(query='"family therapy" -teenagers'), [self.family_therapist]
+        )
+
+    def test_query_matches_education(self):
+        """Test education entries are searchable"""
+        self.assertEqual(self._search(query='Oxford'), [self.anxiety_specialist])
+        self.assertEqual(self._search(query='2015'), [])
+
+    def test_name_matches_prefixes_only_in_names(self):
+        """Test name search matches name prefixes but not other fields"""
+        self.assertEqual(self._search(name='john smi'), [self.family_therapist])
+        self.assertEqual(self._search(name='anxiety'), [])
+
+    def test_location_keywords(self):
+        """Test location keywords only match the office address"""
+        self.assertEqual(self._search(location_keywords='Portsm'), [self.anxiety_specialist])
+        self.assertEqual(self._search(location_keywords='children'), [])
+
+    def test_tsquery_syntax_is_not_interpreted(self):
+        """Test operators in keyword input can't break the query"""
+        self.assertEqual(self._search(name="Anna & !'|:*"), [self.anxiety_specialist])
+        self.assertEqual(self._search(name='&|!'), [])
+        self.assertEqual(self._search(query='& | !'), [])
+
+    def test_non_text_search_orders_by_name(self):
+        """Test searches without text criteria keep alphabetical order"""
+        results = self._search(offers_online_sessions=True)
+
+        self.assertEqual(results, [self.anxiety_specialist, self.family_therapist])
+
+    def test_typeahead_prefix(self):
+        """Test typeahead returns minimal entries for name prefixes"""
+        cache.clear()
+
+        results = PsychologistService.typeahead('  JOHN   smi ')
+
+        self.assertEqual(results, [{
+            'id': str(self.family_therapist.user_id),
+            'full_name': 'Dr. Johnathan Smith',
+            'years_of_experience': 8,
+        }])
+        self.assertEqual(PsychologistService.typeahead('anxiety'), [])
+
+    def test_typeahead_min_length_and_limit(self):
+        """Test short queries are ignored and limits are capped"""
+        cache.clear()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(PsychologistService.typeahead('a'), [])
+
+        with self.settings(PSYCHOLOGIST_TYPEAHEAD={'MAX_LIMIT': 1}):
+            self.assertEqual(len(PsychologistService.typeahead('an', limit=10)), 1)
+
+    def test_typeahead_caches_queries(self):
+        """Test repeated prefixes are served from the cache"""
+        cache.clear()
+        PsychologistService.typeahead('anna')
+
+        with self.assertNumQueries(0):
+            results = PsychologistService.typeahead('Anna')
+
+        self.assertEqual([r['full_name'] for r in results], ['Dr. Anna Keller'])
+
+
+class TypeaheadTrigramTests(TestCase):
+    """Tests for typeahead served by the pg_trgm name index"""
+
+    def setUp(self):
+        # Checked against the test database, which migration 0003 set up
+        if not search.trigram_available():
+            self.skipTest('pg_trgm is not installed on this server')
+        cache.clear()
+
+        for first_name, last_name in [('Johnathan', 'Smith'), ('Mary', 'Smithers'), ('Anna', 'Keller')]:
+            user = User.objects.create_user(
+                email=f'{last_name.lower()}@test.com',
+                password='testpass123',
+                user_type='Psychologist',
+                is_verified=True,
+                is_active=True
+            )
+            Psychologist.objects.create(
+                user=user,
+                first_name=first_name,
+                last_name=last_name,
+                license_number=f'PSY-{last_name}',
+                license_issuing_authority='State Board',
+                license_expiry_date=date.today() + timedelta(days=365),
+                years_of_experience=8,
+                verification_status='Approved',
+            )
+
+    def _names(self, query):
+        return [r['full_name'] for r in PsychologistService.typeahead(query)]
+
+    def test_name_index_exists(self):
+        """Test migration 0003 created the trigram index on search_name"""
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT indexdef FROM pg_indexes WHERE indexname = 'psychologists_name_trgm'")
+            self.assertIn('gin_trgm_ops', cursor.fetchone()[0])
+
+    def test_orders_by_similarity(self):
+        """Test the closest name word ranks first"""
+        self.assertEqual(self._names('smith'), ['Dr. Johnathan Smith', 'Dr. Mary Smithers'])
+
+    def test_tolerates_typos(self):
+        """Test near misses match in the middle of the name"""
+        self.assertEqual(self._names('kellerr'), ['Dr. Anna Keller'])
+
+    def test_similarity_threshold(self):
+        """Test names below pg_trgm's word similarity threshold (0.6) are left out"""
+        # 'smitt' shares 4 of its 6 trigrams with 'smith' (0.67), 'smutt' only 2 (0.33)
+        self.assertEqual(self._names('smitt'), ['Dr. Johnathan Smith', 'Dr. Mary Smithers'])
+        self.assertEqual(self._names('smutt'), [])
+
+
+class MarketplaceSnapshotServiceTests(TestCase):
+    """Tests for the precomputed marketplace listing"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='listed@test.com',
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=self.user,
+            first_name='Listed',
+            last_name='Psychologist',
+            license_number='PSY555555',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=7,
+            biography='Child psychologist',
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=False
+        )
+
+    def _listed(self):
+        return list(MarketplaceSnapshotService.get_listed_payloads())
+
+    def test_snapshot_matches_serializer_output(self):
+        """Test the stored payload is what the serializer would render"""
+        payloads = self._listed()
+
+        self.assertEqual(len(payloads), 1)
+        expected = PsychologistMarketplaceSerializer(self.psychologist).data
+        self.assertEqual(payloads[0]['user'], str(self.user.pk))
+        self.assertEqual(payloads[0]['full_name'], expected['full_name'])
+        self.assertEqual(payloads[0]['profile_completeness'], expected['profile_completeness'])
+        self.assertEqual(payloads[0]['pricing']['currency'], 'USD')
+
+    def test_snapshot_follows_profile_and_user_changes(self):
+        """Test saving the profile or user refreshes the listing"""
+        self.psychologist.biography = 'Updated biography'
+        self.psychologist.save()
+        self.assertEqual(self._listed()[0]['biography'], 'Updated biography')
+
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        self.assertEqual(self._listed(), [])
+
+        self.user.is_active = True
+        self.user.save()
+        self.psychologist.verification_status = 'Rejected'
+        self.psychologist.save()
+        self.assertEqual(self._listed(), [])
+
+    def test_expired_license_is_not_listed(self):
+        """Test license expiry is applied when listing, not when building"""
+        PsychologistMarketplaceSnapshot.objects.filter(pk=self.psychologist.pk).update(
+            license_expiry_date=date.today() - timedelta(days=1)
+        )
+
+        self.assertEqual(self._listed(), [])
+
+    def test_rebuild_all(self):
+        """Test rebuilding restores missing snapshots"""
+        PsychologistMarketplaceSnapshot.objects.all().delete()
+
+        self.assertEqual(MarketplaceSnapshotService.rebuild_all(batch_size=1), 1)
+        self.assertEqual(len(self._listed()), 1)
+
+
+class AvailabilityVersionServiceTests(TestCase):
+    """Tests for availability versions and the ETags derived from them"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='versioned@test.com',
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        self.psychologist = Psychologist.objects.create(
+            user=self.user,
+            first_name='Versioned',
+            last_name='Psychologist',
+            license_number='PSY777777',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=7,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=False
+        )
+
+    def _version(self):
+        return AvailabilityVersionService.get_version(self.psychologist.pk)
+
+    def test_profile_and_block_changes_bump_version(self):
+        """Test saving the profile or an availability block changes the version"""
+        versions = [self._version()]
+
+        self.psychologist.offers_initial_consultation = True
+        self.psychologist.office_address = '1 Main St'
+        self.psychologist.save()
+        versions.append(self._version())
+
+        block = PsychologistAvailability.objects.create(
+            psychologist=self.psychologist,
+            day_of_week=1,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+            is_recurring=True
+        )
+        versions.append(self._version())
+
+        block.delete()
+        versions.append(self._version())
+
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        versions.append(self._version())
+
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_unknown_psychologists_have_no_etag(self):
+        """Test missing or malformed ids make the response unconditional"""
+        self.assertIsNone(AvailabilityVersionService.get_etag('00000000-0000-0000-0000-000000000000'))
+        self.assertIsNone(AvailabilityVersionService.get_etag('not-a-uuid'))
+        self.assertIsNone(AvailabilityVersionService.get_etag(None))
+
+    def test_etag_depends_on_version_and_parts(self):
+        """Test ETags change with the version and with the request parts"""
+        etag = AvailabilityVersionService.get_etag(self.psychologist.pk, '/slots/', [('date_from', '2030-01-01')])
+
+        self.assertEqual(
+            etag, AvailabilityVersionService.get_etag(self.psychologist.pk, '/slots/', [('date_from', '2030-01-01')])
+        )
+        self.assertNotEqual(
+            etag, AvailabilityVersionService.get_etag(self.psychologist.pk, '/slots/', [('date_from', '2030-01-02')])
+        )
+
+        AvailabilityVersionService.bump(self.psychologist.pk)
+        self.assertNotEqual(
+            etag, AvailabilityVersionService.get_etag(self.psychologist.pk, '/slots/', [('date_from', '2030-01-01')])
+        )
+
+    def test_deleting_psychologist_with_availability(self):
+        """Test cascaded block deletes don't recreate the version row"""
+        PsychologistAvailability.objects.create(
+            psychologist=self.psychologist,
+            day_of_week=2,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+            is_recurring=True
+        )
+
+        self.user.delete()
+
+        # Foreign keys are deferred until commit, which TestCase never reaches
+        connection.check_constraints()
+        self.assertFalse(PsychologistAvailabilityVersion.objects.exists())
+
+
+class MarketplaceFacetsTests(TestCase):
+    """Tests for marketplace filter facet counts"""
+
+    def setUp(self):
+        cache.clear()
+        self._create_psychologist('a@test.com', 2, 'State Board', online=True, consultation=False)
+        self._create_psychologist('b@test.com', 4, 'State Board', online=True, consultation=True)
+        self._create_psychologist('c@test.com', 12, 'National Register', online=False, consultation=True)
+        self._create_psychologist('d@test.com', 8, 'National Register', online=True, consultation=True,
+                                  verification_status='Pending')
+
+    def _create_psychologist(self, email, years, authority, online, consultation, verification_status='Approved'):
+        user = User.objects.create_user(
+            email=email,
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        return Psychologist.objects.create(
+            user=user,
+            first_name='Facet',
+            last_name=email[0].upper(),
+            license_number=f'PSY-{email}',
+            license_issuing_authority=authority,
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=years,
+            verification_status=verification_status,
+            offers_online_sessions=online,
+            offers_initial_consultation=consultation,
+            office_address='1 High Street, Leeds' if consultation else '',
+        )
+
+    @staticmethod
+    def _counts(options):
+        return {option['value']: option['count'] for option in options}
+
+    def test_unfiltered_facets(self):
+        """Test facets count every marketplace-visible psychologist"""
+        facets = PsychologistService.get_marketplace_facets()
+
+        self.assertEqual(facets['count'], 3)
+        self.assertEqual(self._counts(facets['services']), {'online': 2, 'consultation': 2, 'both': 1})
+        self.assertEqual(self._counts(facets['experience']), {'0-2': 1, '3-5': 1, '6-10': 0, '11+': 1})
+        self.assertEqual(
+            facets['license_authority'],
+            [{'value': 'State Board', 'count': 2}, {'value': 'National Register', 'count': 1}]
+        )
+
+    def test_facets_exclude_their_own_filter(self):
+        """Test each dimension is counted with only the other dimensions' filters"""
+        facets = PsychologistService.get_marketplace_facets({
+            'offers_online_sessions': True,
+            'license_authority': 'State Board',
+        })
+
+        self.assertEqual(facets['count'], 2)
+        # Services options ignore the online filter but respect the authority
+        self.assertEqual(self._counts(facets['services']), {'online': 2, 'consultation': 1, 'both': 1})
+        self.assertEqual(self._counts(facets['experience']), {'0-2': 1, '3-5': 1, '6-10': 0, '11+': 0})
+        # Authority options ignore the authority filter but respect services
+        self.assertEqual(self._counts(facets['license_authority']), {'State Board': 2})
+
+    def test_facets_use_one_query_and_are_cached(self):
+        """Test facets cost one query, and none for a repeated filter combination"""
+        with self.assertNumQueries(1):
+            facets = PsychologistService.get_marketplace_facets({'location_keywords': 'Leeds'})
+        self.assertEqual(facets['count'], 2)
+
+        with self.assertNumQueries(0):
+            cached = PsychologistService.get_marketplace_facets({'location_keywords': '  LEEDS '})
+        self.assertEqual(cached, facets)
+
+
+class PsychologistPlatformStatisticsTests(TestCase):
+    """Tests for the admin platform statistics"""
+
+    def setUp(self):
+        cache.clear()
+        self.approved = self._create_psychologist('approved@test.com', 'Approved', True, True)
+        self.pending = self._create_psychologist('pending@test.com', 'Pending', True, False)
+        self.expired = self._create_psychologist('expired@test.com', 'Approved', False, True, expired=True)
+
+    def _create_psychologist(self, email, verification_status, online, consultation, expired=False):
+        user = User.objects.create_user(
+            email=email,
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        psychologist = Psychologist.objects.create(
+            user=user,
+            first_name='Stats',
+            last_name=email.split('@')[0].title(),
+            license_number=f'PSY-{email}',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=5,
+            verification_status=verification_status,
+            offers_online_sessions=online,
+            offers_initial_consultation=consultation,
+            office_address='1 Main Street' if consultation else '',
+        )
+        if expired:
+            # save() rejects expired licenses
+            Psychologist.objects.filter(pk=psychologist.pk).update(
+                license_expiry_date=date.today() - timedelta(days=1)
+            )
+        return psychologist
+
+    def test_statistics_single_query(self):
+        """Test every figure comes from one aggregate query"""
+        with self.assertNumQueries(1):
+            statistics = PsychologistService.get_platform_statistics()
+
+        self.assertEqual(statistics['total_psychologists'], 3)
+        self.assertEqual(statistics['verification_status'], {'Approved': 2, 'Pending': 1, 'Rejected': 0})
+        self.assertEqual(
+            statistics['service_offerings'],
+            {'online_only': 1, 'consultation_only': 1, 'both_services': 1}
+        )
+        self.assertEqual(statistics['license_status'], {'valid_licenses': 2, 'expired_licenses': 1})
+        self.assertEqual(statistics['marketplace_visible'], 1)
+        self.assertEqual(statistics['user_status'], {'active_users': 3, 'verified_emails': 3})
+
+
+class PsychologistNearSearchTests(TestCase):
+    """Tests for distance ("near") filtering"""
+
+    LEEDS = (53.801, -1.549)
+
+    def setUp(self):
+        cache.clear()
+        self.parent_user = User.objects.create_user(
+            email='parent@test.com',
+            password='testpass123',
+            user_type='Parent',
+            is_verified=True,
+            is_active=True
+        )
+        self.headingley = self._create_psychologist('headingley@test.com', 53.819, -1.577)
+        self.city_centre = self._create_psychologist('centre@test.com', 53.797, -1.546)
+        self.york = self._create_psychologist('york@test.com', 53.959, -1.082)
+        self.no_office = self._create_psychologist('online@test.com', None, None)
+
+    def _create_psychologist(self, email, latitude, longitude):
+        user = User.objects.create_user(
+            email=email,
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        return Psychologist.objects.create(
+            user=user,
+            first_name='Near',
+            last_name=email.split('@')[0].title(),
+            license_number=f'PSY-{email}',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=5,
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=latitude is not None,
+            office_address='Leeds' if latitude is not None else '',
+            office_latitude=latitude,
+            office_longitude=longitude,
+        )
+
+    def test_marketplace_near_orders_by_distance(self):
+        """Test offices within the radius are listed nearest first"""
+        latitude, longitude = self.LEEDS
+        results = PsychologistService.get_marketplace_psychologists(
+            {'latitude': latitude, 'longitude': longitude, 'radius_km': 10}
+        )
+
+        self.assertEqual(results, [self.city_centre, self.headingley])
+        self.assertAlmostEqual(
+            results[1].distance_km,
+            geo.haversine_km(latitude, longitude, 53.819, -1.577),
+            places=6
+        )
+
+    def test_radius_defaults_and_widens(self):
+        """Test the default radius and a wider one reaching York (~35 km)"""
+        latitude, longitude = self.LEEDS
+        default = PsychologistService.get_marketplace_psychologists({'latitude': latitude, 'longitude': longitude})
+        wide = PsychologistService.get_marketplace_psychologists(
+            {'latitude': latitude, 'longitude': longitude, 'radius_km': 50}
+        )
+
+        self.assertEqual(default, [self.city_centre, self.headingley])
+        self.assertEqual(wide, [self.city_centre, self.headingley, self.york])
+
+    def test_search_near_ranks_by_distance(self):
+        """Test search combines distance with other filters"""
+        latitude, longitude = 53.96, -1.08
+        results = PsychologistService.search_psychologists(
+            {'latitude': latitude, 'longitude': longitude, 'radius_km': 50, 'offers_online_sessions': True},
+            self.parent_user
+        )
+
+        self.assertEqual(results, [self.york, self.city_centre, self.headingley])
+
+    def test_bounding_box_across_antimeridian(self):
+        """Test boxes crossing the antimeridian wrap instead of spanning the globe"""
+        min_lat, max_lat, min_lng, max_lng = geo.bounding_box(-17.7, 179.9, 50)
+
+        self.assertGreater(min_lng, max_lng)
+        self.assertAlmostEqual(max_lat - min_lat, 2 * 50 / geo.KM_PER_DEGREE_LATITUDE)
+
+        self.headingley.office_latitude, self.headingley.office_longitude = -17.75, -179.9
+        self.headingley.save()
+        results = PsychologistService.get_marketplace_psychologists(
+            {'latitude': -17.7, 'longitude': 179.9, 'radius_km': 50}
+        )
+        self.assertEqual(results, [self.headingley])
+
+    def test_coordinates_required_together(self):
+        """Test a latitude without longitude is rejected"""
+        self.york.office_longitude = None
+
+        with self.assertRaises(ValidationError):
+            self.york.save()
+
+
+class PsychologistCredentialFilterTests(TestCase):
+    """Tests for education and certification filters"""
+
+    def setUp(self):
+        cache.clear()
+        self.parent_user = User.objects.create_user(
+            email='parent@test.com',
+            password='testpass123',
+            user_type='Parent',
+            is_verified=True,
+            is_active=True
+        )
+        self.doctor = self._create_psychologist(
+            'doctor@test.com',
+            ['BSc Psychology', 'Ph.D. Clinical Psychology'],
+            ['EMDR Europe']
+        )
+        self.master = self._create_psychologist(
+            'master@test.com',
+            ['M.Sc. Child Psychology'],
+            ['British Psychological Society', 'EMDR Europe']
+        )
+        self.bachelor = self._create_psychologist('bachelor@test.com', ['BA Psychology'], [])
+
+    def _create_psychologist(self, email, degrees, certifying_bodies):
+        user = User.objects.create_user(
+            email=email,
+            password='testpass123',
+            user_type='Psychologist',
+            is_verified=True,
+            is_active=True
+        )
+        return Psychologist.objects.create(
+            user=user,
+            first_name='Credential',
+            last_name=email.split('@')[0].title(),
+            license_number=f'PSY-{email}',
+            license_issuing_authority='State Board',
+            license_expiry_date=date.today() + timedelta(days=365),
+            years_of_experience=5,
+            education=[
+                {'degree': degree, 'institution': 'Leeds University', 'year': 2010}
+                for degree in degrees
+            ],
+            certifications=[
+                {'name': 'Certificate', 'institution': body, 'year': 2015}
+                for body in certifying_bodies
+            ],
+            verification_status='Approved',
+            offers_online_sessions=True,
+            offers_initial_consultation=False,
+        )
+
+    def test_infer_degree_level(self):
+        """Test free-text degrees map to a degree level"""
+        self.assertEqual(infer_degree_level('Ph.D. Clinical Psychology'), 'doctorate')
+        self.assertEqual(infer_degree_level('PsyD'), 'doctorate')
+        self.assertEqual(infer_degree_level("Master's in Counselling"), 'master')
+        self.assertEqual(infer_degree_level('MSc Neuropsychology'), 'master')
+        self.assertEqual(infer_degree_level('B.A. Psychology'), 'bachelor')
+        self.assertIsNone(infer_degree_level('Diploma in Play Therapy'))
+
+    def test_level_set_on_save(self):
+        """Test education entries get a level on save unless one is given"""
+        self.assertEqual([edu['level'] for edu in self.doctor.education], ['bachelor', 'doctorate'])
+
+        self.bachelor.education = [{'degree': 'Diploma', 'institution': 'Leeds', 'year': 2012, 'level': 'master'}]
+        self.bachelor.save()
+        self.bachelor.refresh_from_db()
+        self.assertEqual(self.bachelor.education[0]['level'], 'master')
+
+    def test_invalid_level_rejected(self):
+        """Test unknown degree levels fail validation"""
+        self.bachelor.education[0]['level'] = 'postdoc'
+
+        with self.assertRaises(ValidationError):
+            self.bachelor.save()
+
+    def test_marketplace_min_degree_level(self):
+        """Test a minimum degree level includes the levels above it"""
+        masters_up = PsychologistService.get_marketplace_psychologists({'min_degree_level': 'master'})
+        doctorates = PsychologistService.get_marketplace_psychologists({'min_degree_level': 'doctorate'})
+
+        self.assertCountEqual(masters_up, [self.doctor, self.master])
+        self.assertEqual(doctorates, [self.doctor])
+
+    def test_search_certification_institution(self):
+        """Test search combines the certification filter with other criteria"""
+        results = PsychologistService.search_psychologists(
+            {'certification_institution': 'EMDR Europe', 'min_degree_level': 'doctorate'},
+            self.parent_user
+        )
+        self.assertEqual(results, [self.doctor])
+
+        results = PsychologistService.search_psychologists(
+            {'certification_institution': 'British Psychological Society'},
+            self.parent_user
+        )
+        self.assertEqual(results, [self.master])
+
+    def test_facets_narrowed_by_credentials(self):
+        """Test facet counts only include psychologists matching credential filters"""
+        facets = PsychologistService.get_marketplace_facets({'certification_institution': 'EMDR Europe'})
+
+        self.assertEqual(facets['count'], 2)
+
+    def test_credential_filters_use_gin_indexes(self):
+        """Test containment filters are answered by the jsonb_path_ops indexes"""
+        cases = [
+            ({'certification_institution': 'EMDR Europe'}, 'psychologists_certs_gin'),
+            ({'min_degree_level': 'master'}, 'psychologists_education_gin'),
+        ]
+
+        for params, index_name in cases:
+            queryset = PsychologistService._apply_credential_filters(Psychologist.objects.all(), params)
+
+            # The table is tiny, so sequential scans are disabled to see which
+            # index the planner would pick
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+                plan = queryset.explain()
+
+            self.assertIn(index_name, plan)
+
+
 class PsychologistVerificationServiceTests(TestCase):
     """Tests for PsychologistVerificationService"""
 
@@ -623,6 +1371,21 @@ class PsychologistAvailabilityServiceTests(TestCase):
         self.assertEqual(result['errors'], 1)   # Monday should fail
         self.assertTrue(len(result['error_details']) > 0)
 
+    def test_bulk_create_weekly_availability_time_strings(self):
+        """Test times sent as strings by the API are checked against existing blocks"""
+        weekly_schedule = {
+            'monday': [  # Same day as the existing Monday 9-12, without overlapping it
+                {'start_time': '14:00', 'end_time': '17:00'}
+            ]
+        }
+
+        result = PsychologistAvailabilityService.bulk_create_weekly_availability(
+            self.psychologist, weekly_schedule
+        )
+
+        self.assertEqual(result['success'], 1)
+        self.assertEqual(result['errors'], 0)
+
     def test_validate_availability_data_invalid_time_range(self):
         """Test validation fails with invalid time range"""
         invalid_data = {
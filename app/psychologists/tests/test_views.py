@@ -15,6 +15,7 @@ from unittest.mock import patch
 
 from django.test import TestCase
 from django.urls import reverse
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework.authtoken.models import Token
@@ -631,6 +632,38 @@ class PsychologistMarketplaceViewSetTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 0)
 
+    def test_search_marketplace_paginated(self):
+        """Test full-text search results are ranked and paginated"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.parent_token.key}')
+
+        url = reverse('psychologist-marketplace-search')
+        response = self.client.post(url, {'query': 'experienced psychologist'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertIn('next', response.data)
+        self.assertEqual(response.data['results'][0]['full_name'], 'Dr. Test Psychologist')
+
+        response = self.client.post(f'{url}?page=2', {'query': 'experienced'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_typeahead(self):
+        """Test typeahead suggests marketplace psychologists only"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.parent_token.key}')
+
+        url = reverse('psychologist-marketplace-typeahead')
+        response = self.client.get(url, {'q': 'psych'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{
+            'id': str(self.psychologist.user_id),
+            'full_name': 'Dr. Test Psychologist',
+            'years_of_experience': 5,
+        }])
+
+        response = self.client.get(url, {'q': 'psych', 'limit': 'x'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_filter_marketplace_psychologists(self):
         """Test filtering marketplace psychologists"""
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.parent_token.key}')
@@ -643,6 +676,26 @@ class PsychologistMarketplaceViewSetTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['facets']['count'], 1)
+        self.assertEqual(
+            {option['value'] for option in response.data['facets']['services']},
+            {'online', 'consultation', 'both'}
+        )
+
+        response = self.client.get(url, {'max_experience': 'many'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(url, {'latitude': 53.8})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('latitude', response.data)
+
+        response = self.client.get(url, {'certification_institution': 'Nowhere Institute'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+        response = self.client.get(url, {'min_degree_level': 'postdoc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('min_degree_level', response.data)
 
     def test_get_psychologist_availability(self):
         """Test getting psychologist availability for booking"""
@@ -664,6 +717,29 @@ class PsychologistMarketplaceViewSetTests(APITestCase):
         self.assertIn('appointment_slots', response.data)
         self.assertEqual(response.data['psychologist_name'], 'Dr. Test Psychologist')
 
+    def test_psychologist_availability_conditional_get(self):
+        """Test availability polls get a 304 until an availability block changes"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.parent_token.key}')
+        url = reverse('psychologist-marketplace-availability', kwargs={'pk': self.psychologist.user.id})
+
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        PsychologistAvailability.objects.create(
+            psychologist=self.psychologist,
+            day_of_week=2,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+            is_recurring=True
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['recurring_availability']), 1)
+        self.assertNotEqual(response['ETag'], etag)
+
     def test_marketplace_access_unauthorized(self):
         """Test marketplace access without authentication"""
         url = reverse('psychologist-marketplace-list')
@@ -676,6 +752,7 @@ class PsychologistManagementViewSetTests(APITestCase):
     """Test PsychologistManagementViewSet (Admin only)"""
 
     def setUp(self):
+        cache.clear()
         # Create admin user
         self.admin_user = User.objects.create_user(
             email='admin@test.com',
@@ -763,6 +840,9 @@ class PsychologistManagementViewSetTests(APITestCase):
         self.assertIn('service_offerings', response.data)
         self.assertEqual(response.data['total_psychologists'], 1)
 
+        response = self.client.get(url, {'fresh': '1'})
+        self.assertEqual(response['X-Cache'], 'FRESH')
+
     def test_get_statistics_non_admin(self):
         """Test non-admin cannot access statistics"""
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.regular_token.key}')
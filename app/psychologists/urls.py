@@ -1,4 +1,5 @@
 # psychologists/urls.py
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
@@ -6,6 +7,8 @@ from .views import (
     PsychologistProfileViewSet,
     PsychologistAvailabilityViewSet,
     PsychologistMarketplaceViewSet,
+    PsychologistMarketplaceListView,
+    PsychologistMarketplaceDetailView,
     PsychologistManagementViewSet
 )
 
@@ -22,6 +25,15 @@ urlpatterns = [
     path('', include(router.urls)),
 ]
 
+if settings.SERVER_MODE == 'asgi':
+    # Async marketplace list and profile; ahead of the router's list and retrieve, which serve them
+    # under WSGI. Profile ids are UUIDs, so marketplace actions like search/ still reach the router.
+    urlpatterns = [
+        path('marketplace/', PsychologistMarketplaceListView.as_view(), name='psychologist-marketplace-list'),
+        path('marketplace/<uuid:pk>/', PsychologistMarketplaceDetailView.as_view(),
+             name='psychologist-marketplace-detail'),
+    ] + urlpatterns
+
 # The resulting URL patterns will be:
 #
 # Psychologist Profile Management (for psychologists):
@@ -1,4 +1,5 @@
 # psychologists/views.py
+from asgiref.sync import sync_to_async
 from rest_framework import status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -8,7 +9,7 @@ from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 import logging
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied
 from datetime import date, timedelta
 
 from .models import Psychologist, PsychologistAvailability
@@ -19,6 +20,7 @@ from .serializers import (
     PsychologistMarketplaceSerializer,
     PsychologistSummarySerializer,
     PsychologistSearchSerializer,
+    PsychologistTypeaheadSerializer,
     PsychologistAvailabilitySerializer,
     PsychologistEducationSerializer,
     PsychologistCertificationSerializer
@@ -30,7 +32,8 @@ from .services import (
     PsychologistAccessDeniedError,
     AvailabilityManagementError,
     PsychologistAvailabilityService,
-
+    MarketplaceSnapshotService,
+    AvailabilityVersionService,
 )
 from .permissions import (
     IsPsychologistOwner,
@@ -43,10 +46,18 @@ from .permissions import (
     PsychologistAvailabilityPermissions,
     PsychologistMarketplacePermissions
 )
+from core.async_views import AsyncGenericAPIView
+from core.caching import FRESH_PARAMETER, cached_statistics, conditional_get
+from core.db_router import read_from_replica
 
 logger = logging.getLogger(__name__)
 
 
+def availability_etag(request, pk=None):
+    """ETag of a marketplace psychologist's availability"""
+    return AvailabilityVersionService.get_etag(pk, request.path, sorted(request.query_params.items()))
+
+
 class PsychologistProfileViewSet(GenericViewSet):
     """
     ViewSet for psychologist profile management by psychologists themselves
@@ -272,7 +283,7 @@ class PsychologistProfileViewSet(GenericViewSet):
             psychologist = self.get_current_psychologist()
 
             completeness_data = {
-                'profile_completeness': psychologist.get_profile_completeness(),
+                'profile_completeness': psychologist.profile_completeness,
                 'verification_requirements': psychologist.get_verification_requirements(),
                 'verification_status': psychologist.verification_status,
                 'is_verified': psychologist.is_verified,
@@ -470,7 +481,7 @@ class PsychologistAvailabilityViewSet(GenericViewSet):
         try:
             psychologist = self.get_current_psychologist()
 
-            # Get recurring availability
+            # Get recurring availability (cached, with the psychologist the serializer shows)
             recurring_blocks = PsychologistAvailability.get_psychologist_recurring_availability(psychologist)
 
             # Get specific date availability for next 30 days
@@ -478,7 +489,7 @@ class PsychologistAvailabilityViewSet(GenericViewSet):
             date_to = date_from + timedelta(days=30)
             specific_blocks = PsychologistAvailability.get_psychologist_specific_availability(
                 psychologist, date_from, date_to
-            )
+            ).select_related('psychologist__user')
 
             recurring_serializer = self.get_serializer(recurring_blocks, many=True)
             specific_serializer = self.get_serializer(specific_blocks, many=True)
@@ -854,14 +865,24 @@ class PsychologistAvailabilityViewSet(GenericViewSet):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
+class MarketplaceViewMixin:
     """
-    ViewSet for public marketplace where parents browse psychologists
+    Queryset and access rules shared by the marketplace viewset and its
+    async list/detail views, so both server modes answer the same way
     """
     queryset = Psychologist.get_marketplace_psychologists()
-    serializer_class = PsychologistMarketplaceSerializer
     permission_classes = [permissions.IsAuthenticated, PsychologistMarketplacePermissions]
 
+
+class PsychologistMarketplaceViewSet(MarketplaceViewMixin, GenericViewSet, ListModelMixin, RetrieveModelMixin):
+    """
+    ViewSet for public marketplace where parents browse psychologists
+
+    Under ASGI, listing and profile retrieval are served by the async
+    PsychologistMarketplaceListView and PsychologistMarketplaceDetailView.
+    """
+    serializer_class = PsychologistMarketplaceSerializer
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
         if self.action == 'retrieve':
@@ -875,9 +896,16 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
         responses={200: PsychologistMarketplaceSerializer(many=True)},
         tags=['Psychologist Marketplace']
     )
+    @read_from_replica()
     def list(self, request, *args, **kwargs):
-        """List marketplace psychologists"""
-        return super().list(request, *args, **kwargs)
+        """
+        List marketplace psychologists
+
+        Served from precomputed snapshots: pages over listed psychologists
+        only and returns their stored payloads without serializing.
+        """
+        page = self.paginate_queryset(MarketplaceSnapshotService.get_listed_payloads())
+        return self.get_paginated_response(page)
 
     @extend_schema(
         description="Get detailed psychologist profile for marketplace",
@@ -894,10 +922,22 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
             200: PsychologistMarketplaceSerializer(many=True),
             400: {'description': 'Invalid search parameters'}
         },
-        description="Search psychologists in marketplace",
+        description=(
+            "Search psychologists in marketplace. Text criteria use full-text search and results "
+            "are ranked by relevance. Results are paginated with the `page` query parameter."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='page',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Results page number'
+            )
+        ],
         tags=['Psychologist Marketplace']
     )
     @action(detail=False, methods=['post'])
+    @read_from_replica()
     def search(self, request):
         """
         Search psychologists in marketplace
@@ -907,20 +947,23 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
 
         if serializer.is_valid():
             try:
-                # Perform search using service
-                psychologists = PsychologistService.search_psychologists(
+                # Build the ranked search queryset using service
+                queryset = PsychologistService.get_search_queryset(
                     serializer.validated_data, request.user
                 )
 
-                # Serialize results
-                result_serializer = PsychologistMarketplaceSerializer(psychologists, many=True)
+                # Serialize only the requested page
+                page = self.paginate_queryset(queryset)
+                result_serializer = PsychologistMarketplaceSerializer(page, many=True)
 
-                logger.info(f"Marketplace search performed by {request.user.email}: {len(psychologists)} results")
-                return Response({
-                    'count': len(psychologists),
-                    'results': result_serializer.data
-                }, status=status.HTTP_200_OK)
+                logger.info(
+                    f"Marketplace search performed by {request.user.email}: "
+                    f"{self.paginator.page.paginator.count} results"
+                )
+                return self.get_paginated_response(result_serializer.data)
 
+            except NotFound:
+                raise
             except Exception as e:
                 logger.error(f"Error in marketplace search by {request.user.email}: {str(e)}")
                 return Response({
@@ -929,6 +972,51 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='q',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description='Name prefix or fuzzy name query (at least 2 characters)'
+            ),
+            OpenApiParameter(
+                name='limit',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Maximum number of suggestions (default 8, max 20)'
+            )
+        ],
+        responses={
+            200: PsychologistTypeaheadSerializer(many=True),
+            400: {'description': 'Invalid limit'}
+        },
+        description="Lightweight name suggestions for marketplace autocomplete",
+        tags=['Psychologist Marketplace']
+    )
+    @action(detail=False, methods=['get'])
+    @read_from_replica()
+    def typeahead(self, request):
+        """
+        Suggest psychologists by name
+        GET /api/psychologists/marketplace/typeahead/?q=<query>&limit=<n>
+        """
+        limit = request.query_params.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return Response({
+                    'error': _('Invalid limit value')
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+        results = PsychologistService.typeahead(request.query_params.get('q', ''), limit)
+
+        return Response(results, status=status.HTTP_200_OK)
+
     @extend_schema(
         parameters=[
             OpenApiParameter(
@@ -943,20 +1031,68 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
                 location=OpenApiParameter.QUERY,
                 description='Minimum years of experience'
             ),
+            OpenApiParameter(
+                name='max_experience',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Maximum years of experience'
+            ),
+            OpenApiParameter(
+                name='license_authority',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='License issuing authority (exact value from the license_authority facet)'
+            ),
             OpenApiParameter(
                 name='location',
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
                 description='Location keywords for office address'
+            ),
+            OpenApiParameter(
+                name='certification_institution',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Holds a certification from this institution (exact name)'
+            ),
+            OpenApiParameter(
+                name='min_degree_level',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=['bachelor', 'master', 'doctorate'],
+                description='Holds a degree at or above this level'
+            ),
+            OpenApiParameter(
+                name='latitude',
+                type=OpenApiTypes.NUMBER,
+                location=OpenApiParameter.QUERY,
+                description='Latitude to search near (requires longitude); results are ordered by distance'
+            ),
+            OpenApiParameter(
+                name='longitude',
+                type=OpenApiTypes.NUMBER,
+                location=OpenApiParameter.QUERY,
+                description='Longitude to search near (requires latitude)'
+            ),
+            OpenApiParameter(
+                name='radius_km',
+                type=OpenApiTypes.NUMBER,
+                location=OpenApiParameter.QUERY,
+                description='Search radius in km (default 25, max 500)'
             )
         ],
         responses={
             200: PsychologistMarketplaceSerializer(many=True),
         },
-        description="Filter psychologists by query parameters",
+        description=(
+            "Filter psychologists by query parameters. The response includes `facets`: result "
+            "counts for each services, experience and license authority option, each computed "
+            "with the other selected filters applied."
+        ),
         tags=['Psychologist Marketplace']
     )
     @action(detail=False, methods=['get'])
+    @read_from_replica()
     def filter(self, request):
         """
         Filter psychologists by query parameters
@@ -968,24 +1104,40 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
 
             services = request.query_params.get('services')
             if services:
-                if services == 'online':
+                if services in ('online', 'both'):
                     filters['offers_online_sessions'] = True
-                elif services == 'consultation':
+                if services in ('consultation', 'both'):
                     filters['offers_initial_consultation'] = True
 
-            min_experience = request.query_params.get('min_experience')
-            if min_experience:
-                try:
-                    filters['min_years_experience'] = int(min_experience)
-                except ValueError:
-                    return Response({
-                        'error': _('Invalid min_experience value')
-                    }, status=status.HTTP_400_BAD_REQUEST)
+            for param, key in (('min_experience', 'min_years_experience'),
+                               ('max_experience', 'max_years_experience')):
+                value = request.query_params.get(param)
+                if value:
+                    try:
+                        filters[key] = int(value)
+                    except ValueError:
+                        return Response({
+                            'error': _('Invalid %(param)s value') % {'param': param}
+                        }, status=status.HTTP_400_BAD_REQUEST)
+
+            license_authority = request.query_params.get('license_authority', '').strip()
+            if license_authority:
+                filters['license_authority'] = license_authority
 
             location = request.query_params.get('location')
             if location:
                 filters['location_keywords'] = location
 
+            # Distance and credential filters share the search validation
+            extra = PsychologistSearchSerializer(data={
+                key: request.query_params[key]
+                for key in ('latitude', 'longitude', 'radius_km', 'certification_institution', 'min_degree_level')
+                if request.query_params.get(key)
+            })
+            if not extra.is_valid():
+                return Response(extra.errors, status=status.HTTP_400_BAD_REQUEST)
+            filters.update(extra.validated_data)
+
             # Get filtered psychologists
             psychologists = PsychologistService.get_marketplace_psychologists(filters)
 
@@ -995,6 +1147,7 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
             return Response({
                 'count': len(psychologists),
                 'filters_applied': filters,
+                'facets': PsychologistService.get_marketplace_facets(filters),
                 'results': serializer.data
             }, status=status.HTTP_200_OK)
 
@@ -1035,12 +1188,14 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
                     ]
                 }
             },
+            304: {'description': 'Availability unchanged since the If-None-Match ETag'},
             404: {'description': 'Psychologist not found'}
         },
         description="Get psychologist availability for appointment booking",
         tags=['Psychologist Marketplace']
     )
     @action(detail=True, methods=['get'])
+    @conditional_get(availability_etag)
     def availability(self, request, pk=None):
         """
         Get psychologist availability for appointment booking
@@ -1086,12 +1241,58 @@ class PsychologistMarketplaceViewSet(GenericViewSet, ListModelMixin, RetrieveMod
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class PsychologistMarketplaceListView(MarketplaceViewMixin, AsyncGenericAPIView):
+    """
+    Marketplace listing (async, routed under ASGI)
+    """
+    serializer_class = PsychologistMarketplaceSerializer
+
+    @extend_schema(
+        description="List marketplace psychologists (approved and visible)",
+        responses={200: PsychologistMarketplaceSerializer(many=True)},
+        tags=['Psychologist Marketplace']
+    )
+    async def get(self, request):
+        """
+        List marketplace psychologists
+        GET /api/psychologists/marketplace/
+
+        Served from precomputed snapshots: pages over listed psychologists
+        only and returns their stored payloads without serializing.
+        """
+        with read_from_replica():
+            page = await self.apaginate_queryset(MarketplaceSnapshotService.get_listed_payloads())
+        return self.get_paginated_response(page)
+
+
+class PsychologistMarketplaceDetailView(MarketplaceViewMixin, AsyncGenericAPIView):
+    """
+    Marketplace psychologist profile (async, routed under ASGI)
+    """
+    serializer_class = PsychologistDetailSerializer
+
+    @extend_schema(
+        description="Get detailed psychologist profile for marketplace",
+        responses={200: PsychologistDetailSerializer},
+        tags=['Psychologist Marketplace']
+    )
+    async def get(self, request, pk=None):
+        """
+        Get detailed psychologist profile
+        GET /api/psychologists/marketplace/{id}/
+        """
+        psychologist = await self.aget_object()
+        data = await sync_to_async(lambda: self.get_serializer(psychologist).data)()
+        return Response(data, status=status.HTTP_200_OK)
+
+
 class PsychologistManagementViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
     """
     ViewSet for psychologist management (Admin access)
     """
     queryset = Psychologist.objects.select_related('user').all()
     permission_classes = [permissions.IsAuthenticated]
+    cursor_ordering = '-created_at'
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -1167,71 +1368,33 @@ class PsychologistManagementViewSet(GenericViewSet, ListModelMixin, RetrieveMode
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @extend_schema(
+        parameters=[FRESH_PARAMETER],
         responses={
             200: {
                 'description': 'Platform-wide psychologist statistics',
                 'example': {
                     'total_psychologists': 50,
-                    'by_verification_status': {'Approved': 35, 'Pending': 10, 'Rejected': 5},
-                    'by_services': {'online_only': 20, 'consultation_only': 5, 'both': 25}
+                    'verification_status': {'Approved': 35, 'Pending': 10, 'Rejected': 5},
+                    'service_offerings': {'online_only': 20, 'consultation_only': 5, 'both_services': 25},
+                    'license_status': {'valid_licenses': 48, 'expired_licenses': 2},
+                    'marketplace_visible': 33,
+                    'user_status': {'active_users': 49, 'verified_emails': 47}
                 }
             }
         },
-        description="Get platform-wide psychologist statistics (Admin only)",
+        description="Get platform-wide psychologist statistics, cached briefly (Admin only)",
         tags=['Psychologist Management']
     )
     @action(detail=False, methods=['get'])
+    @cached_statistics()
+    @read_from_replica()
     def statistics(self, request):
         """
         Get platform-wide psychologist statistics
         GET /api/psychologists/manage/statistics/
         """
         try:
-            queryset = Psychologist.objects.all()
-
-            # Basic counts
-            total_psychologists = queryset.count()
-
-            # Verification status distribution
-            verification_stats = {}
-            for status_code, status_label in Psychologist.VERIFICATION_STATUS_CHOICES:
-                verification_stats[status_code] = queryset.filter(verification_status=status_code).count()
-
-            # Service offerings
-            online_only = queryset.filter(offers_online_sessions=True, offers_initial_consultation=False).count()
-            consultation_only = queryset.filter(offers_online_sessions=False, offers_initial_consultation=True).count()
-            both_services = queryset.filter(offers_online_sessions=True, offers_initial_consultation=True).count()
-
-            # License validity
-            valid_licenses = queryset.filter(license_expiry_date__gte=date.today()).count()
-            expired_licenses = queryset.filter(license_expiry_date__lt=date.today()).count()
-
-            # Marketplace visibility
-            marketplace_visible = queryset.filter(
-                verification_status='Approved',
-                user__is_active=True,
-                user__is_verified=True,
-                license_expiry_date__gte=date.today()
-            ).count()
-
-            statistics = {
-                'total_psychologists': total_psychologists,
-                'verification_status': verification_stats,
-                'service_offerings': {
-                    'online_only': online_only,
-                    'consultation_only': consultation_only,
-                    'both_services': both_services
-                },
-                'license_status': {
-                    'valid_licenses': valid_licenses,
-                    'expired_licenses': expired_licenses
-                },
-                'marketplace_visible': marketplace_visible,
-                'user_status': {
-                    'active_users': queryset.filter(user__is_active=True).count(),
-                    'verified_emails': queryset.filter(user__is_verified=True).count()
-                }
-            }
+            statistics = PsychologistService.get_platform_statistics()
 
             logger.info(f"Psychologist statistics accessed by admin {request.user.email}")
             return Response(statistics, status=status.HTTP_200_OK)
@@ -0,0 +1,64 @@
+# users/actor.py
+from django.core.exceptions import ObjectDoesNotExist
+
+
+def get_user_profile(user, relation: str):
+    """
+    Return the user's profile for `relation`, or None if it has none
+
+    The result (including "no profile") is memoized in the user's relation
+    cache, so it is loaded at most once per user instance. Users coming from
+    CachedTokenAuthentication already carry their profile, so this makes no
+    query for them.
+    """
+    if user is None or not getattr(user, 'is_authenticated', False):
+        return None
+
+    try:
+        return getattr(user, relation)
+    except ObjectDoesNotExist:
+        return None
+
+
+class Actor:
+    """
+    The user making a request together with their parent/psychologist profile
+
+    Use get_actor(request) rather than instantiating directly, so the context
+    is built once and shared by permissions, views and services.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    @property
+    def is_authenticated(self) -> bool:
+        return bool(self.user and self.user.is_authenticated)
+
+    @property
+    def parent(self):
+        """Parent profile, or None for non-parents"""
+        if not self.is_authenticated or self.user.user_type != 'Parent':
+            return None
+        return get_user_profile(self.user, 'parent_profile')
+
+    @property
+    def psychologist(self):
+        """Psychologist profile, or None for non-psychologists"""
+        if not self.is_authenticated or self.user.user_type != 'Psychologist':
+            return None
+        return get_user_profile(self.user, 'psychologist_profile')
+
+    @property
+    def profile(self):
+        """The profile matching the user's type, if any"""
+        return self.parent or self.psychologist
+
+
+def get_actor(request) -> Actor:
+    """Get the actor context for a request, building it on first use"""
+    actor = getattr(request, '_actor', None)
+    if actor is None or actor.user is not request.user:
+        actor = Actor(request.user)
+        request._actor = actor
+    return actor
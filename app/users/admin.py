@@ -3,7 +3,8 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 from rest_framework.authtoken.admin import TokenAdmin
 
-from .models import User
+from .models import User, OutboundEmail
+from .services import EmailOutboxService
 
 
 @admin.register(User)
@@ -40,5 +41,25 @@ class UserAdmin(BaseUserAdmin):
     readonly_fields = ['registration_date', 'created_at', 'updated_at']
 
 
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    """
+    Admin for the email outbox
+    """
+    list_display = ['recipient_email', 'subject', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'created_at']
+    list_filter = ['status', 'template_name', 'created_at']
+    search_fields = ['recipient_email', 'subject']
+    readonly_fields = [
+        'recipient_email', 'from_email', 'subject', 'template_name', 'text_body', 'html_body',
+        'attempts', 'locked_until', 'last_error', 'sent_at', 'created_at', 'updated_at'
+    ]
+    actions = ['requeue_dead_letters']
+
+    @admin.action(description=_('Requeue selected dead-lettered emails'))
+    def requeue_dead_letters(self, request, queryset):
+        count = EmailOutboxService.requeue_dead_letters(queryset)
+        self.message_user(request, _('%(count)d email(s) requeued.') % {'count': count})
+
+
 # Fix TokenAdmin to work with our custom User model
 TokenAdmin.autocomplete_fields = ['user']
\ No newline at end of file
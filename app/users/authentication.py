@@ -0,0 +1,151 @@
+# users/authentication.py
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+class TokenCache:
+    """
+    Two-tier cache of token key -> (user, token)
+
+    A bounded in-process LRU with TTL sits in front of the shared Django
+    cache. A local hit needs neither the database nor the shared cache; a
+    local entry is trusted for LOCAL_TTL seconds and then re-read from the
+    shared tier. Invalidation deletes only the affected tokens' shared
+    entries (and the local ones in this process), so other workers see it
+    once their local copy expires, within LOCAL_TTL. Lookups never touch the
+    database.
+
+    Local entries are kept pickled so every request gets its own copy of the
+    user and can't leak changes into another request.
+    """
+
+    KEY_PREFIX = 'auth:token:'
+
+    DEFAULT_CONFIG = {
+        'CACHE_ALIAS': 'default',
+        'MAX_ENTRIES': 1000,
+        'LOCAL_TTL': 5,
+        'SHARED_TTL': 300,
+    }
+
+    def __init__(self, **config):
+        self.config = {**self.DEFAULT_CONFIG, **getattr(settings, 'TOKEN_AUTH_CACHE', {}), **config}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.config['CACHE_ALIAS']]
+
+    @classmethod
+    def make_key(cls, token_key: str) -> str:
+        """Shared cache key for a token; raw tokens are never used as cache keys"""
+        return cls.KEY_PREFIX + hashlib.sha256(token_key.encode()).hexdigest()
+
+    def get(self, token_key: str):
+        """Return the cached (user, token) pair or None"""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(token_key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(token_key)
+                    return pickle.loads(value)
+                del self._entries[token_key]
+
+        value = self.shared.get(self.make_key(token_key))
+        if value is not None:
+            self._store_local(token_key, value)
+        return value
+
+    def set(self, token_key: str, user, token):
+        """Cache a successful lookup in both tiers"""
+        value = (user, token)
+        self.shared.set(self.make_key(token_key), value, self.config['SHARED_TTL'])
+        self._store_local(token_key, value)
+
+    def invalidate(self, *token_keys: str):
+        """Drop tokens from the shared cache and this process; other workers follow within LOCAL_TTL"""
+        if not token_keys:
+            return
+
+        self.shared.delete_many([self.make_key(key) for key in token_keys])
+        with self._lock:
+            for key in token_keys:
+                self._entries.pop(key, None)
+
+    def clear_local(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _store_local(self, token_key, value):
+        if self.config['LOCAL_TTL'] <= 0:
+            return
+
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[token_key] = (data, time.monotonic() + self.config['LOCAL_TTL'])
+            self._entries.move_to_end(token_key)
+            while len(self._entries) > self.config['MAX_ENTRIES']:
+                self._entries.popitem(last=False)
+
+
+token_cache = TokenCache()
+
+
+def invalidate_user_tokens(*user_ids):
+    """
+    Drop the cached tokens of the given users so changes to them or their
+    profiles take effect on the next request
+
+    Call this after bulk QuerySet.update()s, which bypass the model signals.
+    """
+    keys = list(Token.objects.filter(user_id__in=user_ids).values_list('key', flat=True))
+    if keys:
+        token_cache.invalidate(*keys)
+        # A request may have re-cached the old row before this transaction commits
+        transaction.on_commit(lambda: token_cache.invalidate(*keys))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that serves repeat lookups from TokenCache
+
+    The user is loaded together with their parent/psychologist profile in
+    the same query, so users.actor can resolve the profile without another
+    lookup. Entries are invalidated by the signals in users.signals when a
+    token is deleted (logout), or its user or profile is saved or deleted
+    (e.g. deactivation).
+    """
+
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is not None:
+            return cached
+
+        model = self.get_model()
+        try:
+            token = model.objects.select_related(
+                'user', 'user__parent_profile', 'user__psychologist_profile'
+            ).get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        token_cache.set(key, token.user, token)
+        return token.user, token
@@ -0,0 +1,115 @@
+"""
+Django command to measure bulk email throughput against a local SMTP server.
+
+Requires the `aiosmtpd` dev dependency. Nothing leaves the machine: the
+command starts an in-process SMTP stand-in that accepts and discards mail.
+"""
+import asyncio
+import socket
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from users.services import EmailService
+
+
+class CountingHandler:
+    """aiosmtpd handler that counts and discards messages"""
+
+    def __init__(self, latency_ms=0):
+        self.latency = latency_ms / 1000
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.received += 1
+        return '250 Message accepted'
+
+
+class Command(BaseCommand):
+    """Django command to benchmark EmailService.send_bulk_email."""
+
+    help = 'Benchmark bulk email throughput against a local aiosmtpd server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recipients', type=int, default=1000, help='Number of messages to send')
+        parser.add_argument('--latency-ms', type=int, default=0, help='Simulated server latency per message')
+        parser.add_argument('--chunk-size', type=int, help='Override EMAIL_BULK CHUNK_SIZE')
+        parser.add_argument('--render-workers', type=int, help='Override EMAIL_BULK RENDER_WORKERS')
+        parser.add_argument(
+            '--compare', action='store_true',
+            help='Also time one send_email call per recipient (the previous bulk behaviour)'
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        try:
+            from aiosmtpd.controller import Controller
+        except ImportError:
+            raise CommandError('aiosmtpd is required: pip install -r requirements.dev.txt')
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        handler = CountingHandler(options['latency_ms'])
+        controller = Controller(handler, hostname='127.0.0.1', port=port)
+        controller.start()
+
+        recipients = [
+            (f'benchmark{i}@example.com', {
+                'user_name': f'benchmark{i}@example.com',
+                'verification_link': f'https://example.com/verify/{i}/',
+                'expiry_days': 3,
+            })
+            for i in range(options['recipients'])
+        ]
+
+        smtp_settings = {
+            'EMAIL_BACKEND': 'django.core.mail.backends.smtp.EmailBackend',
+            'EMAIL_HOST': '127.0.0.1',
+            'EMAIL_PORT': port,
+            'EMAIL_USE_TLS': False,
+            'EMAIL_USE_SSL': False,
+            'EMAIL_HOST_USER': '',
+            'EMAIL_HOST_PASSWORD': '',
+        }
+
+        try:
+            with override_settings(**smtp_settings):
+                if options['compare']:
+                    self._report('send_email per recipient', handler, lambda: self._send_individually(recipients))
+
+                self._report('send_bulk_email', handler, lambda: EmailService.send_bulk_email(
+                    subject='Benchmark',
+                    template_name='verify_email',
+                    recipients_contexts=recipients,
+                    chunk_size=options['chunk_size'],
+                    render_workers=options['render_workers'],
+                ))
+        finally:
+            controller.stop()
+
+    def _send_individually(self, recipients):
+        results = {'success': [], 'failed': []}
+        for recipient_email, context in recipients:
+            try:
+                EmailService.send_email('Benchmark', 'verify_email', context, recipient_email)
+                results['success'].append(recipient_email)
+            except Exception as e:
+                results['failed'].append((recipient_email, str(e)))
+        return results
+
+    def _report(self, label, handler, run):
+        handler.received = 0
+        started = time.perf_counter()
+        results = run()
+        elapsed = time.perf_counter() - started
+
+        sent = len(results['success'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{label}: {sent} sent, {len(results['failed'])} failed, "
+            f"{handler.received} received in {elapsed:.2f}s ({sent / elapsed:.0f} msg/s)"
+        ))
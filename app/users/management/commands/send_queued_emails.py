@@ -0,0 +1,49 @@
+"""
+Django command to deliver emails queued in the outbox.
+
+Run it as a long-lived worker (`--loop`) next to the web processes, or
+periodically from a scheduler to drain the queue and exit.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from users.services import EmailOutboxService
+
+
+class Command(BaseCommand):
+    """Django command to send queued outbox emails."""
+
+    help = 'Deliver pending outbox emails in batches, retrying failures with backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Emails claimed and sent per connection')
+        parser.add_argument('--max-batches', type=int, help='Stop after this many batches')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new emails until interrupted')
+        parser.add_argument('--poll-interval', type=int, help='Seconds to sleep when the queue is empty (with --loop)')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        poll_interval = options['poll_interval'] or EmailOutboxService.get_config()['POLL_INTERVAL_SECONDS']
+
+        try:
+            while True:
+                result = EmailOutboxService.process_outbox(
+                    batch_size=options['batch_size'],
+                    max_batches=options['max_batches'],
+                )
+                if result['claimed']:
+                    self.stdout.write(self.style.SUCCESS(
+                        f"Processed {result['claimed']} emails in {result['batches']} batches "
+                        f"(sent: {result['sent']}, retried: {result['retried']}, "
+                        f"dead-lettered: {result['dead_lettered']})"
+                    ))
+                elif not options['loop']:
+                    self.stdout.write("No queued emails to send")
+
+                if not options['loop']:
+                    break
+                if not result['claimed']:
+                    time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            self.stdout.write("Email worker stopped")
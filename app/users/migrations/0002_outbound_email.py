@@ -0,0 +1,41 @@
+# Generated by Django 5.1.9 on 2026-10-18 22:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('recipient_email', models.EmailField(help_text='Address the email is delivered to', max_length=254, verbose_name='recipient email')),
+                ('from_email', models.CharField(help_text='Sender address', max_length=255, verbose_name='from email')),
+                ('subject', models.CharField(max_length=255, verbose_name='subject')),
+                ('template_name', models.CharField(blank=True, help_text='Template the bodies were rendered from', max_length=100, verbose_name='template name')),
+                ('text_body', models.TextField(verbose_name='text body')),
+                ('html_body', models.TextField(blank=True, verbose_name='HTML body')),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('Sent', 'Sent'), ('Dead_Letter', 'Dead Letter')], default='Pending', max_length=20, verbose_name='status')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Number of delivery attempts made so far', verbose_name='attempts')),
+                ('max_attempts', models.PositiveIntegerField(default=5, help_text='Attempts before the email is dead-lettered', verbose_name='max attempts')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Earliest time the worker may (re)try delivery', verbose_name='next attempt at')),
+                ('last_error', models.TextField(blank=True, verbose_name='last error')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='sent at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+            ],
+            options={
+                'verbose_name': 'Outbound Email',
+                'verbose_name_plural': 'Outbound Emails',
+                'db_table': 'outbound_emails',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbound_em_status_54195c_idx'), models.Index(fields=['recipient_email'], name='outbound_em_recipie_24196b_idx')],
+            },
+        ),
+    ]
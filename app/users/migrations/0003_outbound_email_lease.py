@@ -0,0 +1,27 @@
+# Generated by Django 5.1.9 on 2026-10-19 04:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_outbound_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboundemail',
+            name='locked_until',
+            field=models.DateTimeField(blank=True, help_text="While Sending: when the worker's claim expires and another worker may retry", null=True, verbose_name='locked until'),
+        ),
+        migrations.AlterField(
+            model_name='outboundemail',
+            name='status',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Sending', 'Sending'), ('Sent', 'Sent'), ('Dead_Letter', 'Dead Letter')], default='Pending', max_length=20, verbose_name='status'),
+        ),
+        migrations.AddIndex(
+            model_name='outboundemail',
+            index=models.Index(fields=['status', 'locked_until'], name='outbound_em_status_f6c082_idx'),
+        ),
+    ]
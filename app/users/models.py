@@ -1,6 +1,7 @@
 # users/models.py
 import uuid
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.core.mail import EmailMultiAlternatives
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
@@ -125,4 +126,107 @@ class User(AbstractBaseUser, PermissionsMixin):
     @property
     def is_admin(self):
         """Check if user is an admin"""
-        return self.user_type == 'Admin'
\ No newline at end of file
+        return self.user_type == 'Admin'
+
+
+class OutboundEmail(models.Model):
+    """
+    Transactional outbox for emails.
+
+    Request handlers write rows here inside their own transaction; the
+    `send_queued_emails` worker delivers them, so SMTP latency, retries and
+    backoff never block a request.
+    """
+
+    STATUS_CHOICES = [
+        ('Pending', _('Pending')),
+        ('Sending', _('Sending')),
+        ('Sent', _('Sent')),
+        ('Dead_Letter', _('Dead Letter')),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    recipient_email = models.EmailField(
+        _('recipient email'),
+        help_text=_("Address the email is delivered to")
+    )
+    from_email = models.CharField(
+        _('from email'),
+        max_length=255,
+        help_text=_("Sender address")
+    )
+    subject = models.CharField(
+        _('subject'),
+        max_length=255
+    )
+    template_name = models.CharField(
+        _('template name'),
+        max_length=100,
+        blank=True,
+        help_text=_("Template the bodies were rendered from")
+    )
+    text_body = models.TextField(_('text body'))
+    html_body = models.TextField(_('HTML body'), blank=True)
+
+    # Delivery state
+    status = models.CharField(
+        _('status'),
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='Pending'
+    )
+    attempts = models.PositiveIntegerField(
+        _('attempts'),
+        default=0,
+        help_text=_("Number of delivery attempts made so far")
+    )
+    max_attempts = models.PositiveIntegerField(
+        _('max attempts'),
+        default=5,
+        help_text=_("Attempts before the email is dead-lettered")
+    )
+    next_attempt_at = models.DateTimeField(
+        _('next attempt at'),
+        default=timezone.now,
+        help_text=_("Earliest time the worker may (re)try delivery")
+    )
+    locked_until = models.DateTimeField(
+        _('locked until'),
+        blank=True,
+        null=True,
+        help_text=_("While Sending: when the worker's claim expires and another worker may retry")
+    )
+    last_error = models.TextField(_('last error'), blank=True)
+    sent_at = models.DateTimeField(_('sent at'), blank=True, null=True)
+
+    created_at = models.DateTimeField(_('created at'), auto_now_add=True)
+    updated_at = models.DateTimeField(_('updated at'), auto_now=True)
+
+    class Meta:
+        verbose_name = _('Outbound Email')
+        verbose_name_plural = _('Outbound Emails')
+        db_table = 'outbound_emails'
+        ordering = ['-created_at']
+        indexes = [
+            # Worker claim query: status = 'Pending' AND next_attempt_at <= now
+            models.Index(fields=['status', 'next_attempt_at']),
+            # Expired claims: status = 'Sending' AND locked_until <= now
+            models.Index(fields=['status', 'locked_until']),
+            models.Index(fields=['recipient_email']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.recipient_email} ({self.status})"
+
+    def to_email_message(self, connection=None):
+        """Build the EmailMultiAlternatives message for this row"""
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.text_body,
+            from_email=self.from_email,
+            to=[self.recipient_email],
+            connection=connection,
+        )
+        if self.html_body:
+            message.attach_alternative(self.html_body, "text/html")
+        return message
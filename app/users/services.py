@@ -1,15 +1,23 @@
 # users/services.py
-from django.core.mail import send_mail, EmailMultiAlternatives
+from django.core.mail import send_mail, EmailMultiAlternatives, get_connection
 from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone, translation
 from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
 from django.utils.html import strip_tags
 import logging
 from typing import Tuple, Optional
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from functools import wraps
+from itertools import islice
+from smtplib import SMTPServerDisconnected
 
-from .models import User
+from .models import User, OutboundEmail
 from .tokens import token_generator
 from django.conf import settings
 # Set up logging
@@ -62,6 +70,91 @@ class EmailService:
             'company_address': getattr(settings, 'COMPANY_ADDRESS', ''),
         }
 
+    @staticmethod
+    def render_email(template_name: str, context: dict) -> Tuple[str, str]:
+        """
+        Render the HTML and text bodies of a templated email
+
+        Returns:
+            tuple: (html_content, text_content)
+        """
+        # Merge with base context
+        full_context = {**EmailService.get_email_context_base(), **context}
+
+        html_content = render_to_string(f'emails/{template_name}.html', full_context)
+        text_content = render_to_string(f'emails/{template_name}.txt', full_context)
+        return html_content, text_content
+
+    @staticmethod
+    def queue_email(subject: str, template_name: str, context: dict,
+                    recipient_email: str, from_email: str = None) -> OutboundEmail:
+        """
+        Render an email and store it in the outbox for the delivery worker
+
+        The row is written in the caller's transaction, so the email is only
+        delivered if that transaction commits. Templates are rendered here
+        because contexts usually hold model instances that cannot be stored.
+
+        Args:
+            subject: Email subject
+            template_name: Base name of template (without .html/.txt extension)
+            context: Context dictionary for template rendering
+            recipient_email: Recipient email address
+            from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
+
+        Returns:
+            OutboundEmail: The queued outbox row
+        """
+        html_content, text_content = EmailService.render_email(template_name, context)
+
+        outbound = OutboundEmail.objects.create(
+            recipient_email=recipient_email,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            subject=str(subject),
+            template_name=template_name,
+            text_body=text_content,
+            html_body=html_content,
+            max_attempts=EmailOutboxService.get_config()['MAX_ATTEMPTS'],
+        )
+
+        logger.info(f"Email '{template_name}' queued for {recipient_email} (outbox id {outbound.id})")
+        return outbound
+
+    @staticmethod
+    def queue_bulk_email(subject: str, template_name: str, recipients_contexts: list,
+                         from_email: str = None) -> list:
+        """
+        Render emails for several recipients and add them to the outbox in one insert
+
+        Args:
+            subject: Email subject
+            template_name: Base name of template
+            recipients_contexts: List of tuples (email, context)
+            from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
+
+        Returns:
+            list: The queued OutboundEmail rows
+        """
+        from_email = from_email or settings.DEFAULT_FROM_EMAIL
+        max_attempts = EmailOutboxService.get_config()['MAX_ATTEMPTS']
+
+        rows = []
+        for recipient_email, context in recipients_contexts:
+            html_content, text_content = EmailService.render_email(template_name, context)
+            rows.append(OutboundEmail(
+                recipient_email=recipient_email,
+                from_email=from_email,
+                subject=str(subject),
+                template_name=template_name,
+                text_body=text_content,
+                html_body=html_content,
+                max_attempts=max_attempts,
+            ))
+
+        outbound = OutboundEmail.objects.bulk_create(rows)
+        logger.info(f"{len(outbound)} '{template_name}' emails queued")
+        return outbound
+
     @staticmethod
     @retry_on_email_failure(max_attempts=3)
     def send_email(subject: str, template_name: str, context: dict,
@@ -80,12 +173,7 @@ class EmailService:
             bool: True if email sent successfully
         """
         try:
-            # Merge with base context
-            full_context = {**EmailService.get_email_context_base(), **context}
-
-            # Render templates
-            html_content = render_to_string(f'emails/{template_name}.html', full_context)
-            text_content = render_to_string(f'emails/{template_name}.txt', full_context)
+            html_content, text_content = EmailService.render_email(template_name, context)
 
             # Create email
             email = EmailMultiAlternatives(
@@ -111,36 +199,303 @@ class EmailService:
             )
             raise
 
+    @staticmethod
+    def get_bulk_config() -> dict:
+        """Get bulk sending configuration merged over the defaults"""
+        return {'CHUNK_SIZE': 100, 'RENDER_WORKERS': 4, **getattr(settings, 'EMAIL_BULK', {})}
+
     @staticmethod
     def send_bulk_email(subject: str, template_name: str,
-                       recipients_contexts: list) -> dict:
+                        recipients_contexts, from_email: str = None,
+                        chunk_size: int = None, render_workers: int = None) -> dict:
         """
         Send bulk emails with individual contexts
 
+        Messages are rendered in a thread pool and sent chunk by chunk over a
+        single reused connection. A failing recipient is recorded and the run
+        carries on; nothing is retried here.
+
+        Contexts are rendered outside the calling thread, so any related
+        objects the templates use should already be loaded.
+
         Args:
             subject: Email subject
             template_name: Base name of template
-            recipients_contexts: List of tuples (email, context)
+            recipients_contexts: Iterable of tuples (email, context)
+            from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
+            chunk_size: Messages rendered and sent per chunk
+            render_workers: Threads used for template rendering
 
         Returns:
-            dict: {'success': list, 'failed': list}
+            dict: {'success': list, 'failed': list of (email, error)}
         """
+        config = EmailService.get_bulk_config()
+        chunk_size = chunk_size or config['CHUNK_SIZE']
+        render_workers = render_workers or config['RENDER_WORKERS']
+
         results = {'success': [], 'failed': []}
+        render = EmailService._bulk_message_renderer(subject, template_name, from_email)
+        recipients_contexts = iter(recipients_contexts)
 
-        for recipient_email, context in recipients_contexts:
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            logger.error(f"Could not open email connection for bulk send: {str(e)}")
+            results['failed'] = [(recipient_email, str(e)) for recipient_email, _context in recipients_contexts]
+            return results
+
+        try:
+            with ThreadPoolExecutor(max_workers=render_workers) as pool:
+                while True:
+                    chunk = list(islice(recipients_contexts, chunk_size))
+                    if not chunk:
+                        break
+
+                    for recipient_email, message, error in pool.map(render, chunk):
+                        if error is None:
+                            try:
+                                EmailService._send_over_connection(connection, message)
+                            except Exception as e:
+                                error = e
+
+                        if error is None:
+                            results['success'].append(recipient_email)
+                        else:
+                            results['failed'].append((recipient_email, str(error)))
+                            logger.error(f"Failed to send bulk email to {recipient_email}: {str(error)}")
+        finally:
+            connection.close()
+
+        logger.info(
+            f"Bulk email '{template_name}': {len(results['success'])} sent, "
+            f"{len(results['failed'])} failed"
+        )
+        return results
+
+    @staticmethod
+    def _bulk_message_renderer(subject: str, template_name: str, from_email: str = None):
+        """
+        Build the per-recipient render function used by send_bulk_email
+
+        The base context and active language are captured once so that worker
+        threads render exactly what the calling thread would.
+        """
+        base_context = EmailService.get_email_context_base()
+        language = translation.get_language()
+        subject = str(subject)
+        from_email = from_email or settings.DEFAULT_FROM_EMAIL
+
+        def render(recipient_context):
+            recipient_email, context = recipient_context
             try:
-                EmailService.send_email(
+                with translation.override(language):
+                    full_context = {**base_context, **context}
+                    html_content = render_to_string(f'emails/{template_name}.html', full_context)
+                    text_content = render_to_string(f'emails/{template_name}.txt', full_context)
+
+                message = EmailMultiAlternatives(
                     subject=subject,
-                    template_name=template_name,
-                    context=context,
-                    recipient_email=recipient_email
+                    body=text_content,
+                    from_email=from_email,
+                    to=[recipient_email],
                 )
-                results['success'].append(recipient_email)
+                message.attach_alternative(html_content, "text/html")
+                return recipient_email, message, None
             except Exception as e:
-                results['failed'].append((recipient_email, str(e)))
-                logger.error(f"Failed to send bulk email to {recipient_email}: {str(e)}")
+                return recipient_email, None, e
+            finally:
+                # Worker threads get their own DB connections if a template
+                # touches the database; don't leave them open
+                if threading.current_thread() is not threading.main_thread():
+                    connections.close_all()
 
-        return results
+        return render
+
+    @staticmethod
+    def _send_over_connection(connection, message):
+        """
+        Send one message on an open connection, reconnecting once if the
+        server dropped it (e.g. a per-connection message limit)
+        """
+        try:
+            sent = connection.send_messages([message])
+        except SMTPServerDisconnected:
+            connection.close()
+            connection.open()
+            sent = connection.send_messages([message])
+
+        if not sent:
+            raise RuntimeError('Email backend reported no message sent')
+
+
+class EmailOutboxService:
+    """
+    Delivers queued OutboundEmail rows outside the request cycle
+    """
+
+    DEFAULT_CONFIG = {
+        'BATCH_SIZE': 50,
+        'MAX_ATTEMPTS': 5,
+        'RETRY_BASE_SECONDS': 60,
+        'RETRY_MAX_SECONDS': 3600,
+        'POLL_INTERVAL_SECONDS': 5,
+        'LEASE_SECONDS': 300,
+    }
+
+    @staticmethod
+    def get_config() -> dict:
+        """Get outbox configuration merged over the defaults"""
+        return {**EmailOutboxService.DEFAULT_CONFIG, **getattr(settings, 'EMAIL_OUTBOX', {})}
+
+    @staticmethod
+    def get_retry_delay(attempts: int) -> timedelta:
+        """Exponential backoff before the next attempt after `attempts` failures"""
+        config = EmailOutboxService.get_config()
+        seconds = config['RETRY_BASE_SECONDS'] * (2 ** max(attempts - 1, 0))
+        return timedelta(seconds=min(seconds, config['RETRY_MAX_SECONDS']))
+
+    @staticmethod
+    def process_batch(batch_size: int = None) -> dict:
+        """
+        Claim one batch of due emails and deliver them over a single connection
+
+        Rows are claimed in a short transaction (SELECT ... FOR UPDATE SKIP
+        LOCKED), marked Sending with a lease and committed, so several workers
+        can run concurrently without sending the same email twice. Delivery
+        runs outside any transaction and each row's outcome is saved as soon
+        as its message is handed over, so a crash mid-batch never resends the
+        emails already delivered. Rows whose lease expired (their worker died)
+        are claimed again by a later batch.
+
+        Returns:
+            dict: Counts of claimed, sent, retried and dead-lettered emails
+        """
+        config = EmailOutboxService.get_config()
+        batch_size = batch_size or config['BATCH_SIZE']
+        result = {'claimed': 0, 'sent': 0, 'retried': 0, 'dead_lettered': 0}
+
+        now = timezone.now()
+        locked_until = now + timedelta(seconds=config['LEASE_SECONDS'])
+        with transaction.atomic():
+            batch = list(
+                OutboundEmail.objects.select_for_update(skip_locked=True).filter(
+                    Q(status='Pending', next_attempt_at__lte=now) | Q(status='Sending', locked_until__lte=now)
+                ).order_by('next_attempt_at', 'id')[:batch_size]
+            )
+            if not batch:
+                return result
+            for outbound in batch:
+                outbound.status = 'Sending'
+                outbound.attempts += 1
+                outbound.locked_until = locked_until
+                outbound.updated_at = now
+            OutboundEmail.objects.bulk_update(batch, ['status', 'attempts', 'locked_until', 'updated_at'])
+        result['claimed'] = len(batch)
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            logger.error(f"Could not open email connection: {str(e)}")
+            for outbound in batch:
+                EmailOutboxService._record_failure(outbound, e, result)
+        else:
+            try:
+                for outbound in batch:
+                    try:
+                        if not connection.send_messages([outbound.to_email_message(connection)]):
+                            raise RuntimeError('Email backend reported no message sent')
+                    except Exception as e:
+                        EmailOutboxService._record_failure(outbound, e, result)
+                    else:
+                        EmailOutboxService._save_outcome(
+                            outbound, status='Sent', sent_at=timezone.now(), last_error=''
+                        )
+                        result['sent'] += 1
+            finally:
+                connection.close()
+
+        logger.info(
+            f"Email outbox batch: {result['sent']} sent, {result['retried']} retried, "
+            f"{result['dead_lettered']} dead-lettered"
+        )
+        return result
+
+    @staticmethod
+    def _save_outcome(outbound: OutboundEmail, **fields):
+        """
+        Release this worker's claim on a row with its delivery outcome
+
+        Matches on the lease, so a worker whose lease expired doesn't
+        overwrite the row after another worker has claimed it.
+        """
+        now = timezone.now()
+        updated = OutboundEmail.objects.filter(
+            pk=outbound.pk, status='Sending', locked_until=outbound.locked_until
+        ).update(locked_until=None, updated_at=now, **fields)
+        if not updated:
+            logger.warning(f"Email {outbound.id} was reclaimed after its lease expired; outcome not saved")
+        for name, value in fields.items():
+            setattr(outbound, name, value)
+        outbound.locked_until = None
+
+    @staticmethod
+    def _record_failure(outbound: OutboundEmail, error: Exception, result: dict):
+        """Schedule a retry with backoff, or dead-letter once attempts run out"""
+        last_error = str(error)[:2000]
+
+        if outbound.attempts >= outbound.max_attempts:
+            EmailOutboxService._save_outcome(outbound, status='Dead_Letter', last_error=last_error)
+            result['dead_lettered'] += 1
+            logger.error(
+                f"Email {outbound.id} to {outbound.recipient_email} dead-lettered "
+                f"after {outbound.attempts} attempts: {last_error}"
+            )
+        else:
+            next_attempt_at = timezone.now() + EmailOutboxService.get_retry_delay(outbound.attempts)
+            EmailOutboxService._save_outcome(
+                outbound, status='Pending', next_attempt_at=next_attempt_at, last_error=last_error
+            )
+            result['retried'] += 1
+            logger.warning(
+                f"Email {outbound.id} to {outbound.recipient_email} failed "
+                f"(attempt {outbound.attempts}), retrying at {next_attempt_at}"
+            )
+
+    @staticmethod
+    def process_outbox(batch_size: int = None, max_batches: int = None) -> dict:
+        """
+        Process batches until no due email is left (or max_batches is reached)
+
+        Returns:
+            dict: Totals across batches plus the number of batches processed
+        """
+        totals = {'batches': 0, 'claimed': 0, 'sent': 0, 'retried': 0, 'dead_lettered': 0}
+
+        while max_batches is None or totals['batches'] < max_batches:
+            result = EmailOutboxService.process_batch(batch_size=batch_size)
+            if not result['claimed']:
+                break
+
+            totals['batches'] += 1
+            for key, value in result.items():
+                totals[key] += value
+
+        return totals
+
+    @staticmethod
+    def requeue_dead_letters(queryset=None) -> int:
+        """Move dead-lettered emails back to Pending with a fresh attempt budget"""
+        if queryset is None:
+            queryset = OutboundEmail.objects.all()
+
+        return queryset.filter(status='Dead_Letter').update(
+            status='Pending',
+            attempts=0,
+            next_attempt_at=timezone.now(),
+            updated_at=timezone.now()
+        )
 
 
 class AuthenticationService:
@@ -192,7 +547,7 @@ class AuthenticationService:
     @staticmethod
     def send_verification_email(user: User) -> bool:
         """
-        Send email verification link to user
+        Queue email verification link for user
         """
         token = token_generator.make_token(user)
         uidb64 = token_generator.encode_uid(user)
@@ -206,12 +561,13 @@ class AuthenticationService:
             'expiry_days': getattr(settings, 'EMAIL_VERIFICATION_TIMEOUT_DAYS', 3),
         }
 
-        return EmailService.send_email(
+        EmailService.queue_email(
             subject=_('Verify your K&Mdiscova account'),
             template_name='verify_email',
             context=context,
             recipient_email=user.email
         )
+        return True
 
     @staticmethod
     def verify_email(uidb64: str, token: str) -> Tuple[Optional[User], str]:
@@ -248,7 +604,7 @@ class AuthenticationService:
     @staticmethod
     def request_password_reset(email: str) -> Tuple[bool, str]:
         """
-        Send password reset email with rate limiting
+        Queue password reset email with rate limiting
         """
         try:
             user = User.objects.get(email=email, is_active=True)
@@ -269,15 +625,14 @@ class AuthenticationService:
                 'ip_address': getattr(user, '_request_ip', 'Unknown'),  # Pass from view
             }
 
-            success = EmailService.send_email(
+            EmailService.queue_email(
                 subject=_('Reset your K&Mdiscova password'),
                 template_name='password_reset',
                 context=context,
                 recipient_email=user.email
             )
 
-            if success:
-                logger.info(f"Password reset email sent to {user.email}")
+            logger.info(f"Password reset email queued for {user.email}")
 
             return True, "Password reset link sent"
 
@@ -319,7 +674,7 @@ class AuthenticationService:
     @staticmethod
     def send_password_change_confirmation(user: User) -> bool:
         """
-        Send confirmation email after password change
+        Queue confirmation email after password change
         """
         context = {
             'user': user,
@@ -327,12 +682,13 @@ class AuthenticationService:
             'support_url': f"{settings.FRONTEND_URL}/support",
         }
 
-        return EmailService.send_email(
+        EmailService.queue_email(
             subject=_('Your K&Mdiscova password has been changed'),
             template_name='password_change_confirmation',
             context=context,
             recipient_email=user.email
         )
+        return True
 
 
 class UserService:
@@ -0,0 +1,44 @@
+# users/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import token_cache, invalidate_user_tokens
+from .models import User
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """
+    Drop a deleted token (logout, user deletion) from the auth cache
+    """
+    token_cache.invalidate(instance.key)
+
+
+# User fields that can't change who a token authenticates or what they may do
+AUTH_IRRELEVANT_FIELDS = frozenset({'last_login', 'last_login_date', 'updated_at'})
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Drop cached tokens when a user changes (deactivation, permission changes)
+
+    Saves of only bookkeeping fields, like the last login time written on
+    every login, keep the cache; cached users may show that field up to
+    SHARED_TTL old.
+    """
+    if created or (update_fields and update_fields <= AUTH_IRRELEVANT_FIELDS):
+        return
+    invalidate_user_tokens(instance.pk)
+
+
+@receiver(post_save, sender='parents.Parent')
+@receiver(post_delete, sender='parents.Parent')
+@receiver(post_save, sender='psychologists.Psychologist')
+@receiver(post_delete, sender='psychologists.Psychologist')
+def invalidate_user_tokens_on_profile_change(sender, instance, **kwargs):
+    """
+    Cached users carry their profile, so drop them when the profile changes
+    """
+    invalidate_user_tokens(instance.user_id)
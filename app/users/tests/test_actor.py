@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from parents.services import ParentService
+from psychologists.services import PsychologistService
+from users.actor import Actor, get_actor
+from users.authentication import CachedTokenAuthentication, token_cache
+from users.models import User
+
+
+class ActorTestCase(TestCase):
+    """Test cases for the request actor context"""
+
+    def setUp(self):
+        cache.clear()
+        token_cache.clear_local()
+
+        self.parent_user = User.objects.create_parent(email='parent@test.com', password='TestPass123!')
+        self.psychologist_user = User.objects.create_psychologist(email='psych@test.com', password='TestPass123!')
+
+    def test_profile_resolved_once(self):
+        """Test the actor, services and repeat accesses share one profile lookup"""
+        user = User.objects.get(pk=self.parent_user.pk)
+        actor = Actor(user)
+
+        with self.assertNumQueries(1):
+            parent = actor.parent
+            self.assertIs(actor.parent, parent)
+            self.assertIs(ParentService.get_parent_by_user(user), parent)
+            self.assertIs(actor.profile, parent)
+            self.assertIsNone(actor.psychologist)
+
+    def test_missing_profile_is_memoized(self):
+        """Test a psychologist without a profile is looked up only once"""
+        user = User.objects.get(pk=self.psychologist_user.pk)
+        actor = Actor(user)
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(actor.psychologist)
+            self.assertIsNone(PsychologistService.get_psychologist_by_user(user))
+            self.assertIsNone(actor.parent)
+
+    def test_get_actor_memoized_on_request(self):
+        """Test get_actor builds the context once per request"""
+        request = Request(APIRequestFactory().get('/'))
+        request.user = self.parent_user
+
+        self.assertIs(get_actor(request), get_actor(request))
+        self.assertEqual(get_actor(request).user, self.parent_user)
+
+    def test_token_authentication_preloads_profile(self):
+        """Test the authenticated user arrives with their profile already loaded"""
+        token = Token.objects.create(user=self.parent_user)
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        with self.assertNumQueries(1):
+            user, _token = CachedTokenAuthentication().authenticate(request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(Actor(user).parent.user_id, self.parent_user.pk)
+
+    def test_profile_change_refreshes_cached_user(self):
+        """Test saving a profile drops users cached with the old profile"""
+        token = Token.objects.create(user=self.parent_user)
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Token {token.key}')
+        user, _token = CachedTokenAuthentication().authenticate(request)
+
+        parent = user.parent_profile
+        parent.first_name = 'Updated'
+        parent.save()
+
+        user, _token = CachedTokenAuthentication().authenticate(request)
+        self.assertEqual(user.parent_profile.first_name, 'Updated')
+
+    def test_create_child_has_no_duplicate_parent_lookups(self):
+        """Test permission and view share the parent profile loaded with the token"""
+        self.parent_user.is_verified = True
+        self.parent_user.save()
+        token = Token.objects.create(user=self.parent_user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        data = {
+            'first_name': 'Test',
+            'date_of_birth': (date.today() - timedelta(days=365 * 7)).isoformat(),
+        }
+
+        for first_name in ('Cold', 'Warm'):
+            data['first_name'] = first_name
+            with CaptureQueriesContext(connection) as queries:
+                response = client.post(reverse('child-profile-list'), data, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            # Profile row loads; the child's FK validation only runs SELECT 1
+            profile_loads = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('SELECT "parents".')]
+            self.assertEqual(profile_loads, [])
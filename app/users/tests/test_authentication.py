@@ -0,0 +1,148 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import exceptions, status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient, APIRequestFactory
+
+from users.authentication import CachedTokenAuthentication, TokenCache, token_cache
+from users.models import User
+
+
+class CachedTokenAuthenticationTestCase(APITestCase):
+    """
+    Test cases for CachedTokenAuthentication
+    """
+
+    def setUp(self):
+        cache.clear()
+        token_cache.clear_local()
+
+        self.user = User.objects.create_user(
+            email='cached@example.com',
+            password='testpass123',
+            user_type='Parent',
+            is_verified=True,
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.factory = APIRequestFactory()
+
+    def authenticate(self):
+        request = self.factory.get('/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        return CachedTokenAuthentication().authenticate(request)
+
+    def test_cache_hit_makes_no_queries(self):
+        """Test only the first lookup for a token hits the database"""
+        with self.assertNumQueries(1):
+            user, token = self.authenticate()
+
+        with self.assertNumQueries(0):
+            cached_user, cached_token = self.authenticate()
+
+        self.assertEqual(cached_user, self.user)
+        self.assertEqual(cached_token.key, self.token.key)
+
+    def test_authenticated_request_skips_auth_query(self):
+        """Test a repeated API request saves the token/user query"""
+        me_url = reverse('auth-me')
+        with self.assertNumQueries(1):
+            # The view itself makes no queries for /auth/me/
+            self.client.get(me_url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(me_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['email'], self.user.email)
+
+    def test_logout_invalidates_cached_token(self):
+        """Test a logged-out token is rejected immediately"""
+        self.client.get(reverse('auth-me'))
+
+        response = self.client.post(reverse('auth-logout'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('auth-me'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivation_invalidates_cached_token(self):
+        """Test a deactivated user's cached token stops working"""
+        self.authenticate()
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authenticate()
+
+    def test_invalidation_reaches_other_workers(self):
+        """Test other processes drop an invalidated token once their local copy expires"""
+        worker_a, worker_b = TokenCache(LOCAL_TTL=5), TokenCache(LOCAL_TTL=5)
+        with patch('users.authentication.time.monotonic', return_value=100):
+            worker_a.set(self.token.key, self.user, self.token)
+            self.assertIsNotNone(worker_b.get(self.token.key))
+
+            worker_a.invalidate(self.token.key)
+            self.assertIsNone(worker_a.get(self.token.key))
+
+        with patch('users.authentication.time.monotonic', return_value=106):
+            self.assertIsNone(worker_b.get(self.token.key))
+
+    def test_local_hit_skips_shared_cache(self):
+        """Test a local hit doesn't make a round trip to the shared cache"""
+        self.authenticate()
+
+        with patch.object(TokenCache, 'shared') as shared:
+            user, _token = self.authenticate()
+
+        shared.get.assert_not_called()
+        self.assertEqual(user, self.user)
+
+    def test_login_keeps_cached_tokens(self):
+        """Test recording the login time doesn't invalidate the user's tokens"""
+        self.authenticate()
+
+        self.user.save(update_fields=['last_login_date'])
+        token_cache.clear_local()
+
+        with self.assertNumQueries(0):
+            self.authenticate()
+
+    def test_invalidation_is_per_user(self):
+        """Test a change to one user leaves other users' cached tokens alone"""
+        other = User.objects.create_user(email='other@example.com', password='testpass123', user_type='Parent')
+        other_token = Token.objects.create(user=other)
+        token_cache.set(other_token.key, other, other_token)
+        self.authenticate()
+
+        self.user.is_staff = True
+        self.user.save()
+        token_cache.clear_local()
+
+        self.assertIsNone(cache.get(TokenCache.make_key(self.token.key)))
+        self.assertIsNotNone(cache.get(TokenCache.make_key(other_token.key)))
+
+    def test_local_lru_is_bounded(self):
+        """Test the in-process tier evicts its least recently used entry"""
+        local = TokenCache(MAX_ENTRIES=2)
+        for key in ('a', 'b', 'c'):
+            local.set(key, self.user, self.token)
+
+        self.assertEqual(list(local._entries), ['b', 'c'])
+        # Evicted locally, still served from the shared cache
+        self.assertIsNotNone(local.get('a'))
+
+    def test_local_entries_expire(self):
+        """Test local entries are dropped after LOCAL_TTL"""
+        local = TokenCache(LOCAL_TTL=10)
+        with patch('users.authentication.time.monotonic', return_value=100):
+            local.set('a', self.user, self.token)
+        cache.delete(TokenCache.make_key('a'))
+
+        with patch('users.authentication.time.monotonic', return_value=105):
+            self.assertIsNotNone(local.get('a'))
+        with patch('users.authentication.time.monotonic', return_value=111):
+            self.assertIsNone(local.get('a'))
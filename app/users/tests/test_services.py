@@ -1,8 +1,13 @@
+from datetime import timedelta
+from smtplib import SMTPException, SMTPServerDisconnected
 from django.test import TestCase, override_settings
 from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from unittest.mock import patch, MagicMock
-from users.services import AuthenticationService, UserService
+from users.services import AuthenticationService, UserService, EmailService, EmailOutboxService
+from users.models import OutboundEmail
 from users.tokens import token_generator
 
 User = get_user_model()
@@ -101,6 +106,11 @@ class AuthenticationServiceTestCase(TestCase):
         result = AuthenticationService.send_verification_email(user)
 
         self.assertTrue(result)
+        # Queued in the outbox, delivered by the worker
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.filter(recipient_email=user.email).count(), 1)
+
+        EmailOutboxService.process_outbox()
         self.assertEqual(len(mail.outbox), 1)
         sent_email = mail.outbox[0]
         self.assertEqual(sent_email.subject, 'Verify your K&Mdiscova account')
@@ -187,6 +197,9 @@ class AuthenticationServiceTestCase(TestCase):
 
         self.assertTrue(success)
         self.assertEqual(message, "Password reset link sent")
+        self.assertEqual(len(mail.outbox), 0)
+
+        EmailOutboxService.process_outbox()
         self.assertEqual(len(mail.outbox), 1)
         sent_email = mail.outbox[0]
         self.assertEqual(sent_email.subject, 'Reset your K&Mdiscova password')
@@ -202,6 +215,7 @@ class AuthenticationServiceTestCase(TestCase):
         self.assertTrue(success)  # Security: always return True
         self.assertEqual(message, "If email exists, reset link will be sent")
         self.assertEqual(len(mail.outbox), 0)  # No email sent
+        self.assertFalse(OutboundEmail.objects.exists())
 
     def test_request_password_reset_inactive_user(self):
         """Test password reset request for inactive user"""
@@ -220,6 +234,7 @@ class AuthenticationServiceTestCase(TestCase):
         self.assertTrue(success)  # Security: always return True
         self.assertEqual(message, "If email exists, reset link will be sent")
         self.assertEqual(len(mail.outbox), 0)  # No email sent
+        self.assertFalse(OutboundEmail.objects.exists())
 
     def test_reset_password_success(self):
         """Test successful password reset"""
@@ -266,6 +281,237 @@ class AuthenticationServiceTestCase(TestCase):
         self.assertEqual(message, "Invalid or expired reset link")
 
 
+@override_settings(
+    EMAIL_OUTBOX={'BATCH_SIZE': 2, 'MAX_ATTEMPTS': 3, 'RETRY_BASE_SECONDS': 60, 'RETRY_MAX_SECONDS': 3600}
+)
+class EmailOutboxServiceTestCase(TestCase):
+    """Test cases for the email outbox worker"""
+
+    def queue(self, recipient='user@example.com'):
+        with patch('users.services.render_to_string', side_effect=['<p>hello</p>', 'hello']):
+            return EmailService.queue_email(
+                subject='Hello',
+                template_name='verify_email',
+                context={},
+                recipient_email=recipient
+            )
+
+    def mock_connection(self, send_side_effect=None):
+        connection = MagicMock()
+        connection.send_messages.side_effect = send_side_effect or (lambda messages: len(messages))
+        return connection
+
+    def test_queue_email_stores_rendered_message(self):
+        """Test queueing renders the templates without sending"""
+        mail.outbox = []
+
+        outbound = self.queue()
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(outbound.status, 'Pending')
+        self.assertEqual(outbound.html_body, '<p>hello</p>')
+        self.assertEqual(outbound.text_body, 'hello')
+        self.assertEqual(outbound.max_attempts, 3)
+
+    def test_process_outbox_sends_and_marks_sent(self):
+        """Test pending emails are delivered and marked sent"""
+        mail.outbox = []
+        for i in range(3):
+            self.queue(f'user{i}@example.com')
+
+        result = EmailOutboxService.process_outbox()
+
+        self.assertEqual(result['sent'], 3)
+        self.assertEqual(result['batches'], 2)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].alternatives[0][0], '<p>hello</p>')
+        self.assertFalse(OutboundEmail.objects.exclude(status='Sent').exists())
+        self.assertFalse(OutboundEmail.objects.filter(sent_at__isnull=True).exists())
+
+    def test_batch_reuses_one_connection(self):
+        """Test a batch opens a single connection for all its messages"""
+        self.queue('a@example.com')
+        self.queue('b@example.com')
+        connection = self.mock_connection()
+
+        with patch('users.services.get_connection', return_value=connection) as mock_get:
+            result = EmailOutboxService.process_batch()
+
+        self.assertEqual(result['sent'], 2)
+        mock_get.assert_called_once()
+        connection.open.assert_called_once()
+        connection.close.assert_called_once()
+        self.assertEqual(connection.send_messages.call_count, 2)
+
+    def test_failed_send_is_retried_with_backoff(self):
+        """Test a failed message is rescheduled while others still go out"""
+        failing = self.queue('fail@example.com')
+        ok = self.queue('ok@example.com')
+
+        def send(messages):
+            if messages[0].to == ['fail@example.com']:
+                raise SMTPException('mailbox unavailable')
+            return 1
+
+        before = timezone.now()
+        with patch('users.services.get_connection', return_value=self.mock_connection(send)):
+            result = EmailOutboxService.process_batch()
+
+        self.assertEqual(result['sent'], 1)
+        self.assertEqual(result['retried'], 1)
+        failing.refresh_from_db()
+        ok.refresh_from_db()
+        self.assertEqual(ok.status, 'Sent')
+        self.assertEqual(failing.status, 'Pending')
+        self.assertEqual(failing.attempts, 1)
+        self.assertIn('mailbox unavailable', failing.last_error)
+        self.assertGreaterEqual(failing.next_attempt_at, before + timedelta(seconds=60))
+
+        # Not due yet, so the next run leaves it alone
+        self.assertEqual(EmailOutboxService.process_batch()['claimed'], 0)
+
+    def test_crash_mid_batch_does_not_resend_delivered_emails(self):
+        """Test a worker dying mid-batch leaves delivered emails sent and the rest to a later batch"""
+        emails = [self.queue(f'user{i}@example.com') for i in range(3)]
+
+        def send(messages):
+            if messages[0].to == ['user1@example.com']:
+                raise KeyboardInterrupt  # worker killed while talking to the mail server
+            return 1
+
+        with patch('users.services.get_connection', return_value=self.mock_connection(send)):
+            with self.assertRaises(KeyboardInterrupt):
+                EmailOutboxService.process_batch(batch_size=3)
+
+        for outbound in emails:
+            outbound.refresh_from_db()
+        self.assertEqual([outbound.status for outbound in emails], ['Sent', 'Sending', 'Sending'])
+
+        # Still leased, so nobody picks them up yet
+        self.assertEqual(EmailOutboxService.process_batch()['claimed'], 0)
+
+        # Once the lease runs out another run delivers the rest, and only the rest
+        OutboundEmail.objects.filter(status='Sending').update(locked_until=timezone.now() - timedelta(seconds=1))
+        connection = self.mock_connection()
+        with patch('users.services.get_connection', return_value=connection):
+            result = EmailOutboxService.process_batch(batch_size=3)
+
+        self.assertEqual(result['sent'], 2)
+        recipients = [call.args[0][0].to[0] for call in connection.send_messages.call_args_list]
+        self.assertEqual(recipients, ['user1@example.com', 'user2@example.com'])
+        self.assertFalse(OutboundEmail.objects.exclude(status='Sent').exists())
+        self.assertFalse(OutboundEmail.objects.filter(locked_until__isnull=False).exists())
+
+    def test_retry_delay_is_exponential_and_capped(self):
+        """Test backoff doubles per attempt up to the configured maximum"""
+        self.assertEqual(EmailOutboxService.get_retry_delay(1), timedelta(seconds=60))
+        self.assertEqual(EmailOutboxService.get_retry_delay(3), timedelta(seconds=240))
+        self.assertEqual(EmailOutboxService.get_retry_delay(10), timedelta(seconds=3600))
+
+    def test_connection_failure_dead_letters_after_max_attempts(self):
+        """Test emails are dead-lettered once their attempts are used up"""
+        outbound = self.queue()
+        OutboundEmail.objects.filter(pk=outbound.pk).update(attempts=2)
+        connection = self.mock_connection()
+        connection.open.side_effect = SMTPException('connection refused')
+
+        with patch('users.services.get_connection', return_value=connection):
+            result = EmailOutboxService.process_batch()
+
+        self.assertEqual(result['dead_lettered'], 1)
+        connection.send_messages.assert_not_called()
+        outbound.refresh_from_db()
+        self.assertEqual(outbound.status, 'Dead_Letter')
+        self.assertEqual(outbound.attempts, 3)
+
+        self.assertEqual(EmailOutboxService.requeue_dead_letters(), 1)
+        outbound.refresh_from_db()
+        self.assertEqual(outbound.status, 'Pending')
+        self.assertEqual(outbound.attempts, 0)
+
+    def test_send_queued_emails_command(self):
+        """Test the worker command drains the queue"""
+        mail.outbox = []
+        self.queue()
+
+        call_command('send_queued_emails', stdout=MagicMock())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(OutboundEmail.objects.get().status, 'Sent')
+
+
+class EmailServiceBulkTestCase(TestCase):
+    """Test cases for EmailService.send_bulk_email"""
+
+    def setUp(self):
+        self.recipients = [(f'user{i}@example.com', {'user_name': f'User {i}'}) for i in range(5)]
+
+    def render(self, template_name, context):
+        if context['user_name'] == 'User 2':
+            raise ValueError('bad context')
+        return f"Hello {context['user_name']}"
+
+    @patch('users.services.render_to_string')
+    def test_send_bulk_email_sends_all(self, mock_render):
+        """Test every recipient gets its own rendered message"""
+        mock_render.side_effect = self.render
+        mail.outbox = []
+
+        results = EmailService.send_bulk_email('News', 'newsletter', self.recipients, chunk_size=2)
+
+        self.assertEqual(len(results['success']), 4)
+        self.assertEqual(results['failed'], [('user2@example.com', 'bad context')])
+        self.assertEqual(len(mail.outbox), 4)
+        bodies = {message.to[0]: message.body for message in mail.outbox}
+        self.assertEqual(bodies['user4@example.com'], 'Hello User 4')
+
+    @patch('users.services.render_to_string', return_value='Hello')
+    def test_send_bulk_email_reuses_connection_and_continues(self, mock_render):
+        """Test one connection is used and a failed send doesn't stop the run"""
+        connection = MagicMock()
+
+        def send(messages):
+            if messages[0].to == ['user1@example.com']:
+                raise SMTPException('rejected')
+            return 1
+
+        connection.send_messages.side_effect = send
+
+        with patch('users.services.get_connection', return_value=connection) as mock_get:
+            results = EmailService.send_bulk_email('News', 'newsletter', self.recipients, chunk_size=2)
+
+        mock_get.assert_called_once()
+        connection.close.assert_called_once()
+        self.assertEqual(connection.send_messages.call_count, 5)
+        self.assertEqual(results['failed'], [('user1@example.com', 'rejected')])
+        self.assertEqual(len(results['success']), 4)
+
+    @patch('users.services.render_to_string', return_value='Hello')
+    def test_send_bulk_email_reconnects_after_disconnect(self, mock_render):
+        """Test a dropped connection is reopened and the message resent"""
+        connection = MagicMock()
+        connection.send_messages.side_effect = [1, SMTPServerDisconnected('closed'), 1, 1, 1, 1]
+
+        with patch('users.services.get_connection', return_value=connection):
+            results = EmailService.send_bulk_email('News', 'newsletter', self.recipients)
+
+        self.assertEqual(len(results['success']), 5)
+        self.assertEqual(connection.open.call_count, 2)
+
+    @patch('users.services.render_to_string', return_value='Hello')
+    def test_send_bulk_email_connection_failure(self, mock_render):
+        """Test every recipient is reported failed when no connection can be opened"""
+        connection = MagicMock()
+        connection.open.side_effect = SMTPException('connection refused')
+
+        with patch('users.services.get_connection', return_value=connection):
+            results = EmailService.send_bulk_email('News', 'newsletter', self.recipients)
+
+        self.assertEqual(results['success'], [])
+        self.assertEqual(len(results['failed']), 5)
+        connection.send_messages.assert_not_called()
+
+
 class UserServiceTestCase(TestCase):
     """Test cases for UserService"""
 
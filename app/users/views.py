@@ -336,6 +336,7 @@ class UserViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
+    cursor_ordering = '-created_at'
 
     def get_permissions(self):
         """